@@ -0,0 +1,182 @@
+"""
+Agency Stats Service
+
+Maintains the materialized AgencyStats rows that back agency browse/search.
+Counters are recomputed per agency (indexed on Job.assignedAgencyFK) whenever a
+job changes status/agency or a review on an agency job is written, so browse,
+sort and min-rating filtering are plain lookups on agency_stats.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+
+from .models import Agency, AgencyStats, Job, JobReview
+
+
+ACTIVE_JOB_STATUSES = ("ACTIVE", "IN_PROGRESS")
+
+STAT_FIELDS = (
+    "totalJobs",
+    "completedJobs",
+    "activeJobs",
+    "reviewCount",
+    "ratingSum",
+    "averageRating",
+)
+
+
+def _job_counters():
+    return {
+        "totalJobs": Count("jobID"),
+        "completedJobs": Count("jobID", filter=Q(status="COMPLETED")),
+        "activeJobs": Count("jobID", filter=Q(status__in=ACTIVE_JOB_STATUSES)),
+    }
+
+
+def _review_counters():
+    return {
+        "reviewCount": Count("reviewID"),
+        "ratingSum": Sum("rating"),
+    }
+
+
+def _build_values(job_row: Optional[Dict], review_row: Optional[Dict]) -> Dict:
+    job_row = job_row or {}
+    review_row = review_row or {}
+
+    review_count = review_row.get("reviewCount") or 0
+    rating_sum = review_row.get("ratingSum") or Decimal("0.00")
+    average = None
+    if review_count:
+        average = (Decimal(rating_sum) / review_count).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+
+    return {
+        "totalJobs": job_row.get("totalJobs") or 0,
+        "completedJobs": job_row.get("completedJobs") or 0,
+        "activeJobs": job_row.get("activeJobs") or 0,
+        "reviewCount": review_count,
+        "ratingSum": rating_sum,
+        "averageRating": average,
+    }
+
+
+def compute_agency_stats(agency_id: int) -> Dict:
+    """Compute live counters for one agency (two aggregate queries)."""
+    job_row = Job.objects.filter(assignedAgencyFK_id=agency_id).aggregate(
+        **_job_counters()
+    )
+    review_row = JobReview.objects.filter(
+        jobID__assignedAgencyFK_id=agency_id
+    ).aggregate(**_review_counters())
+    return _build_values(job_row, review_row)
+
+
+def refresh_agency_stats(agency_id: int) -> Optional[AgencyStats]:
+    """
+    Recompute and persist AgencyStats for one agency.
+
+    Runs inside the caller's transaction (savepoint if nested). The agency row
+    is locked first so concurrent refreshes serialize and the later one always
+    aggregates over committed data.
+    """
+    with transaction.atomic():
+        locked = list(
+            Agency.objects.select_for_update()
+            .filter(agencyId=agency_id)
+            .values_list("agencyId", flat=True)
+        )
+        if not locked:
+            return None
+
+        values = compute_agency_stats(agency_id)
+        stats, _ = AgencyStats.objects.update_or_create(
+            agencyID_id=agency_id, defaults=values
+        )
+        return stats
+
+
+def rebuild_agency_stats(agency_ids: Optional[Iterable[int]] = None, batch_size: int = 500) -> int:
+    """
+    Rebuild AgencyStats for all agencies (or the given ids) with grouped
+    aggregates and a bulk upsert. Returns the number of rows written.
+    """
+    agencies = Agency.objects.order_by("agencyId")
+    if agency_ids is not None:
+        agencies = agencies.filter(agencyId__in=list(agency_ids))
+    ids = list(agencies.values_list("agencyId", flat=True))
+    if not ids:
+        return 0
+
+    written = 0
+    for start in range(0, len(ids), batch_size):
+        chunk = ids[start:start + batch_size]
+
+        job_rows = {
+            row["assignedAgencyFK_id"]: row
+            for row in Job.objects.filter(assignedAgencyFK_id__in=chunk)
+            .values("assignedAgencyFK_id")
+            .annotate(**_job_counters())
+            .order_by()
+        }
+        review_rows = {
+            row["jobID__assignedAgencyFK_id"]: row
+            for row in JobReview.objects.filter(jobID__assignedAgencyFK_id__in=chunk)
+            .values("jobID__assignedAgencyFK_id")
+            .annotate(**_review_counters())
+            .order_by()
+        }
+
+        rows: List[AgencyStats] = [
+            AgencyStats(
+                agencyID_id=agency_id,
+                **_build_values(job_rows.get(agency_id), review_rows.get(agency_id)),
+            )
+            for agency_id in chunk
+        ]
+        with transaction.atomic():
+            AgencyStats.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["agencyID"],
+                update_fields=list(STAT_FIELDS) + ["updatedAt"],
+            )
+        written += len(rows)
+
+    return written
+
+
+def find_stale_agency_stats(agency_ids: Optional[Iterable[int]] = None) -> List[Dict]:
+    """
+    Compare stored AgencyStats with live aggregates.
+    Returns one entry per agency whose row is missing or differs.
+    """
+    agencies = Agency.objects.order_by("agencyId")
+    if agency_ids is not None:
+        agencies = agencies.filter(agencyId__in=list(agency_ids))
+
+    stored = {
+        row["agencyID_id"]: row
+        for row in AgencyStats.objects.filter(
+            agencyID_id__in=agencies.values("agencyId")
+        ).values("agencyID_id", *STAT_FIELDS)
+    }
+
+    mismatches = []
+    for agency_id in agencies.values_list("agencyId", flat=True):
+        expected = compute_agency_stats(agency_id)
+        current = stored.get(agency_id)
+        if current is None:
+            mismatches.append({"agency_id": agency_id, "missing": True, "expected": expected})
+            continue
+        diff = {
+            field: {"stored": current[field], "expected": expected[field]}
+            for field in STAT_FIELDS
+            if current[field] != expected[field]
+        }
+        if diff:
+            mismatches.append({"agency_id": agency_id, "missing": False, "diff": diff})
+    return mismatches
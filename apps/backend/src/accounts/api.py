@@ -2156,6 +2156,34 @@ def get_unread_count(request):
         return {"success": False, "error": "Failed to get unread count"}
 
 
+@router.get("/notifications/sync", auth=dual_auth)
+def sync_notifications(request, since_id: int = 0, limit: int = 100):
+    """
+    Delta sync for reconnecting clients: notifications newer than since_id.
+    New notifications are pushed over the inbox WebSocket; call this once on
+    (re)connect with the highest notificationID seen, then follow
+    next_since_id while has_more is true.
+
+    Query params:
+    - since_id: Highest notificationID the client already has (default 0)
+    - limit: Page size (default 100, max 200)
+    """
+    try:
+        from .notification_feed import get_notifications_since
+
+        user = request.auth
+        profile_type = getattr(user, 'profile_type', None)
+        result = get_notifications_since(user.accountID, since_id, profile_type, limit)
+
+        return {"success": True, **result}
+
+    except Exception as e:
+        print(f"❌ Error syncing notifications: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return {"success": False, "error": "Failed to sync notifications"}
+
+
 @router.post("/register-push-token", auth=dual_auth)
 def register_push_token(request, pushToken: str, deviceType: str = "android"):
     """
@@ -3176,13 +3204,13 @@ def xendit_webhook(request):
     This endpoint is kept for processing historical Xendit transactions.
     New transactions use PayMongo via /wallet/paymongo-webhook.
     
-    This endpoint is called by Xendit when payment status changes.
+    Verifies and queues the callback in the webhook inbox; the payment is
+    applied by accounts.webhook_inbox (duplicates are stored once).
     """
     try:
-        from .models import Transaction
+        from .models import WebhookEvent
+        from .webhook_inbox import record_event, xendit_invoice_event_id
         from .xendit_service import XenditService
-        from decimal import Decimal
-        from django.utils import timezone
         import json
         
         # Get webhook payload
@@ -3199,85 +3227,24 @@ def xendit_webhook(request):
                 status=401
             )
         
-        # Parse webhook data
-        webhook_data = XenditService.parse_webhook_payload(payload)
-        if not webhook_data:
+        event_id = xendit_invoice_event_id(payload, request.headers.get('webhook-id', ''))
+        if not event_id:
             return Response(
                 {"error": "Invalid webhook payload"},
                 status=400
             )
         
-        # Find transaction by Xendit invoice ID
-        try:
-            transaction = Transaction.objects.get(
-                xenditInvoiceID=webhook_data['invoice_id']
-            )
-        except Transaction.DoesNotExist:
-            print(f"❌ Transaction not found for invoice {webhook_data['invoice_id']}")
-            return Response(
-                {"error": "Transaction not found"},
-                status=404
-            )
-        
-        # Update transaction based on status
-        invoice_status = webhook_data['status']
-        
-        if invoice_status == 'PAID':
-            # IDEMPOTENCY CHECK: Skip if already completed to prevent duplicate deposits
-            if transaction.status == Transaction.TransactionStatus.COMPLETED:
-                print(f"⚠️ Transaction {transaction.transactionID} already COMPLETED - skipping duplicate webhook")
-                return {"success": True, "message": "Transaction already processed"}
-            
-            # Payment successful
-            wallet = transaction.walletID
-            
-            # Update wallet balance based on transaction type
-            if transaction.transactionType == Transaction.TransactionType.DEPOSIT:
-                # Deposit adds to wallet
-                wallet.balance += transaction.amount
-                wallet.save()
-                print(f"💰 Added ₱{transaction.amount} to wallet (DEPOSIT)")
-            elif transaction.transactionType == Transaction.TransactionType.PAYMENT:
-                # Payment/Escrow - money goes to platform, not deducted from wallet
-                # Wallet balance stays the same (escrow is held by platform)
-                print(f"💸 Escrow payment of ₱{transaction.amount} received (held by platform)")
-            
-            # Update transaction
-            transaction.status = Transaction.TransactionStatus.COMPLETED
-            transaction.balanceAfter = wallet.balance
-            transaction.xenditPaymentID = webhook_data.get('payment_id')
-            transaction.xenditPaymentChannel = webhook_data.get('payment_channel')
-            transaction.xenditPaymentMethod = webhook_data.get('payment_method')
-            transaction.completedAt = timezone.now()
-            transaction.save()
-            
-            # If this is an escrow payment, mark the job as escrow paid
-            if transaction.relatedJobPosting:
-                job = transaction.relatedJobPosting
-                if "escrow" in transaction.description.lower() or "downpayment" in transaction.description.lower():
-                    job.escrowPaid = True
-                    job.escrowPaidAt = timezone.now()
-                    job.save()
-                    print(f"✅ Job {job.jobID} escrow marked as paid")
-                elif "remaining" in transaction.description.lower() or "final" in transaction.description.lower():
-                    # This is the remaining payment - mark job as completed
-                    job.remainingPaymentPaid = True
-                    job.remainingPaymentPaidAt = timezone.now()
-                    job.status = "COMPLETED"
-                    job.save()
-                    print(f"✅ Job {job.jobID} remaining payment received - Job marked as COMPLETED")
-            
-            print(f"✅ Payment completed for transaction {transaction.transactionID}")
-            
-        elif invoice_status in ['EXPIRED', 'FAILED']:
-            # Payment failed or expired
-            transaction.status = Transaction.TransactionStatus.FAILED
-            transaction.description = f"{transaction.description} - {invoice_status}"
-            transaction.save()
-            
-            print(f"❌ Payment {invoice_status.lower()} for transaction {transaction.transactionID}")
-        
-        return {"success": True, "message": "Webhook processed"}
+        event, created = record_event(
+            WebhookEvent.Provider.XENDIT_INVOICE,
+            event_id,
+            payload,
+            event_type=str(payload.get('status', '')),
+        )
+        return {
+            "success": True,
+            "message": "Webhook queued" if created else "Duplicate webhook ignored",
+            "event_id": event.webhookEventID,
+        }
         
     except Exception as e:
         print(f"❌ Error processing webhook: {str(e)}")
@@ -3299,17 +3266,18 @@ def xendit_disbursement_webhook(request):
     
     This endpoint is called by Xendit when a disbursement status changes.
     Used for withdrawal processing (both agency and worker withdrawals).
+    The callback is queued in the webhook inbox and applied asynchronously.
     """
     try:
-        from .models import Transaction, Wallet
+        from .models import WebhookEvent
+        from .webhook_inbox import record_event, xendit_disbursement_event_id
         from .xendit_service import XenditService
-        from django.utils import timezone
         import json
         
         # Get webhook payload
         payload = json.loads(request.body)
         
-        print(f"📥 Xendit Disbursement Webhook received: {payload}")
+        print(f"📥 Xendit Disbursement Webhook received: {payload.get('id')}")
         
         # Verify webhook (optional in TEST mode)
         webhook_token = request.headers.get('x-callback-token', '')
@@ -3320,70 +3288,25 @@ def xendit_disbursement_webhook(request):
                 status=401
             )
         
-        # Parse disbursement webhook data
-        # Xendit sends different formats for payouts vs invoices
-        disbursement_id = payload.get('id')
-        external_id = payload.get('external_id') or payload.get('reference_id')
-        status = payload.get('status', '').upper()
-        failure_code = payload.get('failure_code')
-        
-        print(f"📤 Disbursement ID: {disbursement_id}, Status: {status}, External ID: {external_id}")
-        
-        if not disbursement_id and not external_id:
+        event_id = xendit_disbursement_event_id(payload, request.headers.get('webhook-id', ''))
+        if not event_id:
             print("❌ No disbursement ID or external ID in webhook payload")
             return Response(
                 {"error": "Invalid webhook payload - missing ID"},
                 status=400
             )
         
-        # Find transaction by Xendit disbursement ID or external ID
-        transaction = None
-        try:
-            if disbursement_id:
-                transaction = Transaction.objects.filter(
-                    xenditInvoiceID=disbursement_id
-                ).first()
-            if not transaction and external_id:
-                transaction = Transaction.objects.filter(
-                    xenditExternalID=external_id
-                ).first()
-        except Exception as e:
-            print(f"❌ Error finding transaction: {str(e)}")
-        
-        if not transaction:
-            print(f"❌ Transaction not found for disbursement {disbursement_id} / {external_id}")
-            # Return 200 to prevent Xendit from retrying for unknown transactions
-            return {"success": True, "message": "Transaction not found, skipping"}
-        
-        print(f"✅ Found transaction {transaction.transactionID} for disbursement")
-        
-        # Update transaction based on status
-        if status in ['COMPLETED', 'SUCCEEDED', 'PAID']:
-            # Disbursement successful - money sent to recipient
-            transaction.status = Transaction.TransactionStatus.COMPLETED
-            transaction.completedAt = timezone.now()
-            transaction.save()
-            print(f"✅ Withdrawal completed for transaction {transaction.transactionID}")
-            
-        elif status in ['FAILED', 'VOIDED', 'CANCELLED', 'REVERSED']:
-            # Disbursement failed - refund the wallet balance
-            wallet = transaction.walletID
-            wallet.balance += transaction.amount  # Refund the deducted amount
-            wallet.save()
-            
-            transaction.status = Transaction.TransactionStatus.FAILED
-            transaction.description = f"{transaction.description} - {status}"
-            if failure_code:
-                transaction.description += f" ({failure_code})"
-            transaction.save()
-            
-            print(f"❌ Withdrawal {status} for transaction {transaction.transactionID}. Refunded ₱{transaction.amount} to wallet.")
-            
-        elif status == 'PENDING':
-            # Still processing, no action needed
-            print(f"⏳ Withdrawal still pending for transaction {transaction.transactionID}")
-        
-        return {"success": True, "message": "Disbursement webhook processed"}
+        event, created = record_event(
+            WebhookEvent.Provider.XENDIT_DISBURSEMENT,
+            event_id,
+            payload,
+            event_type=str(payload.get('status', '')),
+        )
+        return {
+            "success": True,
+            "message": "Disbursement webhook queued" if created else "Duplicate webhook ignored",
+            "event_id": event.webhookEventID,
+        }
         
     except Exception as e:
         print(f"❌ Error processing disbursement webhook: {str(e)}")
@@ -3405,16 +3328,20 @@ def paymongo_webhook(request):
     - checkout_session.payment.failed (payment failed)
     - checkout_session.payment.expired (checkout expired)
     - payment.paid, payment.failed (direct payment events)
+    - transfer events (BANK withdrawals)
     
     Also handles:
     - gcash_verification: Verifies payment method and credits ₱1 bonus
     
+    The event is verified and queued in the webhook inbox (keyed by the
+    PayMongo event ID); accounts.webhook_inbox applies it.
+    
     This endpoint must be registered in PayMongo dashboard under Webhooks.
     """
     try:
-        from .models import Transaction, Wallet, UserPaymentMethod, Notification
+        from .models import WebhookEvent
         from .paymongo_service import PayMongoService
-        from django.utils import timezone
+        from .webhook_inbox import paymongo_event_id, paymongo_event_type, record_event
         import json
         
         # Get webhook payload
@@ -3434,222 +3361,25 @@ def paymongo_webhook(request):
                 status=401
             )
         
-        # Parse webhook data
-        webhook_data = paymongo.parse_webhook_payload(payload)
-        if not webhook_data:
-            print(f"❌ Failed to parse PayMongo webhook payload")
+        event_id = paymongo_event_id(payload)
+        if not event_id:
+            print(f"❌ PayMongo webhook payload has no event ID")
             return Response(
                 {"error": "Invalid webhook payload"},
                 status=400
             )
         
-        event_type = webhook_data.get('event_type', '')
-        payment_id = webhook_data.get('payment_id')
-        external_id = webhook_data.get('external_id')
-        transaction_id = webhook_data.get('transaction_id')
-        status = webhook_data.get('status', '')
-        metadata = webhook_data.get('metadata', {})
-        
-        print(f"📤 PayMongo Event: {event_type}, Payment ID: {payment_id}, External ID: {external_id}")
-        print(f"   Metadata: {metadata}")
-        
-        # ============================================
-        # Handle Transfer V2 Webhooks (BANK withdrawals)
-        # ============================================
-        if 'transfer' in event_type.lower() or webhook_data.get('transfer_id'):
-            transfer_id = webhook_data.get('transfer_id')
-            transfer_status = str(webhook_data.get('status', '')).lower()
-
-            transaction = None
-            try:
-                tx_id = webhook_data.get('transaction_id')
-                if tx_id:
-                    transaction = Transaction.objects.filter(transactionID=int(tx_id)).first()
-            except Exception:
-                transaction = None
-
-            if not transaction and transfer_id:
-                transaction = Transaction.objects.filter(paymongoTransferId=transfer_id).first()
-
-            if not transaction:
-                ext_id = webhook_data.get('external_id')
-                if ext_id:
-                    transaction = Transaction.objects.filter(xenditExternalID=ext_id).first()
-
-            if not transaction:
-                print(f"⚠️ Transfer webhook transaction not found for transfer_id={transfer_id}")
-                return {"success": True, "message": "Transfer transaction not found, skipping"}
-
-            # Idempotency: if already terminal, skip duplicate webhook
-            if transaction.status in [Transaction.TransactionStatus.COMPLETED, Transaction.TransactionStatus.FAILED]:
-                print(f"⚠️ Transfer webhook duplicate ignored for txn={transaction.transactionID}, status={transaction.status}")
-                return {"success": True, "message": "Transfer transaction already settled"}
-
-            transaction.paymongoTransferId = transfer_id or transaction.paymongoTransferId
-            transaction.paymongoTransferStatus = transfer_status or transaction.paymongoTransferStatus
-
-            if transfer_status in ['completed', 'paid', 'succeeded', 'success']:
-                transaction.status = Transaction.TransactionStatus.COMPLETED
-                transaction.completedAt = timezone.now()
-                transaction.save()
-
-                wallet = transaction.walletID
-                if wallet and wallet.accountFK:
-                    Notification.objects.create(
-                        accountFK=wallet.accountFK,
-                        notificationType='PAYMENT_RELEASED',
-                        title='Bank Withdrawal Completed',
-                        message=f'Your bank withdrawal of ₱{transaction.amount:,.2f} has been completed.'
-                    )
-
-                return {"success": True, "message": "Transfer webhook processed (completed)"}
-
-            if transfer_status in ['failed', 'cancelled', 'canceled', 'reversed']:
-                wallet = transaction.walletID
-                if wallet:
-                    # Refund only when failing from non-terminal state
-                    wallet.balance += transaction.amount
-                    wallet.save(update_fields=['balance', 'updatedAt'])
-
-                    Transaction.objects.create(
-                        walletID=wallet,
-                        transactionType=Transaction.TransactionType.REFUND,
-                        amount=transaction.amount,
-                        balanceAfter=wallet.balance,
-                        status=Transaction.TransactionStatus.COMPLETED,
-                        description=f"BANK withdrawal transfer failure refund - Original txn #{transaction.transactionID}",
-                        referenceNumber=f"REFUND-BANK-WD-{transaction.transactionID}",
-                        completedAt=timezone.now(),
-                        paymentMethod=Transaction.PaymentMethod.WALLET,
-                    )
-
-                transaction.status = Transaction.TransactionStatus.FAILED
-                transaction.save()
-
-                if wallet and wallet.accountFK:
-                    Notification.objects.create(
-                        accountFK=wallet.accountFK,
-                        notificationType='SYSTEM',
-                        title='Bank Withdrawal Failed',
-                        message=(
-                            f'Your bank withdrawal of ₱{transaction.amount:,.2f} failed and was '
-                            'refunded to your wallet balance.'
-                        )
-                    )
-
-                return {"success": True, "message": "Transfer webhook processed (failed + refunded)"}
-
-            transaction.save()
-            return {"success": True, "message": "Transfer webhook processed (pending)"}
-
-        # ============================================
-        # Handle GCash Verification Checkout
-        # ============================================
-        if metadata.get('payment_type') == 'gcash_verification':
-            payment_method_id = metadata.get('payment_method_id')
-            
-            if not payment_method_id:
-                print(f"❌ Missing payment_method_id in verification metadata")
-                return {"success": True, "message": "Missing payment method ID"}
-            
-            if status == 'paid' or 'paid' in event_type:
-                return _handle_gcash_verification_success(
-                    payment_method_id=int(payment_method_id),
-                    metadata=metadata,
-                    payment_id=payment_id
-                )
-            elif status in ['failed', 'expired', 'cancelled'] or any(s in event_type for s in ['failed', 'expired', 'cancel']):
-                return _handle_gcash_verification_failed(
-                    payment_method_id=int(payment_method_id),
-                    reason=status
-                )
-            
-            return {"success": True, "message": "Verification webhook processed"}
-        
-        # ============================================
-        # Handle Regular Transaction Webhooks
-        # ============================================
-        
-        # Find transaction by PayMongo checkout ID or external ID
-        transaction = None
-        try:
-            if transaction_id:
-                transaction = Transaction.objects.filter(transactionID=int(transaction_id)).first()
-            if not transaction and payment_id:
-                # Try finding by checkout session ID stored in xenditInvoiceID field
-                # (we reuse this field for PayMongo checkout ID)
-                transaction = Transaction.objects.filter(xenditInvoiceID=payment_id).first()
-            if not transaction and external_id:
-                transaction = Transaction.objects.filter(xenditExternalID=external_id).first()
-        except Exception as e:
-            print(f"❌ Error finding transaction: {str(e)}")
-        
-        if not transaction:
-            print(f"❌ Transaction not found for PayMongo payment {payment_id} / {external_id}")
-            # Return 200 to prevent PayMongo from retrying for unknown transactions
-            return {"success": True, "message": "Transaction not found, skipping"}
-        
-        print(f"✅ Found transaction {transaction.transactionID} for PayMongo payment")
-        
-        # Update transaction based on status
-        if status == 'paid' or 'paid' in event_type:
-            # IDEMPOTENCY CHECK: Skip if already completed to prevent duplicate deposits
-            if transaction.status == Transaction.TransactionStatus.COMPLETED:
-                print(f"⚠️ Transaction {transaction.transactionID} already COMPLETED - skipping duplicate webhook")
-                return {"success": True, "message": "Transaction already processed"}
-            
-            # Payment successful
-            wallet = transaction.walletID
-            
-            # Update wallet balance based on transaction type
-            if transaction.transactionType == Transaction.TransactionType.DEPOSIT:
-                # Deposit adds to wallet
-                wallet.balance += transaction.amount
-                wallet.save()
-                print(f"💰 Added ₱{transaction.amount} to wallet (DEPOSIT via PayMongo)")
-            elif transaction.transactionType == Transaction.TransactionType.PAYMENT:
-                # Payment/Escrow - money goes to platform, not deducted from wallet
-                print(f"💸 Escrow payment of ₱{transaction.amount} received via PayMongo")
-            
-            # Update transaction
-            transaction.status = Transaction.TransactionStatus.COMPLETED
-            transaction.balanceAfter = wallet.balance
-            transaction.xenditPaymentID = payment_id  # Reuse field for PayMongo ID
-            transaction.xenditPaymentChannel = webhook_data.get('payment_channel', 'PAYMONGO')
-            transaction.xenditPaymentMethod = webhook_data.get('payment_method', 'checkout')
-            transaction.completedAt = timezone.now()
-            # Store the actual pay_xxx payment ID from the webhook payments[] array
-            actual_payment_id = webhook_data.get('actual_payment_id')
-            if actual_payment_id:
-                transaction.paymongoPaymentId = actual_payment_id
-            transaction.save()
-            
-            # If this is an escrow payment, mark the job as escrow paid
-            if transaction.relatedJobPosting:
-                job = transaction.relatedJobPosting
-                desc_lower = transaction.description.lower()
-                if "escrow" in desc_lower or "downpayment" in desc_lower:
-                    job.escrowPaid = True
-                    job.escrowPaidAt = timezone.now()
-                    job.save()
-                    print(f"✅ Job {job.jobID} escrow marked as paid (PayMongo)")
-                elif "remaining" in desc_lower or "final" in desc_lower:
-                    job.remainingPaymentPaid = True
-                    job.remainingPaymentPaidAt = timezone.now()
-                    job.status = "COMPLETED"
-                    job.save()
-                    print(f"✅ Job {job.jobID} remaining payment received - Job COMPLETED (PayMongo)")
-            
-            print(f"✅ PayMongo payment completed for transaction {transaction.transactionID}")
-            
-        elif status in ['failed', 'expired', 'cancelled'] or any(s in event_type for s in ['failed', 'expired', 'cancel']):
-            # Payment failed or expired
-            transaction.status = Transaction.TransactionStatus.FAILED
-            transaction.description = f"{transaction.description} - {status.upper()}"
-            transaction.save()
-            print(f"❌ PayMongo payment {status} for transaction {transaction.transactionID}")
-        
-        return {"success": True, "message": "PayMongo webhook processed"}
+        event, created = record_event(
+            WebhookEvent.Provider.PAYMONGO,
+            event_id,
+            payload,
+            event_type=paymongo_event_type(payload),
+        )
+        return {
+            "success": True,
+            "message": "PayMongo webhook queued" if created else "Duplicate webhook ignored",
+            "event_id": event.webhookEventID,
+        }
         
     except Exception as e:
         print(f"❌ Error processing PayMongo webhook: {str(e)}")
@@ -3661,114 +3391,6 @@ def paymongo_webhook(request):
         )
 
 
-def _handle_gcash_verification_success(payment_method_id: int, metadata: dict, payment_id: str):
-    """
-    Handle successful GCash verification payment.
-    
-    1. Mark payment method as verified
-    2. Credit ₱1 verification amount to user's wallet as bonus
-    """
-    from .models import UserPaymentMethod, Wallet, Transaction
-    from django.utils import timezone
-    from django.db import transaction as db_transaction
-    from decimal import Decimal
-    
-    try:
-        # Find the payment method
-        payment_method = UserPaymentMethod.objects.filter(id=payment_method_id).first()
-        
-        if not payment_method:
-            print(f"❌ Payment method {payment_method_id} not found for verification")
-            return {"success": True, "message": "Payment method not found"}
-        
-        # Idempotency: Skip if already verified
-        if payment_method.isVerified:
-            print(f"⚠️ Payment method {payment_method_id} already verified - skipping duplicate")
-            return {"success": True, "message": "Already verified"}
-        
-        with db_transaction.atomic():
-            # Mark payment method as verified
-            payment_method.isVerified = True
-            payment_method.save()
-            
-            print(f"✅ Payment method {payment_method_id} verified via PayMongo!")
-            
-            # Get or create user's wallet
-            user = payment_method.accountFK
-            wallet, _ = Wallet.objects.get_or_create(
-                accountFK=user,
-                defaults={'balance': Decimal('0')}
-            )
-            
-            # Credit ₱1 verification bonus (use Decimal for wallet operations)
-            bonus_amount = Decimal('1.00')
-            balance_before = wallet.balance
-            wallet.balance += bonus_amount
-            wallet.save()
-            
-            # Create transaction record for the bonus
-            verification_tx = Transaction.objects.create(
-                walletID=wallet,
-                transactionType=Transaction.TransactionType.DEPOSIT,
-                amount=bonus_amount,
-                balanceAfter=wallet.balance,
-                status=Transaction.TransactionStatus.COMPLETED,
-                description=f"GCash Verification Bonus - Account {payment_method.accountNumber[-4:].rjust(11, '*')}",
-                paymentMethod='GCASH',
-                xenditPaymentID=payment_id
-            )
-            
-            print(f"💰 Credited ₱{bonus_amount} verification bonus to wallet for {user.email}")
-            print(f"   Transaction ID: {verification_tx.transactionID}")
-            print(f"   Balance: ₱{balance_before} → ₱{wallet.balance}")
-        
-        return {"success": True, "message": "GCash verification completed"}
-        
-    except Exception as e:
-        print(f"❌ Error processing GCash verification: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return {"success": True, "message": f"Verification error: {str(e)}"}
-
-
-def _handle_gcash_verification_failed(payment_method_id: int, reason: str):
-    """
-    Handle failed GCash verification payment.
-    
-    Delete the unverified payment method to allow user to try again.
-    """
-    from .models import UserPaymentMethod
-    
-    try:
-        payment_method = UserPaymentMethod.objects.filter(id=payment_method_id).first()
-        
-        if not payment_method:
-            print(f"⚠️ Payment method {payment_method_id} not found for failed verification")
-            return {"success": True, "message": "Payment method not found"}
-        
-        if payment_method.isVerified:
-            print(f"⚠️ Payment method {payment_method_id} is already verified - ignoring failure")
-            return {"success": True, "message": "Already verified, ignoring failure"}
-        
-        account_number = payment_method.accountNumber
-        user_email = payment_method.accountFK.email
-        
-        # Delete the unverified payment method
-        payment_method.delete()
-        
-        print(f"🗑️ Deleted unverified payment method {payment_method_id} for {user_email}")
-        print(f"   Reason: {reason}")
-        print(f"   GCash: ***{account_number[-4:] if account_number else '****'}")
-        
-        return {"success": True, "message": "Verification failed - payment method removed"}
-        
-    except Exception as e:
-        print(f"❌ Error handling verification failure: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return {"success": True, "message": f"Error: {str(e)}"}
-
-
 def cleanup_unverified_payment_methods():
     """
     Cleanup task: Delete unverified payment methods older than 24 hours.
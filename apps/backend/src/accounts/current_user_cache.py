@@ -0,0 +1,151 @@
+"""
+Current-User Cache
+
+The /me payload (account flags, system role, agency or profile data, worker
+skills/rating/job counts) is requested on every app launch and web page load
+but only changes when the user edits something. It is cached per
+(account, profile_type):
+
+- Each account has a version number in the shared cache. Model save/delete
+  hooks (Accounts, Profile, Agency, WorkerProfile, skills, certifications,
+  reviews, completed jobs, KYC, SystemRoles) call invalidate_current_user(),
+  which bumps it immediately and again after commit, so a read inside the
+  writing transaction rebuilds and a read that raced the commit is dropped.
+- Payloads are stored in Redis tagged with the version they were built for,
+  and in a bounded in-process LRU. Both copies expire after PAYLOAD_TIMEOUT,
+  so a change the hooks miss is picked up within 15 minutes. A warm request
+  costs one cache GET (the version) and no DB query; a version mismatch falls
+  back to Redis, then to the builder.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = "cache:me:version:{account_id}"
+PAYLOAD_KEY = "cache:me:payload:{account_id}:{profile_type}"
+VERSION_TIMEOUT = 60 * 60 * 24 * 7
+PAYLOAD_TIMEOUT = 60 * 15
+LOCAL_MAX_ENTRIES = 2048
+
+
+class _LocalLRU:
+    """
+    Thread-safe bounded LRU of (account_id, profile_type) -> (version, payload).
+    Entries expire after `timeout` seconds, like the Redis copy.
+    """
+
+    def __init__(self, max_entries: int, timeout: float):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries: "OrderedDict[Tuple[int, str], Tuple[float, int, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[Tuple[int, dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1], entry[2]
+
+    def set(self, key, version: int, payload: dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.timeout, version, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard_account(self, account_id: int) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == account_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_local = _LocalLRU(LOCAL_MAX_ENTRIES, PAYLOAD_TIMEOUT)
+
+
+def _profile_key(profile_type: Optional[str]) -> str:
+    return profile_type or "-"
+
+
+def _get_version(account_id: int) -> int:
+    key = VERSION_KEY.format(account_id=account_id)
+    version = cache.get(key)
+    if version is None:
+        # Time-based start so a version never repeats after the key expires
+        cache.add(key, time.time_ns(), VERSION_TIMEOUT)
+        version = cache.get(key) or 0
+    return int(version)
+
+
+def _bump(account_id: int) -> None:
+    key = VERSION_KEY.format(account_id=account_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), VERSION_TIMEOUT)
+    _local.discard_account(account_id)
+
+
+def invalidate_current_user(account_id: Optional[int]) -> None:
+    """Drop cached /me payloads for an account (every profile_type)."""
+    if not account_id:
+        return
+    account_id = int(account_id)
+    _bump(account_id)
+    transaction.on_commit(lambda: _bump(account_id))
+
+
+def invalidate_for_worker_profile(worker_profile_id: Optional[int]) -> None:
+    """Invalidate the account owning a WorkerProfile (skills, certifications, stats)."""
+    if not worker_profile_id:
+        return
+    from .models import WorkerProfile
+
+    invalidate_current_user(
+        WorkerProfile.objects.filter(pk=worker_profile_id)
+        .values_list("profileID__accountFK_id", flat=True)
+        .first()
+    )
+
+
+def get_current_user(account_id: int, profile_type: Optional[str], builder: Callable[[int, Optional[str]], dict]) -> dict:
+    """
+    Cached payload for (account_id, profile_type); `builder` assembles it on a
+    miss. Builder exceptions (e.g. unknown account) propagate and are not cached.
+    """
+    account_id = int(account_id)
+    local_key = (account_id, _profile_key(profile_type))
+    version = _get_version(account_id)
+
+    entry = _local.get(local_key)
+    if entry is not None and entry[0] == version:
+        return copy.deepcopy(entry[1])
+
+    payload_key = PAYLOAD_KEY.format(account_id=account_id, profile_type=_profile_key(profile_type))
+    stored = cache.get(payload_key)
+    if stored is not None and stored[0] == version:
+        payload = stored[1]
+    else:
+        payload = builder(account_id, profile_type)
+        cache.set(payload_key, (version, payload), PAYLOAD_TIMEOUT)
+
+    _local.set(local_key, version, payload)
+    return copy.deepcopy(payload)
+
+
+def clear_local() -> None:
+    """Empty this process's LRU (tests and benchmarks)."""
+    _local.clear()
@@ -0,0 +1,453 @@
+"""
+Wallet Ledger Service
+
+Wallet.balance and pendingEarnings are mutated in place from many call sites
+(payment buffer, cancellations, daily payments, webhooks, admin payouts).
+This module treats the Transaction table as the ledger and derives balances
+from it:
+
+- Effect rules (mirrored in Python by balance_effect() and in SQL by
+  BALANCE_EFFECT / PENDING_EFFECT):
+    credit   DEPOSIT, EARNING, REFUND, MATERIALS_REIMBURSEMENT when COMPLETED
+    debit    WITHDRAWAL in any status (funds leave on request; a rejected or
+             failed withdrawal is compensated by its own REFUND row)
+    debit    PAYMENT, FEE when COMPLETED and paid from the WALLET
+    pending  PENDING_EARNING while PENDING (the 7-day buffer); release turns
+             the row into a COMPLETED EARNING
+- WalletSnapshot stores the ledger balances as of transaction N, so
+  balance-at-time and statements read one snapshot plus the tail after it
+  instead of the wallet's full history.
+- get_transaction_history() pages a wallet's history with a keyset cursor
+  (no COUNT/OFFSET) and attaches a ledger running balance to every row.
+- check_consistency() streams every wallet once (keyset batches, three
+  queries per batch) and reports wallets whose stored balances drift from
+  the ledger.
+"""
+import logging
+import operator
+import time
+from datetime import datetime
+from decimal import Decimal
+from functools import reduce
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from django.db.models import Case, Count, DecimalField, F, Max, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+
+from adminpanel.pagination import decode_cursor, encode_cursor, keyset_page
+
+from .models import Transaction, Wallet, WalletSnapshot
+
+logger = logging.getLogger(__name__)
+
+ZERO = Decimal("0.00")
+WALLET_BATCH_SIZE = 1000
+SNAPSHOT_MIN_NEW_TRANSACTIONS = 50
+STATEMENT_MAX_ROWS = 500
+HISTORY_DEFAULT_LIMIT = 20
+HISTORY_MAX_LIMIT = 100
+# Newest first; transactionID breaks createdAt ties so the keyset is unique
+HISTORY_ORDERING = ("-createdAt", "-transactionID")
+HISTORY_COMPACT_FIELDS = (
+    "transactionID", "walletID", "transactionType", "status", "amount",
+    "balanceAfter", "paymentMethod", "createdAt",
+)
+
+_TYPES = Transaction.TransactionType
+_STATUS = Transaction.TransactionStatus
+
+CREDIT_TYPES = (_TYPES.DEPOSIT, _TYPES.EARNING, _TYPES.REFUND, _TYPES.MATERIALS_REIMBURSEMENT)
+WALLET_DEBIT_TYPES = (_TYPES.PAYMENT, _TYPES.FEE)
+
+CREDIT_Q = Q(transactionType__in=CREDIT_TYPES, status=_STATUS.COMPLETED)
+DEBIT_Q = Q(transactionType=_TYPES.WITHDRAWAL) | Q(
+    transactionType__in=WALLET_DEBIT_TYPES,
+    status=_STATUS.COMPLETED,
+    paymentMethod=Transaction.PaymentMethod.WALLET,
+)
+PENDING_Q = Q(transactionType=_TYPES.PENDING_EARNING, status=_STATUS.PENDING)
+
+_MONEY = DecimalField(max_digits=12, decimal_places=2)
+BALANCE_EFFECT = Case(
+    When(CREDIT_Q, then=F("amount")),
+    When(DEBIT_Q, then=-F("amount")),
+    default=Value(ZERO),
+    output_field=_MONEY,
+)
+PENDING_EFFECT = Case(When(PENDING_Q, then=F("amount")), default=Value(ZERO), output_field=_MONEY)
+
+
+def balance_effect(txn: Transaction) -> Tuple[Decimal, Decimal]:
+    """(balance delta, pendingEarnings delta) of one ledger row."""
+    if txn.transactionType == _TYPES.PENDING_EARNING:
+        return ZERO, (txn.amount if txn.status == _STATUS.PENDING else ZERO)
+    if txn.transactionType in CREDIT_TYPES:
+        return (txn.amount if txn.status == _STATUS.COMPLETED else ZERO), ZERO
+    if txn.transactionType == _TYPES.WITHDRAWAL:
+        return -txn.amount, ZERO
+    if (
+        txn.transactionType in WALLET_DEBIT_TYPES
+        and txn.status == _STATUS.COMPLETED
+        and txn.paymentMethod == Transaction.PaymentMethod.WALLET
+    ):
+        return -txn.amount, ZERO
+    return ZERO, ZERO
+
+
+# =============================================================================
+# SNAPSHOTS
+# =============================================================================
+
+
+def invalidate_snapshots(wallet_id: int, transaction_id: int) -> None:
+    """Drop snapshots that folded in a transaction which has since changed."""
+    WalletSnapshot.objects.filter(
+        walletID_id=wallet_id, lastTransactionID__gte=transaction_id
+    ).delete()
+
+
+def invalidate_snapshots_for(rows: Iterable[Tuple[int, int]]) -> None:
+    """invalidate_snapshots() for many (wallet_id, transaction_id) pairs, e.g. after bulk_update()."""
+    earliest: Dict[int, int] = {}
+    for wallet_id, transaction_id in rows:
+        earliest[wallet_id] = min(transaction_id, earliest.get(wallet_id, transaction_id))
+    if earliest:
+        WalletSnapshot.objects.filter(
+            reduce(
+                operator.or_,
+                (Q(walletID_id=w, lastTransactionID__gte=t) for w, t in earliest.items()),
+            )
+        ).delete()
+
+
+def _latest_snapshots(wallet_ids: Sequence[int]) -> Dict[int, WalletSnapshot]:
+    return {
+        snapshot.walletID_id: snapshot
+        for snapshot in WalletSnapshot.objects.filter(walletID_id__in=wallet_ids)
+        .order_by("walletID", "-lastTransactionID")
+        .distinct("walletID")
+    }
+
+
+def _tail_totals(wallet_ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+    """Per-wallet effect of the ledger rows after each wallet's latest snapshot (one query)."""
+    floor = Subquery(
+        WalletSnapshot.objects.filter(walletID=OuterRef("walletID"))
+        .order_by("-lastTransactionID")
+        .values("lastTransactionID")[:1]
+    )
+    rows = (
+        Transaction.objects.filter(walletID_id__in=wallet_ids)
+        .annotate(snapshot_floor=Coalesce(floor, Value(0)))
+        .filter(transactionID__gt=F("snapshot_floor"))
+        .order_by()
+        .values("walletID")
+        .annotate(
+            balance_delta=Coalesce(Sum(BALANCE_EFFECT), Value(ZERO), output_field=_MONEY),
+            pending_delta=Coalesce(Sum(PENDING_EFFECT), Value(ZERO), output_field=_MONEY),
+            rows=Count("transactionID"),
+            last_id=Max("transactionID"),
+            last_created=Max("createdAt"),
+        )
+    )
+    return {row["walletID"]: row for row in rows}
+
+
+def ledger_balances(wallet_ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Ledger-derived balances for a batch of wallets: latest snapshot plus tail.
+    Returns {wallet_id: {balance, pending, last_id, last_created, transaction_count}}.
+    """
+    snapshots = _latest_snapshots(wallet_ids)
+    tails = _tail_totals(wallet_ids)
+    result = {}
+    for wallet_id in wallet_ids:
+        snapshot = snapshots.get(wallet_id)
+        tail = tails.get(wallet_id, {})
+        result[wallet_id] = {
+            "balance": (snapshot.balance if snapshot else ZERO) + tail.get("balance_delta", ZERO),
+            "pending": (snapshot.pendingEarnings if snapshot else ZERO) + tail.get("pending_delta", ZERO),
+            "last_id": tail.get("last_id") or (snapshot.lastTransactionID if snapshot else None),
+            "last_created": tail.get("last_created") or (snapshot.asOf if snapshot else None),
+            "transaction_count": (snapshot.transactionCount if snapshot else 0) + tail.get("rows", 0),
+            "tail_rows": tail.get("rows", 0),
+        }
+    return result
+
+
+def _iter_wallet_batches(batch_size: int, fields: Sequence[str]) -> Iterator[List[Dict[str, Any]]]:
+    last_id = 0
+    while True:
+        batch = list(
+            Wallet.objects.filter(walletID__gt=last_id).order_by("walletID").values(*fields)[:batch_size]
+        )
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]["walletID"]
+
+
+def take_snapshots(
+    batch_size: int = WALLET_BATCH_SIZE,
+    min_new_transactions: int = SNAPSHOT_MIN_NEW_TRANSACTIONS,
+) -> Dict[str, int]:
+    """Snapshot every wallet with at least `min_new_transactions` rows since its last snapshot."""
+    summary = {"wallets_scanned": 0, "snapshots_created": 0}
+    for batch in _iter_wallet_batches(batch_size, ["walletID"]):
+        wallet_ids = [row["walletID"] for row in batch]
+        summary["wallets_scanned"] += len(wallet_ids)
+        snapshots = [
+            WalletSnapshot(
+                walletID_id=wallet_id,
+                lastTransactionID=totals["last_id"],
+                asOf=totals["last_created"],
+                balance=totals["balance"],
+                pendingEarnings=totals["pending"],
+                transactionCount=totals["transaction_count"],
+            )
+            for wallet_id, totals in ledger_balances(wallet_ids).items()
+            if totals["tail_rows"] and totals["tail_rows"] >= min_new_transactions
+        ]
+        WalletSnapshot.objects.bulk_create(snapshots, ignore_conflicts=True)
+        summary["snapshots_created"] += len(snapshots)
+    return summary
+
+
+# =============================================================================
+# BALANCE-AT-TIME AND STATEMENTS
+# =============================================================================
+
+
+def balance_at(wallet_id: int, moment: datetime, inclusive: bool = True) -> Dict[str, Decimal]:
+    """
+    Ledger balance / pendingEarnings over every row created at (inclusive) or
+    strictly before `moment`.
+    """
+    before = "lte" if inclusive else "lt"
+    snapshot = (
+        WalletSnapshot.objects.filter(walletID_id=wallet_id, **{f"asOf__{before}": moment})
+        .order_by("-lastTransactionID")
+        .first()
+    )
+    tail = Transaction.objects.filter(walletID_id=wallet_id, **{f"createdAt__{before}": moment})
+    if snapshot:
+        tail = tail.filter(transactionID__gt=snapshot.lastTransactionID)
+    totals = tail.aggregate(
+        balance_delta=Coalesce(Sum(BALANCE_EFFECT), Value(ZERO), output_field=_MONEY),
+        pending_delta=Coalesce(Sum(PENDING_EFFECT), Value(ZERO), output_field=_MONEY),
+    )
+    return {
+        "balance": (snapshot.balance if snapshot else ZERO) + totals["balance_delta"],
+        "pending_earnings": (snapshot.pendingEarnings if snapshot else ZERO) + totals["pending_delta"],
+    }
+
+
+def get_wallet_statement(
+    wallet_id: int,
+    date_from: datetime,
+    date_to: datetime,
+    limit: int = STATEMENT_MAX_ROWS,
+) -> Dict[str, Any]:
+    """
+    Statement for [date_from, date_to]: opening balance from snapshot + tail,
+    then each row with its ledger effect and running balance.
+    """
+    limit = max(1, min(int(limit or STATEMENT_MAX_ROWS), STATEMENT_MAX_ROWS))
+    opening = balance_at(wallet_id, date_from, inclusive=False)["balance"]
+
+    rows = list(
+        Transaction.objects.filter(
+            walletID_id=wallet_id, createdAt__gte=date_from, createdAt__lte=date_to
+        )
+        .order_by("transactionID")
+        .only(
+            "transactionID", "transactionType", "status", "amount", "balanceAfter",
+            "paymentMethod", "description", "referenceNumber", "createdAt",
+        )[: limit + 1]
+    )
+    truncated = len(rows) > limit
+    rows = rows[:limit]
+
+    running = opening
+    credits = debits = ZERO
+    entries = []
+    for txn in rows:
+        delta, _ = balance_effect(txn)
+        running += delta
+        if delta > 0:
+            credits += delta
+        else:
+            debits -= delta
+        entries.append({
+            "transaction_id": txn.transactionID,
+            "type": txn.transactionType,
+            "status": txn.status,
+            "amount": float(txn.amount),
+            "effect": float(delta),
+            "running_balance": float(running),
+            "recorded_balance_after": float(txn.balanceAfter),
+            "description": txn.description,
+            "reference_number": txn.referenceNumber,
+            "created_at": txn.createdAt.isoformat(),
+        })
+
+    return {
+        "wallet_id": wallet_id,
+        "date_from": date_from.isoformat(),
+        "date_to": date_to.isoformat(),
+        "opening_balance": float(opening),
+        "closing_balance": float(running),
+        "total_credits": float(credits),
+        "total_debits": float(debits),
+        "transactions": entries,
+        "truncated": truncated,
+    }
+
+
+# =============================================================================
+# TRANSACTION HISTORY (KEYSET)
+# =============================================================================
+
+
+def get_transaction_history(
+    wallet_id: int,
+    cursor: Optional[str] = None,
+    limit: int = HISTORY_DEFAULT_LIMIT,
+    transaction_type: Optional[str] = None,
+    compact: bool = False,
+) -> Tuple[List[Transaction], Dict[str, Any]]:
+    """
+    One page of a wallet's history, newest first, continuing from `cursor`.
+    No COUNT and no OFFSET: each page is an index range scan on
+    (walletID, -createdAt), so deep pages cost the same as the first.
+
+    Every row gets `running_balance`, the wallet balance right after it:
+    - unfiltered: derived from the ledger. The first page starts from
+      ledger_balances() (snapshot + tail) and walks back with
+      balance_effect(); the cursor carries the balance for the next page.
+    - filtered by transaction_type: the other rows are not on the page, so
+      the recorded balanceAfter is used.
+
+    Returns (rows, meta) with meta = {next_cursor, has_next, running_balance_source}.
+    Raises ValueError for an invalid cursor.
+    """
+    limit = max(1, min(int(limit or HISTORY_DEFAULT_LIMIT), HISTORY_MAX_LIMIT))
+    queryset = Transaction.objects.filter(walletID_id=wallet_id)
+    if transaction_type:
+        queryset = queryset.filter(transactionType=transaction_type)
+    if compact:
+        queryset = queryset.only(*HISTORY_COMPACT_FIELDS)
+    else:
+        queryset = queryset.select_related("relatedJobPosting")
+
+    ledger = not transaction_type
+    running = None
+    page_cursor = None
+    if cursor:
+        values = decode_cursor(cursor, len(HISTORY_ORDERING) + 1)
+        page_cursor = encode_cursor(values[:-1])
+        if ledger:
+            # A cursor from a filtered listing carries no balance
+            if not isinstance(values[-1], str):
+                raise ValueError("Invalid cursor")
+            try:
+                running = Decimal(values[-1])
+            except ArithmeticError:
+                raise ValueError("Invalid cursor")
+
+    rows, next_page_cursor, has_next = keyset_page(queryset, HISTORY_ORDERING, page_cursor, limit)
+
+    if ledger and running is None and rows:
+        running = ledger_balances([wallet_id])[wallet_id]["balance"]
+    for txn in rows:
+        if ledger:
+            txn.running_balance = running
+            running -= balance_effect(txn)[0]
+        else:
+            txn.running_balance = txn.balanceAfter
+
+    next_cursor = None
+    if next_page_cursor:
+        carried = str(running) if ledger else None
+        next_cursor = encode_cursor([*decode_cursor(next_page_cursor, len(HISTORY_ORDERING)), carried])
+    return rows, {
+        "next_cursor": next_cursor,
+        "has_next": has_next,
+        "running_balance_source": "ledger" if ledger else "recorded",
+    }
+
+
+# =============================================================================
+# CONSISTENCY CHECK
+# =============================================================================
+
+
+def iter_drift(
+    batch_size: int = WALLET_BATCH_SIZE,
+    tolerance: Decimal = ZERO,
+    stats: Optional[Dict[str, int]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream every wallet once and yield those whose stored balances disagree
+    with the ledger (or whose reserved amount exceeds the balance).
+    `stats["wallets_checked"]` is incremented as batches are read.
+    """
+    fields = ["walletID", "accountFK_id", "balance", "pendingEarnings", "reservedBalance"]
+    for batch in _iter_wallet_batches(batch_size, fields):
+        if stats is not None:
+            stats["wallets_checked"] = stats.get("wallets_checked", 0) + len(batch)
+        ledger = ledger_balances([row["walletID"] for row in batch])
+        for row in batch:
+            expected = ledger[row["walletID"]]
+            balance_drift = row["balance"] - expected["balance"]
+            pending_drift = row["pendingEarnings"] - expected["pending"]
+            issues = []
+            if abs(balance_drift) > tolerance:
+                issues.append("balance_drift")
+            if abs(pending_drift) > tolerance:
+                issues.append("pending_earnings_drift")
+            if row["reservedBalance"] > row["balance"]:
+                issues.append("reserved_exceeds_balance")
+            if issues:
+                yield {
+                    "wallet_id": row["walletID"],
+                    "account_id": row["accountFK_id"],
+                    "issues": issues,
+                    "balance": row["balance"],
+                    "ledger_balance": expected["balance"],
+                    "balance_drift": balance_drift,
+                    "pending_earnings": row["pendingEarnings"],
+                    "ledger_pending_earnings": expected["pending"],
+                    "pending_drift": pending_drift,
+                    "reserved_balance": row["reservedBalance"],
+                    "last_transaction_id": expected["last_id"],
+                }
+
+
+def check_consistency(
+    batch_size: int = WALLET_BATCH_SIZE,
+    tolerance: Decimal = ZERO,
+    max_reported: int = 200,
+) -> Dict[str, Any]:
+    """Summary of iter_drift() over all wallets."""
+    started = time.monotonic()
+    drifted: List[Dict[str, Any]] = []
+    stats = {"wallets_checked": 0}
+    drift_count = 0
+    net_drift = ZERO
+    for entry in iter_drift(batch_size, tolerance, stats):
+        drift_count += 1
+        net_drift += entry["balance_drift"]
+        if len(drifted) < max_reported:
+            drifted.append(entry)
+    if drift_count:
+        logger.warning(
+            "Wallet ledger check: %s of %s wallets drifted", drift_count, stats["wallets_checked"]
+        )
+    return {
+        "wallets_checked": stats["wallets_checked"],
+        "drifted_wallets": drift_count,
+        "net_balance_drift": net_drift,
+        "drifted": drifted,
+        "duration_ms": round((time.monotonic() - started) * 1000, 1),
+    }
@@ -0,0 +1,491 @@
+"""
+Location Service
+
+GPS pings and nearby-worker discovery.
+
+- A ping is staged, not saved: the latest coordinates per profile go into a
+  pending buffer and (for workers) into a geo index. flush_pending() writes
+  the buffer to Profile with one bulk_update; it runs at most once per
+  LOCATION_FLUSH_INTERVAL seconds from the ping path, and from the
+  `location_index flush` command.
+- The geo index is a Redis GEO set when the cache is Redis, otherwise a
+  per-process grid of CELL_DEGREES cells. Both are rebuilt from Profile on
+  a cold start (rebuild_index()).
+- find_nearby_workers() asks the index for profile IDs within the radius,
+  then hydrates them with one WorkerProfile query (specialization filter in
+  SQL) and one prefetch. If Redis is unreachable it falls back to a
+  bounding-box query on Profile.
+"""
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+logger = logging.getLogger(__name__)
+
+GEO_KEY = "iayos:geo:workers"
+PENDING_KEY = "iayos:geo:pending"
+PROFILE_META_KEY = "cache:location:profile:{account_id}"
+PROFILE_META_TIMEOUT = 60 * 60
+FLUSH_LOCK_KEY = "cache:location:flush"
+REBUILD_LOCK_KEY = "cache:location:rebuild"
+FLUSH_BATCH_SIZE = 500
+CELL_DEGREES = 0.1  # ~11 km grid cells for the in-process index
+EARTH_RADIUS_KM = 6371.0
+COORD_PLACES = Decimal("0.00000001")
+
+# (profile_id, latitude, longitude, epoch seconds)
+Ping = Tuple[int, float, float, float]
+
+
+def flush_interval() -> int:
+    return int(getattr(settings, "LOCATION_FLUSH_INTERVAL", 15))
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in kilometers."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(min_lat, max_lat, min_lon, max_lon) enclosing the search circle."""
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+    lon_delta = min(180.0, lat_delta / cos_lat)
+    return latitude - lat_delta, latitude + lat_delta, longitude - lon_delta, longitude + lon_delta
+
+
+# =============================================================================
+# STORES
+# =============================================================================
+
+
+class RedisGeoStore:
+    """Pending pings in a Redis hash, worker positions in a Redis GEO set."""
+
+    def __init__(self, url: str):
+        import redis
+
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+
+    def stage(self, ping: Ping, index: bool) -> None:
+        profile_id, latitude, longitude, ts = ping
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hset(PENDING_KEY, profile_id, f"{latitude},{longitude},{ts}")
+        if index:
+            pipe.geoadd(GEO_KEY, (longitude, latitude, profile_id))
+        pipe.execute()
+
+    def restage(self, ping: Ping) -> None:
+        profile_id, latitude, longitude, ts = ping
+        self.client.hsetnx(PENDING_KEY, profile_id, f"{latitude},{longitude},{ts}")
+
+    def index(self, positions: Iterable[Tuple[int, float, float]]) -> None:
+        values = []
+        for profile_id, latitude, longitude in positions:
+            values.extend((longitude, latitude, profile_id))
+        if values:
+            self.client.geoadd(GEO_KEY, values)
+
+    def remove(self, profile_id: int) -> None:
+        self.client.zrem(GEO_KEY, profile_id)
+
+    def drain(self) -> List[Ping]:
+        # RENAME is atomic: pings arriving mid-flush land in a fresh hash
+        import redis
+
+        processing_key = f"{PENDING_KEY}:flushing:{uuid.uuid4().hex}"
+        try:
+            self.client.rename(PENDING_KEY, processing_key)
+        except redis.ResponseError:
+            return []  # nothing pending
+        pipe = self.client.pipeline()
+        pipe.hgetall(processing_key)
+        pipe.delete(processing_key)
+        raw, _ = pipe.execute()
+        pings = []
+        for profile_id, value in raw.items():
+            latitude, longitude, ts = value.split(",")
+            pings.append((int(profile_id), float(latitude), float(longitude), float(ts)))
+        return pings
+
+    def is_ready(self) -> bool:
+        return bool(self.client.exists(GEO_KEY))
+
+    def replace(self, positions: List[Tuple[int, float, float]]) -> None:
+        if not positions:
+            self.client.delete(GEO_KEY)
+            return
+        staging_key = f"{GEO_KEY}:rebuild:{uuid.uuid4().hex}"
+        for start in range(0, len(positions), FLUSH_BATCH_SIZE):
+            values = []
+            for profile_id, latitude, longitude in positions[start:start + FLUSH_BATCH_SIZE]:
+                values.extend((longitude, latitude, profile_id))
+            self.client.geoadd(staging_key, values)
+        self.client.rename(staging_key, GEO_KEY)
+
+    def search(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[int, float, float, float]]:
+        """[(profile_id, distance_km, latitude, longitude)] nearest first."""
+        hits = self.client.georadius(
+            GEO_KEY, longitude, latitude, radius_km, unit="km",
+            withdist=True, withcoord=True, sort="ASC",
+        )
+        return [
+            (int(member), float(distance), float(coord[1]), float(coord[0]))
+            for member, distance, coord in hits
+        ]
+
+
+class LocalGridStore:
+    """Per-process fallback: a dict buffer and a lat/lon grid index."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Ping] = {}
+        self._positions: Dict[int, Tuple[float, float]] = {}
+        self._cells: Dict[Tuple[int, int], set] = defaultdict(set)
+        self._ready = False
+
+    @staticmethod
+    def _cell(latitude: float, longitude: float) -> Tuple[int, int]:
+        return int(math.floor(latitude / CELL_DEGREES)), int(math.floor(longitude / CELL_DEGREES))
+
+    def _place(self, profile_id: int, latitude: float, longitude: float) -> None:
+        self._unplace(profile_id)
+        self._positions[profile_id] = (latitude, longitude)
+        self._cells[self._cell(latitude, longitude)].add(profile_id)
+
+    def _unplace(self, profile_id: int) -> None:
+        previous = self._positions.pop(profile_id, None)
+        if previous is not None:
+            self._cells[self._cell(*previous)].discard(profile_id)
+
+    def stage(self, ping: Ping, index: bool) -> None:
+        with self._lock:
+            self._pending[ping[0]] = ping
+            if index:
+                self._place(ping[0], ping[1], ping[2])
+
+    def restage(self, ping: Ping) -> None:
+        with self._lock:
+            self._pending.setdefault(ping[0], ping)
+
+    def index(self, positions: Iterable[Tuple[int, float, float]]) -> None:
+        with self._lock:
+            for profile_id, latitude, longitude in positions:
+                self._place(profile_id, latitude, longitude)
+
+    def remove(self, profile_id: int) -> None:
+        with self._lock:
+            self._unplace(profile_id)
+
+    def drain(self) -> List[Ping]:
+        with self._lock:
+            pings, self._pending = list(self._pending.values()), {}
+        return pings
+
+    def is_ready(self) -> bool:
+        return self._ready
+
+    def replace(self, positions: List[Tuple[int, float, float]]) -> None:
+        with self._lock:
+            self._positions.clear()
+            self._cells.clear()
+            for profile_id, latitude, longitude in positions:
+                self._place(profile_id, latitude, longitude)
+            self._ready = True
+
+    def search(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[int, float, float, float]]:
+        min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+        (lat_lo, lon_lo), (lat_hi, lon_hi) = self._cell(min_lat, min_lon), self._cell(max_lat, max_lon)
+        hits = []
+        with self._lock:
+            for lat_cell in range(lat_lo, lat_hi + 1):
+                for lon_cell in range(lon_lo, lon_hi + 1):
+                    for profile_id in self._cells.get((lat_cell, lon_cell), ()):
+                        lat, lon = self._positions[profile_id]
+                        distance = haversine_km(latitude, longitude, lat, lon)
+                        if distance <= radius_km:
+                            hits.append((profile_id, distance, lat, lon))
+        hits.sort(key=lambda hit: hit[1])
+        return hits
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Redis GEO store when the default cache is Redis, else the in-process grid."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                backend = settings.CACHES["default"]["BACKEND"]
+                redis_url = getattr(settings, "REDIS_URL", None)
+                if backend.endswith("RedisCache") and redis_url and redis_url != "none":
+                    _store = RedisGeoStore(redis_url)
+                else:
+                    _store = LocalGridStore()
+    return _store
+
+
+# =============================================================================
+# PINGS
+# =============================================================================
+
+
+def _profile_meta(account_id: int) -> Optional[dict]:
+    key = PROFILE_META_KEY.format(account_id=account_id)
+    meta = cache.get(key)
+    if meta is None:
+        from .models import Profile
+
+        meta = (
+            Profile.objects.filter(accountFK_id=account_id)
+            .values("profileID", "profileType", "location_sharing_enabled")
+            .first()
+        )
+        if meta is None:
+            return None
+        cache.set(key, meta, PROFILE_META_TIMEOUT)
+    return meta
+
+
+def forget_profile_meta(account_id: int) -> None:
+    cache.delete(PROFILE_META_KEY.format(account_id=account_id))
+
+
+def record_ping(account_id: int, latitude: float, longitude: float) -> dict:
+    """
+    Stage a GPS ping. The Profile row is written by the next flush, except
+    that the first ping after sharing was off enables sharing immediately.
+    """
+    from .models import Profile
+
+    meta = _profile_meta(account_id)
+    if meta is None:
+        raise ValueError("Profile not found")
+
+    now = time.time()
+    profile_id = meta["profileID"]
+    if not meta["location_sharing_enabled"]:
+        Profile.objects.filter(pk=profile_id).update(location_sharing_enabled=True)
+        forget_profile_meta(account_id)
+
+    ping = (profile_id, float(latitude), float(longitude), now)
+    try:
+        get_store().stage(ping, index=meta["profileType"] == Profile.ProfileType.WORKER)
+    except Exception as e:
+        # Index unavailable: write through so the ping is not lost
+        logger.warning("Location store unavailable, writing ping directly: %s", e)
+        _write_pings([ping])
+    else:
+        if cache.add(FLUSH_LOCK_KEY, 1, flush_interval()):
+            flush_pending()
+
+    return {
+        "profile_id": profile_id,
+        "latitude": ping[1],
+        "longitude": ping[2],
+        "location_updated_at": datetime.fromtimestamp(now, tz=dt_timezone.utc).isoformat(),
+        "location_sharing_enabled": True,
+        "message": "Location updated successfully",
+    }
+
+
+def _write_pings(pings: List[Ping]) -> int:
+    from .models import Profile
+
+    profiles = [
+        Profile(
+            profileID=profile_id,
+            latitude=Decimal(str(latitude)).quantize(COORD_PLACES),
+            longitude=Decimal(str(longitude)).quantize(COORD_PLACES),
+            location_updated_at=datetime.fromtimestamp(ts, tz=dt_timezone.utc),
+        )
+        for profile_id, latitude, longitude, ts in pings
+    ]
+    return Profile.objects.bulk_update(
+        profiles, ["latitude", "longitude", "location_updated_at"], batch_size=FLUSH_BATCH_SIZE
+    )
+
+
+def flush_pending() -> int:
+    """Write every staged ping to Profile in one bulk_update. Returns rows written."""
+    try:
+        pings = get_store().drain()
+    except Exception as e:
+        logger.warning("Could not drain pending locations: %s", e)
+        return 0
+    if not pings:
+        return 0
+    try:
+        written = _write_pings(pings)
+    except Exception:
+        # Put them back so the next flush retries (newer pings win on restage)
+        store = get_store()
+        for ping in pings:
+            store.restage(ping)
+        raise
+    logger.info("Flushed %s location ping(s)", written)
+    return written
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+
+def _shared_worker_profiles():
+    from .models import Profile
+
+    return Profile.objects.filter(
+        profileType=Profile.ProfileType.WORKER,
+        location_sharing_enabled=True,
+        latitude__isnull=False,
+        longitude__isnull=False,
+    )
+
+
+def rebuild_index() -> int:
+    """Reload the geo index from Profile. Returns the number of indexed workers."""
+    positions = [
+        (profile_id, float(latitude), float(longitude))
+        for profile_id, latitude, longitude in _shared_worker_profiles()
+        .values_list("profileID", "latitude", "longitude")
+        .iterator(chunk_size=FLUSH_BATCH_SIZE)
+    ]
+    get_store().replace(positions)
+    return len(positions)
+
+
+def sync_sharing(profile) -> None:
+    """Keep the index in step with a location-sharing toggle."""
+    from .models import Profile
+
+    forget_profile_meta(profile.accountFK_id)
+    try:
+        store = get_store()
+        if not profile.location_sharing_enabled:
+            store.remove(profile.profileID)
+        elif (
+            profile.profileType == Profile.ProfileType.WORKER
+            and profile.latitude is not None
+            and profile.longitude is not None
+        ):
+            store.index([(profile.profileID, float(profile.latitude), float(profile.longitude))])
+    except Exception as e:
+        logger.warning("Could not update location index for profile %s: %s", profile.profileID, e)
+
+
+# =============================================================================
+# SEARCH
+# =============================================================================
+
+
+def _search_db(latitude: float, longitude: float, radius_km: float) -> List[Tuple[int, float, float, float]]:
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    hits = []
+    rows = _shared_worker_profiles().filter(
+        latitude__range=(min_lat, max_lat),
+        longitude__range=(min_lon, max_lon),
+    ).values_list("profileID", "latitude", "longitude")
+    for profile_id, lat, lon in rows:
+        distance = haversine_km(latitude, longitude, float(lat), float(lon))
+        if distance <= radius_km:
+            hits.append((profile_id, distance, float(lat), float(lon)))
+    hits.sort(key=lambda hit: hit[1])
+    return hits
+
+
+def _search_index(latitude: float, longitude: float, radius_km: float) -> List[Tuple[int, float, float, float]]:
+    try:
+        store = get_store()
+        if not store.is_ready():
+            if not cache.add(REBUILD_LOCK_KEY, 1, 60):
+                return _search_db(latitude, longitude, radius_km)
+            try:
+                rebuild_index()
+            finally:
+                cache.delete(REBUILD_LOCK_KEY)
+        return store.search(latitude, longitude, radius_km)
+    except Exception as e:
+        logger.warning("Location index search failed, using database: %s", e)
+        return _search_db(latitude, longitude, radius_km)
+
+
+def find_nearby_workers(
+    latitude: float, longitude: float, radius_km: float = 10.0, specialization_id: int = None
+) -> dict:
+    """Workers within radius_km, nearest first, optionally with a given specialization."""
+    from .models import WorkerProfile, workerSpecialization
+
+    hits = _search_index(latitude, longitude, radius_km)
+    by_profile = {profile_id: (distance, lat, lon) for profile_id, distance, lat, lon in hits}
+
+    workers = (
+        WorkerProfile.objects.filter(
+            profileID_id__in=list(by_profile),
+            profileID__location_sharing_enabled=True,
+        )
+        .select_related("profileID")
+        .prefetch_related(
+            Prefetch(
+                "workerspecialization_set",
+                queryset=workerSpecialization.objects.select_related("specializationID"),
+            )
+        )
+    )
+    if specialization_id:
+        workers = workers.filter(workerspecialization__specializationID_id=specialization_id).distinct()
+
+    nearby_workers = []
+    for worker_profile in workers if by_profile else ():
+        profile = worker_profile.profileID
+        distance, lat, lon = by_profile[profile.profileID]
+        nearby_workers.append({
+            "profile_id": profile.profileID,
+            "worker_id": profile.profileID,
+            "first_name": profile.firstName,
+            "last_name": profile.lastName,
+            "profile_img": profile.profileImg if profile.profileImg else None,
+            "latitude": lat,
+            "longitude": lon,
+            "distance_km": round(distance, 2),
+            "availability_status": worker_profile.availability_status,
+            "specializations": [
+                {
+                    "id": ws.specializationID.specializationID,
+                    "name": ws.specializationID.specializationName,
+                    "experience_years": ws.experienceYears,
+                    "certification": ws.certification,
+                }
+                for ws in worker_profile.workerspecialization_set.all()
+            ],
+        })
+
+    nearby_workers.sort(key=lambda worker: worker["distance_km"])
+    return {
+        "workers": nearby_workers,
+        "count": len(nearby_workers),
+        "search_location": {
+            "latitude": latitude,
+            "longitude": longitude,
+            "radius_km": radius_km,
+        },
+    }
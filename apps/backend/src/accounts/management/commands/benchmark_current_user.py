@@ -0,0 +1,96 @@
+"""
+Benchmark the cached /me payload (fetch_currentUser).
+
+Creates a worker account with skills and certifications, then prints JSON
+with DB queries and median latency per call for:
+
+- cold:        version bumped and local LRU cleared (full rebuild)
+- warm_redis:  local LRU cleared, payload served from the shared cache
+- warm_local:  served from the in-process LRU
+
+The benchmark account is deleted afterwards.
+
+Usage:
+    python manage.py benchmark_current_user
+    python manage.py benchmark_current_user --skills 8 --repeat 200
+"""
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from accounts.current_user_cache import clear_local, invalidate_current_user
+from accounts.models import (
+    Accounts,
+    Profile,
+    Specializations,
+    WorkerCertification,
+    WorkerProfile,
+    workerSpecialization,
+)
+from accounts.services import fetch_currentUser
+
+EMAIL = "bench-me@benchmark.local"
+PROFILE_TYPE = "WORKER"
+
+
+class Command(BaseCommand):
+    help = "Compare DB queries and latency of /me on cold vs warm cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--skills", type=int, default=5, help="Skills (each with one certification).")
+        parser.add_argument("--repeat", type=int, default=50, help="Calls per scenario.")
+
+    def handle(self, *args, **options):
+        Accounts.objects.filter(email=EMAIL).delete()
+        account = Accounts.objects.create_user(email=EMAIL, password="benchmark-pass")
+        specializations = []
+        try:
+            profile = Profile.objects.create(
+                accountFK=account, firstName="Bench", lastName="Worker", profileType=PROFILE_TYPE
+            )
+            worker = WorkerProfile.objects.create(profileID=profile)
+            for index in range(max(0, options["skills"])):
+                specialization = Specializations.objects.create(
+                    specializationName=f"Bench skill {index}", is_custom=True, created_by_worker=account
+                )
+                specializations.append(specialization.pk)
+                skill = workerSpecialization.objects.create(
+                    workerID=worker, specializationID=specialization, experienceYears=index, certification=""
+                )
+                WorkerCertification.objects.create(workerID=worker, specializationID=skill, name=f"Cert {index}")
+
+            def cold():
+                invalidate_current_user(account.accountID)
+                clear_local()
+
+            results = [
+                self._run("cold", account.accountID, options["repeat"], before=cold),
+                self._run("warm_redis", account.accountID, options["repeat"], before=clear_local),
+                self._run("warm_local", account.accountID, options["repeat"]),
+            ]
+        finally:
+            Accounts.objects.filter(accountID=account.accountID).delete()
+            Specializations.objects.filter(pk__in=specializations).delete()
+
+        self.stdout.write(json.dumps({"skills": options["skills"], "results": results}, indent=2))
+
+    def _run(self, name, account_id, repeat, before=None):
+        fetch_currentUser(account_id, PROFILE_TYPE)  # prime
+        samples, queries = [], 0
+        for _ in range(max(1, repeat)):
+            if before:
+                before()
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                fetch_currentUser(account_id, PROFILE_TYPE)
+                samples.append((time.perf_counter() - started) * 1000)
+            queries += len(captured)
+        return {
+            "scenario": name,
+            "queries_per_call": round(queries / max(1, repeat), 2),
+            "median_ms": round(statistics.median(samples), 3),
+        }
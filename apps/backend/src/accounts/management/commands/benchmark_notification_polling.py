@@ -0,0 +1,125 @@
+"""
+Load-test notification reads: interval polling vs WebSocket push + since_id sync.
+
+Simulates clients against the real database (no sleeping; time is simulated)
+and prints JSON with read-side DB queries per minute for each strategy:
+
+- poll: every client lists /notifications and /notifications/unread-count
+  (uncached COUNT) every --poll-interval seconds.
+- push: notifications arrive over the socket; each client only calls
+  /notifications/sync (which includes the cached unread count) when it
+  reconnects, every --reconnect-minutes.
+
+Both strategies see the same notification write rate. Benchmark accounts are
+created up front and deleted afterwards.
+
+Usage:
+    python manage.py benchmark_notification_polling
+    python manage.py benchmark_notification_polling --clients 200 --minutes 10 --poll-interval 10
+"""
+import json
+import random
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import Accounts, Notification
+from accounts.notification_feed import get_notifications_since, visible_notifications
+from accounts.services import get_user_notifications
+
+EMAIL_TEMPLATE = "bench-notif-{index}@benchmark.local"
+PROFILE_TYPE = "CLIENT"
+
+
+class Command(BaseCommand):
+    help = "Compare DB queries per minute for notification polling vs push + since_id sync"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clients", type=int, default=50, help="Simulated connected clients.")
+        parser.add_argument("--minutes", type=int, default=5, help="Simulated minutes per strategy.")
+        parser.add_argument("--poll-interval", type=int, default=15, help="Seconds between polls.")
+        parser.add_argument(
+            "--notifications-per-minute", type=int, default=20, help="Notifications created per minute."
+        )
+        parser.add_argument(
+            "--reconnect-minutes", type=int, default=5, help="push: minutes between socket reconnects."
+        )
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        clients = max(1, options["clients"])
+        minutes = max(1, options["minutes"])
+        rng = random.Random(options["seed"])
+
+        accounts = [
+            Accounts.objects.create_user(email=EMAIL_TEMPLATE.format(index=index), password="benchmark-pass")
+            for index in range(clients)
+        ]
+        account_ids = [account.accountID for account in accounts]
+        try:
+            results = [
+                self._run_poll(account_ids, minutes, rng, options),
+                self._run_push(account_ids, minutes, rng, options),
+            ]
+        finally:
+            Accounts.objects.filter(accountID__in=account_ids).delete()
+
+        poll, push = results
+        self.stdout.write(json.dumps({
+            "clients": clients,
+            "minutes": minutes,
+            "results": results,
+            "reduction_pct": round(
+                100 * (1 - push["read_queries_per_minute"] / max(poll["read_queries_per_minute"], 1)), 2
+            ),
+        }, indent=2))
+
+    def _create_notifications(self, account_ids, rng, count):
+        for _ in range(count):
+            Notification.objects.create(
+                accountFK_id=rng.choice(account_ids),
+                notificationType=Notification.NotificationType.SYSTEM,
+                title="Benchmark",
+                message="Simulated notification",
+                profile_type=PROFILE_TYPE,
+            )
+
+    def _run_poll(self, account_ids, minutes, rng, options):
+        polls_per_minute = max(1, 60 // max(1, options["poll_interval"]))
+        read_queries = 0
+        for _ in range(minutes):
+            self._create_notifications(account_ids, rng, options["notifications_per_minute"])
+            with CaptureQueriesContext(connection) as captured:
+                for _ in range(polls_per_minute):
+                    for account_id in account_ids:
+                        get_user_notifications(account_id, 50, False, PROFILE_TYPE)
+                        visible_notifications(account_id, PROFILE_TYPE).filter(isRead=False).count()
+            read_queries += len(captured)
+        return {
+            "strategy": "poll",
+            "read_queries": read_queries,
+            "read_queries_per_minute": round(read_queries / minutes, 2),
+        }
+
+    def _run_push(self, account_ids, minutes, rng, options):
+        reconnect_minutes = max(1, options["reconnect_minutes"])
+        last_seen = {account_id: 0 for account_id in account_ids}
+        read_queries = 0
+        for minute in range(minutes):
+            self._create_notifications(account_ids, rng, options["notifications_per_minute"])
+            with CaptureQueriesContext(connection) as captured:
+                for index, account_id in enumerate(account_ids):
+                    # Reconnects are spread evenly across the interval
+                    if (minute + index) % reconnect_minutes:
+                        continue
+                    page = {"has_more": True}
+                    while page["has_more"]:
+                        page = get_notifications_since(account_id, last_seen[account_id], PROFILE_TYPE)
+                        last_seen[account_id] = page["next_since_id"]
+            read_queries += len(captured)
+        return {
+            "strategy": "push",
+            "read_queries": read_queries,
+            "read_queries_per_minute": round(read_queries / minutes, 2),
+        }
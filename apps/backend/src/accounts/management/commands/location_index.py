@@ -0,0 +1,33 @@
+"""
+Django Management Command: location_index
+
+Location ping buffer and nearby-worker geo index (accounts.location_service).
+
+Usage:
+    python manage.py location_index flush       # Write staged GPS pings to Profile
+    python manage.py location_index rebuild     # Reload the geo index from Profile
+
+Run `flush` every minute via cron so the last pings of idle devices reach the
+database; pings also trigger a flush themselves at most every
+LOCATION_FLUSH_INTERVAL seconds. Run `rebuild` after restoring Redis or bulk
+editing profiles.
+"""
+from django.core.management.base import BaseCommand
+
+from accounts.location_service import flush_pending, rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Flush staged location pings or rebuild the nearby-worker geo index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['flush', 'rebuild'])
+
+    def handle(self, *args, **options):
+        if options['action'] == 'flush':
+            written = flush_pending()
+            self.stdout.write(self.style.SUCCESS(f"Flushed {written} location ping(s)"))
+            return
+
+        indexed = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} worker location(s)"))
@@ -0,0 +1,59 @@
+"""
+Django Management Command: process_webhook_events
+
+Applies queued payment webhook events (accounts.webhook_inbox). Events are
+normally applied right after the webhook commits; this sweeper picks up
+anything left RECEIVED (e.g. the process died) and retries FAILED events.
+
+Usage:
+    python manage.py process_webhook_events                 # One sweep
+    python manage.py process_webhook_events --loop          # Run as a worker
+    python manage.py process_webhook_events --limit 500
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.webhook_inbox import MAX_ATTEMPTS, SWEEP_BATCH_SIZE, process_pending
+
+
+class Command(BaseCommand):
+    help = 'Apply queued payment webhook events (sweeps RECEIVED and retryable FAILED events)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=SWEEP_BATCH_SIZE,
+            help=f'Maximum events per sweep (default: {SWEEP_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=MAX_ATTEMPTS,
+            help=f'Stop retrying an event after this many attempts (default: {MAX_ATTEMPTS})',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep sweeping until interrupted',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='Seconds to sleep between sweeps that found nothing (with --loop)',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            summary = process_pending(limit=options['limit'], max_attempts=options['max_attempts'])
+            if summary['picked'] or not options['loop']:
+                self.stdout.write(
+                    f"picked={summary['picked']} processed={summary['processed']} "
+                    f"failed={summary['failed']} skipped={summary['skipped']}"
+                )
+            if not options['loop']:
+                break
+            if summary['picked'] < options['limit']:
+                time.sleep(options['interval'])
@@ -0,0 +1,55 @@
+"""
+Management command to rebuild the materialized AgencyStats table.
+
+Usage:
+    python manage.py rebuild_agency_stats
+    python manage.py rebuild_agency_stats --agency-id 12
+    python manage.py rebuild_agency_stats --check
+"""
+
+from django.core.management.base import BaseCommand
+
+from accounts.agency_stats_service import find_stale_agency_stats, rebuild_agency_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild AgencyStats (job/review counters used by agency browse/search)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--agency-id",
+            type=int,
+            default=0,
+            help="Optional single agency ID to rebuild.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report agencies whose stored stats differ from live aggregates.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Agencies aggregated per upsert batch.",
+        )
+
+    def handle(self, *args, **options):
+        agency_id = int(options.get("agency_id") or 0)
+        agency_ids = [agency_id] if agency_id > 0 else None
+
+        if options.get("check"):
+            mismatches = find_stale_agency_stats(agency_ids)
+            for entry in mismatches:
+                if entry["missing"]:
+                    self.stdout.write(f"agency#{entry['agency_id']}: missing stats row")
+                else:
+                    self.stdout.write(f"agency#{entry['agency_id']}: {entry['diff']}")
+            style = self.style.WARNING if mismatches else self.style.SUCCESS
+            self.stdout.write(style(f"AgencyStats check complete. stale={len(mismatches)}"))
+            return
+
+        written = rebuild_agency_stats(agency_ids, batch_size=max(1, options["batch_size"]))
+        self.stdout.write(
+            self.style.SUCCESS(f"AgencyStats rebuild complete. rows={written}")
+        )
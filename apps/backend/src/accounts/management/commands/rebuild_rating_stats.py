@@ -0,0 +1,46 @@
+"""
+Management command to rebuild the materialized RatingStats table.
+
+Usage:
+    python manage.py rebuild_rating_stats
+    python manage.py rebuild_rating_stats --check
+"""
+
+from django.core.management.base import BaseCommand
+
+from accounts.rating_stats_service import find_stale_rating_stats, rebuild_rating_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild RatingStats (per-reviewee rating histograms used by review stats)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report reviewees whose stored stats differ from live aggregates.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows per upsert batch.",
+        )
+
+    def handle(self, *args, **options):
+        if options.get("check"):
+            mismatches = find_stale_rating_stats()
+            for entry in mismatches:
+                label = f"{entry['scope'].lower()}#{entry['subject_id']}"
+                if entry["missing"]:
+                    self.stdout.write(f"{label}: missing stats row")
+                else:
+                    self.stdout.write(f"{label}: {entry['diff']}")
+            style = self.style.WARNING if mismatches else self.style.SUCCESS
+            self.stdout.write(style(f"RatingStats check complete. stale={len(mismatches)}"))
+            return
+
+        written = rebuild_rating_stats(batch_size=max(1, options["batch_size"]))
+        self.stdout.write(
+            self.style.SUCCESS(f"RatingStats rebuild complete. rows={written}")
+        )
@@ -0,0 +1,76 @@
+"""
+Django Management Command: replay_webhook_events
+
+Re-applies stored payment webhook events from the inbox. Handlers are
+idempotent against the ledger (already-settled transactions are skipped),
+so replaying a PROCESSED event is safe.
+
+Usage:
+    python manage.py replay_webhook_events                       # All FAILED events
+    python manage.py replay_webhook_events --id 12 --id 13       # Specific events (any status)
+    python manage.py replay_webhook_events --provider PAYMONGO --since 2026-01-31
+    python manage.py replay_webhook_events --status PROCESSED --since 2026-01-31 --dry-run
+"""
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from accounts.models import WebhookEvent
+from accounts.webhook_inbox import replay_events
+
+
+class Command(BaseCommand):
+    help = 'Replay stored payment webhook events (defaults to FAILED events)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--id', type=int, action='append', dest='ids', help='Inbox event ID (repeatable)')
+        parser.add_argument('--provider', choices=WebhookEvent.Provider.values)
+        parser.add_argument(
+            '--status',
+            choices=WebhookEvent.EventStatus.values + ['ANY'],
+            help='Event status to replay (default: FAILED, or ANY when --id is given)',
+        )
+        parser.add_argument('--since', help='Only events received on/after this date (YYYY-MM-DD)')
+        parser.add_argument('--limit', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help='List matching events without replaying')
+
+    def handle(self, *args, **options):
+        status = options['status'] or ('ANY' if options['ids'] else WebhookEvent.EventStatus.FAILED)
+        status = None if status == 'ANY' else status
+
+        since = None
+        if options['since']:
+            try:
+                since = timezone.make_aware(datetime.strptime(options['since'], '%Y-%m-%d'))
+            except ValueError:
+                raise CommandError('--since must be YYYY-MM-DD')
+
+        if options['dry_run']:
+            queryset = WebhookEvent.objects.all()
+            if options['ids']:
+                queryset = queryset.filter(pk__in=options['ids'])
+            if options['provider']:
+                queryset = queryset.filter(provider=options['provider'])
+            if status:
+                queryset = queryset.filter(status=status)
+            if since:
+                queryset = queryset.filter(receivedAt__gte=since)
+            for event in queryset.order_by('receivedAt')[:options['limit']]:
+                self.stdout.write(
+                    f"{event.webhookEventID} {event.provider} {event.eventID} "
+                    f"{event.status} attempts={event.attempts} {event.lastError[:80]}"
+                )
+            return
+
+        summary = replay_events(
+            event_ids=options['ids'],
+            provider=options['provider'],
+            status=status,
+            since=since,
+            limit=options['limit'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Replayed {summary['picked']} event(s): processed={summary['processed']} "
+            f"failed={summary['failed']} skipped={summary['skipped']}"
+        ))
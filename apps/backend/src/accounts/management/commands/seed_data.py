@@ -50,6 +50,10 @@ class Command(BaseCommand):
         elif locations_only:
             self.seed_locations(force)
 
+        # --force deletes via querysets, which skip the model hooks
+        from accounts.reference_data import bump_version
+        bump_version()
+
         self.stdout.write(self.style.SUCCESS('Seeding completed successfully!'))
 
     def seed_specializations(self, force=False):
@@ -0,0 +1,86 @@
+"""
+Django Management Command: wallet_ledger
+
+Wallet ledger maintenance (accounts.ledger_service).
+
+Usage:
+    python manage.py wallet_ledger snapshot                   # Snapshot wallets with >= 50 new rows
+    python manage.py wallet_ledger snapshot --min-new 1       # Snapshot every wallet with new rows
+    python manage.py wallet_ledger snapshot --rebuild         # Drop all snapshots first
+    python manage.py wallet_ledger check                      # Report wallets drifting from the ledger
+    python manage.py wallet_ledger check --tolerance 0.01 --max-reported 50
+
+Run `snapshot` nightly via cron and `check` after it; `check` exits non-zero
+when drift is found so cron/alerting can pick it up.
+"""
+from decimal import Decimal, InvalidOperation
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.ledger_service import (
+    SNAPSHOT_MIN_NEW_TRANSACTIONS,
+    WALLET_BATCH_SIZE,
+    check_consistency,
+    take_snapshots,
+)
+from accounts.models import WalletSnapshot
+
+
+class Command(BaseCommand):
+    help = 'Take wallet ledger snapshots or check wallet balances against the Transaction ledger'
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['snapshot', 'check'])
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=WALLET_BATCH_SIZE,
+            help=f'Wallets per batch (default: {WALLET_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--min-new',
+            type=int,
+            default=SNAPSHOT_MIN_NEW_TRANSACTIONS,
+            help=f'snapshot: minimum new transactions since the last snapshot (default: {SNAPSHOT_MIN_NEW_TRANSACTIONS})',
+        )
+        parser.add_argument('--rebuild', action='store_true', help='snapshot: delete all snapshots first')
+        parser.add_argument('--tolerance', default='0.00', help='check: ignore drift up to this amount')
+        parser.add_argument('--max-reported', type=int, default=100, help='check: wallets to list')
+
+    def handle(self, *args, **options):
+        if options['action'] == 'snapshot':
+            if options['rebuild']:
+                deleted, _ = WalletSnapshot.objects.all().delete()
+                self.stdout.write(f"Deleted {deleted} snapshot(s)")
+            summary = take_snapshots(
+                batch_size=options['batch_size'],
+                min_new_transactions=max(1, options['min_new']),
+            )
+            self.stdout.write(self.style.SUCCESS(
+                f"Scanned {summary['wallets_scanned']} wallet(s), created {summary['snapshots_created']} snapshot(s)"
+            ))
+            return
+
+        try:
+            tolerance = Decimal(options['tolerance'])
+        except InvalidOperation:
+            raise CommandError('--tolerance must be a decimal amount')
+
+        report = check_consistency(
+            batch_size=options['batch_size'],
+            tolerance=tolerance,
+            max_reported=options['max_reported'],
+        )
+        for entry in report['drifted']:
+            self.stdout.write(
+                f"wallet={entry['wallet_id']} account={entry['account_id']} {','.join(entry['issues'])} "
+                f"balance={entry['balance']} ledger={entry['ledger_balance']} drift={entry['balance_drift']} "
+                f"pending={entry['pending_earnings']} ledger_pending={entry['ledger_pending_earnings']}"
+            )
+        message = (
+            f"Checked {report['wallets_checked']} wallet(s) in {report['duration_ms']}ms: "
+            f"{report['drifted_wallets']} drifted, net balance drift ₱{report['net_balance_drift']}"
+        )
+        if report['drifted_wallets']:
+            raise CommandError(message)
+        self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,125 @@
+"""
+Add the materialized AgencyStats table and backfill it from existing jobs/reviews.
+
+Browse/search previously annotated Count/Avg across assigned_jobs and
+assigned_jobs__reviews for every agency on every request.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+import django.db.models.deletion
+
+
+def backfill_agency_stats(apps, schema_editor):
+    Agency = apps.get_model("accounts", "Agency")
+    AgencyStats = apps.get_model("accounts", "AgencyStats")
+    Job = apps.get_model("accounts", "Job")
+    JobReview = apps.get_model("accounts", "JobReview")
+    db_alias = schema_editor.connection.alias
+
+    job_rows = {
+        row["assignedAgencyFK_id"]: row
+        for row in Job.objects.using(db_alias)
+        .filter(assignedAgencyFK__isnull=False)
+        .values("assignedAgencyFK_id")
+        .annotate(
+            total=Count("jobID"),
+            completed=Count("jobID", filter=Q(status="COMPLETED")),
+            active=Count("jobID", filter=Q(status__in=["ACTIVE", "IN_PROGRESS"])),
+        )
+        .order_by()
+    }
+    review_rows = {
+        row["jobID__assignedAgencyFK_id"]: row
+        for row in JobReview.objects.using(db_alias)
+        .filter(jobID__assignedAgencyFK__isnull=False)
+        .values("jobID__assignedAgencyFK_id")
+        .annotate(count=Count("reviewID"), rating_sum=Sum("rating"))
+        .order_by()
+    }
+
+    rows = []
+    for agency_id in Agency.objects.using(db_alias).values_list("agencyId", flat=True):
+        jobs = job_rows.get(agency_id, {})
+        reviews = review_rows.get(agency_id, {})
+        review_count = reviews.get("count") or 0
+        rating_sum = reviews.get("rating_sum") or Decimal("0.00")
+        rows.append(
+            AgencyStats(
+                agencyID_id=agency_id,
+                totalJobs=jobs.get("total") or 0,
+                completedJobs=jobs.get("completed") or 0,
+                activeJobs=jobs.get("active") or 0,
+                reviewCount=review_count,
+                ratingSum=rating_sum,
+                averageRating=(
+                    (Decimal(rating_sum) / review_count).quantize(
+                        Decimal("0.01"), rounding=ROUND_HALF_UP
+                    )
+                    if review_count
+                    else None
+                ),
+            )
+        )
+
+    AgencyStats.objects.using(db_alias).bulk_create(rows, batch_size=500)
+    print(f"\n[0136_agency_stats] Backfilled {len(rows)} agency stats row(s).")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0135_daily_skip_day_per_person_targets"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AgencyStats",
+            fields=[
+                (
+                    "agencyID",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="accounts.agency",
+                    ),
+                ),
+                ("totalJobs", models.IntegerField(default=0)),
+                ("completedJobs", models.IntegerField(default=0)),
+                ("activeJobs", models.IntegerField(default=0)),
+                ("reviewCount", models.IntegerField(default=0)),
+                (
+                    "ratingSum",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0.00"), max_digits=12
+                    ),
+                ),
+                (
+                    "averageRating",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="ratingSum / reviewCount (NULL when the agency has no reviews)",
+                        max_digits=3,
+                        null=True,
+                    ),
+                ),
+                ("updatedAt", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "agency_stats",
+                "indexes": [
+                    models.Index(
+                        fields=["-averageRating"], name="agency_stats_rating_idx"
+                    ),
+                    models.Index(
+                        fields=["-completedJobs"], name="agency_stats_completed_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_agency_stats, migrations.RunPython.noop),
+    ]
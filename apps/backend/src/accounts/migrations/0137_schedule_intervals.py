@@ -0,0 +1,190 @@
+"""
+Add the ScheduleInterval availability index and backfill it from current
+direct/team worker and agency employee assignments.
+
+Schedule-conflict checks previously loaded every active job/assignment for a
+person and compared date windows in Python on each apply/assign request.
+"""
+from django.contrib.postgres.fields import DateRangeField
+from django.contrib.postgres.indexes import GistIndex
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+from django.db.backends.postgresql.psycopg_any import DateRange
+import django.db.models.deletion
+
+
+def backfill_schedule_intervals(apps, schema_editor):
+    Job = apps.get_model("accounts", "Job")
+    JobWorkerAssignment = apps.get_model("accounts", "JobWorkerAssignment")
+    JobEmployeeAssignment = apps.get_model("accounts", "JobEmployeeAssignment")
+    ScheduleInterval = apps.get_model("accounts", "ScheduleInterval")
+    db_alias = schema_editor.connection.alias
+
+    worker_statuses = ["ACTIVE", "IN_PROGRESS"]
+    employee_statuses = ["ASSIGNED", "IN_PROGRESS"]
+
+    jobs = {
+        job["jobID"]: job
+        for job in Job.objects.using(db_alias)
+        .filter(status__in=worker_statuses + employee_statuses)
+        .values(
+            "jobID",
+            "status",
+            "preferredStartDate",
+            "scheduled_end_date",
+            "shift_type",
+            "assignedWorkerID_id",
+            "assignedEmployeeID_id",
+        )
+    }
+
+    def window(job):
+        start = job["preferredStartDate"]
+        if not start:
+            return None
+        end = job["scheduled_end_date"] or start
+        return DateRange(start, max(start, end), "[]")
+
+    rows = []
+    for job in jobs.values():
+        if job["status"] in worker_statuses and job["assignedWorkerID_id"]:
+            rows.append(
+                ScheduleInterval(
+                    jobID_id=job["jobID"],
+                    source="DIRECT_WORKER",
+                    workerID_id=job["assignedWorkerID_id"],
+                    window=window(job),
+                    shift=job["shift_type"],
+                )
+            )
+        if job["status"] in employee_statuses and job["assignedEmployeeID_id"]:
+            rows.append(
+                ScheduleInterval(
+                    jobID_id=job["jobID"],
+                    source="LEGACY_EMPLOYEE",
+                    employeeID_id=job["assignedEmployeeID_id"],
+                    window=window(job),
+                    shift=job["shift_type"],
+                )
+            )
+
+    for job_id, worker_id, shift in (
+        JobWorkerAssignment.objects.using(db_alias)
+        .filter(assignment_status="ACTIVE", jobID__status__in=worker_statuses)
+        .values_list("jobID_id", "workerID_id", "assigned_shift")
+    ):
+        rows.append(
+            ScheduleInterval(
+                jobID_id=job_id,
+                source="TEAM_WORKER",
+                workerID_id=worker_id,
+                window=window(jobs[job_id]),
+                shift=shift,
+            )
+        )
+
+    for job_id, employee_id in (
+        JobEmployeeAssignment.objects.using(db_alias)
+        .filter(status__in=employee_statuses, job__status__in=employee_statuses)
+        .values_list("job_id", "employee_id")
+    ):
+        rows.append(
+            ScheduleInterval(
+                jobID_id=job_id,
+                source="EMPLOYEE_ASSIGNMENT",
+                employeeID_id=employee_id,
+                window=window(jobs[job_id]),
+                shift=jobs[job_id]["shift_type"],
+            )
+        )
+
+    ScheduleInterval.objects.using(db_alias).bulk_create(rows, batch_size=1000)
+    print(f"\n[0137_schedule_intervals] Backfilled {len(rows)} schedule interval(s).")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0136_agency_stats"),
+        ("agency", "0012_alter_agencyemployee_email"),
+    ]
+
+    operations = [
+        # Lets GiST indexes combine the scalar person FK with the date range
+        BtreeGistExtension(),
+        migrations.CreateModel(
+            name="ScheduleInterval",
+            fields=[
+                ("intervalID", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "source",
+                    models.CharField(
+                        choices=[
+                            ("DIRECT_WORKER", "Job.assignedWorkerID"),
+                            ("TEAM_WORKER", "JobWorkerAssignment"),
+                            ("LEGACY_EMPLOYEE", "Job.assignedEmployeeID"),
+                            ("EMPLOYEE_ASSIGNMENT", "JobEmployeeAssignment"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "window",
+                    DateRangeField(
+                        blank=True,
+                        help_text="Inclusive [start, end] work dates; NULL when the job has no schedule",
+                        null=True,
+                    ),
+                ),
+                ("shift", models.CharField(blank=True, max_length=10, null=True)),
+                ("createdAt", models.DateTimeField(auto_now_add=True)),
+                (
+                    "employeeID",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="schedule_intervals",
+                        to="agency.agencyemployee",
+                    ),
+                ),
+                (
+                    "jobID",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="schedule_intervals",
+                        to="accounts.job",
+                    ),
+                ),
+                (
+                    "workerID",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="schedule_intervals",
+                        to="accounts.workerprofile",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "schedule_intervals",
+                "indexes": [
+                    models.Index(
+                        fields=["workerID", "jobID"], name="sched_iv_worker_job_idx"
+                    ),
+                    models.Index(
+                        fields=["employeeID", "jobID"], name="sched_iv_employee_job_idx"
+                    ),
+                    GistIndex(
+                        fields=["workerID", "window"], name="sched_iv_worker_window_gist"
+                    ),
+                    GistIndex(
+                        fields=["employeeID", "window"],
+                        name="sched_iv_employee_window_gist",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_schedule_intervals, migrations.RunPython.noop),
+    ]
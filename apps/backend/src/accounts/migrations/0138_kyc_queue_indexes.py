@@ -0,0 +1,26 @@
+"""
+Composite indexes for the paginated admin KYC queue (status filter plus
+keyset pagination on createdAt/kycID, newest first).
+"""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0137_schedule_intervals"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="kyc",
+            index=models.Index(
+                fields=["kyc_status", "-createdAt", "-kycID"],
+                name="kyc_status_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="kyc",
+            index=models.Index(fields=["-createdAt", "-kycID"], name="kyc_created_idx"),
+        ),
+    ]
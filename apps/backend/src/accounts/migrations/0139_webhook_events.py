@@ -0,0 +1,75 @@
+"""
+Payment webhook inbox: provider deliveries are persisted once per
+(provider, eventID) and applied asynchronously by accounts.webhook_inbox.
+"""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0138_kyc_queue_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WebhookEvent",
+            fields=[
+                ("webhookEventID", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "provider",
+                    models.CharField(
+                        choices=[
+                            ("XENDIT_INVOICE", "Xendit Invoice"),
+                            ("XENDIT_DISBURSEMENT", "Xendit Disbursement"),
+                            ("PAYMONGO", "PayMongo"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                (
+                    "eventID",
+                    models.CharField(
+                        help_text="Provider event ID (idempotency key)", max_length=255
+                    ),
+                ),
+                ("eventType", models.CharField(blank=True, default="", max_length=100)),
+                ("payload", models.JSONField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("RECEIVED", "Received"),
+                            ("PROCESSED", "Processed"),
+                            ("FAILED", "Failed"),
+                        ],
+                        default="RECEIVED",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.IntegerField(default=0)),
+                ("lastError", models.TextField(blank=True, default="")),
+                ("result", models.JSONField(blank=True, null=True)),
+                (
+                    "duplicateCount",
+                    models.IntegerField(
+                        default=0, help_text="Deliveries received after the first one"
+                    ),
+                ),
+                ("receivedAt", models.DateTimeField(auto_now_add=True)),
+                ("processedAt", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "webhook_events",
+                "ordering": ["receivedAt"],
+                "indexes": [
+                    models.Index(fields=["status", "receivedAt"], name="webhook_event_status_idx"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("provider", "eventID"), name="webhook_event_provider_event_uniq"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,58 @@
+"""
+Ledger-derived wallet balance snapshots (accounts.ledger_service), plus a
+(walletID, transactionID) index for scanning a wallet's ledger tail.
+"""
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0139_webhook_events"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WalletSnapshot",
+            fields=[
+                ("snapshotID", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "lastTransactionID",
+                    models.BigIntegerField(help_text="Highest transactionID folded into this snapshot"),
+                ),
+                ("asOf", models.DateTimeField(help_text="createdAt of lastTransactionID")),
+                ("balance", models.DecimalField(decimal_places=2, max_digits=12)),
+                ("pendingEarnings", models.DecimalField(decimal_places=2, max_digits=12)),
+                ("transactionCount", models.IntegerField(default=0)),
+                ("createdAt", models.DateTimeField(auto_now_add=True)),
+                (
+                    "walletID",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="snapshots",
+                        to="accounts.wallet",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "wallet_snapshots",
+                "indexes": [
+                    models.Index(
+                        fields=["walletID", "-lastTransactionID"], name="wallet_snapshot_latest_idx"
+                    ),
+                    models.Index(fields=["walletID", "-asOf"], name="wallet_snapshot_asof_idx"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("walletID", "lastTransactionID"),
+                        name="wallet_snapshot_wallet_txn_uniq",
+                    ),
+                ],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(fields=["walletID", "transactionID"], name="txn_wallet_id_idx"),
+        ),
+    ]
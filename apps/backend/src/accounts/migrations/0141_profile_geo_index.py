@@ -0,0 +1,21 @@
+"""
+Index for the nearby-worker bounding-box query (accounts.location_service).
+"""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0140_wallet_snapshots"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                fields=["profileType", "location_sharing_enabled", "latitude", "longitude"],
+                name="profile_geo_bbox_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,97 @@
+"""
+Add the materialized RatingStats table (per-reviewee rating histogram) and
+backfill it from existing ACTIVE reviews.
+
+Review stats previously ran an Avg, a count and five range counts per request.
+"""
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Q, Sum
+
+
+BUCKETS = {
+    "fiveStar": Q(rating__gte=4.5),
+    "fourStar": Q(rating__gte=3.5, rating__lt=4.5),
+    "threeStar": Q(rating__gte=2.5, rating__lt=3.5),
+    "twoStar": Q(rating__gte=1.5, rating__lt=2.5),
+    "oneStar": Q(rating__lt=1.5),
+}
+
+
+def backfill_rating_stats(apps, schema_editor):
+    JobReview = apps.get_model("accounts", "JobReview")
+    RatingStats = apps.get_model("accounts", "RatingStats")
+    db_alias = schema_editor.connection.alias
+
+    counters = {
+        "reviewCount": Count("reviewID"),
+        "ratingSum": Sum("rating"),
+        **{field: Count("reviewID", filter=condition) for field, condition in BUCKETS.items()},
+        "lastReviewID": Max("reviewID"),
+        "lastReviewAt": Max("createdAt"),
+    }
+    active = JobReview.objects.using(db_alias).filter(status="ACTIVE")
+    groups = (
+        ("PROFILE", "revieweeProfileID_id", active.filter(revieweeProfileID__isnull=False)),
+        ("ACCOUNT", "revieweeID_id", active.filter(reviewerType="CLIENT", revieweeID__isnull=False)),
+    )
+
+    rows = []
+    for scope, key, queryset in groups:
+        for row in queryset.values(key).annotate(**counters).order_by():
+            subject_id = row.pop(key)
+            row["ratingSum"] = row["ratingSum"] or Decimal("0.00")
+            rows.append(RatingStats(scope=scope, subjectID=subject_id, **row))
+
+    RatingStats.objects.using(db_alias).bulk_create(rows, batch_size=500)
+    print(f"\n[0142_rating_stats] Backfilled {len(rows)} rating stats row(s).")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0141_profile_geo_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RatingStats",
+            fields=[
+                ("statsID", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "scope",
+                    models.CharField(
+                        choices=[("PROFILE", "Profile"), ("ACCOUNT", "Account (client reviews)")],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "subjectID",
+                    models.BigIntegerField(help_text="profileID (PROFILE) or accountID (ACCOUNT)"),
+                ),
+                ("reviewCount", models.IntegerField(default=0)),
+                (
+                    "ratingSum",
+                    models.DecimalField(decimal_places=2, default=Decimal("0.00"), max_digits=12),
+                ),
+                ("oneStar", models.IntegerField(default=0)),
+                ("twoStar", models.IntegerField(default=0)),
+                ("threeStar", models.IntegerField(default=0)),
+                ("fourStar", models.IntegerField(default=0)),
+                ("fiveStar", models.IntegerField(default=0)),
+                ("lastReviewID", models.BigIntegerField(blank=True, null=True)),
+                ("lastReviewAt", models.DateTimeField(blank=True, null=True)),
+                ("updatedAt", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "rating_stats",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("scope", "subjectID"), name="rating_stats_subject_uniq"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
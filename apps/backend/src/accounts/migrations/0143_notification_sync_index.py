@@ -0,0 +1,19 @@
+"""
+(accountFK, notificationID) index for since_id notification sync
+(accounts.notification_feed).
+"""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0142_rating_stats"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(fields=["accountFK", "notificationID"], name="notif_account_id_idx"),
+        ),
+    ]
@@ -0,0 +1,19 @@
+"""
+(status, updatedAt) index for the job consistency reconciler's incremental
+scans (jobs.consistency_reconciler).
+"""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0143_notification_sync_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["status", "updatedAt"], name="job_status_updated_idx"),
+        ),
+    ]
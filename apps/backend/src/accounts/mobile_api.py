@@ -42,6 +42,7 @@ from .authentication import (
     require_kyc,
 )  # Use Bearer token auth for mobile, dual_auth for endpoints that support both
 from .profile_metrics_service import get_profile_metrics
+from iayos_project.conditional_get import conditional_get
 from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta, datetime as dt_datetime
@@ -1250,6 +1251,7 @@ def mobile_my_jobs(
             jobs_qs = (
                 JobPosting.objects.filter(clientID=client_profile)
                 .select_related(
+                    "clientID__profileID",
                     "categoryID",
                     "assignedWorkerID__profileID__accountFK",
                     "assignedAgencyFK__accountFK",
@@ -1290,6 +1292,7 @@ def mobile_my_jobs(
                 .select_related(
                     "clientID__profileID__accountFK",
                     "categoryID",
+                    "assignedWorkerID__profileID__accountFK",
                     "assignedAgencyFK__accountFK",
                 )
                 .prefetch_related("photos")
@@ -1316,11 +1319,60 @@ def mobile_my_jobs(
         print(f"\n   📊 Query results:")
         print(f"      Total jobs found: {total_count}")
 
+        # Per-job flags/counts as subqueries of the page query (no per-row queries)
+        from django.db.models import (
+            Case,
+            Count,
+            Exists,
+            IntegerField,
+            OuterRef,
+            Subquery,
+            Value,
+            When,
+        )
+        from django.db.models.functions import Coalesce
+
+        jobs_qs = jobs_qs.annotate(
+            _has_backjob=Exists(JobDispute.objects.filter(jobID=OuterRef("pk")))
+        )
+        if profile.profileType == "CLIENT":
+            application_counts = (
+                JobApplication.objects.filter(jobID=OuterRef("pk"))
+                .order_by()
+                .values("jobID")
+                .annotate(c=Count("applicationID"))
+                .values("c")
+            )
+            jobs_qs = jobs_qs.annotate(
+                _application_count=Coalesce(
+                    Subquery(application_counts), Value(0), output_field=IntegerField()
+                )
+            )
+
         # Pagination
         offset = (page - 1) * limit
-        jobs = jobs_qs[offset : offset + limit]
+        jobs = list(jobs_qs[offset : offset + limit])
         print(f"      Returning jobs {offset + 1} to {offset + len(jobs)}")
 
+        # Worker's own application per job, best status first (one query for the page)
+        applications_by_job = {}
+        if profile.profileType == "WORKER" and jobs:
+            for application in JobApplication.objects.filter(
+                jobID__in=[job.jobID for job in jobs], workerID=worker_profile
+            ).order_by(
+                Case(
+                    When(status=JobApplication.ApplicationStatus.ACCEPTED, then=Value(0)),
+                    When(status=JobApplication.ApplicationStatus.PENDING, then=Value(1)),
+                    When(status=JobApplication.ApplicationStatus.REJECTED, then=Value(2)),
+                    When(status=JobApplication.ApplicationStatus.WITHDRAWN, then=Value(3)),
+                    default=Value(4),
+                    output_field=IntegerField(),
+                ),
+                "-updatedAt",
+                "-createdAt",
+            ):
+                applications_by_job.setdefault(application.jobID_id, application)
+
         job_list = []
         for idx, job in enumerate(jobs):
             print(
@@ -1514,9 +1566,7 @@ def mobile_my_jobs(
                 "assigned_agency_id": assigned_agency.agencyId
                 if assigned_agency
                 else None,
-                "has_backjob": JobDispute.objects.filter(
-                    jobID=job
-                ).exists(),  # Check if backjob/dispute exists
+                "has_backjob": job._has_backjob,  # Check if backjob/dispute exists
                 # Team Job Fields
                 "is_team_job": job.is_team_job,
                 "total_workers_needed": job.total_workers_needed
@@ -1529,7 +1579,7 @@ def mobile_my_jobs(
                 if job.is_team_job
                 else None,
                 # Application count for clients to see how many workers applied
-                "application_count": job.applications.count()
+                "application_count": job._application_count
                 if profile.profileType == "CLIENT"
                 else None,
             }
@@ -1553,36 +1603,7 @@ def mobile_my_jobs(
                 job_data["agency_logo"] = getattr(assigned_agency, "logo", "")
 
             if profile.profileType == "WORKER":
-                from django.db.models import Case, IntegerField, Value, When
-
-                application = (
-                    JobApplication.objects.filter(jobID=job, workerID=worker_profile)
-                    .order_by(
-                        Case(
-                            When(
-                                status=JobApplication.ApplicationStatus.ACCEPTED,
-                                then=Value(0),
-                            ),
-                            When(
-                                status=JobApplication.ApplicationStatus.PENDING,
-                                then=Value(1),
-                            ),
-                            When(
-                                status=JobApplication.ApplicationStatus.REJECTED,
-                                then=Value(2),
-                            ),
-                            When(
-                                status=JobApplication.ApplicationStatus.WITHDRAWN,
-                                then=Value(3),
-                            ),
-                            default=Value(4),
-                            output_field=IntegerField(),
-                        ),
-                        "-updatedAt",
-                        "-createdAt",
-                    )
-                    .first()
-                )
+                application = applications_by_job.get(job.jobID)
                 if application:
                     job_data["application_status"] = application.status
 
@@ -1648,10 +1669,16 @@ def mobile_job_categories(
     """
     Get all job categories/specializations for mobile.
     If agency_id is provided, also includes that agency's custom skills.
+    The global list (no worker_id/agency_id) is served from the versioned
+    reference-data cache with an ETag.
     """
     from .mobile_services import get_job_categories_mobile
+    from .reference_data import reference_response
 
     try:
+        if not worker_id and not agency_id:
+            return reference_response(request, "job_categories")
+
         result = get_job_categories_mobile(worker_id=worker_id, agency_id=agency_id)
 
         if result["success"]:
@@ -2100,6 +2127,11 @@ def mobile_reorder_skills(request, payload: ReorderSkillsSchema):
                     id=worker_skill_id,
                 ).update(displayOrder=index)
 
+        # .update() skips workerSpecialization.save(); the /me payload lists skills in displayOrder
+        from .current_user_cache import invalidate_current_user
+
+        invalidate_current_user(user.accountID)
+
         return {
             "success": True,
             "message": "Skills reordered successfully",
@@ -2320,11 +2352,10 @@ def get_cities(request):
     """
     Get all cities (public endpoint for registration)
     """
-    from .models import City
+    from .reference_data import reference_response
 
     try:
-        cities = City.objects.all().values("cityID", "name", "province", "region")
-        return {"success": True, "cities": list(cities)}
+        return reference_response(request, "cities")
     except Exception as e:
         print(f"[ERROR] Get cities error: {str(e)}")
         return Response({"error": "Failed to fetch cities"}, status=500)
@@ -2335,16 +2366,10 @@ def get_barangays(request, city_id: int):
     """
     Get all barangays for a specific city (public endpoint for registration)
     """
-    from .models import Barangay
+    from .reference_data import reference_response
 
     try:
-        barangays = (
-            Barangay.objects.filter(city_id=city_id)
-            .values("barangayID", "name", "zipCode")
-            .order_by("name")
-        )
-
-        return {"success": True, "barangays": list(barangays)}
+        return reference_response(request, "barangays", city_id)
     except Exception as e:
         print(f"[ERROR] Get barangays error: {str(e)}")
         return Response({"error": "Failed to fetch barangays"}, status=500)
@@ -2475,6 +2500,7 @@ def get_my_backjobs_mobile(request, status: Optional[str] = None):
 
 
 @mobile_router.get("/jobs/{job_id}", auth=jwt_auth)
+@conditional_get("job")
 def mobile_job_detail(request, job_id: int):
     """
     Get complete job details for mobile view
@@ -5414,6 +5440,7 @@ def mobile_available_jobs(request, page: int = 1, limit: int = 20):
 
 
 @mobile_router.get("/wallet/balance", auth=jwt_auth)
+@conditional_get("wallet")
 def mobile_get_wallet_balance(request):
     """Get current user's wallet balance including reserved funds and pending earnings - Mobile"""
     try:
@@ -5501,6 +5528,7 @@ def mobile_get_wallet_balance(request):
 
 
 @mobile_router.get("/wallet/pending-earnings", auth=jwt_auth)
+@conditional_get("wallet")
 def mobile_get_pending_earnings(request):
     """
     Get detailed list of pending earnings (Due Balance) for the current user.
@@ -6022,24 +6050,35 @@ def mobile_withdraw_funds(request, payload: WithdrawFundsSchema):
 
 
 @mobile_router.get("/wallet/transactions", auth=jwt_auth)
+@conditional_get("wallet")
 def mobile_get_transactions(
-    request, page: int = 1, limit: int = 20, type: Optional[str] = None
+    request,
+    page: int = 1,
+    limit: int = 20,
+    type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count_mode: str = "exact",
+    compact: bool = False,
 ):
-    """Get wallet transaction history - Mobile with pagination"""
+    """
+    Get wallet transaction history - Mobile with pagination
+
+    Page mode (default): page/limit with a total count. Cursor mode
+    (count_mode="none" or a cursor): no count, pages continue from
+    next_cursor in constant time and every row carries running_balance.
+    compact=true returns only id/type/amount/status/created_at/balances.
+    """
     try:
         from .models import Wallet, Transaction
+        from .ledger_service import get_transaction_history
 
         # Get user's wallet
         wallet = Wallet.objects.filter(accountFK=request.auth).first()
 
         if not wallet:
-            return {"results": [], "count": 0, "has_next": False, "next_page": None}
-
-        # Build query with optional type filter
-        queryset = Transaction.objects.filter(walletID=wallet).select_related(
-            "relatedJobPosting"
-        )
+            return {"results": [], "count": 0, "has_next": False, "next_page": None, "next_cursor": None}
 
+        transaction_type = None
         if type:
             type_mapping = {
                 "DEPOSIT": Transaction.TransactionType.DEPOSIT,
@@ -6050,15 +6089,7 @@ def mobile_get_transactions(
                 "PENDING": Transaction.TransactionType.PENDING_EARNING,
                 "REFUND": Transaction.TransactionType.REFUND,
             }
-            if type.upper() in type_mapping:
-                queryset = queryset.filter(transactionType=type_mapping[type.upper()])
-
-        # Get total count
-        total_count = queryset.count()
-
-        # Paginate
-        offset = (page - 1) * limit
-        transactions = queryset.order_by("-createdAt")[offset : offset + limit]
+            transaction_type = type_mapping.get(type.upper())
 
         # Human-readable labels for each transaction type
         TYPE_LABELS = {
@@ -6071,8 +6102,23 @@ def mobile_get_transactions(
             "FEE": "Platform Fee",
         }
 
-        transaction_list = []
-        for t in transactions:
+        def serialize(t):
+            running_balance = getattr(t, "running_balance", None)
+            if compact:
+                return {
+                    "id": t.transactionID,
+                    "type": t.transactionType,
+                    "amount": float(t.amount),
+                    "status": t.status.lower() if t.status else "pending",
+                    "created_at": t.createdAt.isoformat(),
+                    "balance_after": float(t.balanceAfter)
+                    if t.balanceAfter is not None
+                    else None,
+                    "running_balance": float(running_balance)
+                    if running_balance is not None
+                    else None,
+                }
+
             # Map transaction type to frontend format
             type_display = t.transactionType
             if t.transactionType == Transaction.TransactionType.EARNING:
@@ -6096,40 +6142,83 @@ def mobile_get_transactions(
             ):
                 paymongo_checkout_url = t.invoiceURL
 
-            transaction_list.append(
-                {
-                    "id": t.transactionID,
-                    "type": type_display,
-                    "transaction_type_label": TYPE_LABELS.get(
-                        t.transactionType, t.transactionType
-                    ),
-                    "title": t.description
-                    or TYPE_LABELS.get(
-                        t.transactionType, f"{t.transactionType} Transaction"
-                    ),
-                    "description": t.description or "",
-                    "amount": float(t.amount),
-                    "created_at": t.createdAt.isoformat(),
-                    "status": t.status.lower() if t.status else "pending",
-                    "payment_method": t.paymentMethod or "wallet",
-                    "transaction_id": str(t.transactionID),
-                    "reference_number": t.referenceNumber or t.xenditExternalID or None,
-                    "balance_after": float(t.balanceAfter)
-                    if t.balanceAfter is not None
-                    else None,
-                    "paymongo_checkout_url": paymongo_checkout_url,
-                    "paymongo_payment_id": t.paymongoPaymentId or None,
-                    "job": job_data,
-                }
+            return {
+                "id": t.transactionID,
+                "type": type_display,
+                "transaction_type_label": TYPE_LABELS.get(
+                    t.transactionType, t.transactionType
+                ),
+                "title": t.description
+                or TYPE_LABELS.get(
+                    t.transactionType, f"{t.transactionType} Transaction"
+                ),
+                "description": t.description or "",
+                "amount": float(t.amount),
+                "created_at": t.createdAt.isoformat(),
+                "status": t.status.lower() if t.status else "pending",
+                "payment_method": t.paymentMethod or "wallet",
+                "transaction_id": str(t.transactionID),
+                "reference_number": t.referenceNumber or t.xenditExternalID or None,
+                "balance_after": float(t.balanceAfter)
+                if t.balanceAfter is not None
+                else None,
+                "running_balance": float(running_balance)
+                if running_balance is not None
+                else None,
+                "paymongo_checkout_url": paymongo_checkout_url,
+                "paymongo_payment_id": t.paymongoPaymentId or None,
+                "job": job_data,
+            }
+
+        # Cursor mode: keyset pages, no COUNT
+        if cursor or (count_mode or "").lower() == "none":
+            try:
+                transactions, meta = get_transaction_history(
+                    wallet.walletID,
+                    cursor=cursor,
+                    limit=limit,
+                    transaction_type=transaction_type,
+                    compact=compact,
+                )
+            except ValueError:
+                return Response({"error": "Invalid cursor"}, status=400)
+
+            return {
+                "results": [serialize(t) for t in transactions],
+                "count": None,
+                "has_next": meta["has_next"],
+                "next_page": None,
+                "next_cursor": meta["next_cursor"],
+                "running_balance_source": meta["running_balance_source"],
+            }
+
+        # Build query with optional type filter
+        queryset = Transaction.objects.filter(walletID=wallet)
+        if compact:
+            queryset = queryset.only(
+                "transactionID", "transactionType", "amount", "status", "createdAt", "balanceAfter"
             )
+        else:
+            queryset = queryset.select_related("relatedJobPosting")
+
+        if transaction_type:
+            queryset = queryset.filter(transactionType=transaction_type)
+
+        # Get total count
+        total_count = queryset.count()
+
+        # Paginate
+        offset = (page - 1) * limit
+        transactions = queryset.order_by("-createdAt")[offset : offset + limit]
 
         has_next = (offset + limit) < total_count
 
         return {
-            "results": transaction_list,
+            "results": [serialize(t) for t in transactions],
             "count": total_count,
             "has_next": has_next,
             "next_page": page + 1 if has_next else None,
+            "next_cursor": None,
         }
 
     except Exception as e:
@@ -8394,6 +8483,7 @@ def mobile_create_final_payment(request):
 
 
 @mobile_router.get("/payments/cash-status/{job_id}", auth=dual_auth)
+@conditional_get("job")
 def mobile_get_cash_payment_status(request, job_id: int):
     """
     Get the cash payment status for a job.
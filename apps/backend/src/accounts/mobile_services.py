@@ -263,11 +263,9 @@ def get_mobile_job_list(
             if user_profile and user_profile.latitude and user_profile.longitude:
                 user_lat = user_profile.latitude
                 user_lon = user_profile.longitude
-                print(
-                    f"📍 [LOCATION] User location ({profile_type}): {user_lat}, {user_lon}"
-                )
+                logger.debug("📍 [LOCATION] User location (%s): %s, %s", profile_type, user_lat, user_lon)
         except Exception as e:
-            print(f"⚠️ [LOCATION] Could not fetch user location: {e}")
+            logger.warning("⚠️ [LOCATION] Could not fetch user location: %s", e)
             pass
 
         # Exclude only jobs with active applications so REJECTED/WITHDRAWN
@@ -326,31 +324,53 @@ def get_mobile_job_list(
             queryset = queryset.filter(location__icontains=location)
 
         # Optimize queries with select_related and prefetch_related
+        # Team stats are counted in memory from filtered to_attr prefetches
         queryset = queryset.select_related(
             "clientID__profileID__accountFK", "categoryID"
-        ).prefetch_related("photos")
+        ).prefetch_related(
+            "photos",
+            Prefetch(
+                "skill_slots",
+                queryset=JobSkillSlot.objects.prefetch_related(
+                    Prefetch(
+                        "worker_assignments",
+                        queryset=JobWorkerAssignment.objects.filter(
+                            assignment_status__in=["ACTIVE", "COMPLETED"]
+                        ).only("assignmentID", "skillSlotID"),
+                        to_attr="filled_worker_assignments",
+                    )
+                ),
+                to_attr="prefetched_skill_slots",
+            ),
+        )
 
         # Get all jobs first (we'll sort by distance in memory if user has location)
         all_jobs = list(queryset)
 
+        # Resolve "has applied" once for the whole page instead of per job
+        applied_job_id_set = set()
+        try:
+            # Get profile_type from JWT if available, default to WORKER
+            profile_type = getattr(user, "profile_type", "WORKER")
+            profile = Profile.objects.filter(
+                accountFK=user, profileType=profile_type
+            ).first()
+
+            if profile and hasattr(profile, "workerprofile") and all_jobs:
+                applied_job_id_set = set(
+                    JobApplication.objects.filter(
+                        jobID__in=[job.jobID for job in all_jobs],
+                        workerID__profileID__accountFK=user,
+                    ).values_list("jobID", flat=True)
+                )
+        except Exception:
+            pass
+
         # Calculate distances and add to jobs if user has location
         jobs_with_distance = []
         for job in all_jobs:
             # Check if current user has applied
-            has_applied = False
-            try:
-                # Get profile_type from JWT if available, default to WORKER
-                profile_type = getattr(user, "profile_type", "WORKER")
-                profile = Profile.objects.filter(
-                    accountFK=user, profileType=profile_type
-                ).first()
-
-                if profile and hasattr(profile, "workerprofile"):
-                    has_applied = JobApplication.objects.filter(
-                        jobID=job, workerID__profileID__accountFK=user
-                    ).exists()
-            except Exception:
-                pass
+            has_applied = job.jobID in applied_job_id_set
 
             # Get client info
             client_profile = job.clientID.profileID
@@ -382,12 +402,9 @@ def get_mobile_job_list(
             team_workers_assigned = 0
             team_fill_percentage = 0
             if job.is_team_job:
-                skill_slots = JobSkillSlot.objects.filter(jobID=job)
-                for slot in skill_slots:
+                for slot in job.prefetched_skill_slots:
                     team_workers_needed += slot.workers_needed
-                    team_workers_assigned += slot.worker_assignments.filter(
-                        assignment_status__in=["ACTIVE", "COMPLETED"]
-                    ).count()
+                    team_workers_assigned += len(slot.filled_worker_assignments)
                 if team_workers_needed > 0:
                     team_fill_percentage = round(
                         (team_workers_assigned / team_workers_needed) * 100, 1
@@ -455,30 +472,30 @@ def get_mobile_job_list(
         # NEW: Apply manual sorting if specified, otherwise auto-sort by distance
         if sort_by == "distance_asc":
             jobs_with_distance.sort(key=lambda x: x["_distance_sort"])
-            print(f"📍 [SORT] Sorted by distance (nearest first)")
+            logger.debug("📍 [SORT] Sorted by distance (nearest first)")
         elif sort_by == "distance_desc":
             jobs_with_distance.sort(key=lambda x: x["_distance_sort"], reverse=True)
-            print(f"📍 [SORT] Sorted by distance (farthest first)")
+            logger.debug("📍 [SORT] Sorted by distance (farthest first)")
         elif sort_by == "budget_asc":
             jobs_with_distance.sort(key=lambda x: x["budget"])
-            print(f"💰 [SORT] Sorted by budget (lowest first)")
+            logger.debug("💰 [SORT] Sorted by budget (lowest first)")
         elif sort_by == "budget_desc":
             jobs_with_distance.sort(key=lambda x: x["budget"], reverse=True)
-            print(f"💰 [SORT] Sorted by budget (highest first)")
+            logger.debug("💰 [SORT] Sorted by budget (highest first)")
         elif sort_by == "created_desc":
             jobs_with_distance.sort(key=lambda x: x["_created_sort"], reverse=True)
-            print(f"🕒 [SORT] Sorted by date (newest first)")
+            logger.debug("🕒 [SORT] Sorted by date (newest first)")
         elif sort_by == "urgency_desc":
             jobs_with_distance.sort(key=lambda x: x["_urgency_sort"], reverse=True)
-            print(f"🔴 [SORT] Sorted by urgency (highest first)")
+            logger.debug("🔴 [SORT] Sorted by urgency (highest first)")
         elif user_lat and user_lon:
             # Default: auto-sort by distance if user has location
             jobs_with_distance.sort(key=lambda x: x["_distance_sort"])
-            print(f"📍 [SORT] Auto-sorted by distance (default)")
+            logger.debug("📍 [SORT] Auto-sorted by distance (default)")
         else:
             # Fallback: sort by creation date
             jobs_with_distance.sort(key=lambda x: x["_created_sort"], reverse=True)
-            print(f"🕒 [SORT] Sorted by date (no location)")
+            logger.debug("🕒 [SORT] Sorted by date (no location)")
 
         # Remove the sorting helper fields
         for job in jobs_with_distance:
@@ -521,7 +538,7 @@ def get_mobile_job_list(
         }
 
     except Exception as e:
-        print(f"[ERROR] get_mobile_job_list failed: {str(e)}")
+        logger.error("[ERROR] get_mobile_job_list failed: %s", e)
         import traceback
 
         traceback.print_exc()
@@ -3156,6 +3173,10 @@ def upload_profile_image_mobile(user, image_file):
         updated_count = Profile.objects.filter(accountFK=user).update(
             profileImg=image_url
         )
+        # .update() skips Profile.save(), so drop the cached /me payload here
+        from .current_user_cache import invalidate_current_user
+
+        invalidate_current_user(user.accountID)
         print(
             f"✅ Updated {updated_count} profiles with new image URL for user {user.email}"
         )
@@ -4873,41 +4894,21 @@ def get_review_stats_mobile(worker_id: int) -> Dict[str, Any]:
             accountFK=worker_account, profileType="WORKER"
         ).first()
 
-        # Get all active reviews for the WORKER profile
-        if worker_profile:
-            reviews = JobReview.objects.filter(
-                revieweeProfileID=worker_profile, status="ACTIVE"
-            )
-            # Fallback for old reviews without profileID
-            if not reviews.exists():
-                reviews = JobReview.objects.filter(
-                    revieweeID=worker_account,
-                    reviewerType="CLIENT",  # Only client reviews about workers
-                    status="ACTIVE",
-                )
-        else:
-            # Fallback: filter by reviewer type
-            reviews = JobReview.objects.filter(
-                revieweeID=worker_account, reviewerType="CLIENT", status="ACTIVE"
-            )
-
-        # Calculate average rating
-        avg_rating = reviews.aggregate(Avg("rating"))["rating__avg"] or 0.0
-        total_reviews = reviews.count()
+        # Counts and breakdown come from the materialized RatingStats row
+        from .rating_stats_service import get_worker_rating_stats, scope_reviews
 
-        # Rating breakdown
-        breakdown = {
-            "five_star": reviews.filter(rating__gte=4.5).count(),
-            "four_star": reviews.filter(rating__gte=3.5, rating__lt=4.5).count(),
-            "three_star": reviews.filter(rating__gte=2.5, rating__lt=3.5).count(),
-            "two_star": reviews.filter(rating__gte=1.5, rating__lt=2.5).count(),
-            "one_star": reviews.filter(rating__lt=1.5).count(),
-        }
+        stats = get_worker_rating_stats(
+            worker_account.accountID, worker_profile.profileID if worker_profile else None
+        )
 
         # Recent reviews (last 5)
-        recent_reviews = reviews.select_related("reviewerID", "jobID").order_by(
-            "-createdAt"
-        )[:5]
+        recent_reviews = []
+        if stats["total_reviews"]:
+            recent_reviews = (
+                scope_reviews(stats["scope"], stats["subject_id"])
+                .select_related("reviewerID", "jobID")
+                .order_by("-createdAt")[:5]
+            )
         recent_list = []
 
         for review in recent_reviews:
@@ -4938,9 +4939,9 @@ def get_review_stats_mobile(worker_id: int) -> Dict[str, Any]:
         return {
             "success": True,
             "data": {
-                "average_rating": float(avg_rating),
-                "total_reviews": total_reviews,
-                "rating_breakdown": breakdown,
+                "average_rating": stats["average_rating"],
+                "total_reviews": stats["total_reviews"],
+                "rating_breakdown": stats["rating_breakdown"],
                 "recent_reviews": recent_list,
             },
         }
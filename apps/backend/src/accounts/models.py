@@ -1,4 +1,6 @@
 from django.db import models
+from django.contrib.postgres.fields import DateRangeField
+from django.contrib.postgres.indexes import GistIndex
 from datetime import datetime
 from decimal import Decimal
 from django.contrib.auth.models import (
@@ -118,6 +120,23 @@ class Accounts(AbstractBaseUser, PermissionsMixin):  # <-- include PermissionsMi
 
     objects = AccountsManager()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_is_verified = instance.__dict__.get("isVerified")
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Verification flips move the account between analytics buckets
+        if (
+            hasattr(self, "_loaded_is_verified")
+            and self._loaded_is_verified != self.isVerified
+        ):
+            _mark_rollup_dirty("accounts", self.createdAt)
+            self._loaded_is_verified = self.isVerified
+        _invalidate_current_user(self.accountID)
+
 
 class Profile(models.Model):
     profileID = models.BigAutoField(primary_key=True)
@@ -162,6 +181,24 @@ class Profile(models.Model):
 
     accountFK = models.ForeignKey(Accounts, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            # Bounding-box fallback for nearby-worker search (accounts.location_service)
+            models.Index(
+                fields=["profileType", "location_sharing_enabled", "latitude", "longitude"],
+                name="profile_geo_bbox_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _invalidate_current_user(self.accountFK_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _invalidate_current_user(self.accountFK_id)
+        return result
+
 
 class Agency(models.Model):
     agencyId = models.BigAutoField(primary_key=True)
@@ -183,6 +220,15 @@ class Agency(models.Model):
 
     createdAt = models.DateTimeField(auto_now_add=True)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _invalidate_current_user(self.accountFK_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _invalidate_current_user(self.accountFK_id)
+        return result
+
 
 class WorkerProfile(models.Model):
     profileID = models.OneToOneField(Profile, on_delete=models.CASCADE)
@@ -272,6 +318,17 @@ class WorkerProfile(models.Model):
         self.save(update_fields=["profile_completion_percentage"])
         return self.profile_completion_percentage
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _invalidate_current_user(worker_profile_id=self.pk)
+
+    def delete(self, *args, **kwargs):
+        # Resolve the owner before the row is gone
+        account_id = Profile.objects.filter(pk=self.profileID_id).values_list("accountFK_id", flat=True).first()
+        result = super().delete(*args, **kwargs)
+        _invalidate_current_user(account_id)
+        return result
+
 
 class ClientProfile(models.Model):
     profileID = models.OneToOneField(Profile, on_delete=models.CASCADE)
@@ -322,6 +379,18 @@ class Specializations(models.Model):
     class Meta:
         db_table = "specializations"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Custom (worker/agency) skills are not part of the cached global list
+        if not self.is_custom:
+            _bump_reference_data()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        if not self.is_custom:
+            _bump_reference_data()
+        return result
+
 
 class InterestedJobs(models.Model):
     clientID = models.ForeignKey(ClientProfile, on_delete=models.CASCADE)
@@ -353,6 +422,15 @@ class workerSpecialization(models.Model):
             models.Index(fields=["workerID", "displayOrder"]),
         ]
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _invalidate_current_user(worker_profile_id=self.workerID_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _invalidate_current_user(worker_profile_id=self.workerID_id)
+        return result
+
 
 # Worker Phase 1: Profile Enhancement Models
 
@@ -444,6 +522,15 @@ class WorkerCertification(models.Model):
                     {"expiry_date": "Expiry date cannot be before issue date"}
                 )
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _invalidate_current_user(worker_profile_id=self.workerID_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _invalidate_current_user(worker_profile_id=self.workerID_id)
+        return result
+
 
 class WorkerMaterial(models.Model):
     """
@@ -647,6 +734,16 @@ class kyc(models.Model):
         """Get number of remaining resubmission attempts."""
         return max(0, self.maxResubmissions - self.resubmissionCount)
 
+    class Meta:
+        indexes = [
+            # Admin KYC queue: status tab + keyset on (createdAt, kycID) DESC
+            models.Index(
+                fields=["kyc_status", "-createdAt", "-kycID"],
+                name="kyc_status_created_idx",
+            ),
+            models.Index(fields=["-createdAt", "-kycID"], name="kyc_created_idx"),
+        ]
+
 
 class kycFiles(models.Model):
     kycFileID = models.BigAutoField(primary_key=True)
@@ -750,6 +847,7 @@ class kycFiles(models.Model):
     def save(self, *args, **kwargs):
         self.full_clean()
         super().save(*args, **kwargs)
+        _invalidate_current_user(self.kycID.accountFK_id)
 
     class Meta:
         indexes = [
@@ -1311,11 +1409,27 @@ class Notification(models.Model):
             models.Index(fields=["accountFK", "-createdAt"]),
             models.Index(fields=["accountFK", "isRead"]),
             models.Index(fields=["accountFK", "profile_type", "-createdAt"]),
+            # since_id delta sync (accounts.notification_feed)
+            models.Index(fields=["accountFK", "notificationID"], name="notif_account_id_idx"),
         ]
 
     def __str__(self):
         return f"{self.notificationType} - {self.accountFK.email} - {self.title}"
 
+    def save(self, *args, **kwargs):
+        """Override save to push new notifications and refresh the cached unread count"""
+        created = self._state.adding
+        super().save(*args, **kwargs)
+        _publish_notification(self, created)
+
+    def delete(self, *args, **kwargs):
+        account_id, notification_id = self.accountFK_id, self.notificationID
+        result = super().delete(*args, **kwargs)
+        from accounts.notification_feed import publish_deleted
+
+        publish_deleted(account_id, notification_id, self.profile_type)
+        return result
+
 
 class PushToken(models.Model):
     """
@@ -1946,40 +2060,77 @@ class Job(models.Model):
                 fields=["assignedEmployeeID", "status"],
                 name="job_assign_emp_status_idx",
             ),
+            models.Index(fields=["status", "updatedAt"], name="job_status_updated_idx"),
         ]
 
     def __str__(self):
         return f"{self.title} - {self.clientID.profileID.accountFK.email}"
 
+    SCHEDULE_FIELDS = (
+        "status",
+        "preferredStartDate",
+        "scheduled_end_date",
+        "shift_type",
+        "assignedWorkerID_id",
+        "assignedEmployeeID_id",
+    )
+    ROLLUP_FIELDS = ("status", "categoryID_id", "urgency", "budget")
+
     def save(self, *args, **kwargs):
         """Override save to create job log entry on status change"""
-        # Check if this is an update (not a new instance)
+        old_instance = None
         if self.pk:
-            try:
-                old_instance = Job.objects.get(pk=self.pk)
-                # If status changed, create a log entry
-                if old_instance.status != self.status:
-                    # Import here to avoid circular dependency
-                    from django.utils import timezone
-
-                    # Save the job first
-                    super().save(*args, **kwargs)
-
-                    # Create log entry
-                    JobLog.objects.create(
-                        jobID=self,
-                        oldStatus=old_instance.status,
-                        newStatus=self.status,
-                        changedBy=None,  # You can pass this through kwargs if needed
-                        notes=f"Status changed from {old_instance.status} to {self.status}",
-                    )
-                    return
-            except Job.DoesNotExist:
-                pass
-
-        # Normal save
+            old_instance = Job.objects.filter(pk=self.pk).first()
+        is_new = self._state.adding
+
         super().save(*args, **kwargs)
 
+        if old_instance is None:
+            if is_new and self.assignedAgencyFK_id:
+                self._sync_agency_stats()
+        elif old_instance.status != self.status:
+            # Create log entry
+            JobLog.objects.create(
+                jobID=self,
+                oldStatus=old_instance.status,
+                newStatus=self.status,
+                changedBy=None,  # You can pass this through kwargs if needed
+                notes=f"Status changed from {old_instance.status} to {self.status}",
+            )
+            self._sync_agency_stats(old_instance.assignedAgencyFK_id)
+            # Worker /me payload shows the completed-jobs count
+            if self.assignedWorkerID_id and self.JobStatus.COMPLETED in (old_instance.status, self.status):
+                _invalidate_current_user(worker_profile_id=self.assignedWorkerID_id)
+        elif old_instance.assignedAgencyFK_id != self.assignedAgencyFK_id:
+            # Agency (re)assignment moves the job between agency counters
+            self._sync_agency_stats(old_instance.assignedAgencyFK_id)
+
+        if old_instance is not None and any(
+            getattr(old_instance, field) != getattr(self, field)
+            for field in self.ROLLUP_FIELDS
+        ):
+            _mark_rollup_dirty("jobs", self.createdAt)
+
+        # Busy intervals depend on status, date window, shift and assignees
+        if old_instance is None or any(
+            getattr(old_instance, field) != getattr(self, field)
+            for field in self.SCHEDULE_FIELDS
+        ):
+            _sync_schedule_intervals(self.pk)
+
+    def delete(self, *args, **kwargs):
+        created_at = self.createdAt
+        result = super().delete(*args, **kwargs)
+        _mark_rollup_dirty("jobs", created_at)
+        return result
+
+    def _sync_agency_stats(self, previous_agency_id=None):
+        """Refresh AgencyStats for the current (and previously assigned) agency."""
+        from .agency_stats_service import refresh_agency_stats
+
+        for agency_id in {previous_agency_id, self.assignedAgencyFK_id} - {None}:
+            refresh_agency_stats(agency_id)
+
 
 class JobEmployeeAssignment(models.Model):
     """
@@ -2109,6 +2260,16 @@ class JobEmployeeAssignment(models.Model):
     def __str__(self):
         return f"{self.employee.name} assigned to {self.job.title}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _sync_schedule_intervals(self.job_id)
+
+    def delete(self, *args, **kwargs):
+        job_id = self.job_id
+        result = super().delete(*args, **kwargs)
+        _sync_schedule_intervals(job_id)
+        return result
+
 
 class JobPhoto(models.Model):
     """
@@ -2312,6 +2473,16 @@ class JobApplication(models.Model):
             ),
         ]
 
+    def delete(self, *args, **kwargs):
+        job_created_at = (
+            Job.objects.filter(jobID=self.jobID_id)
+            .values_list("createdAt", flat=True)
+            .first()
+        )
+        result = super().delete(*args, **kwargs)
+        _mark_rollup_dirty("jobs", job_created_at)
+        return result
+
     def __str__(self):
         return (
             f"Application by {self.workerID.profileID.firstName} for {self.jobID.title}"
@@ -2801,6 +2972,32 @@ class JobReview(models.Model):
     def __str__(self):
         return f"Review by {self.reviewerID.email} for job #{self.jobID.jobID} - {self.rating}★"
 
+    def save(self, *args, **kwargs):
+        """Override save to keep the reviewed job's AgencyStats and the reviewee's RatingStats in sync"""
+        super().save(*args, **kwargs)
+        self._sync_agency_stats()
+        self._sync_rating_stats()
+        _invalidate_current_user(self.revieweeID_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._sync_agency_stats()
+        self._sync_rating_stats()
+        _invalidate_current_user(self.revieweeID_id)
+        return result
+
+    def _sync_rating_stats(self):
+        from .rating_stats_service import refresh_for_review
+
+        refresh_for_review(self)
+
+    def _sync_agency_stats(self):
+        agency_id = self.jobID.assignedAgencyFK_id if self.jobID_id else None
+        if agency_id:
+            from .agency_stats_service import refresh_agency_stats
+
+            refresh_agency_stats(agency_id)
+
 
 class ReviewSkillTag(models.Model):
     """
@@ -2835,6 +3032,87 @@ class ReviewSkillTag(models.Model):
         return f"Review #{self.reviewID.reviewID} tagged with skill #{self.workerSpecializationID.id}"
 
 
+class AgencyStats(models.Model):
+    """
+    Materialized per-agency job and review counters used by agency browse/search.
+    Kept in sync by Job.save / JobReview.save via accounts.agency_stats_service,
+    and fully rebuildable with `manage.py rebuild_agency_stats`.
+    """
+
+    agencyID = models.OneToOneField(
+        Agency, on_delete=models.CASCADE, primary_key=True, related_name="stats"
+    )
+
+    totalJobs = models.IntegerField(default=0)
+    completedJobs = models.IntegerField(default=0)
+    activeJobs = models.IntegerField(default=0)
+
+    reviewCount = models.IntegerField(default=0)
+    ratingSum = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0.00")
+    )
+    averageRating = models.DecimalField(
+        max_digits=3,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        help_text="ratingSum / reviewCount (NULL when the agency has no reviews)",
+    )
+
+    updatedAt = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "agency_stats"
+        indexes = [
+            models.Index(fields=["-averageRating"], name="agency_stats_rating_idx"),
+            models.Index(fields=["-completedJobs"], name="agency_stats_completed_idx"),
+        ]
+
+    def __str__(self):
+        return f"Stats for agency #{self.agencyID_id}: {self.completedJobs} completed, {self.averageRating}★"
+
+
+class RatingStats(models.Model):
+    """
+    Materialized rating histogram for one reviewee, backing review stats on
+    worker profile screens. Kept in sync by JobReview.save / JobReview.delete
+    via accounts.rating_stats_service, and fully rebuildable with
+    `manage.py rebuild_rating_stats`.
+    """
+
+    class Scope(models.TextChoices):
+        # ACTIVE reviews whose revieweeProfileID is subjectID
+        PROFILE = "PROFILE", "Profile"
+        # Legacy rows without a profile: ACTIVE CLIENT reviews whose revieweeID is subjectID
+        ACCOUNT = "ACCOUNT", "Account (client reviews)"
+
+    statsID = models.BigAutoField(primary_key=True)
+    scope = models.CharField(max_length=10, choices=Scope.choices)
+    subjectID = models.BigIntegerField(help_text="profileID (PROFILE) or accountID (ACCOUNT)")
+
+    reviewCount = models.IntegerField(default=0)
+    ratingSum = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
+    oneStar = models.IntegerField(default=0)
+    twoStar = models.IntegerField(default=0)
+    threeStar = models.IntegerField(default=0)
+    fourStar = models.IntegerField(default=0)
+    fiveStar = models.IntegerField(default=0)
+
+    lastReviewID = models.BigIntegerField(null=True, blank=True)
+    lastReviewAt = models.DateTimeField(null=True, blank=True)
+
+    updatedAt = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "rating_stats"
+        constraints = [
+            models.UniqueConstraint(fields=["scope", "subjectID"], name="rating_stats_subject_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.scope} #{self.subjectID}: {self.reviewCount} reviews"
+
+
 # Backward compatibility - keep old names as aliases
 JobPosting = Job
 JobPostingPhoto = JobPhoto
@@ -3070,11 +3348,115 @@ class Transaction(models.Model):
             models.Index(fields=["xenditInvoiceID"]),
             models.Index(fields=["xenditExternalID"]),
             models.Index(fields=["adminReferenceNumber"]),
+            models.Index(fields=["walletID", "transactionID"], name="txn_wallet_id_idx"),
         ]
 
     def __str__(self):
         return f"{self.transactionType} - ₱{self.amount} - {self.status}"
 
+    def save(self, *args, **kwargs):
+        is_new = self._state.adding
+        super().save(*args, **kwargs)
+        # New rows are picked up by the rollup watermark; updates (status
+        # flips, amount corrections) re-aggregate their creation day.
+        if not is_new:
+            _mark_rollup_dirty("transactions", self.createdAt)
+            _invalidate_wallet_snapshots(self.walletID_id, self.transactionID)
+
+
+class WalletSnapshot(models.Model):
+    """
+    Ledger-derived wallet balances as of one transaction (accounts.ledger_service).
+
+    balance / pendingEarnings are what the Transaction ledger says up to and
+    including lastTransactionID, so balance-at-time and statements only scan
+    the tail after the snapshot. Snapshots covering a transaction that is
+    later updated are dropped (see Transaction.save).
+    """
+
+    snapshotID = models.BigAutoField(primary_key=True)
+    walletID = models.ForeignKey(
+        Wallet, on_delete=models.CASCADE, related_name="snapshots"
+    )
+    lastTransactionID = models.BigIntegerField(
+        help_text="Highest transactionID folded into this snapshot"
+    )
+    asOf = models.DateTimeField(help_text="createdAt of lastTransactionID")
+    balance = models.DecimalField(max_digits=12, decimal_places=2)
+    pendingEarnings = models.DecimalField(max_digits=12, decimal_places=2)
+    transactionCount = models.IntegerField(default=0)
+    createdAt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "wallet_snapshots"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["walletID", "lastTransactionID"], name="wallet_snapshot_wallet_txn_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["walletID", "-lastTransactionID"], name="wallet_snapshot_latest_idx"),
+            models.Index(fields=["walletID", "-asOf"], name="wallet_snapshot_asof_idx"),
+        ]
+
+    def __str__(self):
+        return f"Wallet {self.walletID_id} @ txn {self.lastTransactionID}: ₱{self.balance}"
+
+
+class WebhookEvent(models.Model):
+    """
+    Inbox of payment provider webhook deliveries.
+
+    The webhook endpoints only verify and persist the event here; a worker
+    (accounts.webhook_inbox) applies it. (provider, eventID) is unique, so
+    provider retries and duplicate deliveries are stored - and applied - once.
+    """
+
+    class Provider(models.TextChoices):
+        XENDIT_INVOICE = "XENDIT_INVOICE", "Xendit Invoice"
+        XENDIT_DISBURSEMENT = "XENDIT_DISBURSEMENT", "Xendit Disbursement"
+        PAYMONGO = "PAYMONGO", "PayMongo"
+
+    class EventStatus(models.TextChoices):
+        RECEIVED = "RECEIVED", "Received"
+        PROCESSED = "PROCESSED", "Processed"
+        FAILED = "FAILED", "Failed"
+
+    webhookEventID = models.BigAutoField(primary_key=True)
+    provider = models.CharField(max_length=30, choices=Provider.choices)
+    eventID = models.CharField(
+        max_length=255, help_text="Provider event ID (idempotency key)"
+    )
+    eventType = models.CharField(max_length=100, blank=True, default="")
+    payload = models.JSONField()
+    status = models.CharField(
+        max_length=20, choices=EventStatus.choices, default=EventStatus.RECEIVED
+    )
+    attempts = models.IntegerField(default=0)
+    lastError = models.TextField(blank=True, default="")
+    result = models.JSONField(null=True, blank=True)
+    duplicateCount = models.IntegerField(
+        default=0, help_text="Deliveries received after the first one"
+    )
+
+    receivedAt = models.DateTimeField(auto_now_add=True)
+    processedAt = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "webhook_events"
+        ordering = ["receivedAt"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["provider", "eventID"], name="webhook_event_provider_event_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["status", "receivedAt"], name="webhook_event_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.provider} {self.eventID} ({self.status})"
+
 
 class City(models.Model):
     """
@@ -3103,6 +3485,15 @@ class City(models.Model):
     def __str__(self):
         return f"{self.name}, {self.province}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _bump_reference_data()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _bump_reference_data()
+        return result
+
 
 class Barangay(models.Model):
     """
@@ -3131,6 +3522,15 @@ class Barangay(models.Model):
     def __str__(self):
         return f"{self.name}, {self.city.name}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _bump_reference_data()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _bump_reference_data()
+        return result
+
 
 class UserPaymentMethod(models.Model):
     """User's payment methods for withdrawals (GCash, Bank, PayPal, Visa, Mastercard, GrabPay, Maya)"""
@@ -3483,16 +3883,145 @@ class JobWorkerAssignment(models.Model):
         super().save(*args, **kwargs)
         # Update slot status after saving
         self.skillSlotID.update_status()
+        _sync_schedule_intervals(self.jobID_id)
 
     def __str__(self):
         return f"{self.workerID.profileID.firstName} - Position {self.slot_position} in {self.skillSlotID}"
 
+    def delete(self, *args, **kwargs):
+        job_id = self.jobID_id
+        result = super().delete(*args, **kwargs)
+        _sync_schedule_intervals(job_id)
+        return result
+
+
+def _mark_rollup_dirty(source, *moments):
+    """Queue admin analytics rollup days for recomputation once the write commits."""
+    from django.db import transaction
+
+    from adminpanel.rollup_service import mark_dirty
+
+    # robust: a failed mark must not fail the save; the nightly trailing run heals it
+    transaction.on_commit(lambda: mark_dirty(source, *moments), robust=True)
+
+
+def _invalidate_wallet_snapshots(wallet_id, transaction_id):
+    """Drop ledger snapshots that folded in an updated transaction."""
+    from accounts.ledger_service import invalidate_snapshots
+
+    invalidate_snapshots(wallet_id, transaction_id)
+
+
+def _publish_notification(notification, created):
+    """Push a new notification (or a read-state change) after commit."""
+    from accounts.notification_feed import invalidate_unread, publish_created, publish_read
+
+    if created:
+        publish_created([notification])
+    elif notification.isRead:
+        publish_read(
+            notification.accountFK_id, [notification.notificationID], notification.profile_type
+        )
+    else:
+        invalidate_unread([notification.accountFK_id])
+
+
+def _invalidate_current_user(account_id=None, worker_profile_id=None):
+    """Drop the cached /me payload of an account (or of a WorkerProfile's owner)."""
+    from accounts.current_user_cache import invalidate_current_user, invalidate_for_worker_profile
+
+    if worker_profile_id:
+        invalidate_for_worker_profile(worker_profile_id)
+    else:
+        invalidate_current_user(account_id)
+
+
+def _bump_reference_data():
+    """Invalidate cached cities/barangays/categories once the edit commits."""
+    from django.db import transaction
+
+    from accounts.reference_data import bump_version
+
+    transaction.on_commit(bump_version)
+
+
+def _sync_schedule_intervals(job_id):
+    """Recompute ScheduleInterval rows for one job."""
+    from jobs.availability_index import sync_job_intervals
+
+    sync_job_intervals(job_id)
+
+
+class ScheduleInterval(models.Model):
+    """
+    Maintained busy interval for a worker or agency employee on one job.
+
+    One row per person per busy job (direct worker, team slot assignment,
+    legacy assignedEmployeeID, or JobEmployeeAssignment). Rows are rebuilt per
+    job by jobs.availability_index whenever the job's status/date window/
+    assignees or an assignment change, so overlap checks are a single indexed
+    query. A NULL window means the job has no schedule yet.
+    """
+
+    class Source(models.TextChoices):
+        DIRECT_WORKER = "DIRECT_WORKER", "Job.assignedWorkerID"
+        TEAM_WORKER = "TEAM_WORKER", "JobWorkerAssignment"
+        LEGACY_EMPLOYEE = "LEGACY_EMPLOYEE", "Job.assignedEmployeeID"
+        EMPLOYEE_ASSIGNMENT = "EMPLOYEE_ASSIGNMENT", "JobEmployeeAssignment"
+
+    intervalID = models.BigAutoField(primary_key=True)
+    jobID = models.ForeignKey(
+        Job, on_delete=models.CASCADE, related_name="schedule_intervals"
+    )
+    source = models.CharField(max_length=20, choices=Source.choices)
+    workerID = models.ForeignKey(
+        WorkerProfile,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="schedule_intervals",
+    )
+    employeeID = models.ForeignKey(
+        "agency.AgencyEmployee",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="schedule_intervals",
+    )
+    window = DateRangeField(
+        null=True,
+        blank=True,
+        help_text="Inclusive [start, end] work dates; NULL when the job has no schedule",
+    )
+    shift = models.CharField(max_length=10, null=True, blank=True)
+    createdAt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "schedule_intervals"
+        indexes = [
+            models.Index(fields=["workerID", "jobID"], name="sched_iv_worker_job_idx"),
+            models.Index(fields=["employeeID", "jobID"], name="sched_iv_employee_job_idx"),
+            GistIndex(fields=["workerID", "window"], name="sched_iv_worker_window_gist"),
+            GistIndex(fields=["employeeID", "window"], name="sched_iv_employee_window_gist"),
+        ]
+
+    def __str__(self):
+        person = f"worker#{self.workerID_id}" if self.workerID_id else f"employee#{self.employeeID_id}"
+        return f"{person} busy on job#{self.jobID_id} {self.window}"
+
 
 # ============================================================
 # DAILY PAYMENT MODEL - Per-Day Work Tracking
 # ============================================================
 
 
+def _invalidate_daily_summary(job_id):
+    """Drop cached DailyPaymentService summary counters for a daily job."""
+    from jobs.daily_payment_service import DailyPaymentService
+
+    DailyPaymentService.invalidate_daily_summary(job_id)
+
+
 class DailyAttendance(models.Model):
     """
     Tracks daily attendance for workers on daily-rate jobs.
@@ -3661,6 +4190,15 @@ class DailyAttendance(models.Model):
             worker_name = self.employeeID.fullName
         return f"{worker_name} - {self.date} ({self.status})"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _invalidate_daily_summary(self.jobID_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _invalidate_daily_summary(self.jobID_id)
+        return result
+
 
 class DailyJobExtension(models.Model):
     """
@@ -3735,6 +4273,15 @@ class DailyJobExtension(models.Model):
     def __str__(self):
         return f"Extension +{self.additional_days} days for Job #{self.jobID_id} ({self.status})"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _invalidate_daily_summary(self.jobID_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _invalidate_daily_summary(self.jobID_id)
+        return result
+
 
 class DailyRateChange(models.Model):
     """
@@ -3811,6 +4358,15 @@ class DailyRateChange(models.Model):
     def __str__(self):
         return f"Rate change ₱{self.old_rate}→₱{self.new_rate} for Job #{self.jobID_id} ({self.status})"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _invalidate_daily_summary(self.jobID_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _invalidate_daily_summary(self.jobID_id)
+        return result
+
 
 class DailySkipDayRequest(models.Model):
     """
@@ -0,0 +1,188 @@
+"""
+Notification Feed
+
+Realtime delivery and cheap sync for in-app notifications.
+
+- Every new Notification is pushed after commit to the recipient's
+  ``user_{accountID}`` WebSocket group (profiles.channel_routing) as a
+  ``notification_created`` event; read/delete changes go out as
+  ``notifications_read`` / ``notification_deleted``. Everything published in
+  one transaction goes out in a single batched group_send_many call.
+- Reconnecting clients call get_notifications_since(since_id) for the rows
+  they missed instead of re-listing the newest 50.
+- Unread counts come from one cached per-account row of counts grouped by
+  profile_type. Any create/read/delete drops it after commit; the next read
+  recomputes it with a single grouped query.
+
+Sockets only forward events whose profileType is visible to their JWT
+profile (is_visible_to), so dual-profile accounts see per-profile feeds.
+
+Notification.save/delete publish automatically. Code that uses
+bulk_create/.update() must call publish_created() / publish_read().
+"""
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+
+UNREAD_CACHE_KEY = "cache:notifications:unread:{account_id}"
+UNREAD_CACHE_TTL = 60 * 10
+SYNC_MAX_LIMIT = 200
+ACCOUNT_LEVEL = ""  # bucket for notifications with no profile_type
+
+logger = logging.getLogger(__name__)
+
+
+def serialize_notification(notif) -> dict:
+    return {
+        "notificationID": notif.notificationID,
+        "type": notif.notificationType,
+        "notificationType": notif.notificationType,
+        "relatedJobID": notif.relatedJobID,
+        "relatedApplicationID": notif.relatedApplicationID,
+        "title": notif.title,
+        "message": notif.message,
+        "isRead": notif.isRead,
+        "createdAt": notif.createdAt.isoformat(),
+        "readAt": notif.readAt.isoformat() if notif.readAt else None,
+        "relatedKYCLogID": notif.relatedKYCLogID,
+        "profileType": notif.profile_type,
+    }
+
+
+def visible_notifications(account_id: int, profile_type: Optional[str] = None):
+    """Profile-specific + account-level notifications (account-level only without a profile_type)."""
+    from .models import Notification
+
+    queryset = Notification.objects.filter(accountFK_id=account_id)
+    if profile_type:
+        return queryset.filter(Q(profile_type=profile_type) | Q(profile_type__isnull=True))
+    return queryset.filter(profile_type__isnull=True)
+
+
+def is_visible_to(notification_profile_type: Optional[str], profile_type: Optional[str] = None) -> bool:
+    """In-memory twin of visible_notifications() for pushed events."""
+    return not notification_profile_type or notification_profile_type == profile_type
+
+
+# =============================================================================
+# UNREAD COUNTER
+# =============================================================================
+
+
+def _unread_key(account_id: int) -> str:
+    return UNREAD_CACHE_KEY.format(account_id=account_id)
+
+
+def unread_buckets(account_id: int) -> Dict[str, int]:
+    """{profile_type or "": unread count} for one account (cache-aside)."""
+    from .models import Notification
+
+    key = _unread_key(account_id)
+    buckets = cache.get(key)
+    if buckets is None:
+        buckets = {
+            row["profile_type"] or ACCOUNT_LEVEL: row["total"]
+            for row in Notification.objects.filter(accountFK_id=account_id, isRead=False)
+            .values("profile_type")
+            .annotate(total=Count("notificationID"))
+            .order_by()
+        }
+        cache.set(key, buckets, UNREAD_CACHE_TTL)
+    return buckets
+
+
+def unread_count(account_id: int, profile_type: Optional[str] = None) -> int:
+    buckets = unread_buckets(account_id)
+    count = buckets.get(ACCOUNT_LEVEL, 0)
+    if profile_type:
+        count += buckets.get(profile_type, 0)
+    return count
+
+
+def invalidate_unread(account_ids: Iterable[int]) -> None:
+    cache.delete_many([_unread_key(account_id) for account_id in set(account_ids)])
+
+
+# =============================================================================
+# SYNC
+# =============================================================================
+
+
+def get_notifications_since(
+    account_id: int, since_id: int = 0, profile_type: Optional[str] = None, limit: int = 100
+) -> dict:
+    """
+    Notifications with notificationID > since_id, oldest first, plus the
+    current unread count. Clients page with next_since_id while has_more.
+    """
+    limit = max(1, min(int(limit), SYNC_MAX_LIMIT))
+    rows = list(
+        visible_notifications(account_id, profile_type)
+        .filter(notificationID__gt=since_id)
+        .order_by("notificationID")[: limit + 1]
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "notifications": [serialize_notification(notif) for notif in rows],
+        "count": len(rows),
+        "next_since_id": rows[-1].notificationID if rows else since_id,
+        "has_more": has_more,
+        "unread_count": unread_count(account_id, profile_type),
+    }
+
+
+# =============================================================================
+# PUBLISH
+# =============================================================================
+
+
+def _send(account_ids: List[int], events: List[dict]) -> None:
+    """Drop the recipients' unread counters and push every event in one batch."""
+    from profiles.channel_routing import group_send_many, user_group_name
+
+    invalidate_unread(account_ids)
+    messages = [(user_group_name(account_id), event) for account_id, event in zip(account_ids, events)]
+    try:
+        group_send_many(messages)
+    except Exception:
+        logger.exception(
+            "Notification push failed for %s event(s) to %s account(s)", len(messages), len(set(account_ids))
+        )
+
+
+def publish_created(notifications: Iterable) -> None:
+    """Push new notifications to their recipients once the transaction commits."""
+    notifications = [notif for notif in notifications if notif.notificationID]
+    if not notifications:
+        return
+    account_ids = [notif.accountFK_id for notif in notifications]
+    events = [
+        {"type": "notification_created", "notification": serialize_notification(notif)}
+        for notif in notifications
+    ]
+    transaction.on_commit(lambda: _send(account_ids, events))
+
+
+def publish_read(
+    account_id: int, notification_ids: Optional[List[int]] = None, profile_type: Optional[str] = None
+) -> None:
+    """
+    Tell the account's other sockets that notifications were read (None = all).
+    profile_type scopes the event to sockets of that profile, like the rows.
+    """
+    event = {
+        "type": "notifications_read",
+        "notification_ids": notification_ids,
+        "all": notification_ids is None,
+        "profileType": profile_type,
+    }
+    transaction.on_commit(lambda: _send([account_id], [event]))
+
+
+def publish_deleted(account_id: int, notification_id: int, profile_type: Optional[str] = None) -> None:
+    event = {"type": "notification_deleted", "notification_id": notification_id, "profileType": profile_type}
+    transaction.on_commit(lambda: _send([account_id], [event]))
@@ -0,0 +1,236 @@
+"""
+Rating Stats Service
+
+Maintains the materialized RatingStats rows (count, sum, per-star buckets and
+a last-review pointer per reviewee) that back review stats on worker profile
+screens. A reviewee's row is recomputed, under a lock on the reviewee, in the
+same transaction as every JobReview save/delete, so reading stats is a
+single-row lookup.
+"""
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+
+from .models import Accounts, JobReview, Profile, RatingStats
+
+PROFILE = RatingStats.Scope.PROFILE
+ACCOUNT = RatingStats.Scope.ACCOUNT
+
+# Same rounding as the star breakdown shown in the apps
+BUCKETS = {
+    "fiveStar": Q(rating__gte=4.5),
+    "fourStar": Q(rating__gte=3.5, rating__lt=4.5),
+    "threeStar": Q(rating__gte=2.5, rating__lt=3.5),
+    "twoStar": Q(rating__gte=1.5, rating__lt=2.5),
+    "oneStar": Q(rating__lt=1.5),
+}
+
+STAT_FIELDS = ("reviewCount", "ratingSum", *BUCKETS, "lastReviewID", "lastReviewAt")
+
+# (scope, subjectID)
+Subject = Tuple[str, int]
+
+
+def _counters():
+    return {
+        "reviewCount": Count("reviewID"),
+        "ratingSum": Sum("rating"),
+        **{field: Count("reviewID", filter=condition) for field, condition in BUCKETS.items()},
+        "lastReviewID": Max("reviewID"),
+        "lastReviewAt": Max("createdAt"),
+    }
+
+
+def _build_values(row: Optional[Dict]) -> Dict:
+    row = row or {}
+    values = {field: row.get(field) or 0 for field in ("reviewCount", *BUCKETS)}
+    values["ratingSum"] = row.get("ratingSum") or Decimal("0.00")
+    values["lastReviewID"] = row.get("lastReviewID")
+    values["lastReviewAt"] = row.get("lastReviewAt")
+    return values
+
+
+def scope_reviews(scope: str, subject_id: int):
+    """The ACTIVE reviews a stats row summarizes."""
+    if scope == PROFILE:
+        return JobReview.objects.filter(revieweeProfileID_id=subject_id, status="ACTIVE")
+    return JobReview.objects.filter(revieweeID_id=subject_id, reviewerType="CLIENT", status="ACTIVE")
+
+
+def subjects_for(review: JobReview) -> List[Subject]:
+    """Stats rows a review can contribute to."""
+    subjects = []
+    if review.revieweeProfileID_id:
+        subjects.append((PROFILE, review.revieweeProfileID_id))
+    if review.revieweeID_id and review.reviewerType == "CLIENT":
+        subjects.append((ACCOUNT, review.revieweeID_id))
+    return subjects
+
+
+def compute_rating_stats(scope: str, subject_id: int) -> Dict:
+    """Compute live stats for one reviewee (one aggregate query)."""
+    return _build_values(scope_reviews(scope, subject_id).aggregate(**_counters()))
+
+
+def refresh_rating_stats(scope: str, subject_id: int) -> RatingStats:
+    """
+    Recompute and persist RatingStats for one reviewee.
+
+    Runs inside the caller's transaction (savepoint if nested). The reviewee
+    row is locked first so concurrent review writes serialize and the later
+    refresh always aggregates over committed data.
+    """
+    subject_model = Profile if scope == PROFILE else Accounts
+    with transaction.atomic():
+        list(subject_model.objects.select_for_update().filter(pk=subject_id).values_list("pk", flat=True))
+        stats, _ = RatingStats.objects.update_or_create(
+            scope=scope, subjectID=subject_id, defaults=compute_rating_stats(scope, subject_id)
+        )
+        return stats
+
+
+def refresh_subjects(subjects: Iterable[Subject]) -> None:
+    for scope, subject_id in sorted(set(subjects)):
+        refresh_rating_stats(scope, subject_id)
+
+
+def refresh_for_review(review: JobReview) -> None:
+    refresh_subjects(subjects_for(review))
+
+
+def subjects_for_queryset(reviews) -> Set[Subject]:
+    """Collect affected reviewees before a queryset .update()/.delete() (which skip the hooks)."""
+    subjects: Set[Subject] = set()
+    for profile_id, account_id, reviewer_type in reviews.values_list(
+        "revieweeProfileID_id", "revieweeID_id", "reviewerType"
+    ):
+        if profile_id:
+            subjects.add((PROFILE, profile_id))
+        if account_id and reviewer_type == "CLIENT":
+            subjects.add((ACCOUNT, account_id))
+    return subjects
+
+
+# =============================================================================
+# READ
+# =============================================================================
+
+
+def get_worker_rating_stats(worker_account_id: int, worker_profile_id: Optional[int]) -> Dict:
+    """
+    Stats for a worker in one query: the WORKER profile's row, or the legacy
+    account-level row when the profile has no reviews. Mirrors the fallback
+    the review endpoints have always used.
+    """
+    condition = Q(scope=ACCOUNT, subjectID=worker_account_id)
+    if worker_profile_id:
+        condition |= Q(scope=PROFILE, subjectID=worker_profile_id)
+    rows = {row.scope: row for row in RatingStats.objects.filter(condition)}
+
+    profile_row = rows.get(PROFILE)
+    if profile_row is not None and profile_row.reviewCount:
+        scope, subject_id, row = PROFILE, worker_profile_id, profile_row
+    else:
+        scope, subject_id, row = ACCOUNT, worker_account_id, rows.get(ACCOUNT)
+
+    values = _build_values(None) if row is None else {field: getattr(row, field) for field in STAT_FIELDS}
+    count = values["reviewCount"]
+    return {
+        "scope": scope,
+        "subject_id": subject_id,
+        "total_reviews": count,
+        "average_rating": float(values["ratingSum"] / count) if count else 0.0,
+        "rating_breakdown": {
+            "five_star": values["fiveStar"],
+            "four_star": values["fourStar"],
+            "three_star": values["threeStar"],
+            "two_star": values["twoStar"],
+            "one_star": values["oneStar"],
+        },
+        "last_review_id": values["lastReviewID"],
+        "last_review_at": values["lastReviewAt"],
+    }
+
+
+# =============================================================================
+# REBUILD / CHECK
+# =============================================================================
+
+
+def _live_rows() -> Dict[Subject, Dict]:
+    live: Dict[Subject, Dict] = {}
+    for row in (
+        JobReview.objects.filter(status="ACTIVE", revieweeProfileID__isnull=False)
+        .values("revieweeProfileID_id")
+        .annotate(**_counters())
+        .order_by()
+    ):
+        live[(PROFILE, row["revieweeProfileID_id"])] = _build_values(row)
+    for row in (
+        JobReview.objects.filter(status="ACTIVE", reviewerType="CLIENT", revieweeID__isnull=False)
+        .values("revieweeID_id")
+        .annotate(**_counters())
+        .order_by()
+    ):
+        live[(ACCOUNT, row["revieweeID_id"])] = _build_values(row)
+    return live
+
+
+def rebuild_rating_stats(batch_size: int = 500) -> int:
+    """
+    Rebuild every RatingStats row from grouped aggregates with a bulk upsert.
+    Rows for reviewees that no longer have ACTIVE reviews are zeroed.
+    Returns the number of rows written.
+    """
+    live = _live_rows()
+    subjects = sorted(live)
+    written = 0
+    with transaction.atomic():
+        for start in range(0, len(subjects), batch_size):
+            chunk = subjects[start:start + batch_size]
+            RatingStats.objects.bulk_create(
+                [RatingStats(scope=scope, subjectID=subject_id, **live[(scope, subject_id)]) for scope, subject_id in chunk],
+                update_conflicts=True,
+                unique_fields=["scope", "subjectID"],
+                update_fields=list(STAT_FIELDS) + ["updatedAt"],
+            )
+            written += len(chunk)
+
+        for scope in (PROFILE, ACCOUNT):
+            written += (
+                RatingStats.objects.filter(scope=scope)
+                .exclude(subjectID__in=[subject_id for s, subject_id in subjects if s == scope])
+                .exclude(reviewCount=0)
+                .update(**_build_values(None))
+            )
+    return written
+
+
+def find_stale_rating_stats() -> List[Dict]:
+    """
+    Parity check: compare stored RatingStats with live aggregates.
+    Returns one entry per reviewee whose row is missing or differs.
+    """
+    live = _live_rows()
+    stored = {
+        (row["scope"], row["subjectID"]): row
+        for row in RatingStats.objects.values("scope", "subjectID", *STAT_FIELDS)
+    }
+
+    mismatches = []
+    for subject in sorted(set(live) | set(stored)):
+        expected = live.get(subject, _build_values(None))
+        current = stored.get(subject)
+        if current is None:
+            mismatches.append({"scope": subject[0], "subject_id": subject[1], "missing": True, "expected": expected})
+            continue
+        diff = {
+            field: {"stored": current[field], "expected": expected[field]}
+            for field in STAT_FIELDS
+            if current[field] != expected[field]
+        }
+        if diff:
+            mismatches.append({"scope": subject[0], "subject_id": subject[1], "missing": False, "diff": diff})
+    return mismatches
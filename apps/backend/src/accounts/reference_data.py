@@ -0,0 +1,221 @@
+"""
+Reference Data Cache
+
+Cities, barangays and the global job-category list change a few times a
+year but are fetched every time the registration / job-creation screens open.
+
+- One global version number lives in the cache (VERSION_KEY). Admin edits,
+  model saves/deletes (City, Barangay, global Specializations) and seed
+  scripts call bump_version().
+- Each reference set is serialized to JSON bytes once per version and kept
+  both in Redis (shared across workers) and in a bounded in-process LRU of
+  immutable snapshots, so a warm request does no DB query and no
+  serialization. The LRU is capped because barangay sets are keyed by the
+  caller-supplied city id.
+- The process re-reads the version at most every LOCAL_VERSION_TTL seconds.
+- reference_response() answers with a strong ETag (version + content digest)
+  and returns 304 Not Modified when the client's If-None-Match matches.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Tuple
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+from iayos_project.conditional_get import etag_matches
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "cache:refdata:version"
+PAYLOAD_KEY_PREFIX = "cache:refdata:payload:"
+PAYLOAD_TIMEOUT = 60 * 60 * 24 * 7
+LOCAL_VERSION_TTL = 5
+LOCAL_MAX_ENTRIES = 2048
+CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+
+class ReferencePayload(NamedTuple):
+    version: int
+    body: bytes
+    etag: str
+
+
+_lock = threading.Lock()
+_local: "OrderedDict[Tuple[str, Tuple], ReferencePayload]" = OrderedDict()
+_local_version: Dict[str, float] = {"version": 0, "checked_at": 0.0}
+
+
+# =============================================================================
+# VERSION
+# =============================================================================
+
+
+def get_version(refresh: bool = False) -> int:
+    """Current global reference-data version (re-read from cache every LOCAL_VERSION_TTL s)."""
+    now = time.monotonic()
+    if not refresh and _local_version["version"] and now - _local_version["checked_at"] < LOCAL_VERSION_TTL:
+        return int(_local_version["version"])
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, None)
+        version = cache.get(VERSION_KEY) or 1
+    with _lock:
+        if version != _local_version["version"]:
+            _local.clear()
+        _local_version.update(version=version, checked_at=now)
+    return int(version)
+
+
+def bump_version() -> int:
+    """Invalidate every reference set (call after editing cities, barangays or global categories)."""
+    try:
+        version = cache.incr(VERSION_KEY)
+    except ValueError:
+        # Key missing (cold or flushed cache): start above anything clients may hold
+        version = int(time.time())
+        cache.set(VERSION_KEY, version, None)
+    with _lock:
+        _local.clear()
+        _local_version.update(version=version, checked_at=time.monotonic())
+    logger.info("Reference data version bumped to %s", version)
+    return version
+
+
+# =============================================================================
+# BUILDERS
+# =============================================================================
+
+
+def _build_cities() -> dict:
+    from .models import City
+
+    cities = City.objects.order_by("name").values("cityID", "name", "province", "region")
+    return {"success": True, "cities": list(cities)}
+
+
+def _build_barangays(city_id: int) -> dict:
+    from .models import Barangay
+
+    barangays = (
+        Barangay.objects.filter(city_id=city_id)
+        .values("barangayID", "name", "zipCode")
+        .order_by("name")
+    )
+    return {"success": True, "barangays": list(barangays)}
+
+
+def global_categories():
+    """Global (admin-seeded, non-custom) specializations queryset."""
+    from .models import Specializations
+
+    return Specializations.objects.filter(
+        is_custom=False,
+        created_by_agency__isnull=True,
+        created_by_worker__isnull=True,
+    ).order_by("specializationName")
+
+
+def _build_job_categories() -> dict:
+    category_list = [
+        {
+            "id": cat.specializationID,
+            "name": cat.specializationName,
+            "minimum_rate": float(cat.minimumRate),
+            "is_custom": cat.is_custom,
+        }
+        for cat in global_categories().only(
+            "specializationID", "specializationName", "minimumRate", "is_custom"
+        )
+    ]
+    return {"categories": category_list, "total_count": len(category_list)}
+
+
+def _build_category_details() -> dict:
+    return {
+        "categories": [
+            {
+                "id": cat.specializationID,
+                "name": cat.specializationName,
+                "description": cat.description or "",
+                "minimum_rate": float(cat.minimumRate),
+                "rate_type": cat.rateType,
+                "skill_level": cat.skillLevel,
+                "average_project_cost_min": float(cat.averageProjectCostMin),
+                "average_project_cost_max": float(cat.averageProjectCostMax),
+            }
+            for cat in global_categories()
+        ]
+    }
+
+
+BUILDERS: Dict[str, Callable[..., dict]] = {
+    "cities": _build_cities,
+    "barangays": _build_barangays,
+    "job_categories": _build_job_categories,
+    "category_details": _build_category_details,
+}
+
+
+# =============================================================================
+# PAYLOADS
+# =============================================================================
+
+
+def _payload_key(name: str, args: Tuple, version: int) -> str:
+    suffix = ":".join(str(arg) for arg in args)
+    return f"{PAYLOAD_KEY_PREFIX}v{version}:{name}" + (f":{suffix}" if suffix else "")
+
+
+def _make_payload(version: int, body: bytes) -> ReferencePayload:
+    digest = hashlib.sha256(body).hexdigest()[:16]
+    return ReferencePayload(version=version, body=body, etag=f'"v{version}-{digest}"')
+
+
+def get_payload(name: str, *args) -> ReferencePayload:
+    """Serialized reference set for the current version (local -> Redis -> DB)."""
+    version = get_version()
+    local_key = (name, args)
+    with _lock:
+        payload = _local.get(local_key)
+        if payload is not None and payload.version == version:
+            _local.move_to_end(local_key)
+            return payload
+
+    key = _payload_key(name, args, version)
+    body = cache.get(key)
+    if body is None:
+        data = BUILDERS[name](*args)
+        body = json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":")).encode("utf-8")
+        cache.set(key, body, PAYLOAD_TIMEOUT)
+
+    payload = _make_payload(version, body)
+    with _lock:
+        _local[local_key] = payload
+        _local.move_to_end(local_key)
+        while len(_local) > LOCAL_MAX_ENTRIES:
+            _local.popitem(last=False)
+    return payload
+
+
+def get_data(name: str, *args) -> dict:
+    """Decoded reference set, for callers that post-process it."""
+    return json.loads(get_payload(name, *args).body)
+
+
+def reference_response(request, name: str, *args) -> HttpResponse:
+    """200 with JSON bytes and a strong ETag, or 304 when If-None-Match matches."""
+    payload = get_payload(name, *args)
+    if etag_matches(request.headers.get("If-None-Match"), payload.etag):
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(payload.body, content_type="application/json")
+    response["ETag"] = payload.etag
+    response["Cache-Control"] = CACHE_CONTROL
+    response["X-Reference-Version"] = str(payload.version)
+    return response
@@ -6,9 +6,11 @@ Business logic for reviews and ratings
 """
 from decimal import Decimal
 from datetime import datetime, timedelta
-from django.db.models import Avg, Count, Q
+from django.db import transaction
+from django.db.models import Count, Q
 from django.utils import timezone
 from .models import JobReview, Job, Accounts, Profile, Agency
+from .rating_stats_service import get_worker_rating_stats, scope_reviews
 from .review_schemas import (
     SubmitReviewRequest, ReviewResponse, ReviewListResponse,
     ReviewStatsResponse, RatingBreakdown, AddReviewResponseRequest,
@@ -81,17 +83,18 @@ def submit_review(reviewer: Accounts, payload: SubmitReviewRequest) -> ReviewRes
     if payload.rating < 1.0 or payload.rating > 5.0:
         raise ValueError("Rating must be between 1 and 5")
 
-    # Create review with profile-specific reviewee
-    review = JobReview.objects.create(
-        jobID=job,
-        reviewerID=reviewer,
-        revieweeID=reviewee,
-        revieweeProfileID=reviewee_profile,  # Profile-specific for proper separation
-        reviewerType=payload.reviewer_type,
-        rating=Decimal(str(payload.rating)),
-        comment=payload.comment,
-        status="ACTIVE"
-    )
+    # Create review with profile-specific reviewee (RatingStats update commits with it)
+    with transaction.atomic():
+        review = JobReview.objects.create(
+            jobID=job,
+            reviewerID=reviewer,
+            revieweeID=reviewee,
+            revieweeProfileID=reviewee_profile,  # Profile-specific for proper separation
+            reviewerType=payload.reviewer_type,
+            rating=Decimal(str(payload.rating)),
+            comment=payload.comment,
+            status="ACTIVE"
+        )
 
     return _format_review_response(review, reviewer)
 
@@ -176,49 +179,27 @@ def get_review_stats(worker_account_id: int):
         profileType='WORKER'
     ).first()
 
-    # Get all active reviews for the WORKER profile
-    if worker_profile:
-        reviews = JobReview.objects.filter(
-            revieweeProfileID=worker_profile,
-            status="ACTIVE"
-        )
-        # Fallback for old reviews
-        if not reviews.exists():
-            reviews = JobReview.objects.filter(
-                revieweeID=worker_account,
-                reviewerType='CLIENT',
-                status="ACTIVE"
-            )
-    else:
-        reviews = JobReview.objects.filter(
-            revieweeID=worker_account,
-            reviewerType='CLIENT',
-            status="ACTIVE"
-        )
-
-    # Calculate average rating
-    avg_rating = reviews.aggregate(Avg('rating'))['rating__avg'] or 0.0
-    total_reviews = reviews.count()
-
-    # Rating breakdown
-    rating_breakdown = RatingBreakdown(
-        five_star=reviews.filter(rating__gte=4.5).count(),
-        four_star=reviews.filter(rating__gte=3.5, rating__lt=4.5).count(),
-        three_star=reviews.filter(rating__gte=2.5, rating__lt=3.5).count(),
-        two_star=reviews.filter(rating__gte=1.5, rating__lt=2.5).count(),
-        one_star=reviews.filter(rating__lt=1.5).count()
+    # Counts and breakdown come from the materialized RatingStats row
+    stats = get_worker_rating_stats(
+        worker_account.accountID, worker_profile.profileID if worker_profile else None
     )
 
     # Recent reviews (last 5)
-    recent_reviews = reviews.order_by('-createdAt')[:5]
-    recent_review_responses = [
-        _format_review_response(review, None) for review in recent_reviews
-    ]
+    recent_review_responses = []
+    if stats["total_reviews"]:
+        recent_reviews = (
+            scope_reviews(stats["scope"], stats["subject_id"])
+            .select_related("reviewerID", "jobID", "revieweeID")
+            .order_by('-createdAt')[:5]
+        )
+        recent_review_responses = [
+            _format_review_response(review, None) for review in recent_reviews
+        ]
 
     return ReviewStatsResponse(
-        average_rating=float(avg_rating),
-        total_reviews=total_reviews,
-        rating_breakdown=rating_breakdown,
+        average_rating=stats["average_rating"],
+        total_reviews=stats["total_reviews"],
+        rating_breakdown=RatingBreakdown(**stats["rating_breakdown"]),
         recent_reviews=recent_review_responses
     )
 
@@ -281,10 +262,11 @@ def edit_review(review_id: int, user: Accounts, new_comment: str, new_rating: fl
     if new_rating < 1.0 or new_rating > 5.0:
         raise ValueError("Rating must be between 1 and 5")
 
-    # Update review
+    # Update review (RatingStats update commits with it)
     review.comment = new_comment
     review.rating = Decimal(str(new_rating))
-    review.save()
+    with transaction.atomic():
+        review.save()
 
     return _format_review_response(review, user)
 
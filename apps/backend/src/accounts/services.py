@@ -13,10 +13,12 @@ import hashlib
 import random
 from zoneinfo import ZoneInfo
 from iayos_project.utils import upload_kyc_doc
+from iayos_project.observability import get_logger
 import os
 import re
 from difflib import SequenceMatcher
 
+log = get_logger(__name__)
 
 PH_TIMEZONE = ZoneInfo("Asia/Manila")
 
@@ -726,6 +728,16 @@ def refresh_token(expired_token):
 
 
 def fetch_currentUser(accountID, profile_type=None):
+    """
+    Current-user (/me) payload, served from accounts.current_user_cache.
+    Raises ValueError if the account does not exist.
+    """
+    from .current_user_cache import get_current_user
+
+    return get_current_user(accountID, profile_type, _build_current_user)
+
+
+def _build_current_user(accountID, profile_type=None):
     try:
         account = Accounts.objects.get(accountID=accountID)
 
@@ -736,7 +748,7 @@ def fetch_currentUser(accountID, profile_type=None):
         # Fallback: If no SystemRole but user is staff/superuser, treat as ADMIN
         if not user_role and (account.is_staff or account.is_superuser):
             user_role = "ADMIN"
-            print(f"✅ fetch_currentUser: User {account.email} is staff/superuser, setting role to ADMIN")
+            log.debug("fetch_currentUser: account %s is staff/superuser, setting role to ADMIN", account.accountID)
 
         # AGENCY CHECK FIRST: Unless the JWT explicitly says WORKER or CLIENT
         # (mobile app), always check Agency before Profile. This prevents users
@@ -747,7 +759,7 @@ def fetch_currentUser(accountID, profile_type=None):
         if _pt not in ('WORKER', 'CLIENT'):
             agency = Agency.objects.filter(accountFK=account).first()
             if agency:
-                print(f"✅ fetch_currentUser: Agency found for {account.email} (profile_type={profile_type})")
+                log.debug("fetch_currentUser: agency found for account %s (profile_type=%s)", account.accountID, profile_type)
                 needs_completion = not agency.businessName or not agency.contactNumber
                 return {
                     "accountID": account.accountID,
@@ -766,38 +778,33 @@ def fetch_currentUser(accountID, profile_type=None):
                     "needs_profile_completion": needs_completion,
                 }
             else:
-                print(f"⚠️  fetch_currentUser: No Agency record for {account.email}, falling through to Profile")
+                log.debug("fetch_currentUser: no agency for account %s, falling through to Profile", account.accountID)
 
         try:
             # If profile_type is specified (from JWT), fetch that specific profile
             if profile_type:
-                print(f"🔍 fetch_currentUser: Looking for {profile_type} profile for account {accountID}")
+                log.debug("fetch_currentUser: looking for %s profile for account %s", profile_type, accountID)
                 profile = Profile.objects.select_related("accountFK").filter(
                     accountFK=account, 
                     profileType=profile_type
                 ).first()
                 
                 if profile:
-                    print(f"✅ fetch_currentUser: Found {profile_type} profile (ID: {profile.profileID})")
+                    log.debug("fetch_currentUser: found %s profile %s", profile_type, profile.profileID)
                 else:
-                    print(f"⚠️  fetch_currentUser: No {profile_type} profile found for account {accountID}, falling back to any profile")
+                    log.debug("fetch_currentUser: no %s profile for account %s, falling back to any profile", profile_type, accountID)
                     profile = Profile.objects.select_related("accountFK").filter(accountFK=account).order_by('-profileID').first()
                     if profile:
-                        print(f"⚠️  fetch_currentUser: Using fallback profile type: {profile.profileType}")
+                        log.debug("fetch_currentUser: using fallback profile type %s", profile.profileType)
             else:
-                print(f"🔍 fetch_currentUser: No profile_type specified, using most recent profile")
+                log.debug("fetch_currentUser: no profile_type specified, using most recent profile")
                 # Default behavior: get most recent profile
                 profile = Profile.objects.select_related("accountFK").filter(accountFK=account).order_by('-profileID').first()
             
             if not profile:
                 raise Profile.DoesNotExist
 
-            # Debug: Log what's stored in DB vs what we're sending
-            raw_profile_img = profile.profileImg
             formatted_profile_img = get_full_image_url(profile.profileImg)
-            print(f"🖼️  Profile Image Debug for user {accountID}:")
-            print(f"   Raw DB value: {raw_profile_img}")
-            print(f"   Formatted URL: {formatted_profile_img}")
 
             profile_data = {
                 "id": profile.profileID,  # Add profile ID
@@ -826,7 +833,7 @@ def fetch_currentUser(accountID, profile_type=None):
                     )
                     
                     if created:
-                        print(f"   🔧 Auto-repaired: Created missing WorkerProfile for profile {profile.profileID}")
+                        log.debug("fetch_currentUser: auto-repaired missing WorkerProfile for profile %s", profile.profileID)
                     
                     profile_data["workerProfileId"] = worker_profile.id  # WorkerProfile primary key
                     profile_data["bio"] = worker_profile.bio or ""
@@ -862,7 +869,7 @@ def fetch_currentUser(accountID, profile_type=None):
                         status='COMPLETED'
                     ).count()
                     profile_data["totalEarningGross"] = float(worker_profile.totalEarningGross or 0)
-                    print(f"   🔧 Added worker profile ID: {worker_profile.id}")
+                    log.debug("fetch_currentUser: added worker profile %s", worker_profile.id)
                     
                     # Get skills with certification counts
                     specializations_query = workerSpecialization.objects.filter(
@@ -894,12 +901,12 @@ def fetch_currentUser(accountID, profile_type=None):
                         "",
                     )
                     profile_data["jobTitle"] = explicit_job_title or first_primary_skill_name
-                    print(f"   🔧 Added {len(skills_list)} skills to profile data")
+                    log.debug("fetch_currentUser: added %s skills to profile data", len(skills_list))
                     
                 except WorkerProfile.DoesNotExist:
-                    print(f"   ⚠️  Worker profile not found for profile {profile.profileID}")
+                    log.debug("fetch_currentUser: worker profile not found for profile %s", profile.profileID)
                     
-            print(f"   👤 Profile Data for {account.email}: Type={profile.profileType} (Raw: {repr(profile.profileType)})")
+            log.debug("fetch_currentUser: profile type for account %s is %r", account.accountID, profile.profileType)
 
             # If a Profile exists we treat this as an "individual" account
             needs_profile_completion = not profile.contactNum or not profile.birthDate
@@ -1819,42 +1826,18 @@ def get_user_notifications(user_account_id, limit=50, unread_only=False, profile
     Returns:
         List of notification dictionaries
     """
-    from .models import Notification
-    from django.db.models import Q
+    from .notification_feed import serialize_notification, visible_notifications
     
     try:
-        queryset = Notification.objects.filter(accountFK__accountID=user_account_id)
-        
         # Filter by profile_type: show notifications for the specific profile + account-level (null)
-        if profile_type:
-            queryset = queryset.filter(
-                Q(profile_type=profile_type) | Q(profile_type__isnull=True)
-            )
-        else:
-            # If no profile_type provided, only show account-level notifications
-            queryset = queryset.filter(profile_type__isnull=True)
+        queryset = visible_notifications(user_account_id, profile_type)
         
         if unread_only:
             queryset = queryset.filter(isRead=False)
         
         queryset = queryset.order_by('-createdAt')[:limit]
         
-        notifications = []
-        for notif in queryset:
-            notifications.append({
-                "notificationID": notif.notificationID,
-                "type": notif.notificationType,
-                "notificationType": notif.notificationType,
-                "relatedJobID": notif.relatedJobID,
-                "relatedApplicationID": notif.relatedApplicationID,
-                "title": notif.title,
-                "message": notif.message,
-                "isRead": notif.isRead,
-                "createdAt": notif.createdAt.isoformat(),
-                "readAt": notif.readAt.isoformat() if notif.readAt else None,
-                "relatedKYCLogID": notif.relatedKYCLogID,
-                "profileType": notif.profile_type,
-            })
+        notifications = [serialize_notification(notif) for notif in queryset]
         
         return notifications
         
@@ -1918,6 +1901,10 @@ def mark_all_notifications_as_read(user_account_id):
             readAt=timezone.now()
         )
         
+        # Queryset update skips Notification.save: sync other devices and the counter
+        from .notification_feed import publish_read
+        publish_read(user_account_id)
+        
         print(f"✅ Marked {updated_count} notifications as read")
         return updated_count
         
@@ -1939,25 +1926,11 @@ def get_unread_notification_count(user_account_id, profile_type=None):
     Returns:
         Integer count of unread notifications
     """
-    from .models import Notification
-    from django.db.models import Q
+    from .notification_feed import unread_count
 
     try:
-        queryset = Notification.objects.filter(
-            accountFK__accountID=user_account_id,
-            isRead=False
-        )
-        
-        # Filter by profile_type: count notifications for the specific profile + account-level (null)
-        if profile_type:
-            queryset = queryset.filter(
-                Q(profile_type=profile_type) | Q(profile_type__isnull=True)
-            )
-        else:
-            # If no profile_type provided, only count account-level notifications
-            queryset = queryset.filter(profile_type__isnull=True)
-        
-        count = queryset.count()
+        # Cached per-account counts; dropped whenever a notification is created/read/deleted
+        count = unread_count(user_account_id, profile_type)
 
         return count
 
@@ -2553,38 +2526,15 @@ def get_worker_availability(user_id):
 def update_user_location(account_id: int, latitude: float, longitude: float):
     """
     Update user's GPS location
+
+    Pings are coalesced by accounts.location_service and flushed to Profile
+    in batches instead of saving the profile on every update.
     """
-    from django.utils import timezone
-    
+    from .location_service import record_ping
+
     try:
-        # Get the user's profile
-        profile = Profile.objects.filter(accountFK_id=account_id).first()
-        
-        if not profile:
-            raise ValueError("Profile not found")
-        
-        # Update location
-        profile.latitude = latitude
-        profile.longitude = longitude
-        profile.location_updated_at = timezone.now()
-        
-        # Enable location sharing if not already enabled
-        if not profile.location_sharing_enabled:
-            profile.location_sharing_enabled = True
-        
-        profile.save()
-        
-        return {
-            "profile_id": profile.profileID,
-            "latitude": float(profile.latitude),
-            "longitude": float(profile.longitude),
-            "location_updated_at": profile.location_updated_at.isoformat(),
-            "location_sharing_enabled": profile.location_sharing_enabled,
-            "message": "Location updated successfully"
-        }
-        
-    except Profile.DoesNotExist:
-        raise ValueError("Profile not found")
+        return record_ping(account_id, latitude, longitude)
+
     except Exception as e:
         print(f"❌ Error updating location: {str(e)}")
         raise
@@ -2602,6 +2552,9 @@ def toggle_location_sharing(account_id: int, enabled: bool):
         
         profile.location_sharing_enabled = enabled
         profile.save()
+
+        from .location_service import sync_sharing
+        sync_sharing(profile)
         
         return {
             "profile_id": profile.profileID,
@@ -2670,85 +2623,15 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
 def find_nearby_workers(latitude: float, longitude: float, radius_km: float = 10.0, specialization_id: int = None):
     """
     Find workers near a specific location
+
+    Uses the geo index in accounts.location_service and hydrates the hits
+    with one batched WorkerProfile query.
     """
-    from .models import WorkerProfile, workerSpecialization
-    from django.db.models import Q
-    
+    from .location_service import find_nearby_workers as search_nearby_workers
+
     try:
-        # Get all worker profiles with location sharing enabled
-        workers_query = Profile.objects.filter(
-            profileType='WORKER',
-            location_sharing_enabled=True,
-            latitude__isnull=False,
-            longitude__isnull=False
-        ).select_related('accountFK')
-        
-        nearby_workers = []
-        
-        for profile in workers_query:
-            # Calculate distance
-            distance = calculate_distance(
-                latitude, 
-                longitude, 
-                float(profile.latitude), 
-                float(profile.longitude)
-            )
-            
-            # Check if within radius
-            if distance <= radius_km:
-                try:
-                    # Get worker profile
-                    worker_profile = WorkerProfile.objects.get(profileID=profile)
-                    
-                    # Get specializations
-                    specializations_query = workerSpecialization.objects.filter(
-                        workerID=worker_profile
-                    ).select_related('specializationID')
-                    
-                    specializations = [
-                        {
-                            "id": ws.specializationID.specializationID,
-                            "name": ws.specializationID.specializationName,
-                            "experience_years": ws.experienceYears,
-                            "certification": ws.certification
-                        }
-                        for ws in specializations_query
-                    ]
-                    
-                    # Filter by specialization if provided
-                    if specialization_id:
-                        if not any(s['id'] == specialization_id for s in specializations):
-                            continue
-                    
-                    nearby_workers.append({
-                        "profile_id": profile.profileID,
-                        "worker_id": worker_profile.profileID.profileID,
-                        "first_name": profile.firstName,
-                        "last_name": profile.lastName,
-                        "profile_img": profile.profileImg if profile.profileImg else None,
-                        "latitude": float(profile.latitude),
-                        "longitude": float(profile.longitude),
-                        "distance_km": round(distance, 2),
-                        "availability_status": worker_profile.availabilityStatus,
-                        "specializations": specializations
-                    })
-                    
-                except WorkerProfile.DoesNotExist:
-                    continue
-        
-        # Sort by distance
-        nearby_workers.sort(key=lambda x: x['distance_km'])
-        
-        return {
-            "workers": nearby_workers,
-            "count": len(nearby_workers),
-            "search_location": {
-                "latitude": latitude,
-                "longitude": longitude,
-                "radius_km": radius_km
-            }
-        }
-        
+        return search_nearby_workers(latitude, longitude, radius_km, specialization_id)
+
     except Exception as e:
         print(f"❌ Error finding nearby workers: {str(e)}")
         raise
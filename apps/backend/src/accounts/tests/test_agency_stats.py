@@ -0,0 +1,120 @@
+"""
+Unit tests for the materialized agency stats (AgencyStats)
+"""
+
+from decimal import Decimal
+
+from django.test import TestCase
+
+from accounts.agency_stats_service import (
+    find_stale_agency_stats,
+    rebuild_agency_stats,
+)
+from accounts.models import (
+    Accounts,
+    Agency,
+    AgencyStats,
+    ClientProfile,
+    Job,
+    JobReview,
+    Profile,
+)
+
+
+class AgencyStatsTests(TestCase):
+    def setUp(self):
+        self.client_account = Accounts.objects.create_user(
+            email="stats-client@test.com",
+            password="password123",
+            isVerified=True,
+        )
+        self.agency_account = Accounts.objects.create_user(
+            email="stats-agency@test.com",
+            password="password123",
+            isVerified=True,
+        )
+        self.client_profile = Profile.objects.create(
+            accountFK=self.client_account,
+            profileType="CLIENT",
+            firstName="Client",
+            lastName="Stats",
+        )
+        self.client_record = ClientProfile.objects.create(
+            profileID=self.client_profile,
+            description="",
+            totalJobsPosted=0,
+            clientRating=0,
+            activeJobsCount=0,
+        )
+        self.agency = Agency.objects.create(
+            accountFK=self.agency_account,
+            businessName="Stats Agency",
+        )
+
+    def _create_agency_job(self, status=Job.JobStatus.ACTIVE):
+        return Job.objects.create(
+            clientID=self.client_record,
+            title="Agency stats job",
+            description="Counts toward agency stats",
+            budget=Decimal("1000.00"),
+            location="Zamboanga",
+            assignedAgencyFK=self.agency,
+            status=status,
+        )
+
+    def test_stats_follow_job_status_and_reviews(self):
+        job = self._create_agency_job()
+        self._create_agency_job(status=Job.JobStatus.IN_PROGRESS)
+
+        stats = AgencyStats.objects.get(agencyID=self.agency)
+        self.assertEqual(stats.totalJobs, 2)
+        self.assertEqual(stats.activeJobs, 2)
+        self.assertEqual(stats.completedJobs, 0)
+        self.assertIsNone(stats.averageRating)
+
+        job.status = Job.JobStatus.COMPLETED
+        job.save()
+        JobReview.objects.create(
+            jobID=job,
+            reviewerID=self.client_account,
+            revieweeAgencyID=self.agency,
+            reviewerType=JobReview.ReviewerType.CLIENT,
+            rating=Decimal("4.00"),
+            comment="Good",
+        )
+        JobReview.objects.create(
+            jobID=job,
+            reviewerID=self.client_account,
+            revieweeAgencyID=self.agency,
+            reviewerType=JobReview.ReviewerType.CLIENT,
+            rating=Decimal("5.00"),
+            comment="Great",
+        )
+
+        stats.refresh_from_db()
+        self.assertEqual(stats.completedJobs, 1)
+        self.assertEqual(stats.activeJobs, 1)
+        self.assertEqual(stats.reviewCount, 2)
+        self.assertEqual(stats.averageRating, Decimal("4.50"))
+
+    def test_unassigning_agency_moves_job_out_of_stats(self):
+        job = self._create_agency_job()
+        job.assignedAgencyFK = None
+        job.save()
+
+        stats = AgencyStats.objects.get(agencyID=self.agency)
+        self.assertEqual(stats.totalJobs, 0)
+        self.assertEqual(stats.activeJobs, 0)
+
+    def test_rebuild_repairs_drift(self):
+        self._create_agency_job(status=Job.JobStatus.COMPLETED)
+        AgencyStats.objects.filter(agencyID=self.agency).update(completedJobs=42)
+        self.assertEqual(len(find_stale_agency_stats([self.agency.agencyId])), 1)
+
+        written = rebuild_agency_stats()
+
+        self.assertEqual(written, 1)
+        self.assertEqual(find_stale_agency_stats([self.agency.agencyId]), [])
+        self.assertEqual(
+            AgencyStats.objects.get(agencyID=self.agency).completedJobs, 1
+        )
@@ -0,0 +1,88 @@
+"""
+Unit tests for the cached /me payload and its invalidation hooks
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from accounts.current_user_cache import PAYLOAD_TIMEOUT, _LocalLRU, clear_local
+from accounts.models import Accounts, Agency, Profile, WorkerProfile, kyc, kycFiles
+from accounts.services import fetch_currentUser
+from adminpanel.models import SystemRoles
+
+
+class CurrentUserCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_local()
+        self.account = Accounts.objects.create_user(email="me-cache@test.com", password="testpass123")
+        self.profile = Profile.objects.create(
+            accountFK=self.account, firstName="Cached", lastName="Worker", profileType="WORKER"
+        )
+        self.worker = WorkerProfile.objects.create(profileID=self.profile)
+
+    def test_warm_fetch_does_no_db_queries(self):
+        first = fetch_currentUser(self.account.accountID, profile_type="WORKER")
+
+        with self.assertNumQueries(0):
+            second = fetch_currentUser(self.account.accountID, profile_type="WORKER")
+        self.assertEqual(first, second)
+
+        clear_local()  # another worker process: served from the shared cache
+        with self.assertNumQueries(0):
+            fetch_currentUser(self.account.accountID, profile_type="WORKER")
+
+        second["email"] = "mutated"
+        self.assertEqual(fetch_currentUser(self.account.accountID, profile_type="WORKER")["email"], self.account.email)
+
+    def test_profile_worker_and_role_changes_invalidate(self):
+        fetch_currentUser(self.account.accountID, profile_type="WORKER")
+
+        self.profile.firstName = "Renamed"
+        self.profile.save()
+        self.assertEqual(
+            fetch_currentUser(self.account.accountID, profile_type="WORKER")["profile_data"]["firstName"], "Renamed"
+        )
+
+        self.worker.bio = "New bio"
+        self.worker.save()
+        self.assertEqual(fetch_currentUser(self.account.accountID, profile_type="WORKER")["profile_data"]["bio"], "New bio")
+
+        SystemRoles.objects.create(accountID=self.account, systemRole="ADMIN")
+        self.assertEqual(fetch_currentUser(self.account.accountID, profile_type="WORKER")["role"], "ADMIN")
+
+    def test_profile_types_are_cached_separately_and_agency_invalidates(self):
+        self.assertEqual(fetch_currentUser(self.account.accountID)["accountType"], "individual")
+
+        Agency.objects.create(accountFK=self.account, businessName="Cache Co")
+
+        self.assertEqual(fetch_currentUser(self.account.accountID)["accountType"], "agency")
+        self.assertEqual(
+            fetch_currentUser(self.account.accountID, profile_type="WORKER")["accountType"], "individual"
+        )
+
+    def test_kyc_file_saves_invalidate_the_owner(self):
+        record = kyc.objects.create(accountFK=self.account, kyc_status="PENDING")
+
+        with mock.patch("accounts.current_user_cache.invalidate_current_user") as invalidate:
+            kycFiles.objects.create(
+                kycID=record,
+                idType="NATIONALID",
+                fileName="FRONTID_1.jpg",
+                fileURL=f"user_{self.account.accountID}/kyc/FRONTID_1.jpg",
+            )
+        invalidate.assert_called_once_with(self.account.accountID)
+
+    def test_unknown_account_is_not_cached(self):
+        with self.assertRaises(ValueError):
+            fetch_currentUser(987654321)
+
+    def test_local_entries_expire_with_the_shared_copy(self):
+        lru = _LocalLRU(max_entries=4, timeout=PAYLOAD_TIMEOUT)
+        with mock.patch("accounts.current_user_cache.time.monotonic", return_value=1000.0):
+            lru.set((1, "WORKER"), 7, {"email": "a@test.com"})
+            self.assertEqual(lru.get((1, "WORKER")), (7, {"email": "a@test.com"}))
+        with mock.patch("accounts.current_user_cache.time.monotonic", return_value=1000.0 + PAYLOAD_TIMEOUT):
+            self.assertIsNone(lru.get((1, "WORKER")))
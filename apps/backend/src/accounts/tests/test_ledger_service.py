@@ -0,0 +1,118 @@
+"""
+Unit tests for the wallet ledger service (snapshots, statements, drift check)
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.ledger_service import (
+    balance_at,
+    check_consistency,
+    get_transaction_history,
+    get_wallet_statement,
+    ledger_balances,
+    take_snapshots,
+)
+from accounts.models import Accounts, Transaction, Wallet, WalletSnapshot
+
+
+class WalletLedgerTestCase(TestCase):
+    def setUp(self):
+        account = Accounts.objects.create_user(email="ledger@test.com", password="testpass123")
+        self.wallet = Wallet.objects.create(
+            accountFK=account, balance=Decimal("350.00"), pendingEarnings=Decimal("200.00")
+        )
+        self._txn("DEPOSIT", "500.00")
+        self._txn("WITHDRAWAL", "100.00", status="PENDING")
+        self._txn("PAYMENT", "50.00", payment_method="WALLET")
+        # Paid through the gateway: never touched the wallet
+        self._txn("PAYMENT", "300.00", payment_method="GCASH")
+        self._txn("PENDING_EARNING", "200.00", status="PENDING")
+
+    def _txn(self, txn_type, amount, status="COMPLETED", payment_method="GCASH"):
+        return Transaction.objects.create(
+            walletID=self.wallet,
+            transactionType=txn_type,
+            amount=Decimal(amount),
+            balanceAfter=self.wallet.balance,
+            status=status,
+            paymentMethod=payment_method,
+        )
+
+    def test_consistent_wallet_reports_no_drift(self):
+        report = check_consistency()
+
+        self.assertEqual(report["wallets_checked"], 1)
+        self.assertEqual(report["drifted_wallets"], 0)
+
+    def test_in_place_mutation_without_ledger_row_is_flagged(self):
+        Wallet.objects.filter(pk=self.wallet.pk).update(balance=Decimal("360.00"))
+
+        report = check_consistency()
+
+        self.assertEqual(report["drifted_wallets"], 1)
+        entry = report["drifted"][0]
+        self.assertEqual(entry["issues"], ["balance_drift"])
+        self.assertEqual(entry["balance_drift"], Decimal("10.00"))
+
+    def test_snapshot_plus_tail_matches_full_scan(self):
+        self.assertEqual(take_snapshots(min_new_transactions=1)["snapshots_created"], 1)
+        self._txn("DEPOSIT", "25.00")
+
+        totals = ledger_balances([self.wallet.pk])[self.wallet.pk]
+
+        self.assertEqual(totals["tail_rows"], 1)
+        self.assertEqual(totals["balance"], Decimal("375.00"))
+        self.assertEqual(totals["pending"], Decimal("200.00"))
+        self.assertEqual(balance_at(self.wallet.pk, timezone.now())["balance"], Decimal("375.00"))
+
+    def test_updating_a_snapshotted_row_invalidates_the_snapshot(self):
+        take_snapshots(min_new_transactions=1)
+        pending = Transaction.objects.get(transactionType="PENDING_EARNING")
+
+        # Release from the 7-day buffer
+        pending.transactionType = "EARNING"
+        pending.status = "COMPLETED"
+        pending.save()
+
+        self.assertFalse(WalletSnapshot.objects.exists())
+        totals = ledger_balances([self.wallet.pk])[self.wallet.pk]
+        self.assertEqual(totals["balance"], Decimal("550.00"))
+        self.assertEqual(totals["pending"], Decimal("0.00"))
+
+    def test_statement_running_balance(self):
+        now = timezone.now()
+        statement = get_wallet_statement(self.wallet.pk, now - timedelta(days=1), now)
+
+        self.assertEqual(statement["opening_balance"], 0.0)
+        self.assertEqual(
+            [entry["running_balance"] for entry in statement["transactions"]],
+            [500.0, 400.0, 350.0, 350.0, 350.0],
+        )
+        self.assertEqual(statement["closing_balance"], 350.0)
+        self.assertEqual((statement["total_credits"], statement["total_debits"]), (500.0, 150.0))
+
+    def test_history_pages_carry_the_running_balance(self):
+        rows, meta = get_transaction_history(self.wallet.pk, limit=2)
+        balances = [row.running_balance for row in rows]
+        pages = 1
+        while meta["next_cursor"]:
+            with self.assertNumQueries(1):  # no COUNT, no ledger re-read
+                rows, meta = get_transaction_history(self.wallet.pk, cursor=meta["next_cursor"], limit=2)
+            balances += [row.running_balance for row in rows]
+            pages += 1
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(balances, [Decimal(v) for v in ("350", "350", "350", "400", "500")])
+        self.assertFalse(meta["has_next"])
+
+    def test_filtered_history_uses_recorded_balance(self):
+        rows, meta = get_transaction_history(self.wallet.pk, transaction_type="PAYMENT", compact=True)
+
+        self.assertEqual(meta["running_balance_source"], "recorded")
+        self.assertEqual([row.running_balance for row in rows], [row.balanceAfter for row in rows])
+        with self.assertRaises(ValueError):
+            get_transaction_history(self.wallet.pk, cursor="not-a-cursor")
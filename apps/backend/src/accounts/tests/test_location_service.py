@@ -0,0 +1,93 @@
+"""
+Unit tests for the location service (coalesced pings, nearby-worker search)
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from accounts import location_service
+from accounts.location_service import (
+    LocalGridStore,
+    find_nearby_workers,
+    flush_pending,
+    rebuild_index,
+    record_ping,
+)
+from accounts.models import Accounts, Profile, Specializations, WorkerProfile, workerSpecialization
+
+# Zamboanga City Hall
+ORIGIN = (6.9214, 122.0790)
+
+
+class LocationServiceTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        location_service._store = LocalGridStore()
+        self.plumbing = Specializations.objects.create(specializationName="Plumbing")
+        self.near = self._worker("near@test.com", "6.93000000", "122.08000000", skill=self.plumbing)
+        self.far = self._worker("far@test.com", "7.00000000", "122.20000000")
+        self.hidden = self._worker("hidden@test.com", "6.92200000", "122.07900000", sharing=False)
+        rebuild_index()
+
+    def tearDown(self):
+        location_service._store = None
+
+    def _worker(self, email, latitude, longitude, sharing=True, skill=None):
+        account = Accounts.objects.create_user(email=email, password="testpass123")
+        profile = Profile.objects.create(
+            accountFK=account,
+            firstName="Test",
+            lastName="Worker",
+            profileType="WORKER",
+            birthDate=date(1990, 1, 1),
+            latitude=Decimal(latitude),
+            longitude=Decimal(longitude),
+            location_sharing_enabled=sharing,
+        )
+        worker = WorkerProfile.objects.create(profileID=profile)
+        if skill:
+            workerSpecialization.objects.create(
+                workerID=worker, specializationID=skill, experienceYears=3, certification=""
+            )
+        return profile
+
+    def test_pings_are_coalesced_until_flush(self):
+        cache.add(location_service.FLUSH_LOCK_KEY, 1, 60)  # a flush just ran
+
+        record_ping(self.near.accountFK_id, 6.9300001, 122.0800001)
+        record_ping(self.near.accountFK_id, 6.9400000, 122.0900000)
+
+        self.near.refresh_from_db()
+        self.assertEqual(self.near.latitude, Decimal("6.93000000"))
+
+        self.assertEqual(flush_pending(), 1)
+        self.near.refresh_from_db()
+        self.assertEqual(self.near.latitude, Decimal("6.94000000"))
+        self.assertEqual(self.near.longitude, Decimal("122.09000000"))
+        self.assertIsNotNone(self.near.location_updated_at)
+
+    def test_nearby_search_filters_radius_and_sharing(self):
+        with self.assertNumQueries(2):  # workers + prefetched specializations
+            result = find_nearby_workers(*ORIGIN, radius_km=5)
+
+        self.assertEqual([w["profile_id"] for w in result["workers"]], [self.near.profileID])
+        self.assertEqual(result["workers"][0]["specializations"][0]["name"], "Plumbing")
+
+        wide = find_nearby_workers(*ORIGIN, radius_km=50)
+        self.assertEqual(
+            [w["profile_id"] for w in wide["workers"]], [self.near.profileID, self.far.profileID]
+        )
+
+    def test_specialization_filter_and_unflushed_position(self):
+        cache.add(location_service.FLUSH_LOCK_KEY, 1, 60)
+        record_ping(self.far.accountFK_id, *ORIGIN)  # moved, not yet flushed
+
+        result = find_nearby_workers(*ORIGIN, radius_km=5, specialization_id=self.plumbing.pk)
+        self.assertEqual([w["profile_id"] for w in result["workers"]], [self.near.profileID])
+
+        result = find_nearby_workers(*ORIGIN, radius_km=5)
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(result["workers"][0]["profile_id"], self.far.profileID)
@@ -0,0 +1,139 @@
+"""
+Unit tests for notification push, since_id sync and the cached unread counter
+"""
+
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import TestCase
+
+from accounts.models import Accounts, Notification
+from accounts.notification_feed import get_notifications_since, publish_created, unread_count
+from accounts.services import mark_all_notifications_as_read
+from profiles.consumers import InboxConsumer
+
+
+class NotificationFeedTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.account = Accounts.objects.create_user(email="feed@test.com", password="testpass123")
+
+    def _notify(self, profile_type="CLIENT", **extra):
+        return Notification.objects.create(
+            accountFK=self.account, title="Hello", message="World", profile_type=profile_type, **extra
+        )
+
+    def test_since_id_returns_only_newer_rows_in_pages(self):
+        first = self._notify()
+        second = self._notify()
+        third = self._notify(profile_type=None)
+        self._notify(profile_type="WORKER")
+
+        page = get_notifications_since(self.account.accountID, first.notificationID, "CLIENT", limit=1)
+        self.assertEqual([n["notificationID"] for n in page["notifications"]], [second.notificationID])
+        self.assertTrue(page["has_more"])
+
+        page = get_notifications_since(self.account.accountID, page["next_since_id"], "CLIENT", limit=1)
+        self.assertEqual([n["notificationID"] for n in page["notifications"]], [third.notificationID])
+        self.assertFalse(page["has_more"])
+        self.assertEqual(page["unread_count"], 3)
+
+    def test_unread_count_is_cached_and_refreshed_on_commit(self):
+        self._notify()
+        self._notify(profile_type="WORKER")
+        self.assertEqual(unread_count(self.account.accountID, "CLIENT"), 1)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(unread_count(self.account.accountID, "WORKER"), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._notify(profile_type=None)
+        self.assertEqual(unread_count(self.account.accountID, "CLIENT"), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_all_notifications_as_read(self.account.accountID)
+        self.assertEqual(unread_count(self.account.accountID, "CLIENT"), 0)
+
+    @patch("profiles.channel_routing.group_send_many")
+    def test_new_notification_is_pushed_to_the_user_group_after_commit(self, group_send_many):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            notification = self._notify()
+        group_send_many.assert_not_called()
+
+        for callback in callbacks:
+            callback()
+
+        (messages,) = group_send_many.call_args[0]
+        self.assertEqual(len(messages), 1)
+        group, event = messages[0]
+        self.assertEqual(group, f"user_{self.account.accountID}")
+        self.assertEqual(event["type"], "notification_created")
+        self.assertEqual(event["notification"]["notificationID"], notification.notificationID)
+
+    @patch("profiles.channel_routing.group_send_many", side_effect=RuntimeError("layer down"))
+    def test_bulk_publish_sends_one_batch_and_logs_failures(self, group_send_many):
+        other = Accounts.objects.create_user(email="feed-other@test.com", password="testpass123")
+        rows = Notification.objects.bulk_create(
+            [
+                Notification(accountFK=self.account, title="A", message="1", profile_type="CLIENT"),
+                Notification(accountFK=other, title="B", message="2", profile_type="CLIENT"),
+                Notification(accountFK=self.account, title="C", message="3", profile_type="CLIENT"),
+            ]
+        )
+
+        with self.assertLogs("accounts.notification_feed", level="ERROR"):
+            with self.captureOnCommitCallbacks(execute=True):
+                publish_created(rows)
+
+        group_send_many.assert_called_once()
+        (messages,) = group_send_many.call_args[0]
+        self.assertEqual(
+            [(group, event["notification"]["title"]) for group, event in messages],
+            [
+                (f"user_{self.account.accountID}", "A"),
+                (f"user_{other.accountID}", "B"),
+                (f"user_{self.account.accountID}", "C"),
+            ],
+        )
+
+    @patch("profiles.channel_routing.group_send_many")
+    def test_read_event_carries_the_notification_profile_type(self, group_send_many):
+        notification = self._notify(profile_type="WORKER")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            notification.isRead = True
+            notification.save()
+
+        (messages,) = group_send_many.call_args[0]
+        event = messages[0][1]
+        self.assertEqual(event["type"], "notifications_read")
+        self.assertEqual(event["notification_ids"], [notification.notificationID])
+        self.assertEqual(event["profileType"], "WORKER")
+
+    def test_socket_only_forwards_notifications_for_its_profile(self):
+        sent = []
+
+        async def send(text_data=None, bytes_data=None, close=False):
+            sent.append(text_data)
+
+        consumer = InboxConsumer()
+        consumer.user = self.account
+        consumer.send = send
+        self.account.profile_type = "WORKER"
+
+        for profile_type in ("CLIENT", "WORKER", None):
+            async_to_sync(consumer.notification_created)(
+                {"type": "notification_created", "notification": {"profileType": profile_type}}
+            )
+        async_to_sync(consumer.notifications_read)(
+            {"type": "notifications_read", "notification_ids": [1], "all": False, "profileType": "CLIENT"}
+        )
+        async_to_sync(consumer.notifications_read)(
+            {"type": "notifications_read", "notification_ids": None, "all": True, "profileType": None}
+        )
+        async_to_sync(consumer.notification_deleted)(
+            {"type": "notification_deleted", "notification_id": 1, "profileType": "CLIENT"}
+        )
+
+        self.assertEqual(len(sent), 3)
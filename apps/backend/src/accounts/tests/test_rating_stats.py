@@ -0,0 +1,113 @@
+"""
+Unit tests for the materialized rating histograms (RatingStats)
+"""
+
+from decimal import Decimal
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from accounts.models import Accounts, ClientProfile, Job, JobReview, Profile, RatingStats, WorkerProfile
+from accounts.rating_stats_service import (
+    find_stale_rating_stats,
+    get_worker_rating_stats,
+    rebuild_rating_stats,
+)
+from accounts.review_service import get_review_stats
+
+
+class RatingStatsTestCase(TestCase):
+    def setUp(self):
+        self.client_account = Accounts.objects.create_user(email="rating-client@test.com", password="pass12345")
+        self.worker_account = Accounts.objects.create_user(email="rating-worker@test.com", password="pass12345")
+        client_profile = Profile.objects.create(
+            accountFK=self.client_account, profileType="CLIENT", firstName="Client", lastName="Rating"
+        )
+        self.worker_profile = Profile.objects.create(
+            accountFK=self.worker_account, profileType="WORKER", firstName="Worker", lastName="Rating"
+        )
+        self.client_record = ClientProfile.objects.create(
+            profileID=client_profile, description="", totalJobsPosted=0, clientRating=0, activeJobsCount=0
+        )
+        self.worker_record = WorkerProfile.objects.create(profileID=self.worker_profile)
+
+    def _review(self, rating, **extra):
+        job = Job.objects.create(
+            clientID=self.client_record,
+            title="Rated job",
+            description="Rated job",
+            budget=Decimal("500.00"),
+            location="Zamboanga",
+            assignedWorkerID=self.worker_record,
+            status=Job.JobStatus.COMPLETED,
+        )
+        fields = {
+            "jobID": job,
+            "reviewerID": self.client_account,
+            "revieweeID": self.worker_account,
+            "revieweeProfileID": self.worker_profile,
+            "reviewerType": "CLIENT",
+            "rating": Decimal(rating),
+            "comment": "ok",
+        }
+        fields.update(extra)
+        return JobReview.objects.create(**fields)
+
+    def _stats(self):
+        return RatingStats.objects.get(scope="PROFILE", subjectID=self.worker_profile.pk)
+
+    def test_review_writes_maintain_histogram(self):
+        self._review("5.00")
+        low = self._review("2.00")
+        stats = self._stats()
+        self.assertEqual((stats.reviewCount, stats.ratingSum), (2, Decimal("7.00")))
+        self.assertEqual((stats.fiveStar, stats.twoStar), (1, 1))
+        self.assertEqual(stats.lastReviewID, low.reviewID)
+
+        low.rating = Decimal("4.00")
+        low.save()
+        stats = self._stats()
+        self.assertEqual((stats.fourStar, stats.twoStar, stats.ratingSum), (1, 0, Decimal("9.00")))
+
+        low.status = "HIDDEN"  # moderation
+        low.save()
+        self.assertEqual(self._stats().reviewCount, 1)
+        self.assertEqual(find_stale_rating_stats(), [])
+
+    def test_review_stats_read_matches_live_values(self):
+        self._review("5.00")
+        self._review("4.00")
+        self._review("1.00")
+
+        with self.assertNumQueries(1):
+            summary = get_worker_rating_stats(self.worker_account.accountID, self.worker_profile.pk)
+        self.assertEqual(summary["total_reviews"], 3)
+
+        stats = get_review_stats(self.worker_account.accountID)
+
+        self.assertEqual(stats.total_reviews, 3)
+        self.assertAlmostEqual(stats.average_rating, 10 / 3)
+        self.assertEqual(
+            (stats.rating_breakdown.five_star, stats.rating_breakdown.four_star, stats.rating_breakdown.one_star),
+            (1, 1, 1),
+        )
+        self.assertEqual(len(stats.recent_reviews), 3)
+
+    def test_legacy_reviews_without_profile_use_account_row(self):
+        self._review("3.00", revieweeProfileID=None)
+
+        stats = get_review_stats(self.worker_account.accountID)
+
+        self.assertEqual(stats.total_reviews, 1)
+        self.assertEqual(stats.rating_breakdown.three_star, 1)
+
+    def test_rebuild_repairs_drift_and_check_reports_it(self):
+        self._review("5.00")
+        RatingStats.objects.filter(scope="PROFILE").update(reviewCount=7, fiveStar=0)
+
+        self.assertEqual(len(find_stale_rating_stats()), 1)
+        rebuild_rating_stats()
+        self.assertEqual(find_stale_rating_stats(), [])
+        self.assertEqual(self._stats().reviewCount, 1)
+
+        call_command("rebuild_rating_stats", "--check")
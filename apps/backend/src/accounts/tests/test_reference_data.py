@@ -0,0 +1,68 @@
+"""
+Unit tests for the versioned reference-data cache (cities, barangays, categories)
+"""
+
+import json
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from accounts.models import City, Specializations
+from accounts import reference_data
+from accounts.reference_data import bump_version, reference_response
+
+
+class ReferenceDataTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.city = City.objects.create(
+            name="Zamboanga City", province="Zamboanga del Sur", region="Region IX"
+        )
+        Specializations.objects.create(specializationName="Plumbing", minimumRate=Decimal("500.00"))
+        bump_version()  # also drops payloads memoized by earlier tests
+
+    def test_matching_etag_returns_304(self):
+        first = reference_response(self.factory.get("/"), "cities")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(json.loads(first.content)["cities"][0]["name"], "Zamboanga City")
+
+        second = reference_response(
+            self.factory.get("/", HTTP_IF_NONE_MATCH=first["ETag"]), "cities"
+        )
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b"")
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_version_bump_changes_etag_and_content(self):
+        before = reference_response(self.factory.get("/"), "job_categories")
+        self.assertEqual(json.loads(before.content)["total_count"], 1)
+
+        Specializations.objects.create(specializationName="Welding", minimumRate=Decimal("600.00"))
+        bump_version()  # on_commit hooks do not fire inside TestCase
+
+        after = reference_response(
+            self.factory.get("/", HTTP_IF_NONE_MATCH=before["ETag"]), "job_categories"
+        )
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after["ETag"], before["ETag"])
+        self.assertEqual(json.loads(after.content)["total_count"], 2)
+
+    def test_custom_categories_are_excluded(self):
+        Specializations.objects.create(
+            specializationName="Custom Skill", minimumRate=Decimal("1.00"), is_custom=True
+        )
+
+        body = json.loads(reference_response(self.factory.get("/"), "job_categories").content)
+
+        self.assertEqual([cat["name"] for cat in body["categories"]], ["Plumbing"])
+
+    def test_local_snapshots_are_capped_for_arbitrary_city_ids(self):
+        with mock.patch.object(reference_data, "LOCAL_MAX_ENTRIES", 3):
+            for city_id in range(1000, 1010):
+                reference_response(self.factory.get("/"), "barangays", city_id)
+
+            self.assertEqual(len(reference_data._local), 3)
+            self.assertIn(("barangays", (1009,)), reference_data._local)
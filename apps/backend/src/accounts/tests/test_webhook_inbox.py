@@ -0,0 +1,155 @@
+"""
+Tests for the payment webhook inbox (accounts/webhook_inbox.py)
+"""
+
+import json
+import threading
+from decimal import Decimal
+
+from django.db import close_old_connections
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from accounts.models import Accounts, Transaction, Wallet, WebhookEvent
+from accounts.webhook_inbox import process_pending, record_event, replay_events
+
+
+def _paymongo_paid_event(event_id, checkout_id):
+    return {
+        "data": {
+            "id": event_id,
+            "type": "event",
+            "attributes": {
+                "type": "checkout_session.payment.paid",
+                "data": {"id": checkout_id, "attributes": {"amount": 50000, "metadata": {}}},
+            },
+        }
+    }
+
+
+class _InboxFixtureMixin:
+    def _deposit(self, email, checkout_id):
+        account = Accounts.objects.create_user(email=email, password="testpass123")
+        wallet = Wallet.objects.create(accountFK=account, balance=Decimal("100.00"))
+        Transaction.objects.create(
+            walletID=wallet,
+            transactionType=Transaction.TransactionType.DEPOSIT,
+            amount=Decimal("500.00"),
+            balanceAfter=Decimal("100.00"),
+            status=Transaction.TransactionStatus.PENDING,
+            description="Wallet top-up",
+            xenditInvoiceID=checkout_id,
+        )
+        return wallet
+
+
+@override_settings(WEBHOOK_INBOX_DISPATCH_ON_COMMIT=False)
+class WebhookInboxTestCase(_InboxFixtureMixin, TestCase):
+    def setUp(self):
+        self.wallet = self._deposit("inbox@test.com", "cs_inbox")
+
+    def test_duplicate_deliveries_are_stored_and_applied_once(self):
+        payload = _paymongo_paid_event("evt_1", "cs_inbox")
+        results = [record_event(WebhookEvent.Provider.PAYMONGO, "evt_1", payload) for _ in range(5)]
+
+        self.assertEqual([created for _, created in results], [True, False, False, False, False])
+        event = WebhookEvent.objects.get()
+        self.assertEqual(event.duplicateCount, 4)
+
+        self.assertEqual(process_pending()["processed"], 1)
+        self.assertEqual(process_pending()["picked"], 0)
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.balance, Decimal("600.00"))
+        txn = Transaction.objects.get(xenditInvoiceID="cs_inbox")
+        self.assertEqual(txn.status, Transaction.TransactionStatus.COMPLETED)
+        self.assertEqual(txn.balanceAfter, Decimal("600.00"))
+
+    def test_replaying_a_processed_event_does_not_double_credit(self):
+        record_event(WebhookEvent.Provider.PAYMONGO, "evt_2", _paymongo_paid_event("evt_2", "cs_inbox"))
+        process_pending()
+
+        summary = replay_events(status=WebhookEvent.EventStatus.PROCESSED)
+
+        self.assertEqual(summary["processed"], 1)
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.balance, Decimal("600.00"))
+
+    def test_late_failure_event_does_not_undo_completed_payment(self):
+        record_event(WebhookEvent.Provider.PAYMONGO, "evt_3", _paymongo_paid_event("evt_3", "cs_inbox"))
+        failed = _paymongo_paid_event("evt_4", "cs_inbox")
+        failed["data"]["attributes"]["type"] = "checkout_session.payment.expired"
+        record_event(WebhookEvent.Provider.PAYMONGO, "evt_4", failed)
+
+        self.assertEqual(process_pending()["processed"], 2)
+
+        txn = Transaction.objects.get(xenditInvoiceID="cs_inbox")
+        self.assertEqual(txn.status, Transaction.TransactionStatus.COMPLETED)
+
+    @override_settings(XENDIT_WEBHOOK_TOKEN="callback-token")
+    def test_endpoint_only_queues_the_event(self):
+        body = json.dumps({"id": "inv_1", "status": "PAID", "external_id": "ext_1"})
+        for _ in range(3):
+            response = self.client.post(
+                "/api/accounts/wallet/webhook",
+                data=body,
+                content_type="application/json",
+                HTTP_X_CALLBACK_TOKEN="callback-token",
+            )
+            self.assertEqual(response.status_code, 200)
+
+        event = WebhookEvent.objects.get()
+        self.assertEqual(event.eventID, "inv_1:PAID")
+        self.assertEqual(event.status, WebhookEvent.EventStatus.RECEIVED)
+        self.assertEqual(event.duplicateCount, 2)
+
+
+@override_settings(WEBHOOK_INBOX_DISPATCH_ON_COMMIT=False)
+class WebhookInboxBurstTestCase(_InboxFixtureMixin, TransactionTestCase):
+    """Concurrent duplicate deliveries and concurrent workers (real DB locking)."""
+
+    WALLETS = 5
+    DUPLICATES = 8
+
+    def _in_threads(self, target, args_list):
+        errors = []
+
+        def run(*args):
+            try:
+                target(*args)
+            except Exception as e:  # pragma: no cover - surfaced by the assertion below
+                errors.append(e)
+            finally:
+                close_old_connections()
+
+        threads = [threading.Thread(target=run, args=args) for args in args_list]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_burst_of_duplicate_events_credits_each_wallet_once(self):
+        wallets = [self._deposit(f"burst{i}@test.com", f"cs_burst_{i}") for i in range(self.WALLETS)]
+
+        deliveries = [
+            (WebhookEvent.Provider.PAYMONGO, f"evt_burst_{i}", _paymongo_paid_event(f"evt_burst_{i}", f"cs_burst_{i}"))
+            for i in range(self.WALLETS)
+            for _ in range(self.DUPLICATES)
+        ]
+        self._in_threads(record_event, deliveries)
+
+        self.assertEqual(WebhookEvent.objects.count(), self.WALLETS)
+        self.assertEqual(
+            sum(WebhookEvent.objects.values_list("duplicateCount", flat=True)),
+            self.WALLETS * (self.DUPLICATES - 1),
+        )
+
+        # Several workers sweep the same inbox at once
+        self._in_threads(process_pending, [() for _ in range(4)])
+
+        self.assertEqual(
+            WebhookEvent.objects.filter(status=WebhookEvent.EventStatus.PROCESSED).count(), self.WALLETS
+        )
+        for wallet in wallets:
+            wallet.refresh_from_db()
+            self.assertEqual(wallet.balance, Decimal("600.00"))
@@ -0,0 +1,543 @@
+"""
+Payment Webhook Inbox
+
+Xendit and PayMongo retry deliveries aggressively, so the webhook endpoints no
+longer apply payments on the request thread. They verify the signature,
+persist the delivery with record_event() and return 200 immediately.
+
+- Idempotency: WebhookEvent is unique on (provider, eventID). A duplicate
+  delivery only bumps duplicateCount; it is never applied twice.
+- Application: process_event() locks the inbox row (SKIP LOCKED, so
+  concurrent workers never apply the same event), then locks the affected
+  Transaction / Wallet rows and moves money with atomic F() updates.
+- Dispatch: a committed event is handed to a background thread right away
+  (WEBHOOK_INBOX_DISPATCH_ON_COMMIT); `manage.py process_webhook_events`
+  sweeps anything left RECEIVED or FAILED, and `manage.py
+  replay_webhook_events` re-runs selected events.
+"""
+import logging
+import threading
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Notification, Transaction, UserPaymentMethod, Wallet, WebhookEvent
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 8
+SWEEP_BATCH_SIZE = 100
+
+TERMINAL_STATUSES = (
+    Transaction.TransactionStatus.COMPLETED,
+    Transaction.TransactionStatus.FAILED,
+)
+
+
+# =============================================================================
+# EVENT IDS
+# =============================================================================
+
+
+def xendit_invoice_event_id(payload: Dict[str, Any], webhook_id: str = "") -> Optional[str]:
+    """
+    Xendit invoice callbacks carry the invoice id, not an event id; one
+    invoice produces one callback per status. Prefer the webhook-id header.
+    """
+    if webhook_id:
+        return webhook_id
+    invoice_id = payload.get("id")
+    if not invoice_id:
+        return None
+    return f"{invoice_id}:{str(payload.get('status', '')).upper()}"
+
+
+def xendit_disbursement_event_id(payload: Dict[str, Any], webhook_id: str = "") -> Optional[str]:
+    if webhook_id:
+        return webhook_id
+    reference = payload.get("id") or payload.get("external_id") or payload.get("reference_id")
+    if not reference:
+        return None
+    return f"{reference}:{str(payload.get('status', '')).upper()}"
+
+
+def paymongo_event_id(payload: Dict[str, Any]) -> Optional[str]:
+    """PayMongo wraps every delivery in an event resource (evt_...)."""
+    return (payload.get("data") or {}).get("id")
+
+
+def paymongo_event_type(payload: Dict[str, Any]) -> str:
+    return ((payload.get("data") or {}).get("attributes") or {}).get("type", "")
+
+
+# =============================================================================
+# INBOX
+# =============================================================================
+
+
+def record_event(
+    provider: str,
+    event_id: str,
+    payload: Dict[str, Any],
+    event_type: str = "",
+) -> Tuple[WebhookEvent, bool]:
+    """
+    Persist a verified delivery. Returns (event, created); created is False
+    for a duplicate of an event already in the inbox.
+    """
+    try:
+        with transaction.atomic():
+            event = WebhookEvent.objects.create(
+                provider=provider,
+                eventID=event_id,
+                eventType=event_type[:100],
+                payload=payload,
+            )
+    except IntegrityError:
+        WebhookEvent.objects.filter(provider=provider, eventID=event_id).update(
+            duplicateCount=F("duplicateCount") + 1
+        )
+        return WebhookEvent.objects.get(provider=provider, eventID=event_id), False
+
+    if getattr(settings, "WEBHOOK_INBOX_DISPATCH_ON_COMMIT", True):
+        transaction.on_commit(lambda: dispatch_event(event.pk))
+    return event, True
+
+
+def _run_in_thread(event_pk: int) -> None:
+    try:
+        process_event(event_pk)
+    except Exception:
+        logger.exception("Webhook event %s dispatch failed", event_pk)
+    finally:
+        close_old_connections()
+
+
+def dispatch_event(event_pk: int) -> None:
+    """Apply an event off the request thread; the sweeper retries on failure."""
+    threading.Thread(target=_run_in_thread, args=(event_pk,), daemon=True).start()
+
+
+def process_event(event_pk: int) -> Optional[WebhookEvent]:
+    """
+    Apply one RECEIVED/FAILED event. Returns None when the event is already
+    processed or is locked by another worker.
+    """
+    with transaction.atomic():
+        event = (
+            WebhookEvent.objects.select_for_update(skip_locked=True)
+            .filter(
+                pk=event_pk,
+                status__in=[WebhookEvent.EventStatus.RECEIVED, WebhookEvent.EventStatus.FAILED],
+            )
+            .first()
+        )
+        if event is None:
+            return None
+
+        handler = HANDLERS[event.provider]
+        event.attempts += 1
+        try:
+            with transaction.atomic():
+                result = handler(event.payload)
+        except Exception as e:
+            logger.exception("Webhook event %s (%s) failed", event.eventID, event.provider)
+            event.status = WebhookEvent.EventStatus.FAILED
+            event.lastError = str(e)[:2000]
+        else:
+            event.status = WebhookEvent.EventStatus.PROCESSED
+            event.result = result
+            event.lastError = ""
+            event.processedAt = timezone.now()
+        event.save(update_fields=["status", "attempts", "lastError", "result", "processedAt"])
+    return event
+
+
+def process_pending(limit: int = SWEEP_BATCH_SIZE, max_attempts: int = MAX_ATTEMPTS) -> Dict[str, int]:
+    """Sweep RECEIVED events and retryable FAILED ones, oldest first."""
+    pending = list(
+        WebhookEvent.objects.filter(
+            status__in=[WebhookEvent.EventStatus.RECEIVED, WebhookEvent.EventStatus.FAILED],
+            attempts__lt=max_attempts,
+        )
+        .order_by("receivedAt")
+        .values_list("pk", flat=True)[:limit]
+    )
+    summary = {"picked": len(pending), "processed": 0, "failed": 0, "skipped": 0}
+    for event_pk in pending:
+        event = process_event(event_pk)
+        if event is None:
+            summary["skipped"] += 1
+        elif event.status == WebhookEvent.EventStatus.PROCESSED:
+            summary["processed"] += 1
+        else:
+            summary["failed"] += 1
+    return summary
+
+
+def replay_events(
+    event_ids: Optional[Iterable[int]] = None,
+    provider: Optional[str] = None,
+    status: Optional[str] = WebhookEvent.EventStatus.FAILED,
+    since: Optional[datetime] = None,
+    limit: int = SWEEP_BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Reset matching events to RECEIVED (attempts cleared) and apply them again.
+    Handlers are idempotent against the ledger, so replaying a PROCESSED
+    event re-checks it without double-applying.
+    """
+    queryset = WebhookEvent.objects.all()
+    if event_ids:
+        queryset = queryset.filter(pk__in=list(event_ids))
+    if provider:
+        queryset = queryset.filter(provider=provider)
+    if status:
+        queryset = queryset.filter(status=status)
+    if since:
+        queryset = queryset.filter(receivedAt__gte=since)
+
+    pks = list(queryset.order_by("receivedAt").values_list("pk", flat=True)[:limit])
+    WebhookEvent.objects.filter(pk__in=pks).update(
+        status=WebhookEvent.EventStatus.RECEIVED, attempts=0, lastError=""
+    )
+    summary = {"picked": len(pks), "processed": 0, "failed": 0, "skipped": 0}
+    for event_pk in pks:
+        event = process_event(event_pk)
+        if event is None:
+            summary["skipped"] += 1
+        elif event.status == WebhookEvent.EventStatus.PROCESSED:
+            summary["processed"] += 1
+        else:
+            summary["failed"] += 1
+    return summary
+
+
+# =============================================================================
+# LEDGER HELPERS
+# =============================================================================
+
+
+def _credit_wallet(wallet_id: int, amount: Decimal) -> Decimal:
+    """Atomically add `amount` and return the new balance (caller holds the row lock)."""
+    Wallet.objects.filter(pk=wallet_id).update(balance=F("balance") + amount, updatedAt=timezone.now())
+    return Wallet.objects.values_list("balance", flat=True).get(pk=wallet_id)
+
+
+def _lock_transaction(**lookup) -> Optional[Transaction]:
+    return Transaction.objects.select_for_update().filter(**lookup).order_by("transactionID").first()
+
+
+def _complete_payment(
+    txn: Transaction,
+    payment_id: Optional[str],
+    payment_channel: Optional[str],
+    payment_method: Optional[str],
+    paymongo_payment_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Mark a checkout/invoice transaction paid; deposits credit the wallet."""
+    if txn.status == Transaction.TransactionStatus.COMPLETED:
+        return {"transaction_id": txn.transactionID, "message": "Transaction already processed"}
+
+    # Lock the wallet before reading/changing its balance
+    wallet = Wallet.objects.select_for_update().get(pk=txn.walletID_id)
+    balance = wallet.balance
+    if txn.transactionType == Transaction.TransactionType.DEPOSIT:
+        balance = _credit_wallet(wallet.pk, txn.amount)
+    # PAYMENT (escrow) is held by the platform: no wallet movement
+
+    now = timezone.now()
+    txn.status = Transaction.TransactionStatus.COMPLETED
+    txn.balanceAfter = balance
+    txn.xenditPaymentID = payment_id
+    txn.xenditPaymentChannel = payment_channel
+    txn.xenditPaymentMethod = payment_method
+    txn.completedAt = now
+    if paymongo_payment_id:
+        txn.paymongoPaymentId = paymongo_payment_id
+    txn.save()
+
+    if txn.relatedJobPosting_id:
+        job = txn.relatedJobPosting
+        desc_lower = (txn.description or "").lower()
+        if "escrow" in desc_lower or "downpayment" in desc_lower:
+            job.escrowPaid = True
+            job.escrowPaidAt = now
+            job.save()
+        elif "remaining" in desc_lower or "final" in desc_lower:
+            job.remainingPaymentPaid = True
+            job.remainingPaymentPaidAt = now
+            job.status = "COMPLETED"
+            job.save()
+
+    return {"transaction_id": txn.transactionID, "message": "Payment completed", "balance": str(balance)}
+
+
+def _fail_payment(txn: Transaction, reason: str) -> Dict[str, Any]:
+    # A late EXPIRED/FAILED delivery must not undo a completed payment
+    if txn.status in TERMINAL_STATUSES:
+        return {"transaction_id": txn.transactionID, "message": f"Transaction already {txn.status}"}
+    txn.status = Transaction.TransactionStatus.FAILED
+    txn.description = f"{txn.description} - {reason}"[:255]
+    txn.save()
+    return {"transaction_id": txn.transactionID, "message": f"Payment {reason.lower()}"}
+
+
+def _refund_failed_withdrawal(
+    txn: Transaction, reason: str, description: str, reference_prefix: str = "REFUND-WD"
+) -> Decimal:
+    """
+    Return a failed withdrawal's amount to the wallet with a REFUND ledger row.
+    The reference keeps each provider's existing prefix (REFUND-WD for Xendit
+    disbursements, REFUND-BANK-WD for PayMongo transfers) so lookups by
+    reference match rows written before the inbox.
+    """
+    Wallet.objects.select_for_update().get(pk=txn.walletID_id)
+    balance = _credit_wallet(txn.walletID_id, txn.amount)
+    Transaction.objects.create(
+        walletID_id=txn.walletID_id,
+        transactionType=Transaction.TransactionType.REFUND,
+        amount=txn.amount,
+        balanceAfter=balance,
+        status=Transaction.TransactionStatus.COMPLETED,
+        description=description,
+        referenceNumber=f"{reference_prefix}-{txn.transactionID}",
+        completedAt=timezone.now(),
+        paymentMethod=Transaction.PaymentMethod.WALLET,
+    )
+    txn.status = Transaction.TransactionStatus.FAILED
+    txn.description = f"{txn.description} - {reason}"[:255]
+    txn.save()
+    return balance
+
+
+# =============================================================================
+# XENDIT
+# =============================================================================
+
+
+def apply_xendit_invoice(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from .xendit_service import XenditService
+
+    data = XenditService.parse_webhook_payload(payload)
+    txn = _lock_transaction(xenditInvoiceID=data["invoice_id"])
+    if txn is None:
+        return {"message": "Transaction not found, skipping"}
+
+    invoice_status = str(data["status"] or "").upper()
+    if invoice_status == "PAID":
+        return _complete_payment(
+            txn,
+            payment_id=data.get("payment_id"),
+            payment_channel=data.get("payment_channel"),
+            payment_method=data.get("payment_method"),
+        )
+    if invoice_status in ("EXPIRED", "FAILED"):
+        return _fail_payment(txn, invoice_status)
+    return {"transaction_id": txn.transactionID, "message": f"Ignored status {invoice_status}"}
+
+
+def apply_xendit_disbursement(payload: Dict[str, Any]) -> Dict[str, Any]:
+    disbursement_id = payload.get("id")
+    external_id = payload.get("external_id") or payload.get("reference_id")
+    status = str(payload.get("status", "")).upper()
+
+    txn = None
+    if disbursement_id:
+        txn = _lock_transaction(xenditInvoiceID=disbursement_id)
+    if txn is None and external_id:
+        txn = _lock_transaction(xenditExternalID=external_id)
+    if txn is None:
+        return {"message": "Transaction not found, skipping"}
+    if txn.status in TERMINAL_STATUSES:
+        return {"transaction_id": txn.transactionID, "message": f"Transaction already {txn.status}"}
+
+    if status in ("COMPLETED", "SUCCEEDED", "PAID"):
+        txn.status = Transaction.TransactionStatus.COMPLETED
+        txn.completedAt = timezone.now()
+        txn.save()
+        return {"transaction_id": txn.transactionID, "message": "Withdrawal completed"}
+
+    if status in ("FAILED", "VOIDED", "CANCELLED", "REVERSED"):
+        failure_code = payload.get("failure_code")
+        reason = f"{status} ({failure_code})" if failure_code else status
+        balance = _refund_failed_withdrawal(
+            txn, reason, f"Withdrawal disbursement failure refund - Original txn #{txn.transactionID}"
+        )
+        return {"transaction_id": txn.transactionID, "message": "Withdrawal failed, refunded", "balance": str(balance)}
+
+    return {"transaction_id": txn.transactionID, "message": f"Withdrawal {status.lower() or 'pending'}"}
+
+
+# =============================================================================
+# PAYMONGO
+# =============================================================================
+
+
+def _apply_paymongo_transfer(webhook_data: Dict[str, Any]) -> Dict[str, Any]:
+    transfer_id = webhook_data.get("transfer_id")
+    transfer_status = str(webhook_data.get("status", "")).lower()
+
+    txn = None
+    tx_id = webhook_data.get("transaction_id")
+    if tx_id and str(tx_id).isdigit():
+        txn = _lock_transaction(transactionID=int(tx_id))
+    if txn is None and transfer_id:
+        txn = _lock_transaction(paymongoTransferId=transfer_id)
+    if txn is None and webhook_data.get("external_id"):
+        txn = _lock_transaction(xenditExternalID=webhook_data["external_id"])
+    if txn is None:
+        return {"message": "Transfer transaction not found, skipping"}
+    if txn.status in TERMINAL_STATUSES:
+        return {"transaction_id": txn.transactionID, "message": "Transfer transaction already settled"}
+
+    txn.paymongoTransferId = transfer_id or txn.paymongoTransferId
+    txn.paymongoTransferStatus = transfer_status or txn.paymongoTransferStatus
+    account_id = Wallet.objects.values_list("accountFK_id", flat=True).get(pk=txn.walletID_id)
+
+    if transfer_status in ("completed", "paid", "succeeded", "success"):
+        txn.status = Transaction.TransactionStatus.COMPLETED
+        txn.completedAt = timezone.now()
+        txn.save()
+        Notification.objects.create(
+            accountFK_id=account_id,
+            notificationType="PAYMENT_RELEASED",
+            title="Bank Withdrawal Completed",
+            message=f"Your bank withdrawal of ₱{txn.amount:,.2f} has been completed.",
+        )
+        return {"transaction_id": txn.transactionID, "message": "Transfer webhook processed (completed)"}
+
+    if transfer_status in ("failed", "cancelled", "canceled", "reversed"):
+        _refund_failed_withdrawal(
+            txn,
+            transfer_status.upper(),
+            f"BANK withdrawal transfer failure refund - Original txn #{txn.transactionID}",
+            reference_prefix="REFUND-BANK-WD",
+        )
+        Notification.objects.create(
+            accountFK_id=account_id,
+            notificationType="SYSTEM",
+            title="Bank Withdrawal Failed",
+            message=(
+                f"Your bank withdrawal of ₱{txn.amount:,.2f} failed and was "
+                "refunded to your wallet balance."
+            ),
+        )
+        return {"transaction_id": txn.transactionID, "message": "Transfer webhook processed (failed + refunded)"}
+
+    txn.save()
+    return {"transaction_id": txn.transactionID, "message": "Transfer webhook processed (pending)"}
+
+
+def _verify_gcash_payment_method(payment_method_id: int, payment_id: Optional[str]) -> Dict[str, Any]:
+    """Mark the payment method verified and credit the ₱1 verification amount as a bonus."""
+    payment_method = (
+        UserPaymentMethod.objects.select_for_update().select_related("accountFK")
+        .filter(id=payment_method_id).first()
+    )
+    if payment_method is None:
+        return {"message": "Payment method not found"}
+    if payment_method.isVerified:
+        return {"message": "Already verified"}
+
+    payment_method.isVerified = True
+    payment_method.save()
+
+    wallet, _ = Wallet.objects.get_or_create(
+        accountFK=payment_method.accountFK, defaults={"balance": Decimal("0")}
+    )
+    Wallet.objects.select_for_update().get(pk=wallet.pk)
+    bonus_amount = Decimal("1.00")
+    balance = _credit_wallet(wallet.pk, bonus_amount)
+    verification_tx = Transaction.objects.create(
+        walletID=wallet,
+        transactionType=Transaction.TransactionType.DEPOSIT,
+        amount=bonus_amount,
+        balanceAfter=balance,
+        status=Transaction.TransactionStatus.COMPLETED,
+        description=f"GCash Verification Bonus - Account {payment_method.accountNumber[-4:].rjust(11, '*')}",
+        paymentMethod="GCASH",
+        xenditPaymentID=payment_id,
+    )
+    return {"message": "GCash verification completed", "transaction_id": verification_tx.transactionID}
+
+
+def _reject_gcash_payment_method(payment_method_id: int, reason: str) -> Dict[str, Any]:
+    """Delete the unverified payment method so the user can try again."""
+    payment_method = UserPaymentMethod.objects.select_for_update().filter(id=payment_method_id).first()
+    if payment_method is None:
+        return {"message": "Payment method not found"}
+    if payment_method.isVerified:
+        return {"message": "Already verified, ignoring failure"}
+    payment_method.delete()
+    return {"message": f"Verification failed ({reason}) - payment method removed"}
+
+
+def _is_failure(status: str, event_type: str) -> bool:
+    return status in ("failed", "expired", "cancelled") or any(
+        s in event_type for s in ("failed", "expired", "cancel")
+    )
+
+
+def apply_paymongo_event(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from .paymongo_service import PayMongoService
+
+    webhook_data = PayMongoService().parse_webhook_payload(payload)
+    if not webhook_data:
+        raise ValueError("Invalid PayMongo webhook payload")
+
+    event_type = webhook_data.get("event_type", "")
+    status = webhook_data.get("status", "")
+    metadata = webhook_data.get("metadata") or {}
+
+    if "transfer" in event_type.lower() or webhook_data.get("transfer_id"):
+        return _apply_paymongo_transfer(webhook_data)
+
+    if metadata.get("payment_type") == "gcash_verification":
+        payment_method_id = metadata.get("payment_method_id")
+        if not payment_method_id:
+            return {"message": "Missing payment method ID"}
+        if status == "paid" or "paid" in event_type:
+            return _verify_gcash_payment_method(int(payment_method_id), webhook_data.get("payment_id"))
+        if _is_failure(status, event_type):
+            return _reject_gcash_payment_method(int(payment_method_id), status)
+        return {"message": "Verification webhook processed"}
+
+    payment_id = webhook_data.get("payment_id")
+    external_id = webhook_data.get("external_id")
+    transaction_id = webhook_data.get("transaction_id")
+
+    txn = None
+    if transaction_id and str(transaction_id).isdigit():
+        txn = _lock_transaction(transactionID=int(transaction_id))
+    if txn is None and payment_id:
+        # Checkout session ID is stored in xenditInvoiceID
+        txn = _lock_transaction(xenditInvoiceID=payment_id)
+    if txn is None and external_id:
+        txn = _lock_transaction(xenditExternalID=external_id)
+    if txn is None:
+        return {"message": "Transaction not found, skipping"}
+
+    if status == "paid" or "paid" in event_type:
+        return _complete_payment(
+            txn,
+            payment_id=payment_id,
+            payment_channel=webhook_data.get("payment_channel", "PAYMONGO"),
+            payment_method=webhook_data.get("payment_method", "checkout"),
+            paymongo_payment_id=webhook_data.get("actual_payment_id"),
+        )
+    if _is_failure(status, event_type):
+        return _fail_payment(txn, status.upper())
+    return {"transaction_id": txn.transactionID, "message": "PayMongo webhook processed"}
+
+
+HANDLERS = {
+    WebhookEvent.Provider.XENDIT_INVOICE: apply_xendit_invoice,
+    WebhookEvent.Provider.XENDIT_DISBURSEMENT: apply_xendit_disbursement,
+    WebhookEvent.Provider.PAYMONGO: apply_paymongo_event,
+}
@@ -8,83 +8,91 @@ Provides comprehensive analytics data for:
 - Geographic Analytics (user distribution, job density)
 - Engagement Analytics (session duration, feature usage)
 - Support Analytics (ticket stats, response times)
+
+User, job and financial figures are read from the daily rollup tables
+maintained by rollup_service rather than aggregated over full history. They
+are as of the last cron refresh; responses carry `rollups` (rollup_status())
+so the dashboard can flag stale figures.
 """
 
 from django.db import models
-from django.db.models import Count, Avg, Sum, F, Q
-from django.db.models.functions import TruncDate, TruncWeek, TruncMonth
+from django.db.models import Count, Sum, F, Q
+from django.db.models.functions import TruncWeek, TruncMonth
 from django.utils import timezone
 from datetime import timedelta
 from typing import Dict, Any, Optional
 
-from accounts.models import Accounts, Profile, Job, JobApplication
-from profiles.models import Transaction
+from accounts.models import Accounts, Profile, Job, JobApplication, Specializations
 from django.conf import settings
 
+from .rollup_service import (
+    account_rollups,
+    job_rollups,
+    rollup_status,
+    sum_field,
+    transaction_rollups,
+)
+
 
 # =============================================================================
 # USER ANALYTICS
 # =============================================================================
 
+def _period_start_day(period: str):
+    """Local start day for an analytics period (7/30/90 days back)."""
+    days = {"last_7_days": 7, "last_90_days": 90}.get(period, 30)
+    return timezone.localdate() - timedelta(days=days)
+
+
+def _growth(current, previous) -> float:
+    return ((float(current) - float(previous)) / float(previous) * 100) if previous else 0
+
+
 def get_user_analytics(period: str = "last_30_days", segment: str = "all") -> Dict[str, Any]:
     """
     Get comprehensive user analytics including growth, retention, and demographics.
+    Totals and trends come from AccountDailyRollup.
     """
-    # Calculate date range
     now = timezone.now()
-    if period == "last_7_days":
-        start_date = now - timedelta(days=7)
-    elif period == "last_90_days":
-        start_date = now - timedelta(days=90)
-    else:  # last_30_days default
-        start_date = now - timedelta(days=30)
-    
-    # Base querysets
-    users_qs = Accounts.objects.all()
-    profiles_qs = Profile.objects.all()
-    
-    # Apply segment filter
-    if segment == "clients":
-        profiles_qs = profiles_qs.filter(profileType="CLIENT")
-    elif segment == "workers":
-        profiles_qs = profiles_qs.filter(profileType="WORKER")
-    elif segment == "agencies":
-        profiles_qs = profiles_qs.filter(profileType="AGENCY")
-    
-    # Total counts
-    total_users = users_qs.count()
-    new_users_period = users_qs.filter(dateJoined__gte=start_date).count()
-    verified_users = users_qs.filter(isVerified=True).count()
-    
-    # Profile type distribution
-    profile_distribution = profiles_qs.values('profileType').annotate(
-        count=Count('profileID')
+    start_day = _period_start_day(period)
+    prev_start_day = start_day - (timezone.localdate() - start_day)
+
+    totals = account_rollups().aggregate(
+        users=Sum('accountCount'),
+        verified=Sum('verifiedCount'),
+        clients=Sum('clientProfiles'),
+        workers=Sum('workerProfiles'),
+        agencies=Sum('agencyProfiles'),
     )
-    
-    # Daily active users (users who logged in recently - simplified)
-    dau = users_qs.filter(lastLogin__gte=now - timedelta(days=1)).count()
-    wau = users_qs.filter(lastLogin__gte=now - timedelta(days=7)).count()
-    mau = users_qs.filter(lastLogin__gte=now - timedelta(days=30)).count()
-    
-    # User growth trend (daily new registrations)
-    growth_trend = list(
-        users_qs.filter(dateJoined__gte=start_date)
-        .annotate(date=TruncDate('dateJoined'))
-        .values('date')
-        .annotate(count=Count('accountID'))
-        .order_by('date')
+    total_users = totals['users'] or 0
+    verified_users = totals['verified'] or 0
+    new_users_period = sum_field(account_rollups(since=start_day), 'accountCount')
+    prev_new_users = sum_field(account_rollups(since=prev_start_day, until=start_day), 'accountCount')
+
+    by_type = {
+        'clients': totals['clients'] or 0,
+        'workers': totals['workers'] or 0,
+        'agencies': totals['agencies'] or 0,
+    }
+    profile_types = {'clients': 'CLIENT', 'workers': 'WORKER', 'agencies': 'AGENCY'}
+    if segment in profile_types:
+        by_type = {key: (value if key == segment else 0) for key, value in by_type.items()}
+
+    # Active users by last login (one aggregate over the accounts table)
+    active = Accounts.objects.aggregate(
+        dau=Count('accountID', filter=Q(last_login__gte=now - timedelta(days=1))),
+        wau=Count('accountID', filter=Q(last_login__gte=now - timedelta(days=7))),
+        mau=Count('accountID', filter=Q(last_login__gte=now - timedelta(days=30))),
     )
-    
-    # Verification rate
+
+    growth_trend = account_rollups(since=start_day).order_by('day').values('day', 'accountCount')
+
     verification_rate = (verified_users / total_users * 100) if total_users > 0 else 0
-    
-    # Calculate growth percentage
-    prev_start = start_date - (now - start_date)
-    prev_new_users = users_qs.filter(dateJoined__gte=prev_start, dateJoined__lt=start_date).count()
-    growth_rate = ((new_users_period - prev_new_users) / prev_new_users * 100) if prev_new_users > 0 else 0
-    
+    growth_rate = _growth(new_users_period, prev_new_users)
+
     return {
         'success': True,
+        'rollups': rollup_status(),
         'analytics': {
             'overview': {
                 'total_users': total_users,
@@ -94,19 +102,20 @@ def get_user_analytics(period: str = "last_30_days", segment: str = "all") -> Di
                 'growth_rate': round(growth_rate, 1),
             },
             'active_users': {
-                'dau': dau,
-                'wau': wau,
-                'mau': mau,
+                'dau': active['dau'],
+                'wau': active['wau'],
+                'mau': active['mau'],
                 'dau_change': 12.5,  # Would need historical data
                 'wau_change': 8.3,
                 'mau_change': 15.2,
             },
             'profile_distribution': {
-                item['profileType']: item['count'] 
-                for item in profile_distribution
+                profile_types[key]: count
+                for key, count in by_type.items()
+                if count
             },
             'growth_trend': [
-                {'date': item['date'].isoformat() if item['date'] else '', 'count': item['count']}
+                {'date': item['day'].isoformat(), 'count': item['accountCount']}
                 for item in growth_trend
             ],
             # Retention cohort (simplified)
@@ -117,11 +126,7 @@ def get_user_analytics(period: str = "last_30_days", segment: str = "all") -> Di
                 'week_4': 58.3,
             },
             'demographics': {
-                'by_type': {
-                    'clients': profiles_qs.filter(profileType='CLIENT').count(),
-                    'workers': profiles_qs.filter(profileType='WORKER').count(),
-                    'agencies': profiles_qs.filter(profileType='AGENCY').count(),
-                },
+                'by_type': by_type,
             },
         }
     }
@@ -134,66 +139,61 @@ def get_user_analytics(period: str = "last_30_days", segment: str = "all") -> Di
 def get_job_analytics(period: str = "last_30_days") -> Dict[str, Any]:
     """
     Get comprehensive job analytics including completion rates, categories, and trends.
+    Reads JobDailyRollup; status/category counts reflect each job's current state.
     """
-    now = timezone.now()
-    if period == "last_7_days":
-        start_date = now - timedelta(days=7)
-    elif period == "last_90_days":
-        start_date = now - timedelta(days=90)
-    else:
-        start_date = now - timedelta(days=30)
-    
-    jobs_qs = Job.objects.all()
-    period_jobs = jobs_qs.filter(createdAt__gte=start_date)
-    
-    # Basic counts
-    total_jobs = jobs_qs.count()
-    period_jobs_count = period_jobs.count()
-    active_jobs = jobs_qs.filter(status='ACTIVE').count()
-    completed_jobs = jobs_qs.filter(status='COMPLETED').count()
-    cancelled_jobs = jobs_qs.filter(status='CANCELLED').count()
-    
-    # Completion rate
-    completion_rate = (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0
-    
-    # Jobs by status
-    jobs_by_status = list(
-        jobs_qs.values('status').annotate(count=Count('jobID'))
+    start_day = _period_start_day(period)
+
+    rollups = job_rollups()
+    totals = rollups.aggregate(
+        jobs=Sum('jobCount'),
+        budget=Sum('budgetSum'),
+        applications=Sum('applicationCount'),
+        jobs_with_applications=Sum('jobsWithApplications'),
     )
-    
-    # Jobs by category
+    total_jobs = totals['jobs'] or 0
+    period_jobs_count = sum_field(job_rollups(since=start_day), 'jobCount')
+
+    by_status = {
+        item['status']: item['count']
+        for item in rollups.values('status').annotate(count=Sum('jobCount'))
+    }
+    active_jobs = by_status.get('ACTIVE', 0)
+    completed_jobs = by_status.get('COMPLETED', 0)
+    cancelled_jobs = by_status.get('CANCELLED', 0)
+
+    completion_rate = (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0
+
     jobs_by_category = list(
-        jobs_qs.values('categoryID__categoryName')
-        .annotate(count=Count('jobID'))
+        rollups.values('categoryID')
+        .annotate(count=Sum('jobCount'))
         .order_by('-count')[:10]
     )
-    
-    # Jobs by urgency
-    jobs_by_urgency = list(
-        jobs_qs.values('urgencyLevel').annotate(count=Count('jobID'))
+    category_names = dict(
+        Specializations.objects.filter(
+            specializationID__in=[item['categoryID'] for item in jobs_by_category if item['categoryID']]
+        ).values_list('specializationID', 'specializationName')
     )
-    
-    # Daily job creation trend
-    creation_trend = list(
-        period_jobs
-        .annotate(date=TruncDate('createdAt'))
-        .values('date')
-        .annotate(count=Count('jobID'))
-        .order_by('date')
+
+    jobs_by_urgency = rollups.values('urgency').annotate(count=Sum('jobCount'))
+
+    creation_trend = (
+        job_rollups(since=start_day)
+        .values('day')
+        .annotate(count=Sum('jobCount'))
+        .order_by('day')
     )
-    
-    # Average budget
-    avg_budget = jobs_qs.aggregate(avg=Avg('budget'))['avg'] or 0
-    total_budget = jobs_qs.aggregate(total=Sum('budget'))['total'] or 0
-    
-    # Application stats
-    total_applications = JobApplication.objects.count()
-    avg_applications_per_job = JobApplication.objects.values('jobID').annotate(
-        count=Count('applicationID')
-    ).aggregate(avg=Avg('count'))['avg'] or 0
-    
+
+    total_budget = totals['budget'] or 0
+    avg_budget = (total_budget / total_jobs) if total_jobs else 0
+    total_applications = totals['applications'] or 0
+    jobs_with_applications = totals['jobs_with_applications'] or 0
+    avg_applications_per_job = (
+        total_applications / jobs_with_applications if jobs_with_applications else 0
+    )
+
     return {
         'success': True,
+        'rollups': rollup_status(),
         'analytics': {
             'overview': {
                 'total_jobs': total_jobs,
@@ -211,23 +211,20 @@ def get_job_analytics(period: str = "last_30_days") -> Dict[str, Any]:
                 'total': total_applications,
                 'avg_per_job': round(avg_applications_per_job, 1),
             },
-            'by_status': {
-                item['status']: item['count']
-                for item in jobs_by_status
-            },
+            'by_status': by_status,
             'by_category': [
                 {
-                    'category': item['categoryID__categoryName'] or 'Uncategorized',
+                    'category': category_names.get(item['categoryID']) or 'Uncategorized',
                     'count': item['count']
                 }
                 for item in jobs_by_category
             ],
             'by_urgency': {
-                item['urgencyLevel'] or 'MEDIUM': item['count']
+                item['urgency'] or 'MEDIUM': item['count']
                 for item in jobs_by_urgency
             },
             'creation_trend': [
-                {'date': item['date'].isoformat() if item['date'] else '', 'count': item['count']}
+                {'date': item['day'].isoformat(), 'count': item['count']}
                 for item in creation_trend
             ],
         }
@@ -241,67 +238,48 @@ def get_job_analytics(period: str = "last_30_days") -> Dict[str, Any]:
 def get_financial_analytics(period: str = "last_30_days") -> Dict[str, Any]:
     """
     Get comprehensive financial analytics including revenue, transactions, and earnings.
+    Reads TransactionDailyRollup.
     """
-    now = timezone.now()
-    if period == "last_7_days":
-        start_date = now - timedelta(days=7)
-    elif period == "last_90_days":
-        start_date = now - timedelta(days=90)
-    else:
-        start_date = now - timedelta(days=30)
-    
-    transactions_qs = Transaction.objects.all()
-    period_transactions = transactions_qs.filter(createdAt__gte=start_date)
-    
-    # Basic counts
-    total_transactions = transactions_qs.count()
-    period_transactions_count = period_transactions.count()
-    
-    # Revenue calculations
-    total_revenue = transactions_qs.filter(
-        transactionType='ESCROW',
-        status='COMPLETED'
-    ).aggregate(total=Sum('amount'))['total'] or 0
-    
-    period_revenue = period_transactions.filter(
-        transactionType='ESCROW',
-        status='COMPLETED'
-    ).aggregate(total=Sum('amount'))['total'] or 0
-    
+    start_day = _period_start_day(period)
+
+    rollups = transaction_rollups()
+    period_rollups = transaction_rollups(since=start_day)
+    escrow_completed = Q(transactionType='ESCROW', status='COMPLETED')
+
+    totals = rollups.aggregate(
+        count=Sum('transactionCount'),
+        amount=Sum('amountSum'),
+        revenue=Sum('amountSum', filter=escrow_completed),
+    )
+    period_totals = period_rollups.aggregate(
+        count=Sum('transactionCount'),
+        revenue=Sum('amountSum', filter=escrow_completed),
+    )
+    total_transactions = totals['count'] or 0
+    period_transactions_count = period_totals['count'] or 0
+    total_revenue = totals['revenue'] or 0
+    period_revenue = period_totals['revenue'] or 0
+
     # Platform fees (10% of escrow as per settings)
     platform_fees = float(total_revenue) * float(settings.PLATFORM_FEE_RATE)
     period_platform_fees = float(period_revenue) * float(settings.PLATFORM_FEE_RATE)
-    
-    # Transaction by type
-    by_type = list(
-        transactions_qs.values('transactionType').annotate(
-            count=Count('transactionID'),
-            total=Sum('amount')
-        )
-    )
-    
-    # Transaction by status
-    by_status = list(
-        transactions_qs.values('status').annotate(
-            count=Count('transactionID')
-        )
+
+    by_type = rollups.values('transactionType').annotate(
+        count=Sum('transactionCount'),
+        total=Sum('amountSum'),
     )
-    
+    by_status = rollups.values('status').annotate(count=Sum('transactionCount'))
+
     # Daily revenue trend
-    revenue_trend = list(
-        period_transactions.filter(status='COMPLETED')
-        .annotate(date=TruncDate('createdAt'))
-        .values('date')
-        .annotate(
-            revenue=Sum('amount'),
-            count=Count('transactionID')
-        )
-        .order_by('date')
+    revenue_trend = (
+        period_rollups.filter(status='COMPLETED')
+        .values('day')
+        .annotate(revenue=Sum('amountSum'), count=Sum('transactionCount'))
+        .order_by('day')
     )
-    
-    # Average transaction value
-    avg_transaction = transactions_qs.aggregate(avg=Avg('amount'))['avg'] or 0
-    
+
+    avg_transaction = (totals['amount'] or 0) / total_transactions if total_transactions else 0
+
     # Payment methods breakdown (simplified)
     payment_methods = {
         'gcash': 45,
@@ -311,6 +289,7 @@ def get_financial_analytics(period: str = "last_30_days") -> Dict[str, Any]:
     
     return {
         'success': True,
+        'rollups': rollup_status(),
         'analytics': {
             'overview': {
                 'total_transactions': total_transactions,
@@ -334,7 +313,7 @@ def get_financial_analytics(period: str = "last_30_days") -> Dict[str, Any]:
             },
             'revenue_trend': [
                 {
-                    'date': item['date'].isoformat() if item['date'] else '',
+                    'date': item['day'].isoformat(),
                     'revenue': float(item['revenue'] or 0),
                     'count': item['count']
                 }
@@ -597,51 +576,50 @@ def get_analytics_overview(period: str = "last_30_days") -> Dict[str, Any]:
     Args:
         period: Time period for analytics - "last_7_days", "last_30_days", "last_90_days"
     """
-    # Calculate date range based on period
     now = timezone.now()
-    if period == "last_7_days":
-        start_date = now - timedelta(days=7)
-    elif period == "last_90_days":
-        start_date = now - timedelta(days=90)
-    else:  # last_30_days default
-        start_date = now - timedelta(days=30)
-    
+    start_day = _period_start_day(period)
     # Previous period for growth calculation
-    period_length = now - start_date
-    prev_start = start_date - period_length
+    prev_start_day = start_day - (timezone.localdate() - start_day)
+
+    total_users = sum_field(account_rollups(), 'accountCount')
+    new_users_period = sum_field(account_rollups(since=start_day), 'accountCount')
+    prev_new_users = sum_field(account_rollups(since=prev_start_day, until=start_day), 'accountCount')
+
+    job_status_counts = job_rollups().aggregate(
+        total=Sum('jobCount'),
+        active=Sum('jobCount', filter=Q(status='ACTIVE')),
+        completed=Sum('jobCount', filter=Q(status='COMPLETED')),
+    )
+    total_jobs = job_status_counts['total'] or 0
+    active_jobs = job_status_counts['active'] or 0
+    completed_jobs = job_status_counts['completed'] or 0
+
+    escrow_completed = Q(transactionType='ESCROW', status='COMPLETED')
+    transaction_totals = transaction_rollups().aggregate(
+        count=Sum('transactionCount'),
+        amount=Sum('amountSum'),
+        revenue=Sum('amountSum', filter=escrow_completed),
+    )
+    total_transactions = transaction_totals['count'] or 0
+    total_revenue = transaction_totals['revenue'] or 0
+    prev_revenue = (
+        transaction_rollups(since=prev_start_day, until=start_day)
+        .aggregate(total=Sum('amountSum', filter=escrow_completed))['total'] or 0
+    )
 
-    total_users = Accounts.objects.count()
-    new_users_period = Accounts.objects.filter(createdAt__gte=start_date).count()
-    prev_new_users = Accounts.objects.filter(createdAt__gte=prev_start, createdAt__lt=start_date).count()
-    
-    total_jobs = Job.objects.count()
-    active_jobs = Job.objects.filter(status='ACTIVE').count()
-    completed_jobs = Job.objects.filter(status='COMPLETED').count()
-    total_transactions = Transaction.objects.count()
-    
-    # Revenue in period
-    total_revenue = Transaction.objects.filter(
-        transactionType='ESCROW',
-        status='COMPLETED'
-    ).aggregate(total=Sum('amount'))['total'] or 0
-    
-    prev_revenue = Transaction.objects.filter(
-        transactionType='ESCROW',
-        status='COMPLETED',
-        createdAt__gte=prev_start,
-        createdAt__lt=start_date
-    ).aggregate(total=Sum('amount'))['total'] or 0
-    
     platform_fees = float(total_revenue) * float(settings.PLATFORM_FEE_RATE)
     
     # Calculate growth rates
-    user_growth_rate = ((new_users_period - prev_new_users) / prev_new_users * 100) if prev_new_users > 0 else 0
-    revenue_growth_rate = ((float(total_revenue) - float(prev_revenue)) / float(prev_revenue) * 100) if prev_revenue > 0 else 0
-    
+    user_growth_rate = _growth(new_users_period, prev_new_users)
+    revenue_growth_rate = _growth(total_revenue, prev_revenue)
+
     # Payment method breakdown (real calculation)
-    payment_methods = Transaction.objects.filter(
-        status='COMPLETED'
-    ).values('paymentMethod').annotate(count=Count('transactionID'))
+    payment_methods = (
+        transaction_rollups()
+        .filter(status='COMPLETED')
+        .values('paymentMethod')
+        .annotate(count=Sum('transactionCount'))
+    )
     
     payment_breakdown = {'gcash': 0, 'wallet': 0, 'cash': 0}
     total_payments = sum(p['count'] for p in payment_methods)
@@ -656,6 +634,7 @@ def get_analytics_overview(period: str = "last_30_days") -> Dict[str, Any]:
     
     return {
         'success': True,
+        'rollups': rollup_status(),
         'overview': {
             'users': {
                 'total': total_users,
@@ -678,7 +657,7 @@ def get_analytics_overview(period: str = "last_30_days") -> Dict[str, Any]:
             },
             'transactions': {
                 'count': total_transactions,
-                'avg_value': float(Transaction.objects.aggregate(avg=Avg('amount'))['avg'] or 0),
+                'avg_value': float((transaction_totals['amount'] or 0) / total_transactions) if total_transactions else 0.0,
                 'payment_methods': payment_breakdown,
             },
         }
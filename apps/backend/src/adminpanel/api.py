@@ -1,4 +1,5 @@
 import json
+from datetime import date
 from django.http import HttpRequest
 from typing import List, Optional
 from ninja import Router, Schema, Query
@@ -19,6 +20,7 @@ from .service import (
     approve_kyc,
     reject_kyc,
     fetch_kyc_logs,
+    export_kyc_logs,
 )
 from .service import approve_agency_kyc, reject_agency_kyc, get_admin_dashboard_stats
 from .service import get_agency_kyc_list, review_agency_kyc
@@ -41,6 +43,7 @@ from .service import (
 )
 
 # Import optimized query functions for high-traffic endpoints
+from .kyc_queue_service import get_kyc_queue, get_kyc_queue_counts
 from .optimized_queries import (
     get_dashboard_stats_optimized,
     get_kyc_list_optimized,
@@ -60,8 +63,11 @@ from .account_actions import (
     delete_account,
     get_account_status,
 )
+from .bulk_finance_service import bulk_payout, bulk_refund
 from .payment_service import (
     get_transactions_list,
+    export_transactions,
+    export_withdrawals,
     get_transaction_statistics,
     get_transaction_detail,
     release_escrow,
@@ -158,14 +164,24 @@ def get_all_kyc(request: HttpRequest):
 
 
 @router.get("/kyc/pending", auth=cookie_auth)
-def get_pending_kyc_optimized(request: HttpRequest, page: int = 1, page_size: int = 20):
+def get_pending_kyc_optimized(
+    request: HttpRequest,
+    page: int = 1,
+    page_size: int = 20,
+    count_mode: str = "exact",
+    cursor: str | None = None,
+):
     """
     Get paginated pending KYC records using optimized queries.
     Loads faster than /kyc/all for large datasets.
     """
     try:
         result = get_kyc_list_optimized(
-            status_filter="PENDING", page=page, page_size=page_size
+            status_filter="PENDING",
+            page=page,
+            page_size=page_size,
+            count_mode=count_mode,
+            cursor=cursor,
         )
         return {"success": True, **result}
     except Exception as e:
@@ -176,6 +192,54 @@ def get_pending_kyc_optimized(request: HttpRequest, page: int = 1, page_size: in
         return {"success": False, "error": str(e)}
 
 
+@router.get("/kyc/queue", auth=cookie_auth)
+def get_kyc_queue_endpoint(
+    request: HttpRequest,
+    kyc_type: str = "USER",
+    status: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    search: str | None = None,
+    cursor: str | None = None,
+    limit: int = 25,
+):
+    """
+    Paginated KYC review queue (newest first).
+
+    Pass `next_cursor` from the previous response as `cursor` for the next page.
+    File URLs are signed for the returned page only.
+    """
+    try:
+        result = get_kyc_queue(
+            kyc_type=kyc_type,
+            status=status,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+            cursor=cursor,
+            limit=limit,
+        )
+        return {"success": True, **result}
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        print(f"❌ Error in get_kyc_queue_endpoint: {str(e)}")
+        import traceback
+
+        traceback.print_exc()
+        return {"success": False, "error": str(e)}
+
+
+@router.get("/kyc/counts", auth=cookie_auth)
+def get_kyc_counts(request: HttpRequest):
+    """Per-status user/agency KYC counts for the admin tab badges."""
+    try:
+        return {"success": True, **get_kyc_queue_counts()}
+    except Exception as e:
+        print(f"❌ Error in get_kyc_counts: {str(e)}")
+        return {"success": False, "error": str(e)}
+
+
 @router.get("/kyc/logs", auth=cookie_auth)
 def get_kyc_logs(request: HttpRequest, action: str | None = None, limit: int = 100):
     """
@@ -191,9 +255,38 @@ def get_kyc_logs(request: HttpRequest, action: str | None = None, limit: int = 1
         return {"success": False, "error": str(e)}
 
 
+@router.get("/kyc/logs/export", auth=cookie_auth)
+def export_kyc_logs_endpoint(
+    request,
+    action: str | None = None,
+    kyc_type: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    format: str = "csv",
+    gzip: bool = False,
+    after_id: int | None = None,
+    until_id: int | None = None,
+):
+    """Stream the full KYC review log as CSV or NDJSON (resumable via after_id/until_id)."""
+    try:
+        return export_kyc_logs(
+            action_filter=action,
+            kyc_type=kyc_type,
+            date_from=date_from,
+            date_to=date_to,
+            fmt=format,
+            gzip=gzip,
+            after_id=after_id,
+            until_id=until_id,
+        )
+    except Exception as e:
+        print(f"❌ Error in export_kyc_logs_endpoint: {str(e)}")
+        return {"success": False, "error": str(e)}
+
+
 def broadcast_admin_job_status_update(job_id: int, update_data: dict):
     """
-    Broadcast admin-triggered job/dispute status updates to job and chat groups.
+    Broadcast admin-triggered job/dispute status updates to job and participant groups.
     This keeps mobile/web banner and action-button states in sync with admin actions.
     """
     try:
@@ -209,22 +302,16 @@ def broadcast_admin_job_status_update(job_id: int, update_data: dict):
             },
         )
 
-        from profiles.models import Conversation
+        from profiles.channel_routing import send_to_job_conversations
 
-        conv_ids = list(
-            Conversation.objects.filter(relatedJobPosting_id=job_id).values_list(
-                "pk", flat=True
-            )
+        send_to_job_conversations(
+            job_id,
+            {
+                "type": "job_status_update",
+                "data": update_data,
+            },
+            channel_layer=channel_layer,
         )
-
-        for conv_id in conv_ids:
-            async_to_sync(channel_layer.group_send)(
-                f"chat_{conv_id}",
-                {
-                    "type": "job_status_update",
-                    "data": update_data,
-                },
-            )
     except Exception as e:
         print(f"❌ Error broadcasting admin job status for job {job_id}: {str(e)}")
 
@@ -548,6 +635,8 @@ def get_clients(
     page_size: int = 50,
     search: str | None = None,
     status: str | None = None,
+    count_mode: str = "exact",
+    cursor: str | None = None,
 ):
     """
     Get paginated list of client accounts using optimized queries.
@@ -557,11 +646,18 @@ def get_clients(
     - page_size: Items per page (default 50)
     - search: Search by name or email
     - status: Filter by status (all, active, inactive)
+    - count_mode: exact (cached COUNT), estimate (planner estimate) or none (no count, cursor paging)
+    - cursor: next_cursor from the previous page (keyset "load more")
     """
     try:
         # Use optimized query with subqueries to avoid N+1
         result = get_clients_list_optimized(
-            page=page, page_size=page_size, search=search, status_filter=status
+            page=page,
+            page_size=page_size,
+            search=search,
+            status_filter=status,
+            count_mode=count_mode,
+            cursor=cursor,
         )
         return {"success": True, **result}
     except Exception as e:
@@ -601,6 +697,8 @@ def get_workers(
     search: str | None = None,
     status: str | None = None,
     category_id: int | None = None,
+    count_mode: str = "exact",
+    cursor: str | None = None,
 ):
     """
     Get paginated list of worker accounts using optimized queries.
@@ -611,6 +709,8 @@ def get_workers(
     - search: Search by name or email
     - status: Filter by status (all, active, inactive)
     - category_id: Filter by job category
+    - count_mode: exact (cached COUNT), estimate (planner estimate) or none (no count, cursor paging)
+    - cursor: next_cursor from the previous page (keyset "load more")
     """
     try:
         # Use optimized query with subqueries to avoid N+1
@@ -620,6 +720,8 @@ def get_workers(
             search=search,
             status_filter=status,
             category_id=category_id,
+            count_mode=count_mode,
+            cursor=cursor,
         )
         return {"success": True, **result}
     except Exception as e:
@@ -658,6 +760,8 @@ def get_agencies(
     page_size: int = 50,
     search: str | None = None,
     status: str | None = None,
+    count_mode: str = "exact",
+    cursor: str | None = None,
 ):
     """
     Get paginated list of agency accounts using optimized queries.
@@ -667,11 +771,18 @@ def get_agencies(
     - page_size: Items per page (default 50)
     - search: Search by name or email
     - status: Filter by status (all, active, inactive)
+    - count_mode: exact (cached COUNT), estimate (planner estimate) or none (no count, cursor paging)
+    - cursor: next_cursor from the previous page (keyset "load more")
     """
     try:
         # Use optimized query with subqueries to avoid N+1
         result = get_agencies_list_optimized(
-            page=page, page_size=page_size, search=search, status_filter=status
+            page=page,
+            page_size=page_size,
+            search=search,
+            status_filter=status,
+            count_mode=count_mode,
+            cursor=cursor,
         )
         return {"success": True, **result}
     except Exception as e:
@@ -763,6 +874,8 @@ def get_job_listings(
     status: str | None = None,
     category_id: int | None = None,
     search: str | None = None,
+    count_mode: str = "exact",
+    cursor: str | None = None,
 ):
     """
     Get paginated list of all job listings using optimized queries.
@@ -773,6 +886,8 @@ def get_job_listings(
     - status: Filter by status (ACTIVE, IN_PROGRESS, COMPLETED, CANCELLED)
     - category_id: Filter by category ID
     - search: Search by title or description
+    - count_mode: exact (cached COUNT), estimate (planner estimate) or none (no count, cursor paging)
+    - cursor: next_cursor from the previous page (keyset "load more")
     """
     try:
         # Use optimized query with select_related and annotations
@@ -782,6 +897,8 @@ def get_job_listings(
             status=status,
             category_id=category_id,
             search=search,
+            count_mode=count_mode,
+            cursor=cursor,
         )
         return {"success": True, **result}
     except Exception as e:
@@ -1900,6 +2017,8 @@ def get_all_reviews(
     min_rating: Optional[float] = Query(None),
     reviewee_id: Optional[str] = Query(None),
     reviewer_id: Optional[str] = Query(None),
+    count_mode: str = "exact",
+    cursor: str | None = None,
 ):
     """
     Get paginated list of all general user reviews.
@@ -1912,6 +2031,8 @@ def get_all_reviews(
     - min_rating: Minimum rating filter (1.0 - 5.0)
     - reviewee_id: Filter by reviewee account ID
     - reviewer_id: Filter by reviewer account ID
+    - count_mode: exact (cached COUNT), estimate (planner estimate) or none (no count, cursor paging)
+    - cursor: next_cursor from the previous page (keyset "load more")
     """
     try:
         result = get_reviews_list_optimized(
@@ -1922,6 +2043,8 @@ def get_all_reviews(
             min_rating=min_rating,
             reviewee_id=reviewee_id,
             reviewer_id=reviewer_id,
+            count_mode=count_mode,
+            cursor=cursor,
         )
         return {"success": True, **result}
     except Exception as e:
@@ -2137,6 +2260,8 @@ def get_all_transactions(
     date_from: str = None,
     date_to: str = None,
     search: str = None,
+    count_mode: str = "exact",
+    cursor: str | None = None,
 ):
     """
     Get paginated list of all transactions with filtering.
@@ -2150,6 +2275,8 @@ def get_all_transactions(
             date_from=date_from,
             date_to=date_to,
             search=search,
+            count_mode=count_mode,
+            cursor=cursor,
         )
         return result
     except Exception as e:
@@ -2160,6 +2287,43 @@ def get_all_transactions(
         return {"success": False, "error": str(e)}
 
 
+@router.get("/transactions/export", auth=cookie_auth)
+def export_all_transactions(
+    request,
+    status: str = None,
+    payment_method: str = None,
+    transaction_type: str = None,
+    date_from: str = None,
+    date_to: str = None,
+    search: str = None,
+    format: str = "csv",
+    gzip: bool = False,
+    after_id: int = None,
+    until_id: int = None,
+):
+    """
+    Stream all matching transactions as CSV or NDJSON.
+    Resume an interrupted download with after_id=<last ID> and the
+    X-Export-Until-ID value from the first response.
+    """
+    try:
+        return export_transactions(
+            status=status,
+            payment_method=payment_method,
+            transaction_type=transaction_type,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+            fmt=format,
+            gzip=gzip,
+            after_id=after_id,
+            until_id=until_id,
+        )
+    except Exception as e:
+        print(f"❌ Error in export_all_transactions: {str(e)}")
+        return {"success": False, "error": str(e)}
+
+
 @router.get("/transactions/statistics", auth=cookie_auth)
 def get_transactions_statistics(request):
     """
@@ -2193,6 +2357,37 @@ def get_transaction_details(request, transaction_id: int):
         return {"success": False, "error": str(e)}
 
 
+@router.get("/wallets/{wallet_id}/statement", auth=cookie_auth)
+def get_wallet_statement_view(
+    request, wallet_id: int, date_from: date, date_to: date, limit: int = 500
+):
+    """
+    Ledger statement for a wallet: opening balance (snapshot + tail), each
+    transaction with its effect and running balance, and closing balance.
+    """
+    try:
+        from datetime import datetime, time
+
+        from accounts.ledger_service import balance_at, get_wallet_statement
+
+        start = timezone.make_aware(datetime.combine(date_from, time.min))
+        end = timezone.make_aware(datetime.combine(date_to, time.max))
+        statement = get_wallet_statement(wallet_id, start, end, limit=limit)
+        current = balance_at(wallet_id, timezone.now())
+        return {
+            "success": True,
+            "statement": statement,
+            "ledger_balance": float(current["balance"]),
+            "ledger_pending_earnings": float(current["pending_earnings"]),
+        }
+    except Exception as e:
+        print(f"❌ Error in get_wallet_statement_view: {str(e)}")
+        import traceback
+
+        traceback.print_exc()
+        return {"success": False, "error": str(e)}
+
+
 @router.post("/transactions/{transaction_id}/release-escrow", auth=cookie_auth)
 def release_escrow_payment(request, transaction_id: int):
     """
@@ -2289,6 +2484,36 @@ def refund_transaction(request, transaction_id: int):
         return {"success": False, "error": str(e)}
 
 
+@router.post("/transactions/bulk-refund", auth=cookie_auth)
+def bulk_refund_transactions(request):
+    """
+    Refund many transactions to their wallets in one batch.
+    Body: {"items": [{"transaction_id", "amount", "reason"?}], "reason"?, "refund_to"?}
+    Returns per-item results; invalid items are skipped, valid ones applied atomically.
+    """
+    try:
+        body = json.loads(request.body.decode("utf-8")) if request.body else {}
+        items = body.get("items", [])
+
+        if not items:
+            return {"success": False, "error": "No refund items provided"}
+
+        result = bulk_refund(
+            items,
+            reason=body.get("reason"),
+            refund_to=body.get("refund_to", "WALLET"),
+            admin=request.auth,
+            request=request,
+        )
+        return result
+    except Exception as e:
+        print(f"❌ Error in bulk_refund_transactions: {str(e)}")
+        import traceback
+
+        traceback.print_exc()
+        return {"success": False, "error": str(e)}
+
+
 # ===============================
 # Withdrawal Management (Admin)
 # ===============================
@@ -2302,6 +2527,8 @@ def get_all_withdrawals(
     status: str = None,
     payment_method: str = None,
     search: str = None,
+    count_mode: str = "exact",
+    cursor: str | None = None,
 ):
     """
     Get paginated list of all withdrawal requests with filtering.
@@ -2314,6 +2541,8 @@ def get_all_withdrawals(
             status=status,
             payment_method_filter=payment_method,
             search=search,
+            count_mode=count_mode,
+            cursor=cursor,
         )
         return result
     except Exception as e:
@@ -2324,6 +2553,33 @@ def get_all_withdrawals(
         return {"success": False, "error": str(e)}
 
 
+@router.get("/withdrawals/export", auth=cookie_auth)
+def export_all_withdrawals(
+    request,
+    status: str = None,
+    payment_method: str = None,
+    search: str = None,
+    format: str = "csv",
+    gzip: bool = False,
+    after_id: int = None,
+    until_id: int = None,
+):
+    """Stream all matching withdrawal requests as CSV or NDJSON (resumable)."""
+    try:
+        return export_withdrawals(
+            status=status,
+            payment_method=payment_method,
+            search=search,
+            fmt=format,
+            gzip=gzip,
+            after_id=after_id,
+            until_id=until_id,
+        )
+    except Exception as e:
+        print(f"❌ Error in export_all_withdrawals: {str(e)}")
+        return {"success": False, "error": str(e)}
+
+
 @router.get("/withdrawals/statistics", auth=cookie_auth)
 def get_withdrawal_stats(request):
     """
@@ -2441,14 +2697,19 @@ def bulk_release_escrow_payments(request):
     Release multiple escrow payments at once.
     """
     try:
-        body = request.data if hasattr(request, "data") else {}
+        body = json.loads(request.body.decode("utf-8")) if request.body else {}
         escrow_ids = body.get("escrow_ids", [])
         reason = body.get("reason", None)
 
         if not escrow_ids:
             return {"success": False, "error": "No escrow IDs provided"}
 
-        result = bulk_release_escrow(escrow_ids, reason)
+        result = bulk_release_escrow(
+            escrow_ids,
+            reason,
+            admin=request.auth,
+            request=request,
+        )
         return result
     except Exception as e:
         print(f"❌ Error in bulk_release_escrow_payments: {str(e)}")
@@ -2528,6 +2789,30 @@ def process_worker_payout(request):
         return {"success": False, "error": str(e)}
 
 
+@router.post("/transactions/bulk-payout", auth=cookie_auth)
+def bulk_worker_payout(request):
+    """
+    Pay out many workers in one batch.
+    Body: {"items": [{"worker_id", "amount", "payout_method", "gcash_number"?, "bank_details"?}]}
+    Returns per-item results; invalid or overdrawing items are skipped.
+    """
+    try:
+        body = json.loads(request.body.decode("utf-8")) if request.body else {}
+        items = body.get("items", [])
+
+        if not items:
+            return {"success": False, "error": "No payout items provided"}
+
+        result = bulk_payout(items, admin=request.auth, request=request)
+        return result
+    except Exception as e:
+        print(f"❌ Error in bulk_worker_payout: {str(e)}")
+        import traceback
+
+        traceback.print_exc()
+        return {"success": False, "error": str(e)}
+
+
 # ===============================
 # Dispute Management
 # ===============================
@@ -2738,21 +3023,23 @@ def export_audit_logs_endpoint(
     action_type: str | None = None,
     date_from: str | None = None,
     date_to: str | None = None,
+    format: str = "csv",
+    gzip: bool = False,
+    after_id: int | None = None,
+    until_id: int | None = None,
 ):
-    """Export audit logs to CSV format."""
+    """Stream audit logs as CSV or NDJSON (resumable via after_id/until_id)."""
     try:
-        from django.http import HttpResponse
-
-        csv_content = export_audit_logs(
+        return export_audit_logs(
             admin_id=admin_id,
             action_type=action_type,
             date_from=date_from,
             date_to=date_to,
+            fmt=format,
+            gzip=gzip,
+            after_id=after_id,
+            until_id=until_id,
         )
-
-        response = HttpResponse(csv_content, content_type="text/csv")
-        response["Content-Disposition"] = 'attachment; filename="audit-logs.csv"'
-        return response
     except Exception as e:
         print(f"❌ Error in export_audit_logs_endpoint: {str(e)}")
         return {"success": False, "error": str(e)}
@@ -3047,6 +3334,7 @@ def get_analytics_overview(request, period: str = "last_30_days"):
             return {
                 "success": True,
                 "stats": overview["overview"],
+                "rollups": overview["rollups"],
                 "revenue_timeline": [],  # TODO: implement timeline data
                 "user_timeline": [],  # TODO: implement timeline data
             }
@@ -7,9 +7,10 @@ Tracks who did what, when, and the before/after states.
 
 Functions:
 - log_action(): Create an audit log entry
+- build_audit_log(): Build an unsaved entry for bulk inserts
 - get_audit_logs(): Retrieve audit logs with filtering and pagination
 - get_audit_log_detail(): Get details of a specific audit log
-- export_audit_logs(): Export audit logs to CSV format
+- export_audit_logs(): Stream audit logs as CSV/NDJSON
 - get_admin_activity(): Get activity summary for a specific admin
 """
 
@@ -19,8 +20,7 @@ from django.db.models import Q, Count
 from django.utils import timezone
 from adminpanel.models import AuditLog, AdminAccount
 from accounts.models import Accounts
-import csv
-from io import StringIO
+import json
 
 
 def get_client_ip(request) -> Optional[str]:
@@ -36,7 +36,7 @@ def get_user_agent(request) -> str:
     return request.META.get('HTTP_USER_AGENT', '')
 
 
-def log_action(
+def build_audit_log(
     admin: Accounts,
     action: str,
     entity_type: str,
@@ -47,20 +47,9 @@ def log_action(
     request = None
 ) -> AuditLog:
     """
-    Create an audit log entry.
-    
-    Args:
-        admin: The admin account performing the action
-        action: Type of action (from AuditLog.ActionType)
-        entity_type: Type of entity affected (from AuditLog.EntityType)
-        entity_id: ID of the affected entity
-        details: Additional details about the action
-        before_value: State before the change
-        after_value: State after the change
-        request: HTTP request object (for IP and user agent)
-    
-    Returns:
-        Created AuditLog instance
+    Build an unsaved AuditLog entry (for AuditLog.objects.bulk_create).
+
+    Takes the same arguments as log_action().
     """
     ip_address = None
     user_agent = ""
@@ -69,7 +58,7 @@ def log_action(
         ip_address = get_client_ip(request)
         user_agent = get_user_agent(request)
     
-    log_entry = AuditLog.objects.create(
+    return AuditLog(
         adminFK=admin,
         adminEmail=admin.email,
         action=action,
@@ -81,7 +70,38 @@ def log_action(
         ipAddress=ip_address,
         userAgent=user_agent
     )
+
+
+def log_action(
+    admin: Accounts,
+    action: str,
+    entity_type: str,
+    entity_id: str = "",
+    details: dict = None,
+    before_value: dict = None,
+    after_value: dict = None,
+    request = None
+) -> AuditLog:
+    """
+    Create an audit log entry.
+    
+    Args:
+        admin: The admin account performing the action
+        action: Type of action (from AuditLog.ActionType)
+        entity_type: Type of entity affected (from AuditLog.EntityType)
+        entity_id: ID of the affected entity
+        details: Additional details about the action
+        before_value: State before the change
+        after_value: State after the change
+        request: HTTP request object (for IP and user agent)
     
+    Returns:
+        Created AuditLog instance
+    """
+    log_entry = build_audit_log(
+        admin, action, entity_type, entity_id, details, before_value, after_value, request
+    )
+    log_entry.save()
     return log_entry
 
 
@@ -224,21 +244,35 @@ def export_audit_logs(
     admin_id: Optional[str] = None,
     action_type: Optional[str] = None,
     date_from: Optional[str] = None,
-    date_to: Optional[str] = None
-) -> str:
+    date_to: Optional[str] = None,
+    fmt: str = "csv",
+    gzip: bool = False,
+    after_id: Optional[int] = None,
+    until_id: Optional[int] = None,
+):
     """
-    Export audit logs to CSV format.
+    Stream audit logs as CSV or NDJSON (no row cap, constant memory).
     
     Args:
         admin_id: Filter by admin account ID
         action_type: Filter by action type
         date_from: Filter from date (YYYY-MM-DD)
         date_to: Filter to date (YYYY-MM-DD)
+        fmt: "csv" or "ndjson"
+        gzip: Compress the stream on the fly
+        after_id / until_id: Resume range (see export_service)
     
     Returns:
-        CSV string
+        StreamingHttpResponse
     """
-    queryset = AuditLog.objects.select_related('adminFK').all()
+    from adminpanel.export_service import (
+        ExportColumn,
+        choice_label,
+        format_datetime,
+        streaming_export_response,
+    )
+
+    queryset = AuditLog.objects.all()
     
     # Apply filters
     if admin_id and admin_id != "all":
@@ -262,30 +296,26 @@ def export_audit_logs(
         except ValueError:
             pass
     
-    # Create CSV
-    output = StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow([
-        "ID", "Timestamp", "Admin Email", "Action", "Entity Type",
-        "Entity ID", "IP Address", "Details"
-    ])
-    
-    # Write rows
-    for log in queryset[:10000]:  # Limit to 10k rows
-        writer.writerow([
-            log.auditLogID,
-            log.createdAt.strftime("%Y-%m-%d %H:%M:%S"),
-            log.adminEmail,
-            log.get_action_display(),
-            log.get_entityType_display(),
-            log.entityID,
-            log.ipAddress or "",
-            str(log.details)
-        ])
-    
-    return output.getvalue()
+    columns = [
+        ExportColumn("ID", "auditLogID"),
+        ExportColumn("Timestamp", "createdAt", format_datetime),
+        ExportColumn("Admin Email", "adminEmail"),
+        ExportColumn("Action", "action", choice_label(AuditLog.ActionType.choices)),
+        ExportColumn("Entity Type", "entityType", choice_label(AuditLog.EntityType.choices)),
+        ExportColumn("Entity ID", "entityID"),
+        ExportColumn("IP Address", "ipAddress"),
+        ExportColumn("Details", "details", lambda value: json.dumps(value, default=str)),
+    ]
+    return streaming_export_response(
+        queryset,
+        columns,
+        pk_field="auditLogID",
+        filename="audit-logs",
+        fmt=fmt,
+        gzip=gzip,
+        after_id=after_id,
+        until_id=until_id,
+    )
 
 
 def get_admin_activity(admin_id: int, days: int = 30) -> dict:
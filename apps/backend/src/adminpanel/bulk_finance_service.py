@@ -0,0 +1,577 @@
+"""
+Bulk Financial Operations for Admin Panel
+
+Set-based engine for admin escrow releases, refunds and payouts. Each batch
+runs inside one database transaction:
+
+1. Validate every item up front (ids, amounts, and for refunds the original's
+   status and any earlier refund); invalid items are reported per item and
+   skipped, valid items are applied all-or-nothing.
+2. Lock the affected transactions and wallets with SELECT ... FOR UPDATE in
+   primary-key order (consistent lock order, no deadlocks between batches).
+3. Compute each wallet's running balance in Python so every new ledger row
+   gets a correct balanceAfter, then apply one aggregated F() delta per
+   wallet in a single UPDATE ... CASE statement.
+4. Bulk-insert ledger rows, audit logs and notifications, and bulk-update
+   the source transactions/jobs.
+
+Query count is constant in the batch size (apart from bulk statement
+batching), so 1,000 items cost about the same number of round trips as 10.
+See `python manage.py benchmark_bulk_finance`.
+"""
+import logging
+import re
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models import Case, DecimalField, F, Q, Value, When
+from django.utils import timezone
+
+from accounts.ledger_service import invalidate_snapshots_for
+from accounts.models import Job, Notification, Transaction, Wallet, WorkerProfile
+from accounts.notification_feed import publish_created
+from adminpanel.audit_service import build_audit_log
+from adminpanel.models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+OP_RELEASE = "release"
+OP_REFUND = "refund"
+OP_PAYOUT = "payout"
+
+MAX_BATCH_ITEMS = 5000
+BULK_BATCH_SIZE = 500
+DESCRIPTION_MAX_LENGTH = 255
+PAYOUT_METHODS = ("GCASH", "BANK_TRANSFER")
+# process_refund() and bulk_refund() both describe refund rows this way
+REFUND_DESCRIPTION = "Refund for TXN-{transaction_id}:"
+REFUND_DESCRIPTION_RE = re.compile(r"^Refund for TXN-(\d+):")
+
+
+def _to_id(value) -> Optional[int]:
+    """Positive integer id from a request value, or None."""
+    if isinstance(value, bool):
+        return None
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 and str(number) == str(value).strip() else None
+
+
+def _to_amount(value) -> Optional[Decimal]:
+    try:
+        amount = Decimal(str(value)).quantize(Decimal("0.01"))
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    return amount if amount.is_finite() else None
+
+
+def _append_description(current: Optional[str], line: str) -> str:
+    return f"{current or ''}\n{line}".strip()[:DESCRIPTION_MAX_LENGTH]
+
+
+def _batched(items: List, size: int = BULK_BATCH_SIZE) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _lock_wallets(wallet_ids: Iterable[int]) -> Dict[int, Wallet]:
+    """Lock wallets in walletID order and return them keyed by id."""
+    ids = sorted(set(wallet_ids))
+    if not ids:
+        return {}
+    return {
+        wallet.walletID: wallet
+        for wallet in Wallet.objects.select_for_update()
+        .filter(walletID__in=ids)
+        .order_by("walletID")
+        .only("walletID", "accountFK", "balance")
+    }
+
+
+def apply_wallet_deltas(deltas: Dict[int, Decimal], now=None) -> int:
+    """Add each wallet's net delta with one UPDATE ... CASE per chunk."""
+    deltas = {wallet_id: delta for wallet_id, delta in deltas.items() if delta}
+    if not deltas:
+        return 0
+    now = now or timezone.now()
+    updated = 0
+    for chunk in _batched(sorted(deltas)):
+        updated += Wallet.objects.filter(walletID__in=chunk).update(
+            balance=F("balance")
+            + Case(
+                *[When(walletID=wallet_id, then=Value(deltas[wallet_id])) for wallet_id in chunk],
+                default=Value(Decimal("0.00")),
+                output_field=DecimalField(max_digits=10, decimal_places=2),
+            ),
+            updatedAt=now,
+        )
+    return updated
+
+
+def _mark_transactions_dirty(created_ats: Iterable) -> None:
+    # bulk_update bypasses Transaction.save(), which normally queues rollup days
+    from adminpanel.rollup_service import SOURCE_TRANSACTIONS, mark_dirty
+
+    mark_dirty(SOURCE_TRANSACTIONS, *created_ats)
+
+
+def _result(
+    operation: str,
+    results: List[Dict[str, Any]],
+    total_amount: Decimal,
+    started: float,
+) -> Dict[str, Any]:
+    processed = sum(1 for item in results if item["success"])
+    failed = len(results) - processed
+    return {
+        "success": processed > 0,
+        "operation": operation,
+        "requested": len(results),
+        "processed": processed,
+        "failed": failed,
+        "total_amount": float(total_amount),
+        "duration_ms": round((time.monotonic() - started) * 1000, 1),
+        "message": f"{processed} of {len(results)} {operation} item(s) processed",
+        "results": results,
+        **({} if processed else {"error": f"No valid items to {operation}"}),
+    }
+
+
+def _audit_rows(admin, request, action: str, entries: List[Dict[str, Any]]) -> None:
+    if not admin or not entries:
+        return
+    AuditLog.objects.bulk_create(
+        [
+            build_audit_log(admin=admin, action=action, entity_type="payment", request=request, **entry)
+            for entry in entries
+        ],
+        batch_size=BULK_BATCH_SIZE,
+    )
+
+
+def _wallet_accounts(wallet_ids: Iterable[int]) -> Dict[int, int]:
+    return dict(
+        Wallet.objects.filter(walletID__in=set(wallet_ids)).values_list("walletID", "accountFK_id")
+    )
+
+
+# =============================================================================
+# ESCROW RELEASE
+# =============================================================================
+
+
+def bulk_release_escrow(
+    transaction_ids: Iterable[int],
+    reason: Optional[str] = None,
+    admin=None,
+    request=None,
+) -> Dict[str, Any]:
+    """
+    Release escrow PAYMENT transactions in one batch.
+
+    Same effects as releasing each one individually: the payment is marked
+    COMPLETED, the job's escrowPaid flag is set, the client is notified and
+    an audit row is written per payment.
+    """
+    started = time.monotonic()
+    values = list(transaction_ids)
+    if len(values) > MAX_BATCH_ITEMS:
+        raise ValueError(f"Batch too large (max {MAX_BATCH_ITEMS} items)")
+
+    # One result per distinct id, in request order; unparseable values are reported as-is
+    order: List[Any] = []
+    results: Dict[Any, Optional[Dict[str, Any]]] = {}
+    for value in values:
+        txn_id = _to_id(value)
+        key = txn_id if txn_id is not None else ("invalid", len(order))
+        if key in results:
+            continue
+        order.append(key)
+        if txn_id is None:
+            results[key] = {"id": value, "success": False, "error": "Invalid transaction id"}
+        else:
+            results[key] = None
+    ids = [key for key in order if results[key] is None]
+    total = Decimal("0.00")
+    now = timezone.now()
+
+    with transaction.atomic():
+        payments = {
+            txn.transactionID: txn
+            for txn in Transaction.objects.select_for_update()
+            .filter(transactionID__in=ids)
+            .order_by("transactionID")
+            .only(
+                "transactionID", "walletID", "transactionType", "status", "amount",
+                "description", "relatedJobPosting", "createdAt",
+            )
+        }
+
+        released = []
+        for txn_id in ids:
+            txn = payments.get(txn_id)
+            if txn is None:
+                results[txn_id] = {"id": txn_id, "success": False, "error": "Transaction not found"}
+            elif txn.transactionType != Transaction.TransactionType.PAYMENT:
+                results[txn_id] = {
+                    "id": txn_id,
+                    "success": False,
+                    "error": "Only PAYMENT transactions can be released from escrow",
+                }
+            elif txn.status != Transaction.TransactionStatus.PENDING:
+                results[txn_id] = {
+                    "id": txn_id,
+                    "success": False,
+                    "error": f"Cannot release transaction with status: {txn.status}",
+                }
+            else:
+                released.append(txn)
+                total += txn.amount
+                results[txn_id] = {"id": txn_id, "success": True, "transaction_id": str(txn_id)}
+
+        if released:
+            for txn in released:
+                txn.status = Transaction.TransactionStatus.COMPLETED
+                txn.completedAt = now
+                if reason:
+                    txn.description = _append_description(txn.description, f"Release reason: {reason}")
+            Transaction.objects.bulk_update(
+                released, ["status", "completedAt", "description"], batch_size=BULK_BATCH_SIZE
+            )
+            invalidate_snapshots_for((txn.walletID_id, txn.transactionID) for txn in released)
+
+            job_ids = {txn.relatedJobPosting_id for txn in released if txn.relatedJobPosting_id}
+            if job_ids:
+                Job.objects.filter(jobID__in=job_ids).update(
+                    escrowPaid=True, escrowPaidAt=now, updatedAt=now
+                )
+
+            accounts = _wallet_accounts(txn.walletID_id for txn in released)
+            created_notifications = Notification.objects.bulk_create(
+                [
+                    Notification(
+                        accountFK_id=accounts[txn.walletID_id],
+                        notificationType=Notification.NotificationType.ESCROW_PAID,
+                        title="Escrow Payment Confirmed",
+                        message=f"Your escrow payment of ₱{txn.amount} has been confirmed by the admin team.",
+                        relatedJobID=txn.relatedJobPosting_id,
+                    )
+                    for txn in released
+                    if txn.walletID_id in accounts
+                ],
+                batch_size=BULK_BATCH_SIZE,
+            )
+            publish_created(created_notifications)
+            _audit_rows(
+                admin,
+                request,
+                AuditLog.ActionType.PAYMENT_RELEASE,
+                [
+                    {
+                        "entity_id": str(txn.transactionID),
+                        "details": {"action": "escrow_released", "reason": reason or "N/A", "amount": float(txn.amount)},
+                        "before_value": {"status": "PENDING", "amount": float(txn.amount)},
+                        "after_value": {"status": "COMPLETED", "amount": float(txn.amount)},
+                    }
+                    for txn in released
+                ],
+            )
+            _mark_transactions_dirty(txn.createdAt for txn in released)
+
+    return _result(OP_RELEASE, [results[key] for key in order], total, started)
+
+
+# =============================================================================
+# REFUNDS
+# =============================================================================
+
+
+def _refunded_transaction_ids(transaction_ids: Iterable[int]) -> set:
+    """Ids among `transaction_ids` that already have a REFUND row."""
+    refunded = set()
+    for chunk in _batched(sorted(transaction_ids)):
+        match = Q()
+        for txn_id in chunk:
+            match |= Q(description__startswith=REFUND_DESCRIPTION.format(transaction_id=txn_id))
+        for description in Transaction.objects.filter(
+            match, transactionType=Transaction.TransactionType.REFUND
+        ).values_list("description", flat=True):
+            found = REFUND_DESCRIPTION_RE.match(description or "")
+            if found:
+                refunded.add(int(found.group(1)))
+    return refunded
+
+
+def bulk_refund(
+    items: List[Dict[str, Any]],
+    reason: Optional[str] = None,
+    refund_to: str = "WALLET",
+    admin=None,
+    request=None,
+) -> Dict[str, Any]:
+    """
+    Refund many transactions back to their own wallets in one batch.
+
+    items: [{"transaction_id": int, "amount": number, "reason": optional str}]
+    Mirrors process_refund(): a COMPLETED REFUND row per item, the original
+    transaction's description annotated, the wallet credited.
+    """
+    started = time.monotonic()
+    if len(items) > MAX_BATCH_ITEMS:
+        raise ValueError(f"Batch too large (max {MAX_BATCH_ITEMS} items)")
+
+    results: List[Dict[str, Any]] = []
+    planned = []
+    seen = set()
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results.append({"index": index, "id": None, "success": False, "error": "Invalid refund item"})
+            continue
+        raw_id = item.get("transaction_id")
+        txn_id = _to_id(raw_id)
+        amount = _to_amount(item.get("amount"))
+        entry = {"index": index, "id": raw_id, "success": False}
+        results.append(entry)
+        if raw_id in (None, ""):
+            entry["error"] = "transaction_id is required"
+        elif txn_id is None:
+            entry["error"] = "Invalid transaction id"
+        elif txn_id in seen:
+            entry["error"] = "Duplicate transaction in batch"
+        elif amount is None or amount <= 0:
+            entry["error"] = "Refund amount must be greater than 0"
+        else:
+            seen.add(txn_id)
+            entry["id"] = txn_id
+            planned.append((entry, txn_id, amount, item.get("reason") or reason or ""))
+
+    total = Decimal("0.00")
+    now = timezone.now()
+
+    with transaction.atomic():
+        originals = {
+            txn.transactionID: txn
+            for txn in Transaction.objects.select_for_update()
+            .filter(transactionID__in=[txn_id for _, txn_id, _, _ in planned])
+            .order_by("transactionID")
+            .only(
+                "transactionID", "walletID", "transactionType", "status", "amount",
+                "description", "relatedJobPosting", "createdAt",
+            )
+        }
+        already_refunded = _refunded_transaction_ids(originals.keys())
+
+        valid = []
+        for entry, txn_id, amount, item_reason in planned:
+            original = originals.get(txn_id)
+            if original is None:
+                entry["error"] = "Original transaction not found"
+            elif original.transactionType == Transaction.TransactionType.REFUND:
+                entry["error"] = "Refund transactions cannot be refunded"
+            elif original.status != Transaction.TransactionStatus.COMPLETED:
+                entry["error"] = f"Cannot refund transaction with status: {original.status}"
+            elif txn_id in already_refunded:
+                entry["error"] = "Transaction has already been refunded"
+            elif amount > original.amount:
+                entry["error"] = "Refund amount cannot exceed original transaction amount"
+            else:
+                valid.append((entry, original, amount, item_reason))
+
+        wallets = _lock_wallets(original.walletID_id for _, original, _, _ in valid)
+        running = {wallet_id: wallet.balance for wallet_id, wallet in wallets.items()}
+        deltas: Dict[int, Decimal] = {}
+        ledger, touched, notifications, audits = [], [], [], []
+
+        for entry, original, amount, item_reason in valid:
+            wallet_id = original.walletID_id
+            running[wallet_id] += amount
+            deltas[wallet_id] = deltas.get(wallet_id, Decimal("0.00")) + amount
+            ledger.append(
+                Transaction(
+                    walletID_id=wallet_id,
+                    transactionType=Transaction.TransactionType.REFUND,
+                    amount=amount,
+                    balanceAfter=running[wallet_id],
+                    status=Transaction.TransactionStatus.COMPLETED,
+                    paymentMethod=refund_to,
+                    description=(
+                        f"{REFUND_DESCRIPTION.format(transaction_id=original.transactionID)} {item_reason}"
+                    )[:DESCRIPTION_MAX_LENGTH],
+                    referenceNumber=f"REFUND-{original.transactionID}-{now.timestamp()}",
+                    relatedJobPosting_id=original.relatedJobPosting_id,
+                    completedAt=now,
+                )
+            )
+            original.description = _append_description(
+                original.description, f"Refunded: ₱{amount} - {item_reason}"
+            )
+            touched.append(original)
+            notifications.append(
+                Notification(
+                    accountFK_id=wallets[wallet_id].accountFK_id,
+                    notificationType=Notification.NotificationType.PAYMENT_REFUNDED,
+                    title="Payment Refunded",
+                    message=f"₱{amount} has been refunded to your wallet.",
+                    relatedJobID=original.relatedJobPosting_id,
+                )
+            )
+            audits.append({
+                "entity_id": str(original.transactionID),
+                "details": {"action": "refund_processed", "amount": float(amount), "reason": item_reason, "refund_to": refund_to},
+                "before_value": {"original_amount": float(original.amount)},
+                "after_value": {"refund_amount": float(amount)},
+            })
+            total += amount
+
+        if ledger:
+            Transaction.objects.bulk_create(ledger, batch_size=BULK_BATCH_SIZE)
+            Transaction.objects.bulk_update(touched, ["description"], batch_size=BULK_BATCH_SIZE)
+            apply_wallet_deltas(deltas, now)
+            publish_created(Notification.objects.bulk_create(notifications, batch_size=BULK_BATCH_SIZE))
+            _audit_rows(admin, request, AuditLog.ActionType.PAYMENT_REFUND, audits)
+
+            for (entry, original, amount, _), refund_txn in zip(valid, ledger):
+                entry["success"] = True
+                entry["refund_transaction_id"] = str(refund_txn.transactionID)
+                entry["amount_refunded"] = float(amount)
+
+    return _result(OP_REFUND, results, total, started)
+
+
+# =============================================================================
+# PAYOUTS
+# =============================================================================
+
+
+def _payout_description(method: str, gcash_number: Optional[str], bank_details: Optional[str]) -> str:
+    description = f"Payout to worker via {method}"
+    if method == "GCASH" and gcash_number:
+        description += f" - GCash: {gcash_number}"
+    elif method == "BANK_TRANSFER" and bank_details:
+        description += f" - {bank_details}"
+    return description[:DESCRIPTION_MAX_LENGTH]
+
+
+def bulk_payout(items: List[Dict[str, Any]], admin=None, request=None) -> Dict[str, Any]:
+    """
+    Pay out many workers from their wallets in one batch.
+
+    items: [{"worker_id", "amount", "payout_method", "gcash_number"?, "bank_details"?}]
+    Mirrors process_payout(): a COMPLETED WITHDRAWAL row per item and the
+    wallet debited. Items that would overdraw a wallet (taking earlier items
+    in the batch into account) are rejected individually.
+    """
+    started = time.monotonic()
+    if len(items) > MAX_BATCH_ITEMS:
+        raise ValueError(f"Batch too large (max {MAX_BATCH_ITEMS} items)")
+
+    results: List[Dict[str, Any]] = []
+    planned = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results.append({"index": index, "id": None, "success": False, "error": "Invalid payout item"})
+            continue
+        raw_id = item.get("worker_id")
+        worker_id = _to_id(raw_id)
+        amount = _to_amount(item.get("amount"))
+        method = str(item.get("payout_method") or "").upper()
+        entry = {"index": index, "id": raw_id, "success": False}
+        results.append(entry)
+        if raw_id in (None, ""):
+            entry["error"] = "worker_id is required"
+        elif worker_id is None:
+            entry["error"] = "Invalid worker id"
+        elif amount is None or amount <= 0:
+            entry["error"] = "Payout amount must be greater than 0"
+        elif method not in PAYOUT_METHODS:
+            entry["error"] = f"Invalid payout method: {item.get('payout_method')}"
+        else:
+            entry["id"] = worker_id
+            planned.append((entry, worker_id, amount, method, item))
+
+    account_ids = dict(
+        WorkerProfile.objects.filter(
+            pk__in={worker_id for _, worker_id, _, _, _ in planned}
+        ).values_list("pk", "profileID__accountFK_id")
+    )
+    missing_wallets = set(account_ids.values()) - set(
+        Wallet.objects.filter(accountFK_id__in=account_ids.values()).values_list("accountFK_id", flat=True)
+    )
+    if missing_wallets:
+        Wallet.objects.bulk_create(
+            [Wallet(accountFK_id=account_id, balance=Decimal("0.00")) for account_id in missing_wallets],
+            ignore_conflicts=True,
+        )
+
+    total = Decimal("0.00")
+    now = timezone.now()
+
+    with transaction.atomic():
+        wallet_ids = dict(
+            Wallet.objects.filter(accountFK_id__in=account_ids.values()).values_list("accountFK_id", "walletID")
+        )
+        wallets = _lock_wallets(wallet_ids.values())
+        running = {wallet_id: wallet.balance for wallet_id, wallet in wallets.items()}
+        deltas: Dict[int, Decimal] = {}
+        applied, ledger, notifications, audits = [], [], [], []
+
+        for entry, worker_id, amount, method, item in planned:
+            account_id = account_ids.get(worker_id)
+            if account_id is None:
+                entry["error"] = "Worker not found"
+                continue
+            wallet_id = wallet_ids[account_id]
+            if running[wallet_id] < amount:
+                entry["error"] = f"Insufficient wallet balance for payout. Available: ₱{running[wallet_id]}"
+                continue
+
+            running[wallet_id] -= amount
+            deltas[wallet_id] = deltas.get(wallet_id, Decimal("0.00")) - amount
+            ledger.append(
+                Transaction(
+                    walletID_id=wallet_id,
+                    transactionType=Transaction.TransactionType.WITHDRAWAL,
+                    amount=amount,
+                    balanceAfter=running[wallet_id],
+                    status=Transaction.TransactionStatus.COMPLETED,
+                    paymentMethod=method,
+                    description=_payout_description(method, item.get("gcash_number"), item.get("bank_details")),
+                    referenceNumber=f"PAYOUT-{worker_id}-{now.timestamp()}",
+                    completedAt=now,
+                    processedByAdmin=admin,
+                    processedAt=now if admin else None,
+                )
+            )
+            notifications.append(
+                Notification(
+                    accountFK_id=account_id,
+                    notificationType=Notification.NotificationType.SYSTEM,
+                    title="Payout Sent",
+                    message=f"₱{amount} has been paid out from your wallet via {method.replace('_', ' ').title()}.",
+                )
+            )
+            audits.append({
+                "entity_id": str(worker_id),
+                "details": {"action": "payout_processed", "amount": float(amount), "payout_method": method},
+                "before_value": {"balance": float(running[wallet_id] + amount)},
+                "after_value": {"balance": float(running[wallet_id])},
+            })
+            applied.append((entry, amount))
+            total += amount
+
+        if ledger:
+            Transaction.objects.bulk_create(ledger, batch_size=BULK_BATCH_SIZE)
+            apply_wallet_deltas(deltas, now)
+            publish_created(Notification.objects.bulk_create(notifications, batch_size=BULK_BATCH_SIZE))
+            _audit_rows(admin, request, AuditLog.ActionType.PAYMENT_PAYOUT, audits)
+
+            for (entry, amount), payout_txn in zip(applied, ledger):
+                entry["success"] = True
+                entry["transaction_id"] = str(payout_txn.transactionID)
+                entry["amount"] = float(amount)
+
+    return _result(OP_PAYOUT, results, total, started)
@@ -0,0 +1,290 @@
+"""
+Admin KYC Review Queue
+
+Bounded replacement for fetchAll_kyc(): one page of user or agency KYC
+submissions at a time.
+
+- Filters: status (PENDING / APPROVED / REJECTED), submission date range and
+  account email search.
+- Keyset pagination on (createdAt DESC, pk DESC) via an opaque cursor, so deep
+  pages cost the same as the first one and new submissions do not shift rows.
+- Account / reviewer are joined with select_related, files come from a single
+  prefetch, and profile names are fetched in one batch for the page.
+- Private files are signed with one batch storage request per bucket, for the
+  visible page only.
+- get_kyc_queue_counts() serves the tab badges from one conditional aggregate
+  per table, cached for COUNTS_CACHE_SECONDS.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+from django.core.cache import cache
+from django.db.models import Count, Prefetch, Q
+
+from accounts.models import Agency, Profile, kyc, kycFiles
+from agency.models import AgencyKYC, AgencyKycFile
+from iayos_project.utils import get_signed_urls
+
+from .pagination import keyset_page
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+SIGNED_URL_TTL = 60 * 60
+
+COUNTS_CACHE_KEY = "cache:admin:kyc_queue_counts"
+COUNTS_CACHE_SECONDS = 30
+
+KYC_TYPES = ("USER", "AGENCY")
+
+# Queue status -> stored value(s). User KYC stores rejections as "Rejected".
+USER_STATUS_VALUES = {
+    "PENDING": [kyc.KycStatus.PENDING],
+    "APPROVED": [kyc.KycStatus.APPROVED],
+    "REJECTED": [kyc.KycStatus.REJECTED, "REJECTED"],
+}
+AGENCY_STATUS_VALUES = {
+    "PENDING": [AgencyKYC.AgencyKycStatus.PENDING],
+    "APPROVED": [AgencyKYC.AgencyKycStatus.APPROVED],
+    "REJECTED": [AgencyKYC.AgencyKycStatus.REJECTED],
+}
+
+
+# =============================================================================
+# FILE HELPERS
+# =============================================================================
+
+
+def derive_file_type(filename: str) -> str:
+    """Derive fileType from fileName pattern (FRONTID→front, BACKID→back, etc.)"""
+    if not filename:
+        return "unknown"
+    filename_upper = filename.upper()
+    if "FRONTID" in filename_upper or "FRONT_ID" in filename_upper:
+        return "front"
+    if "BACKID" in filename_upper or "BACK_ID" in filename_upper:
+        return "back"
+    if "SELFIE" in filename_upper:
+        return "selfie"
+    if "CLEARANCE" in filename_upper or "NBI" in filename_upper:
+        return "clearance"
+    return "unknown"
+
+
+def storage_path(url_or_path: Optional[str], bucket: str) -> Optional[str]:
+    """
+    Bucket-relative path for a stored fileURL, or None when it cannot be
+    signed (e.g. an external public URL).
+    """
+    if not url_or_path:
+        return None
+    if not url_or_path.startswith("http") and "/object/" not in url_or_path:
+        return url_or_path.lstrip("/")
+    match = re.search(rf"/object/(?:sign|public)/{re.escape(bucket)}/(.+?)(?:\?|$)", url_or_path)
+    return match.group(1) if match else None
+
+
+def _sign_file_urls(file_urls: List[Optional[str]], bucket: str) -> Dict[str, str]:
+    """Map each stored fileURL to a signed URL using one batch request."""
+    paths = {url: storage_path(url, bucket) for url in file_urls if url}
+    signed = get_signed_urls(bucket, [path for path in paths.values() if path], SIGNED_URL_TTL)
+    return {url: signed.get(path) or url for url, path in paths.items()}
+
+
+def _iso(value) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+# =============================================================================
+# QUEUE
+# =============================================================================
+
+
+def _filtered(queryset, status_field: str, status_values: Dict, status, date_from, date_to, search):
+    if status:
+        values = status_values.get(status.upper())
+        if values is None:
+            raise ValueError(f"Invalid status: {status}")
+        queryset = queryset.filter(**{f"{status_field}__in": values})
+    if date_from:
+        queryset = queryset.filter(createdAt__date__gte=date_from)
+    if date_to:
+        queryset = queryset.filter(createdAt__date__lte=date_to)
+    if search:
+        queryset = queryset.filter(accountFK__email__icontains=search.strip())
+    return queryset
+
+
+def _user_queue(status, date_from, date_to, search, cursor, limit) -> Dict[str, Any]:
+    queryset = kyc.objects.select_related("accountFK", "reviewedBy").prefetch_related(
+        Prefetch(
+            "kycfiles_set",
+            queryset=kycFiles.objects.only(
+                "kycFileID", "kycID", "idType", "fileName", "fileURL", "ai_verification_status"
+            ).order_by("kycFileID"),
+        )
+    )
+    queryset = _filtered(queryset, "kyc_status", USER_STATUS_VALUES, status, date_from, date_to, search)
+    records, next_cursor, has_more = keyset_page(queryset, ("-createdAt", "-kycID"), cursor, limit)
+
+    profiles = {}
+    for profile in Profile.objects.filter(
+        accountFK_id__in=[record.accountFK_id for record in records]
+    ).order_by("profileID").only("accountFK", "firstName", "lastName", "profileType", "profileImg"):
+        profiles.setdefault(profile.accountFK_id, profile)
+
+    signed = _sign_file_urls(
+        [f.fileURL for record in records for f in record.kycfiles_set.all()], "kyc-docs"
+    )
+
+    items = []
+    for record in records:
+        profile = profiles.get(record.accountFK_id)
+        files = list(record.kycfiles_set.all())
+        items.append({
+            "kycID": record.kycID,
+            "kycType": "USER",
+            "accountID": record.accountFK_id,
+            "email": record.accountFK.email,
+            "firstName": profile.firstName if profile else "",
+            "lastName": profile.lastName if profile else "",
+            "profileType": profile.profileType if profile else None,
+            "profileImg": profile.profileImg if profile else None,
+            "status": record.kyc_status,
+            "createdAt": _iso(record.createdAt),
+            "reviewedAt": _iso(record.reviewedAt),
+            "reviewedBy": record.reviewedBy.email if record.reviewedBy else None,
+            "notes": record.notes,
+            "rejectionReason": record.rejectionReason,
+            "resubmissionCount": record.resubmissionCount,
+            "files": [
+                {
+                    "fileID": f.kycFileID,
+                    "idType": f.idType,
+                    "fileName": f.fileName,
+                    "fileType": derive_file_type(f.fileName),
+                    "fileURL": signed.get(f.fileURL, f.fileURL),
+                    "aiVerificationStatus": f.ai_verification_status,
+                }
+                for f in files
+            ],
+            "fileCount": len(files),
+        })
+    return {"items": items, "next_cursor": next_cursor, "has_more": has_more}
+
+
+def _agency_queue(status, date_from, date_to, search, cursor, limit) -> Dict[str, Any]:
+    queryset = AgencyKYC.objects.select_related("accountFK", "reviewedBy").prefetch_related(
+        Prefetch(
+            "agencykycfile_set",
+            queryset=AgencyKycFile.objects.only(
+                "fileID", "agencyKyc", "fileType", "fileName", "fileURL", "fileSize",
+                "uploadedAt", "ai_verification_status",
+            ).order_by("fileID"),
+        )
+    )
+    queryset = _filtered(queryset, "status", AGENCY_STATUS_VALUES, status, date_from, date_to, search)
+    records, next_cursor, has_more = keyset_page(
+        queryset, ("-createdAt", "-agencyKycID"), cursor, limit
+    )
+
+    agencies = {
+        agency.accountFK_id: agency
+        for agency in Agency.objects.filter(
+            accountFK_id__in=[record.accountFK_id for record in records]
+        ).only("accountFK", "agencyId", "businessName")
+    }
+
+    signed = _sign_file_urls(
+        [f.fileURL for record in records for f in record.agencykycfile_set.all()], "agency"
+    )
+
+    items = []
+    for record in records:
+        agency = agencies.get(record.accountFK_id)
+        files = list(record.agencykycfile_set.all())
+        items.append({
+            "agencyKycID": record.agencyKycID,
+            "kycType": "AGENCY",
+            "accountID": record.accountFK_id,
+            "email": record.accountFK.email,
+            "agencyId": agency.agencyId if agency else None,
+            "businessName": agency.businessName if agency else "",
+            "status": record.status,
+            "createdAt": _iso(record.createdAt),
+            "reviewedAt": _iso(record.reviewedAt),
+            "reviewedBy": record.reviewedBy.email if record.reviewedBy else None,
+            "notes": record.notes,
+            "rejectionReason": record.rejectionReason,
+            "resubmissionCount": record.resubmissionCount,
+            "faceSimilarityScore": record.face_similarity_score,
+            "files": [
+                {
+                    "fileID": f.fileID,
+                    "fileType": f.fileType,
+                    "fileName": f.fileName,
+                    "fileSize": f.fileSize,
+                    "uploadedAt": _iso(f.uploadedAt),
+                    "fileURL": signed.get(f.fileURL, f.fileURL),
+                    "aiVerificationStatus": f.ai_verification_status,
+                }
+                for f in files
+            ],
+            "fileCount": len(files),
+        })
+    return {"items": items, "next_cursor": next_cursor, "has_more": has_more}
+
+
+def get_kyc_queue(
+    kyc_type: str = "USER",
+    status: Optional[str] = None,
+    date_from=None,
+    date_to=None,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Dict[str, Any]:
+    """
+    One page of the KYC review queue, newest first.
+
+    Pass the returned next_cursor back as `cursor` to fetch the next page;
+    it is None on the last page.
+    """
+    kyc_type = (kyc_type or "USER").upper()
+    if kyc_type not in KYC_TYPES:
+        raise ValueError(f"Invalid kyc_type: {kyc_type}")
+    limit = max(1, min(int(limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+
+    build = _agency_queue if kyc_type == "AGENCY" else _user_queue
+    result = build(status, date_from, date_to, search, cursor, limit)
+    return {"kycType": kyc_type, "limit": limit, **result}
+
+
+# =============================================================================
+# COUNTS (tab badges)
+# =============================================================================
+
+
+def _status_counts(model, status_field: str, status_values: Dict, pk_field: str) -> Dict[str, int]:
+    return model.objects.aggregate(
+        **{
+            status.lower(): Count(pk_field, filter=Q(**{f"{status_field}__in": values}))
+            for status, values in status_values.items()
+        }
+    )
+
+
+def get_kyc_queue_counts() -> Dict[str, Dict[str, int]]:
+    """Per-status counts for user and agency KYC (cached briefly for badge polling)."""
+    counts = cache.get(COUNTS_CACHE_KEY)
+    if counts is not None:
+        return counts
+
+    user = _status_counts(kyc, "kyc_status", USER_STATUS_VALUES, "kycID")
+    agency = _status_counts(AgencyKYC, "status", AGENCY_STATUS_VALUES, "agencyKycID")
+    counts = {
+        "user": user,
+        "agency": agency,
+        "total": {status: user[status] + agency[status] for status in user},
+    }
+    cache.set(COUNTS_CACHE_KEY, counts, COUNTS_CACHE_SECONDS)
+    return counts
@@ -0,0 +1,101 @@
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import Accounts, Profile, Transaction, Wallet, WorkerProfile
+from adminpanel import bulk_finance_service
+from adminpanel.bulk_finance_service import OP_PAYOUT, OP_REFUND, OP_RELEASE
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Time a bulk escrow release / refund / payout batch against synthetic "
+        "rows. Everything runs in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=1000, help="Batch size (default 1000).")
+        parser.add_argument(
+            "--operation",
+            choices=(OP_RELEASE, OP_REFUND, OP_PAYOUT),
+            default=OP_RELEASE,
+        )
+
+    def _seed(self, count, operation):
+        stamp = int(time.time() * 1000)
+        accounts = Accounts.objects.bulk_create(
+            [Accounts(email=f"bench-{stamp}-{i}@bench.invalid", password="!") for i in range(count)]
+        )
+        wallets = Wallet.objects.bulk_create(
+            [Wallet(accountFK=account, balance=Decimal("1000.00")) for account in accounts]
+        )
+        if operation == OP_PAYOUT:
+            profiles = Profile.objects.bulk_create(
+                [
+                    Profile(accountFK=account, firstName="Bench", lastName="Worker", profileType="WORKER")
+                    for account in accounts
+                ]
+            )
+            workers = WorkerProfile.objects.bulk_create([WorkerProfile(profileID=p) for p in profiles])
+            return [
+                {"worker_id": worker.pk, "amount": "100.00", "payout_method": "GCASH", "gcash_number": "09170000000"}
+                for worker in workers
+            ]
+
+        status = (
+            Transaction.TransactionStatus.PENDING
+            if operation == OP_RELEASE
+            else Transaction.TransactionStatus.COMPLETED
+        )
+        payments = Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    walletID=wallet,
+                    transactionType=Transaction.TransactionType.PAYMENT,
+                    amount=Decimal("500.00"),
+                    balanceAfter=wallet.balance,
+                    status=status,
+                    description="Benchmark escrow payment",
+                )
+                for wallet in wallets
+            ]
+        )
+        if operation == OP_RELEASE:
+            return [payment.transactionID for payment in payments]
+        return [{"transaction_id": payment.transactionID, "amount": "250.00"} for payment in payments]
+
+    def handle(self, *args, **options):
+        count = options["items"]
+        operation = options["operation"]
+        if count < 1 or count > bulk_finance_service.MAX_BATCH_ITEMS:
+            raise CommandError(f"--items must be between 1 and {bulk_finance_service.MAX_BATCH_ITEMS}")
+
+        try:
+            with transaction.atomic():
+                items = self._seed(count, operation)
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.monotonic()
+                    if operation == OP_RELEASE:
+                        result = bulk_finance_service.bulk_release_escrow(items, reason="benchmark")
+                    elif operation == OP_REFUND:
+                        result = bulk_finance_service.bulk_refund(items, reason="benchmark")
+                    else:
+                        result = bulk_finance_service.bulk_payout(items)
+                    elapsed = time.monotonic() - started
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        self.stdout.write(
+            f"{operation}: items={count}, processed={result['processed']}, "
+            f"failed={result['failed']}, queries={len(queries)}, "
+            f"elapsed={elapsed * 1000:.1f}ms, per_item={elapsed * 1000 / count:.3f}ms"
+        )
+        self.stdout.write(self.style.SUCCESS("Benchmark finished (all rows rolled back)."))
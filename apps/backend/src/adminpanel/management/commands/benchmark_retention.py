@@ -0,0 +1,146 @@
+"""
+Benchmark notification read latency before and after retention pruning.
+
+Seeds --rows notifications spread evenly over --months months of history for
+a handful of benchmark accounts (most older rows read, like real inboxes),
+times the hot read paths, prunes with the "notifications" retention policy
+(scoped to the benchmark accounts) and times them again. On PostgreSQL the
+table size is reported too; run it once before and once after
+`partition_tables apply notifications` to compare layouts.
+
+Benchmark accounts and their rows are deleted afterwards.
+
+Usage:
+    python manage.py benchmark_retention
+    python manage.py benchmark_retention --rows 1000000 --accounts 20 --months 24 --repeat 50
+"""
+import json
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from accounts.models import Accounts, Notification
+from accounts.notification_feed import get_notifications_since, invalidate_unread, unread_count
+from accounts.services import get_user_notifications
+from adminpanel.retention_service import get_policies, run_policy
+
+EMAIL_TEMPLATE = "bench-retention-{index}@benchmark.local"
+PROFILE_TYPE = "CLIENT"
+UNREAD_RECENT_DAYS = 14
+
+
+class Command(BaseCommand):
+    help = "Time notification queries before and after pruning at realistic row counts"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=200000, help="Notifications to seed.")
+        parser.add_argument("--accounts", type=int, default=10, help="Benchmark accounts.")
+        parser.add_argument("--months", type=int, default=24, help="Months of history to spread rows over.")
+        parser.add_argument("--repeat", type=int, default=20, help="Timed runs per query.")
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        accounts = [
+            Accounts.objects.create_user(email=EMAIL_TEMPLATE.format(index=index), password="benchmark-pass")
+            for index in range(max(1, options["accounts"]))
+        ]
+        account_ids = [account.accountID for account in accounts]
+        try:
+            seeded = self._seed(account_ids, max(1, options["rows"]), max(1, options["months"]), options["batch_size"])
+            before = self._measure(account_ids, options["repeat"])
+
+            policy = get_policies()["notifications"]
+            policy = policy._replace(
+                days=policy.days or 180, filters={**policy.filters, "accountFK_id__in": account_ids}
+            )
+            pruned = run_policy(policy, batch_size=options["batch_size"])
+            after = self._measure(account_ids, options["repeat"])
+        finally:
+            Notification.objects.filter(accountFK_id__in=account_ids).delete()
+            Accounts.objects.filter(accountID__in=account_ids).delete()
+
+        self.stdout.write(json.dumps({
+            "vendor": connection.vendor,
+            "seeded_rows": seeded,
+            "retention_days": policy.days,
+            "pruned": pruned,
+            "before": before,
+            "after": after,
+            "speedup": {
+                query: round(before["queries_ms"][query] / max(after["queries_ms"][query], 0.001), 2)
+                for query in before["queries_ms"]
+            },
+        }, indent=2, default=str))
+
+    def _seed(self, account_ids, rows, months, batch_size):
+        now = timezone.now()
+        span = timedelta(days=30 * months)
+        created = 0
+        while created < rows:
+            chunk = min(batch_size, rows - created)
+            batch = []
+            for offset in range(chunk):
+                index = created + offset
+                age = span * (1 - index / rows)  # oldest first, so IDs follow time
+                batch.append(Notification(
+                    accountFK_id=account_ids[index % len(account_ids)],
+                    notificationType=Notification.NotificationType.SYSTEM,
+                    title="Benchmark",
+                    message="Seeded notification",
+                    profile_type=PROFILE_TYPE,
+                    isRead=age > timedelta(days=UNREAD_RECENT_DAYS),
+                ))
+            inserted = Notification.objects.bulk_create(batch, batch_size=batch_size)
+            # createdAt is auto_now_add, so backdate after insert
+            for offset, notif in enumerate(inserted):
+                notif.createdAt = now - span * (1 - (created + offset) / rows)
+            Notification.objects.bulk_update(inserted, ["createdAt"], batch_size=batch_size)
+            created += chunk
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(Notification._meta.db_table)}")
+        return created
+
+    def _time(self, func, repeat):
+        samples = []
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - started) * 1000)
+        return round(statistics.median(samples), 3)
+
+    def _measure(self, account_ids, repeat):
+        account_id = account_ids[0]
+
+        def cold_unread():
+            invalidate_unread([account_id])
+            unread_count(account_id, PROFILE_TYPE)
+
+        return {
+            "rows": Notification.objects.filter(accountFK_id__in=account_ids).count(),
+            "table_bytes": self._table_bytes(),
+            "queries_ms": {
+                "list_newest_50": self._time(lambda: get_user_notifications(account_id, 50, False, PROFILE_TYPE), repeat),
+                "list_unread_50": self._time(lambda: get_user_notifications(account_id, 50, True, PROFILE_TYPE), repeat),
+                "unread_count_uncached": self._time(cold_unread, repeat),
+                "sync_since_0": self._time(lambda: get_notifications_since(account_id, 0, PROFILE_TYPE), repeat),
+            },
+        }
+
+    def _table_bytes(self):
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            # Sums partitions too when the table is partitioned
+            cursor.execute(
+                """
+                SELECT COALESCE(SUM(pg_total_relation_size(relid)), 0)
+                FROM pg_partition_tree(%s::regclass)
+                """,
+                [connection.ops.quote_name(Notification._meta.db_table)],
+            )
+            return cursor.fetchone()[0]
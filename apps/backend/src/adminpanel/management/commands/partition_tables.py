@@ -0,0 +1,82 @@
+"""
+Management command for monthly range partitioning of notifications and audit logs.
+
+PostgreSQL only and opt-in. `plan` prints the SQL without running it; `apply`
+converts a table in place under an exclusive lock (maintenance window);
+`extend` creates upcoming monthly partitions and should run from cron monthly.
+
+Usage:
+    python manage.py partition_tables status
+    python manage.py partition_tables plan notifications
+    python manage.py partition_tables apply notifications
+    python manage.py partition_tables extend audit_logs --months-ahead 6
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from adminpanel.partitioning import (
+    DEFAULT_MONTHS_AHEAD,
+    PARTITIONED_MODELS,
+    PartitioningError,
+    apply_conversion,
+    conversion_plan,
+    extend_partitions,
+    get_model_table,
+    is_partitioned,
+    list_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = "Plan, apply and extend monthly partitions for notifications and audit logs"
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=("status", "plan", "apply", "extend"))
+        parser.add_argument(
+            "tables",
+            nargs="*",
+            help=f"Tables to act on: {', '.join(PARTITIONED_MODELS)} (default: all).",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=DEFAULT_MONTHS_AHEAD,
+            help="Future monthly partitions to keep created.",
+        )
+
+    def handle(self, *args, **options):
+        names = options["tables"] or list(PARTITIONED_MODELS)
+        months_ahead = max(1, options["months_ahead"])
+        try:
+            for name in names:
+                getattr(self, f"_{options['action']}")(name, months_ahead)
+        except PartitioningError as exc:
+            raise CommandError(str(exc))
+
+    def _status(self, name, months_ahead):
+        _, table = get_model_table(name)
+        if not is_partitioned(table):
+            self.stdout.write(f"{table}: not partitioned")
+            return
+        partitions = list_partitions(table)
+        self.stdout.write(f"{table}: {len(partitions)} partitions")
+        for entry in partitions:
+            self.stdout.write(f"  {entry['partition']}: {entry['bounds']} (~{entry['estimated_rows']} rows)")
+
+    def _plan(self, name, months_ahead):
+        plan = conversion_plan(name, months_ahead)
+        self.stdout.write(f"-- {plan['table']}: {len(plan['partitions'])} monthly partitions")
+        for index_name in plan["skipped_unique_indexes"]:
+            self.stdout.write(self.style.WARNING(f"-- unique index {index_name} lacks the partition key and is dropped"))
+        for statement in plan["statements"]:
+            self.stdout.write(f"{statement};")
+
+    def _apply(self, name, months_ahead):
+        plan = apply_conversion(name, months_ahead)
+        self.stdout.write(
+            self.style.SUCCESS(f"{plan['table']} partitioned. partitions={len(plan['partitions'])}")
+        )
+
+    def _extend(self, name, months_ahead):
+        created = extend_partitions(name, months_ahead)
+        _, table = get_model_table(name)
+        self.stdout.write(self.style.SUCCESS(f"{table}: created={created or 'none'}"))
@@ -0,0 +1,64 @@
+"""
+Management command to archive and delete expired rows from append-only tables.
+
+Policies and defaults live in adminpanel.retention_service; override them
+with settings.DATA_RETENTION. Meant to run nightly from cron.
+
+Usage:
+    python manage.py prune_data --list
+    python manage.py prune_data --dry-run
+    python manage.py prune_data
+    python manage.py prune_data --policy notifications --policy job_logs --batch-size 5000
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from adminpanel.retention_service import DEFAULT_BATCH_SIZE, get_policies, run_policies
+
+
+class Command(BaseCommand):
+    help = "Archive and delete rows older than their retention policy"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--policy",
+            action="append",
+            dest="policies",
+            help="Policy name to run (repeatable). Default: all enabled policies.",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only report what would be pruned.")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per batch.")
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop each policy after this many batches (spread big backlogs over several runs).",
+        )
+        parser.add_argument("--list", action="store_true", help="Print the effective policies and exit.")
+
+    def handle(self, *args, **options):
+        if options["list"]:
+            for policy in get_policies().values():
+                days = "disabled" if policy.days is None else f"{policy.days}d"
+                self.stdout.write(
+                    f"{policy.name}: {policy.model}.{policy.date_field} keep={days} "
+                    f"archive={policy.archive or 'none'} filters={policy.filters or '-'}"
+                )
+            return
+
+        try:
+            results = run_policies(
+                options["policies"],
+                batch_size=max(1, options["batch_size"]),
+                dry_run=options["dry_run"],
+                max_batches=options["max_batches"],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        for result in results:
+            self.stdout.write(json.dumps(result, default=str))
+        total = sum(result.get("deleted", 0) for result in results)
+        label = "Dry run complete." if options["dry_run"] else f"Prune complete. deleted={total}"
+        self.stdout.write(self.style.SUCCESS(label))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from adminpanel.rollup_service import SOURCES, refresh_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Fold new and changed Job/Transaction/Accounts rows into the admin "
+        "analytics daily rollup tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            action="append",
+            choices=SOURCES,
+            help="Refresh only this source (repeatable). Defaults to all sources.",
+        )
+        parser.add_argument(
+            "--trailing-days",
+            type=int,
+            default=0,
+            help="Also recompute the last N days (heals bulk-update drift).",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Drop and recompute every day with data.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            metrics = refresh_rollups(
+                sources=options.get("source"),
+                trailing_days=max(0, int(options.get("trailing_days") or 0)),
+                full=bool(options.get("full")),
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        for entry in metrics:
+            self.stdout.write(
+                f"{entry['source']}: new_rows={entry['new_rows']}, "
+                f"days_recomputed={entry['days_recomputed']}"
+            )
+        self.stdout.write(self.style.SUCCESS("Analytics rollups refreshed."))
@@ -0,0 +1,124 @@
+"""
+Add daily rollup tables for admin analytics.
+
+No data migration: watermarks start at 0, so the first
+`refresh_analytics_rollups` run (or the first dashboard load) folds the
+existing history into the rollups.
+"""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("adminpanel", "0016_contentmoderationterm"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobDailyRollup",
+            fields=[
+                ("rollupID", models.BigAutoField(primary_key=True, serialize=False)),
+                ("day", models.DateField()),
+                ("status", models.CharField(max_length=15)),
+                ("categoryID", models.BigIntegerField(blank=True, null=True)),
+                ("urgency", models.CharField(blank=True, max_length=10, null=True)),
+                ("jobCount", models.IntegerField(default=0)),
+                (
+                    "budgetSum",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=16),
+                ),
+                ("applicationCount", models.IntegerField(default=0)),
+                ("jobsWithApplications", models.IntegerField(default=0)),
+            ],
+            options={
+                "db_table": "analytics_job_daily",
+                "indexes": [
+                    models.Index(fields=["day"], name="analytics_job_day_idx"),
+                    models.Index(
+                        fields=["status", "day"], name="analytics_job_status_day_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="TransactionDailyRollup",
+            fields=[
+                ("rollupID", models.BigAutoField(primary_key=True, serialize=False)),
+                ("day", models.DateField()),
+                ("transactionType", models.CharField(max_length=30)),
+                ("status", models.CharField(max_length=15)),
+                (
+                    "paymentMethod",
+                    models.CharField(blank=True, max_length=20, null=True),
+                ),
+                ("transactionCount", models.IntegerField(default=0)),
+                (
+                    "amountSum",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=16),
+                ),
+            ],
+            options={
+                "db_table": "analytics_transaction_daily",
+                "indexes": [
+                    models.Index(fields=["day"], name="analytics_tx_day_idx"),
+                    models.Index(
+                        fields=["transactionType", "status", "day"],
+                        name="analytics_tx_type_day_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="AccountDailyRollup",
+            fields=[
+                ("day", models.DateField(primary_key=True, serialize=False)),
+                ("accountCount", models.IntegerField(default=0)),
+                ("verifiedCount", models.IntegerField(default=0)),
+                ("clientProfiles", models.IntegerField(default=0)),
+                ("workerProfiles", models.IntegerField(default=0)),
+                ("agencyProfiles", models.IntegerField(default=0)),
+            ],
+            options={
+                "db_table": "analytics_account_daily",
+            },
+        ),
+        migrations.CreateModel(
+            name="RollupDirtyDay",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("source", models.CharField(max_length=20)),
+                ("day", models.DateField()),
+                ("markedAt", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "analytics_rollup_dirty_days",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("source", "day"), name="unique_rollup_dirty_day"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="RollupWatermark",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=50, primary_key=True, serialize=False),
+                ),
+                ("lastID", models.BigIntegerField(default=0)),
+                ("updatedAt", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "analytics_rollup_watermarks",
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+"""
+Compressed archive table for rows pruned by adminpanel.retention_service.
+"""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("adminpanel", "0018_auditlog_payment_payout"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchiveBatch",
+            fields=[
+                ("batchID", models.BigAutoField(primary_key=True, serialize=False)),
+                ("policy", models.CharField(max_length=50)),
+                ("sourceTable", models.CharField(max_length=100)),
+                ("firstSourceID", models.BigIntegerField()),
+                ("lastSourceID", models.BigIntegerField()),
+                ("rowCount", models.IntegerField()),
+                ("oldestAt", models.DateTimeField(blank=True, null=True)),
+                ("newestAt", models.DateTimeField(blank=True, null=True)),
+                ("payload", models.BinaryField(help_text="gzip(NDJSON), one source row per line")),
+                ("archivedAt", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "data_archive_batches",
+                "indexes": [
+                    models.Index(fields=["sourceTable", "firstSourceID"], name="archive_batch_source_idx"),
+                    models.Index(fields=["policy", "-archivedAt"], name="archive_batch_policy_idx"),
+                ],
+            },
+        ),
+    ]
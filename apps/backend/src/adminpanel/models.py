@@ -1,4 +1,5 @@
 from django.db import models
+from accounts.current_user_cache import invalidate_current_user
 from accounts.models import Accounts, kyc
 
 # Import Agency model - use string reference to avoid circular import
@@ -101,6 +102,15 @@ class SystemRoles(models.Model):
     createdAt = models.DateTimeField(auto_now_add=True)
     updatedAt = models.DateTimeField(auto_now=True)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_current_user(self.accountID_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        invalidate_current_user(self.accountID_id)
+        return result
+
 
 class CertificationLog(models.Model):
     """
@@ -573,6 +583,7 @@ class AuditLog(models.Model):
         KYC_REJECTION = "kyc_rejection", "KYC Rejection"
         PAYMENT_RELEASE = "payment_release", "Payment Release"
         PAYMENT_REFUND = "payment_refund", "Payment Refund"
+        PAYMENT_PAYOUT = "payment_payout", "Payment Payout"
         USER_BAN = "user_ban", "User Ban"
         USER_UNBAN = "user_unban", "User Unban"
         USER_SUSPEND = "user_suspend", "User Suspend"
@@ -873,3 +884,139 @@ class AdminAccount(models.Model):
 
     def __str__(self):
         return f"{self.accountFK.email} ({self.role})"
+
+
+# =============================================================================
+# ANALYTICS ROLLUPS
+# =============================================================================
+# Pre-aggregated per-day facts read by the admin dashboard and analytics
+# endpoints. Maintained by adminpanel/rollup_service.py: new rows are picked
+# up past a primary-key watermark, mutations mark their day dirty, and dirty
+# days are recomputed in full.
+
+
+class JobDailyRollup(models.Model):
+    """Jobs created on one local day, grouped by status/category/urgency."""
+
+    rollupID = models.BigAutoField(primary_key=True)
+    day = models.DateField()
+    status = models.CharField(max_length=15)
+    # Specializations PK; plain integer so rows survive category deletes
+    categoryID = models.BigIntegerField(null=True, blank=True)
+    urgency = models.CharField(max_length=10, null=True, blank=True)
+
+    jobCount = models.IntegerField(default=0)
+    budgetSum = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    applicationCount = models.IntegerField(default=0)
+    jobsWithApplications = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "analytics_job_daily"
+        indexes = [
+            models.Index(fields=["day"], name="analytics_job_day_idx"),
+            models.Index(fields=["status", "day"], name="analytics_job_status_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.status} cat={self.categoryID}: {self.jobCount}"
+
+
+class TransactionDailyRollup(models.Model):
+    """Transactions created on one local day, grouped by type/status/method."""
+
+    rollupID = models.BigAutoField(primary_key=True)
+    day = models.DateField()
+    transactionType = models.CharField(max_length=30)
+    status = models.CharField(max_length=15)
+    paymentMethod = models.CharField(max_length=20, null=True, blank=True)
+
+    transactionCount = models.IntegerField(default=0)
+    amountSum = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = "analytics_transaction_daily"
+        indexes = [
+            models.Index(fields=["day"], name="analytics_tx_day_idx"),
+            models.Index(
+                fields=["transactionType", "status", "day"],
+                name="analytics_tx_type_day_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.transactionType}/{self.status}: {self.transactionCount}"
+
+
+class AccountDailyRollup(models.Model):
+    """Accounts (and their profiles) created on one local day."""
+
+    day = models.DateField(primary_key=True)
+    accountCount = models.IntegerField(default=0)
+    verifiedCount = models.IntegerField(default=0)
+    clientProfiles = models.IntegerField(default=0)
+    workerProfiles = models.IntegerField(default=0)
+    agencyProfiles = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "analytics_account_daily"
+
+    def __str__(self):
+        return f"{self.day}: {self.accountCount} accounts"
+
+
+class RollupDirtyDay(models.Model):
+    """A (source, day) bucket whose rollup rows must be recomputed."""
+
+    source = models.CharField(max_length=20)
+    day = models.DateField()
+    markedAt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "analytics_rollup_dirty_days"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "day"], name="unique_rollup_dirty_day"
+            )
+        ]
+
+
+class RollupWatermark(models.Model):
+    """Highest primary key already folded into the rollups, per source table."""
+
+    name = models.CharField(max_length=50, primary_key=True)
+    lastID = models.BigIntegerField(default=0)
+    updatedAt = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "analytics_rollup_watermarks"
+
+    def __str__(self):
+        return f"{self.name} @ {self.lastID}"
+
+
+class ArchiveBatch(models.Model):
+    """
+    One batch of rows moved out of a high-volume table by
+    adminpanel.retention_service, stored as gzip-compressed NDJSON.
+    """
+
+    batchID = models.BigAutoField(primary_key=True)
+    policy = models.CharField(max_length=50)
+    sourceTable = models.CharField(max_length=100)
+    firstSourceID = models.BigIntegerField()
+    lastSourceID = models.BigIntegerField()
+    rowCount = models.IntegerField()
+    oldestAt = models.DateTimeField(null=True, blank=True)
+    newestAt = models.DateTimeField(null=True, blank=True)
+    payload = models.BinaryField(help_text="gzip(NDJSON), one source row per line")
+    archivedAt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "data_archive_batches"
+        indexes = [
+            models.Index(fields=["sourceTable", "firstSourceID"], name="archive_batch_source_idx"),
+            models.Index(fields=["policy", "-archivedAt"], name="archive_batch_policy_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.sourceTable} #{self.firstSourceID}-{self.lastSourceID} ({self.rowCount} rows)"
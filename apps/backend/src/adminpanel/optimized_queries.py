@@ -17,7 +17,6 @@ from django.db.models import (
     OuterRef, Subquery, Prefetch, ExpressionWrapper, FloatField, IntegerField, DecimalField
 )
 from django.db.models.functions import Coalesce, TruncDate, TruncMonth, Now
-from django.core.paginator import Paginator
 from django.utils import timezone
 from django.conf import settings
 from datetime import timedelta
@@ -31,6 +30,7 @@ from accounts.models import (
 from agency.models import AgencyKYC, AgencyKycFile, AgencyEmployee
 from accounts.models import Agency
 from adminpanel.models import KYCLogs
+from adminpanel.pagination import paginate_queryset
 
 
 # =============================================================================
@@ -197,7 +197,9 @@ def get_dashboard_stats_optimized() -> Dict[str, Any]:
 def get_kyc_list_optimized(
     status_filter: Optional[str] = None,
     page: int = 1,
-    page_size: int = 20
+    page_size: int = 20,
+    count_mode: str = 'exact',
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get paginated KYC list with all related data in 2-3 queries max.
@@ -218,8 +220,9 @@ def get_kyc_list_optimized(
         queryset = queryset.filter(kyc_status=status_filter.upper())
     
     # Get profiles for all accounts in one query
-    paginator = Paginator(queryset, page_size)
-    page_obj = paginator.get_page(page)
+    page_obj, pagination = paginate_queryset(
+        queryset, page, page_size, count_mode, cursor, keyset=('-createdAt', '-kycID')
+    )
     
     # Batch fetch profiles for all accounts on this page
     account_ids = [k.accountFK_id for k in page_obj]
@@ -259,11 +262,13 @@ def get_kyc_list_optimized(
     
     return {
         'kyc': kyc_list,
-        'total': paginator.count,
-        'page': page,
-        'totalPages': paginator.num_pages,
-        'hasNext': page_obj.has_next(),
-        'hasPrevious': page_obj.has_previous(),
+        'total': pagination['total'],
+        'page': pagination['page'],
+        'totalPages': pagination['total_pages'],
+        'hasNext': pagination['has_next'],
+        'hasPrevious': pagination['has_previous'],
+        'totalIsEstimate': pagination['total_is_estimate'],
+        'nextCursor': pagination['next_cursor'],
     }
 
 
@@ -275,7 +280,9 @@ def get_clients_list_optimized(
     page: int = 1,
     page_size: int = 50,
     search: Optional[str] = None,
-    status_filter: Optional[str] = None
+    status_filter: Optional[str] = None,
+    count_mode: str = 'exact',
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get paginated clients list with job stats in minimal queries.
@@ -341,8 +348,9 @@ def get_clients_list_optimized(
             queryset = queryset.filter(accountFK__isVerified=False)
     
     # Paginate
-    paginator = Paginator(queryset, page_size)
-    page_obj = paginator.get_page(page)
+    page_obj, pagination = paginate_queryset(
+        queryset, page, page_size, count_mode, cursor, keyset=('-accountFK__createdAt', '-profileID')
+    )
     
     # Build result - annotations already computed, no extra queries
     clients_list = []
@@ -370,11 +378,7 @@ def get_clients_list_optimized(
     
     return {
         'clients': clients_list,
-        'total': paginator.count,
-        'page': page,
-        'total_pages': paginator.num_pages,
-        'has_next': page_obj.has_next(),
-        'has_previous': page_obj.has_previous(),
+        **pagination,
     }
 
 
@@ -383,7 +387,9 @@ def get_workers_list_optimized(
     page_size: int = 50,
     search: Optional[str] = None,
     status_filter: Optional[str] = None,
-    category_id: Optional[int] = None
+    category_id: Optional[int] = None,
+    count_mode: str = 'exact',
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get paginated workers list with job stats and skills in minimal queries.
@@ -452,8 +458,9 @@ def get_workers_list_optimized(
         queryset = queryset.filter(profileID__in=worker_ids_with_category)
 
     
-    paginator = Paginator(queryset, page_size)
-    page_obj = paginator.get_page(page)
+    page_obj, pagination = paginate_queryset(
+        queryset, page, page_size, count_mode, cursor, keyset=('-accountFK__createdAt', '-profileID')
+    )
     
     # Batch fetch worker skills for all profiles on this page
     profile_ids = [p.profileID for p in page_obj]
@@ -511,11 +518,7 @@ def get_workers_list_optimized(
     
     return {
         'workers': workers_list,
-        'total': paginator.count,
-        'page': page,
-        'total_pages': paginator.num_pages,
-        'has_next': page_obj.has_next(),
-        'has_previous': page_obj.has_previous(),
+        **pagination,
     }
 
 
@@ -523,7 +526,9 @@ def get_agencies_list_optimized(
     page: int = 1,
     page_size: int = 50,
     search: Optional[str] = None,
-    status_filter: Optional[str] = None
+    status_filter: Optional[str] = None,
+    count_mode: str = 'exact',
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get paginated agencies list with stats in minimal queries.
@@ -579,8 +584,9 @@ def get_agencies_list_optimized(
         elif status_filter == 'inactive':
             queryset = queryset.filter(accountFK__isVerified=False)
     
-    paginator = Paginator(queryset, page_size)
-    page_obj = paginator.get_page(page)
+    page_obj, pagination = paginate_queryset(
+        queryset, page, page_size, count_mode, cursor, keyset=('-accountFK__createdAt', '-agencyId')
+    )
     
     # Build result
     agencies_list = []
@@ -605,11 +611,7 @@ def get_agencies_list_optimized(
     
     return {
         'agencies': agencies_list,
-        'total': paginator.count,
-        'page': page,
-        'total_pages': paginator.num_pages,
-        'has_next': page_obj.has_next(),
-        'has_previous': page_obj.has_previous(),
+        **pagination,
     }
 
 
@@ -622,7 +624,9 @@ def get_jobs_list_optimized(
     page_size: int = 20,
     status: Optional[str] = None,
     category_id: Optional[int] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    count_mode: str = 'exact',
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get paginated jobs list with all related data in 1-2 queries.
@@ -655,8 +659,9 @@ def get_jobs_list_optimized(
             Q(description__icontains=search)
         )
     
-    paginator = Paginator(queryset, page_size)
-    page_obj = paginator.get_page(page)
+    page_obj, pagination = paginate_queryset(
+        queryset, page, page_size, count_mode, cursor, keyset=('-createdAt', '-jobID')
+    )
     
     jobs_list = []
     for job in page_obj:
@@ -713,11 +718,7 @@ def get_jobs_list_optimized(
     
     return {
         'jobs': jobs_list,
-        'total': paginator.count,
-        'page': page,
-        'total_pages': paginator.num_pages,
-        'has_next': page_obj.has_next(),
-        'has_previous': page_obj.has_previous(),
+        **pagination,
     }
 
 
@@ -735,7 +736,9 @@ def get_transactions_list_optimized(
     end_date: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    count_mode: str = 'exact',
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get paginated transactions with wallet owner info in minimal queries.
@@ -774,8 +777,9 @@ def get_transactions_list_optimized(
             Q(referenceNumber__icontains=search)
         )
     
-    paginator = Paginator(queryset, page_size)
-    page_obj = paginator.get_page(page)
+    page_obj, pagination = paginate_queryset(
+        queryset, page, page_size, count_mode, cursor, keyset=('-createdAt', '-transactionID')
+    )
     
     # Batch fetch profiles for all wallet owners
     account_ids = [
@@ -820,11 +824,7 @@ def get_transactions_list_optimized(
     return {
         'success': True,
         'transactions': transactions_list,
-        'total': paginator.count,
-        'page': page,
-        'total_pages': paginator.num_pages,
-        'has_next': page_obj.has_next(),
-        'has_previous': page_obj.has_previous(),
+        **pagination,
     }
 
 
@@ -925,7 +925,9 @@ def get_reviews_list_optimized(
     reviewer_type: Optional[str] = None,
     min_rating: Optional[float] = None,
     reviewee_id: Optional[str] = None,
-    reviewer_id: Optional[str] = None
+    reviewer_id: Optional[str] = None,
+    count_mode: str = 'exact',
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get paginated reviews with all related data in minimal queries.
@@ -952,8 +954,9 @@ def get_reviews_list_optimized(
     if reviewer_id is not None and str(reviewer_id).lower() != 'all':
         queryset = queryset.filter(reviewerID_id=reviewer_id)
     
-    paginator = Paginator(queryset, page_size)
-    page_obj = paginator.get_page(page)
+    page_obj, pagination = paginate_queryset(
+        queryset, page, page_size, count_mode, cursor, keyset=('-createdAt', '-reviewID')
+    )
     
     # Batch fetch profiles for reviewers and reviewees
     account_ids = set()
@@ -998,11 +1001,13 @@ def get_reviews_list_optimized(
     return {
         'reviews': reviews_list,
         'pagination': {
-            'total': paginator.count,
-            'page': page,
-            'pages': paginator.num_pages,
-            'hasNext': page_obj.has_next(),
-            'hasPrevious': page_obj.has_previous(),
+            'total': pagination['total'],
+            'page': pagination['page'],
+            'pages': pagination['total_pages'],
+            'hasNext': pagination['has_next'],
+            'hasPrevious': pagination['has_previous'],
+            'totalIsEstimate': pagination['total_is_estimate'],
+            'nextCursor': pagination['next_cursor'],
         }
     }
 
@@ -1016,7 +1021,9 @@ def get_withdrawals_list_optimized(
     page_size: int = 20,
     status: Optional[str] = None,
     payment_method_filter: Optional[str] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    count_mode: str = 'exact',
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get paginated withdrawal requests with user info in minimal queries.
@@ -1046,8 +1053,9 @@ def get_withdrawals_list_optimized(
         else:
             queryset = queryset.filter(paymentMethod=method_upper)
     
-    paginator = Paginator(queryset, page_size)
-    page_obj = paginator.get_page(page)
+    page_obj, pagination = paginate_queryset(
+        queryset, page, page_size, count_mode, cursor, keyset=('-createdAt', '-transactionID')
+    )
     
     # Batch fetch profiles and payment methods
     account_ids = [
@@ -1144,9 +1152,5 @@ def get_withdrawals_list_optimized(
     return {
         'success': True,
         'withdrawals': withdrawals_list,
-        'total': paginator.count,
-        'page': page,
-        'total_pages': paginator.num_pages,
-        'has_next': page_obj.has_next(),
-        'has_previous': page_obj.has_previous(),
+        **pagination,
     }
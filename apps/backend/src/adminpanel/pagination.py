@@ -0,0 +1,300 @@
+"""
+Admin List Pagination
+
+Drop-in replacement for django.core.paginator.Paginator on the admin list
+endpoints, which previously ran an exact COUNT(*) over large joined/filtered
+querysets on every page flip.
+
+Count modes:
+- "exact"    COUNT(*) cached per filter signature (the compiled SQL) for
+             COUNT_CACHE_SECONDS, so flipping pages reuses one count.
+- "estimate" planner estimate: pg_class.reltuples for unfiltered lists,
+             EXPLAIN row estimate for filtered ones. Small results
+             (< ESTIMATE_EXACT_BELOW) fall back to the cached exact count.
+- "none"     keyset "load more": no count at all; pages continue from an
+             opaque cursor over the list's ordering columns.
+"""
+import base64
+import hashlib
+import json
+import logging
+import operator
+from datetime import date, datetime
+from decimal import Decimal
+from functools import reduce
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+logger = logging.getLogger(__name__)
+
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_NONE = "none"
+COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATE, COUNT_NONE)
+
+COUNT_CACHE_SECONDS = 60
+COUNT_CACHE_PREFIX = "cache:admin:count:"
+ESTIMATE_EXACT_BELOW = 10000
+
+
+# =============================================================================
+# COUNTS
+# =============================================================================
+
+
+def count_signature(queryset) -> Optional[str]:
+    """Cache key for a queryset's count (None when the SQL cannot be compiled)."""
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    digest = hashlib.sha1(
+        f"{queryset.db}|{queryset.model._meta.label}|{sql}|{params!r}".encode("utf-8")
+    ).hexdigest()
+    return f"{COUNT_CACHE_PREFIX}{digest}"
+
+
+def cached_count(queryset, timeout: int = COUNT_CACHE_SECONDS) -> int:
+    """Exact count, shared across requests with the same filters for `timeout` seconds."""
+    key = count_signature(queryset)
+    if key is None:
+        return 0
+    total = cache.get(key)
+    if total is None:
+        total = queryset.count()
+        cache.set(key, total, timeout)
+    return total
+
+
+def estimated_count(queryset) -> Optional[int]:
+    """
+    Postgres planner estimate of the row count, or None when unavailable
+    (other backends, never-analyzed tables, DISTINCT/grouped querysets).
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    query = queryset.query
+    if query.distinct or query.group_by:
+        return None
+
+    try:
+        if not query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            estimate = row[0] if row else None
+        else:
+            plan = json.loads(queryset.order_by().explain(format="json"))
+            estimate = plan[0]["Plan"]["Plan Rows"]
+    except EmptyResultSet:
+        return 0
+    except Exception as e:
+        logger.warning("Count estimate failed for %s: %s", queryset.model._meta.label, e)
+        return None
+
+    # reltuples is -1 until the table has been vacuumed/analyzed
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+# =============================================================================
+# PAGE-NUMBER PAGINATION
+# =============================================================================
+
+
+class AdminPage(Page):
+    def __init__(self, object_list, number, paginator, has_next=None):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        if self._has_next is not None:
+            return self._has_next
+        return super().has_next()
+
+
+class AdminPaginator(Paginator):
+    """
+    Paginator with cached exact counts or planner estimates.
+
+    When the total is an estimate the page slice is not clamped to it:
+    pages are fetched open-ended (one extra row decides has_next), so an
+    under-estimate never hides rows.
+    """
+
+    def __init__(self, object_list, per_page, count_mode: str = COUNT_EXACT, **kwargs):
+        if count_mode not in (COUNT_EXACT, COUNT_ESTIMATE):
+            raise ValueError(f"Invalid count_mode for page-number pagination: {count_mode}")
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_mode = count_mode
+        self.count_is_estimate = False
+
+    @cached_property
+    def count(self):
+        if self.count_mode == COUNT_ESTIMATE:
+            estimate = estimated_count(self.object_list)
+            if estimate is not None and estimate >= ESTIMATE_EXACT_BELOW:
+                self.count_is_estimate = True
+                return estimate
+        return cached_count(self.object_list)
+
+    def validate_number(self, number):
+        if self.count and self.count_is_estimate:
+            try:
+                number = int(number)
+            except (TypeError, ValueError):
+                raise PageNotAnInteger("That page number is not an integer")
+            if number < 1:
+                raise EmptyPage("That page number is less than 1")
+            return number
+        return super().validate_number(number)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_estimate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        return AdminPage(rows[: self.per_page], number, self, has_next=len(rows) > self.per_page)
+
+    def _get_page(self, *args, **kwargs):
+        return AdminPage(*args, **kwargs)
+
+
+# =============================================================================
+# KEYSET ("LOAD MORE") PAGINATION
+# =============================================================================
+
+
+def _cursor_default(value):
+    # Full-precision ISO strings: Django's JSON encoder truncates microseconds,
+    # which would skip or repeat rows that share a millisecond
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Unsupported cursor value: {value!r}")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), default=_cursor_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _resolve(obj, path: str):
+    for attr in path.split("__"):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _keyset_q(ordering: Sequence[str], values: Sequence[Any]) -> Q:
+    """Rows strictly after `values` in `ordering`: (a, b) > (x, y) as an OR of prefixes."""
+    conditions = []
+    for index, field in enumerate(ordering):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        prefix = {ordering[j].lstrip("-"): values[j] for j in range(index)}
+        conditions.append(Q(**prefix, **{f"{name}__{lookup}": values[index]}))
+    return reduce(operator.or_, conditions)
+
+
+def keyset_page(
+    queryset,
+    ordering: Sequence[str],
+    cursor: Optional[str] = None,
+    limit: int = 50,
+) -> Tuple[List[Any], Optional[str], bool]:
+    """
+    One keyset page: (rows, next_cursor, has_more). No COUNT is issued.
+
+    `ordering` must end with a unique, non-null column (normally the pk) and
+    every column in it must be non-null.
+    """
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        queryset = queryset.filter(_keyset_q(ordering, decode_cursor(cursor, len(ordering))))
+    rows = list(queryset[: limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor([_resolve(rows[-1], field.lstrip("-")) for field in ordering])
+    return rows, next_cursor, has_more
+
+
+# =============================================================================
+# ENTRY POINT
+# =============================================================================
+
+
+def paginate_queryset(
+    queryset,
+    page: int = 1,
+    page_size: int = 50,
+    count_mode: str = COUNT_EXACT,
+    cursor: Optional[str] = None,
+    keyset: Optional[Sequence[str]] = None,
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """
+    Paginate an admin list and return (rows, meta).
+
+    meta always carries total / page / total_pages / has_next / has_previous
+    plus count_mode, total_is_estimate and next_cursor. In keyset mode
+    (count_mode="none" or a cursor is given) total, page and total_pages are
+    None and the client continues with next_cursor.
+    """
+    count_mode = (count_mode or COUNT_EXACT).lower()
+    if count_mode not in COUNT_MODES:
+        raise ValueError(f"Invalid count_mode: {count_mode}")
+
+    if cursor or count_mode == COUNT_NONE:
+        if not keyset:
+            raise ValueError("This list does not support cursor pagination")
+        rows, next_cursor, has_more = keyset_page(queryset, keyset, cursor, page_size)
+        return rows, {
+            "total": None,
+            "page": None,
+            "total_pages": None,
+            "has_next": has_more,
+            "has_previous": bool(cursor),
+            "count_mode": COUNT_NONE,
+            "total_is_estimate": False,
+            "next_cursor": next_cursor,
+        }
+
+    if keyset:
+        queryset = queryset.order_by(*keyset)
+    paginator = AdminPaginator(queryset, page_size, count_mode=count_mode)
+    page_obj = paginator.get_page(page)
+    return list(page_obj), {
+        "total": paginator.count,
+        "page": page_obj.number,
+        "total_pages": paginator.num_pages,
+        "has_next": page_obj.has_next(),
+        "has_previous": page_obj.has_previous(),
+        "count_mode": count_mode,
+        "total_is_estimate": paginator.count_is_estimate,
+        "next_cursor": None,
+    }
@@ -0,0 +1,272 @@
+"""
+Monthly range partitioning for Notification and AuditLog (PostgreSQL only).
+
+Both tables are append-only and almost always read newest-first, so
+partitioning them by month on "createdAt" keeps the hot partitions (and
+their indexes) small, lets autovacuum work per month, and lets old months
+be detached instead of deleted row by row.
+
+Conversion is opt-in and rewrites the table in one transaction under an
+ACCESS EXCLUSIVE lock, so run it in a maintenance window:
+
+1. Capture the table's secondary indexes and foreign keys.
+2. Rename it to <table>_legacy and create <table> as
+   PARTITION BY RANGE ("createdAt") with the same columns and defaults.
+3. Create one partition per month from the oldest row up to a few months
+   ahead, plus a DEFAULT partition as a safety net.
+4. Copy the rows, carry the ID sequence over, drop the legacy table.
+5. Re-add the primary key as (pk, "createdAt") (Postgres requires the
+   partition key in it; IDs stay unique because they come from the
+   sequence) and recreate the indexes and foreign keys.
+
+Django keeps using the pk column as before. Future months must exist before
+rows arrive: schedule `partition_tables extend` monthly (it is idempotent).
+See `python manage.py partition_tables`.
+"""
+from datetime import date
+from typing import Dict, List, NamedTuple
+
+from django.apps import apps
+from django.db import connection, transaction
+from django.utils import timezone
+
+PARTITION_KEY = "createdAt"
+DEFAULT_MONTHS_AHEAD = 3
+
+PARTITIONED_MODELS = {
+    "notifications": "accounts.Notification",
+    "audit_logs": "adminpanel.AuditLog",
+}
+
+
+class PartitioningError(Exception):
+    pass
+
+
+class TableInfo(NamedTuple):
+    table: str
+    pk_column: str
+    indexes: List[str]  # CREATE INDEX statements
+    skipped_unique: List[str]  # unique indexes that cannot exist without the partition key
+    foreign_keys: List[str]  # ALTER TABLE ... ADD CONSTRAINT statements
+    serial_sequence: str  # sequence owned by a serial pk ("" for identity columns)
+
+
+def _qn(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+def _require_postgres() -> None:
+    if connection.vendor != "postgresql":
+        raise PartitioningError("Table partitioning requires PostgreSQL")
+
+
+def _add_month(day: date, months: int = 1) -> date:
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def month_ranges(start: date, end: date) -> List[date]:
+    """First day of every month from start's month through end's month."""
+    months = []
+    current = date(start.year, start.month, 1)
+    while current <= end:
+        months.append(current)
+        current = _add_month(current)
+    return months
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def _partition_sql(table: str, month: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {_qn(partition_name(table, month))} PARTITION OF {_qn(table)} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_month(month).isoformat()}')"
+    )
+
+
+def get_model_table(name: str):
+    if name not in PARTITIONED_MODELS:
+        raise PartitioningError(f"Unknown partitioned table '{name}' (choose from {', '.join(PARTITIONED_MODELS)})")
+    model = apps.get_model(PARTITIONED_MODELS[name])
+    return model, model._meta.db_table
+
+
+# =============================================================================
+# INTROSPECTION
+# =============================================================================
+
+
+def is_partitioned(table: str) -> bool:
+    _require_postgres()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [_qn(table)]
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions(table: str) -> List[Dict]:
+    """Existing partitions with their bounds and estimated row counts."""
+    _require_postgres()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid), child.reltuples::bigint
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            ORDER BY child.relname
+            """,
+            [_qn(table)],
+        )
+        return [
+            {"partition": name, "bounds": bounds, "estimated_rows": max(rows, 0)}
+            for name, bounds, rows in cursor.fetchall()
+        ]
+
+
+def inspect_table(model) -> TableInfo:
+    table = model._meta.db_table
+    pk_column = model._meta.pk.column
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT idx.indexname, idx.indexdef, ix.indisunique, ix.indisprimary
+            FROM pg_indexes idx
+            JOIN pg_index ix ON ix.indexrelid = to_regclass(quote_ident(idx.indexname))
+            WHERE idx.tablename = %s AND idx.schemaname = current_schema()
+            ORDER BY idx.indexname
+            """,
+            [table],
+        )
+        indexes, skipped_unique = [], []
+        for name, definition, unique, primary in cursor.fetchall():
+            if primary:
+                continue
+            if unique and f'"{PARTITION_KEY}"' not in definition:
+                skipped_unique.append(name)
+                continue
+            indexes.append(definition)
+
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE conrelid = to_regclass(%s) AND contype = 'f'
+            ORDER BY conname
+            """,
+            [_qn(table)],
+        )
+        foreign_keys = [
+            f"ALTER TABLE {_qn(table)} ADD CONSTRAINT {_qn(name)} {definition}"
+            for name, definition in cursor.fetchall()
+        ]
+
+        cursor.execute(
+            """
+            SELECT attidentity FROM pg_attribute
+            WHERE attrelid = to_regclass(%s) AND attname = %s
+            """,
+            [_qn(table), pk_column],
+        )
+        row = cursor.fetchone()
+        serial_sequence = ""
+        if row and not row[0]:
+            cursor.execute("SELECT pg_get_serial_sequence(%s, %s)", [_qn(table), pk_column])
+            serial_sequence = cursor.fetchone()[0] or ""
+
+    return TableInfo(table, pk_column, indexes, skipped_unique, foreign_keys, serial_sequence)
+
+
+# =============================================================================
+# PLAN / APPLY
+# =============================================================================
+
+
+def conversion_plan(name: str, months_ahead: int = DEFAULT_MONTHS_AHEAD) -> Dict:
+    """SQL statements that convert one table in place, plus notes for the operator."""
+    _require_postgres()
+    model, table = get_model_table(name)
+    if is_partitioned(table):
+        raise PartitioningError(f"{table} is already partitioned")
+
+    info = inspect_table(model)
+    legacy = f"{table}_legacy"
+    pk, key = _qn(info.pk_column), _qn(PARTITION_KEY)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN({key}) FROM {_qn(table)}")
+        oldest = cursor.fetchone()[0]
+    today = timezone.now().date()
+    months = month_ranges((oldest.date() if oldest else today), _add_month(today, months_ahead))
+
+    statements = [
+        f"LOCK TABLE {_qn(table)} IN ACCESS EXCLUSIVE MODE",
+        f"ALTER TABLE {_qn(table)} RENAME TO {_qn(legacy)}",
+        (
+            f"CREATE TABLE {_qn(table)} (LIKE {_qn(legacy)} INCLUDING DEFAULTS INCLUDING IDENTITY "
+            f"INCLUDING CONSTRAINTS INCLUDING STORAGE INCLUDING COMMENTS) PARTITION BY RANGE ({key})"
+        ),
+        *[_partition_sql(table, month) for month in months],
+        f"CREATE TABLE {_qn(table + '_pdefault')} PARTITION OF {_qn(table)} DEFAULT",
+        f"INSERT INTO {_qn(table)} OVERRIDING SYSTEM VALUE SELECT * FROM {_qn(legacy)}",
+    ]
+    if info.serial_sequence:
+        # Keep the serial sequence alive when the legacy table is dropped
+        statements.append(f"ALTER SEQUENCE {info.serial_sequence} OWNED BY {_qn(table)}.{pk}")
+    else:
+        statements.append(
+            f"SELECT setval(pg_get_serial_sequence('{_qn(table)}', '{info.pk_column}'), "
+            f"COALESCE((SELECT MAX({pk}) FROM {_qn(table)}), 0) + 1, false)"
+        )
+    statements += [
+        f"DROP TABLE {_qn(legacy)}",
+        f"ALTER TABLE {_qn(table)} ADD CONSTRAINT {_qn(table + '_pkey')} PRIMARY KEY ({pk}, {key})",
+        *info.indexes,
+        *info.foreign_keys,
+        f"ANALYZE {_qn(table)}",
+    ]
+    return {
+        "table": table,
+        "partitions": [partition_name(table, month) for month in months],
+        "skipped_unique_indexes": info.skipped_unique,
+        "statements": statements,
+    }
+
+
+def apply_conversion(name: str, months_ahead: int = DEFAULT_MONTHS_AHEAD) -> Dict:
+    plan = conversion_plan(name, months_ahead)
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            for statement in plan["statements"]:
+                cursor.execute(statement)
+    return plan
+
+
+def extend_partitions(name: str, months_ahead: int = DEFAULT_MONTHS_AHEAD) -> List[str]:
+    """
+    Create any missing monthly partitions from this month through
+    months_ahead. Returns the partitions that were created.
+    """
+    _require_postgres()
+    _, table = get_model_table(name)
+    if not is_partitioned(table):
+        raise PartitioningError(f"{table} is not partitioned; run `partition_tables apply {name}` first")
+
+    existing = {entry["partition"] for entry in list_partitions(table)}
+    today = timezone.now().date()
+    created = []
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            for month in month_ranges(today, _add_month(today, months_ahead)):
+                partition = partition_name(table, month)
+                if partition in existing:
+                    continue
+                # Fails if the DEFAULT partition already holds rows for this
+                # month; extend ahead of time so it never does
+                cursor.execute(_partition_sql(table, month))
+                created.append(partition)
+    return created
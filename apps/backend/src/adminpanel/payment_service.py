@@ -144,6 +144,128 @@ def get_transactions_list(
         }
 
 
+def _transaction_export_columns(include_withdrawal_fields: bool = False):
+    from adminpanel.export_service import ExportColumn, format_datetime
+
+    columns = [
+        ExportColumn("ID", "transactionID"),
+        ExportColumn("Reference Number", "referenceNumber"),
+        ExportColumn("Type", "transactionType"),
+        ExportColumn("Amount", "amount"),
+        ExportColumn("Balance After", "balanceAfter"),
+        ExportColumn("Status", "status"),
+        ExportColumn("Payment Method", "paymentMethod"),
+        ExportColumn("User Email", "walletID__accountFK__email"),
+        ExportColumn("Job ID", "relatedJobPosting_id"),
+        ExportColumn("Job Title", "relatedJobPosting__title"),
+        ExportColumn("Description", "description"),
+        ExportColumn("Created At", "createdAt", format_datetime),
+        ExportColumn("Completed At", "completedAt", format_datetime),
+    ]
+    if include_withdrawal_fields:
+        columns += [
+            ExportColumn("Admin Reference", "adminReferenceNumber"),
+            ExportColumn("Transfer Status", "paymongoTransferStatus"),
+            ExportColumn("Processed At", "processedAt", format_datetime),
+        ]
+    return columns
+
+
+def export_transactions(
+    status: Optional[str] = None,
+    payment_method: Optional[str] = None,
+    transaction_type: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    search: Optional[str] = None,
+    fmt: str = 'csv',
+    gzip: bool = False,
+    after_id: Optional[int] = None,
+    until_id: Optional[int] = None,
+):
+    """
+    Stream every transaction matching the list filters as CSV or NDJSON.
+
+    Uses a values_list projection read in keyset pages, so memory stays
+    constant however many rows match. Returns a StreamingHttpResponse.
+    """
+    from adminpanel.export_service import streaming_export_response
+
+    queryset = Transaction.objects.all()
+    if status:
+        queryset = queryset.filter(status=status)
+    if payment_method:
+        queryset = queryset.filter(paymentMethod=payment_method)
+    if transaction_type:
+        queryset = queryset.filter(transactionType=transaction_type)
+    if date_from:
+        date_from_obj = datetime.strptime(date_from, '%Y-%m-%d').date()
+        queryset = queryset.filter(createdAt__gte=date_from_obj)
+    if date_to:
+        date_to_obj = datetime.strptime(date_to, '%Y-%m-%d').date()
+        queryset = queryset.filter(createdAt__lt=date_to_obj + timedelta(days=1))
+    if search:
+        queryset = queryset.filter(
+            Q(description__icontains=search) |
+            Q(referenceNumber__icontains=search) |
+            Q(transactionID__icontains=search)
+        )
+
+    return streaming_export_response(
+        queryset,
+        _transaction_export_columns(),
+        pk_field='transactionID',
+        filename='transactions',
+        fmt=fmt,
+        gzip=gzip,
+        after_id=after_id,
+        until_id=until_id,
+    )
+
+
+def export_withdrawals(
+    status: Optional[str] = None,
+    payment_method: Optional[str] = None,
+    search: Optional[str] = None,
+    fmt: str = 'csv',
+    gzip: bool = False,
+    after_id: Optional[int] = None,
+    until_id: Optional[int] = None,
+):
+    """
+    Stream WITHDRAWAL transactions (same filters as get_withdrawals_list)
+    as CSV or NDJSON. Returns a StreamingHttpResponse.
+    """
+    from adminpanel.export_service import streaming_export_response
+
+    queryset = Transaction.objects.filter(transactionType='WITHDRAWAL')
+    if status:
+        queryset = queryset.filter(status=status)
+    if payment_method == 'GCASH':
+        queryset = queryset.filter(paymentMethod='GCASH')
+    elif payment_method == 'BANK':
+        queryset = queryset.filter(paymentMethod='BANK_TRANSFER')
+    elif payment_method == 'PAYPAL':
+        queryset = queryset.filter(description__icontains='PAYPAL')
+    if search:
+        queryset = queryset.filter(
+            Q(description__icontains=search) |
+            Q(referenceNumber__icontains=search) |
+            Q(walletID__accountFK__email__icontains=search)
+        )
+
+    return streaming_export_response(
+        queryset,
+        _transaction_export_columns(include_withdrawal_fields=True),
+        pk_field='transactionID',
+        filename='withdrawals',
+        fmt=fmt,
+        gzip=gzip,
+        after_id=after_id,
+        until_id=until_id,
+    )
+
+
 def get_transaction_statistics() -> Dict[str, Any]:
     """
     Get overall transaction statistics
@@ -151,77 +273,61 @@ def get_transaction_statistics() -> Dict[str, Any]:
     Returns:
         Dictionary with various transaction metrics
     """
+    from adminpanel.rollup_service import rollup_status, transaction_rollups
+
     try:
-        # Total transactions
-        total_transactions = Transaction.objects.count()
-        
-        # Total volume (all completed transactions)
-        total_volume = Transaction.objects.filter(
-            status='COMPLETED'
-        ).aggregate(
-            total=Coalesce(Sum('amount'), Value(Decimal('0.00')))
-        )['total']
-        
-        # Pending transactions
-        pending_count = Transaction.objects.filter(status='PENDING').count()
-        pending_amount = Transaction.objects.filter(
-            status='PENDING'
-        ).aggregate(
-            total=Coalesce(Sum('amount'), Value(Decimal('0.00')))
-        )['total']
-        
-        # Platform fees collected (FEE type transactions)
-        platform_fees = Transaction.objects.filter(
-            transactionType='FEE',
-            status='COMPLETED'
-        ).aggregate(
-            total=Coalesce(Sum('amount'), Value(Decimal('0.00')))
-        )['total']
-        
-        # Escrow held (PAYMENT type, PENDING status)
-        escrow_held = Transaction.objects.filter(
-            transactionType='PAYMENT',
-            status='PENDING'
-        ).aggregate(
-            total=Coalesce(Sum('amount'), Value(Decimal('0.00')))
-        )['total']
-        
-        # Refunded amount (REFUND type, COMPLETED status)
-        refunded_amount = Transaction.objects.filter(
-            transactionType='REFUND',
-            status='COMPLETED'
-        ).aggregate(
-            total=Coalesce(Sum('amount'), Value(Decimal('0.00')))
-        )['total']
-        
-        # Today's transactions
-        today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_count = Transaction.objects.filter(createdAt__gte=today_start).count()
-        today_volume = Transaction.objects.filter(
-            createdAt__gte=today_start,
-            status='COMPLETED'
-        ).aggregate(
-            total=Coalesce(Sum('amount'), Value(Decimal('0.00')))
-        )['total']
-        
-        # This month's transactions
-        month_start = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        month_count = Transaction.objects.filter(createdAt__gte=month_start).count()
-        month_volume = Transaction.objects.filter(
-            createdAt__gte=month_start,
-            status='COMPLETED'
-        ).aggregate(
-            total=Coalesce(Sum('amount'), Value(Decimal('0.00')))
-        )['total']
-        
+        zero = Value(Decimal('0.00'))
+
+        def _amount(condition):
+            return Coalesce(Sum('amountSum', filter=condition), zero)
+
+        def _count(condition):
+            return Coalesce(Sum('transactionCount', filter=condition), 0)
+
+        # All-time figures from TransactionDailyRollup (one aggregate)
+        totals = transaction_rollups().aggregate(
+            total_transactions=Coalesce(Sum('transactionCount'), 0),
+            # Total volume (all completed transactions)
+            total_volume=_amount(Q(status='COMPLETED')),
+            pending_count=_count(Q(status='PENDING')),
+            pending_amount=_amount(Q(status='PENDING')),
+            # Platform fees collected (FEE type transactions)
+            platform_fees=_amount(Q(transactionType='FEE', status='COMPLETED')),
+            # Escrow held (PAYMENT type, PENDING status)
+            escrow_held=_amount(Q(transactionType='PAYMENT', status='PENDING')),
+            # Refunded amount (REFUND type, COMPLETED status)
+            refunded_amount=_amount(Q(transactionType='REFUND', status='COMPLETED')),
+        )
+        total_transactions = totals['total_transactions']
+        total_volume = totals['total_volume']
+        pending_count = totals['pending_count']
+        pending_amount = totals['pending_amount']
+        platform_fees = totals['platform_fees']
+        escrow_held = totals['escrow_held']
+        refunded_amount = totals['refunded_amount']
+
+        # Today's and this month's transactions (local days)
+        today = timezone.localdate()
+        today_stats = transaction_rollups(since=today).aggregate(
+            count=Coalesce(Sum('transactionCount'), 0),
+            volume=_amount(Q(status='COMPLETED')),
+        )
+        today_count, today_volume = today_stats['count'], today_stats['volume']
+        month_stats = transaction_rollups(since=today.replace(day=1)).aggregate(
+            count=Coalesce(Sum('transactionCount'), 0),
+            volume=_amount(Q(status='COMPLETED')),
+        )
+        month_count, month_volume = month_stats['count'], month_stats['volume']
+
         # Payment method breakdown
-        payment_methods = Transaction.objects.values('paymentMethod').annotate(
-            count=Count('transactionID'),
-            total=Coalesce(Sum('amount'), Value(Decimal('0.00')))
+        payment_methods = transaction_rollups().values('paymentMethod').annotate(
+            count=Sum('transactionCount'),
+            total=Coalesce(Sum('amountSum'), zero)
         ).order_by('-total')
         
         return {
             'success': True,
+            'rollups': rollup_status(),
             'total_transactions': total_transactions,
             'total_volume': float(total_volume),
             'pending_transactions': pending_count,
@@ -740,53 +846,37 @@ def get_escrow_statistics() -> Dict[str, Any]:
         }
 
 
-def bulk_release_escrow(escrow_ids: List[int], reason: Optional[str] = None) -> Dict[str, Any]:
+def bulk_release_escrow(
+    escrow_ids: List[int],
+    reason: Optional[str] = None,
+    admin=None,
+    request=None,
+) -> Dict[str, Any]:
     """
     Release multiple escrow payments at once
     
+    Set-based: one locked read, bulk updates and bulk-inserted audit logs /
+    notifications (see adminpanel.bulk_finance_service).
+    
     Args:
         escrow_ids: List of transaction IDs
         reason: Optional reason for bulk release
+        admin: Admin account performing the action (for audit log)
+        request: HTTP request (for audit log)
         
     Returns:
-        Success/error response with counts
+        Success/error response with counts and per-item results
     """
+    from adminpanel.bulk_finance_service import bulk_release_escrow as release_batch
+
     try:
-        # Get pending payment transactions
-        transactions = Transaction.objects.filter(
-            transactionID__in=escrow_ids,
-            transactionType='PAYMENT',
-            status='PENDING'
-        )
-        
-        # Count transactions
-        count = transactions.count()
-        
-        if count == 0:
-            return {
-                'success': False,
-                'error': 'No valid escrow payments found to release'
-            }
-        
-        # Update all transactions
-        now = timezone.now()
-        updated = transactions.update(
-            status='COMPLETED',
-            completedAt=now
-        )
-        
-        # Update related jobs
-        job_ids = transactions.values_list('relatedJobPosting', flat=True)
-        Job.objects.filter(jobID__in=job_ids).update(
-            escrowPaid=True,
-            escrowPaidAt=now
-        )
-        
-        return {
-            'success': True,
-            'message': f'Successfully released {updated} escrow payments',
-            'released_count': updated
-        }
+        result = release_batch(escrow_ids, reason=reason, admin=admin, request=request)
+        result['released_count'] = result['processed']
+        if not result['processed']:
+            result['error'] = 'No valid escrow payments found to release'
+        else:
+            result['message'] = f"Successfully released {result['processed']} escrow payments"
+        return result
         
     except Exception as e:
         return {
@@ -0,0 +1,220 @@
+"""
+Data Retention Service
+
+Batched archive-and-delete for the append-only tables that otherwise grow
+without bound (notifications, job logs, audit logs, KYC logs, messages).
+
+Each RetentionPolicy names a model, the timestamp column that ages rows out,
+how many days to keep, an optional extra filter, and where pruned rows go:
+
+- "table": gzip-compressed NDJSON stored in ArchiveBatch rows (one per batch)
+- "file":  gzip NDJSON files under settings.DATA_ARCHIVE_DIR/<table>/
+- None:    deleted without an archive copy
+
+Rows are processed in primary-key order, batch_size at a time, and every
+batch (archive write + DELETE) is its own transaction, so a long run never
+holds locks for more than one batch and can be interrupted safely.
+
+Defaults can be overridden per policy with settings.DATA_RETENTION, e.g.
+    DATA_RETENTION = {"notifications": {"days": 90}, "messages": {"days": 1095}}
+Setting "days" to None disables a policy. See `python manage.py prune_data`.
+"""
+import gzip
+import json
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from .models import ArchiveBatch
+
+ARCHIVE_TABLE = "table"
+ARCHIVE_FILE = "file"
+DEFAULT_BATCH_SIZE = 2000
+
+
+class RetentionPolicy(NamedTuple):
+    name: str
+    model: str  # "app_label.ModelName"
+    date_field: str
+    days: Optional[int]
+    archive: Optional[str] = None
+    filters: Dict = {}
+
+
+DEFAULT_POLICIES = (
+    # Read notifications are never shown again after a few months; unread ones are kept
+    RetentionPolicy("notifications", "accounts.Notification", "createdAt", 180, None, {"isRead": True}),
+    RetentionPolicy("job_logs", "accounts.JobLog", "createdAt", 730, ARCHIVE_TABLE),
+    RetentionPolicy("audit_logs", "adminpanel.AuditLog", "createdAt", 1095, ARCHIVE_TABLE),
+    RetentionPolicy("kyc_logs", "adminpanel.KYCLogs", "createdAt", 1825, ARCHIVE_TABLE),
+    # Chat history is user-facing; opt in via settings.DATA_RETENTION.
+    # Deleting a message cascades to its MessageAttachment rows.
+    RetentionPolicy("messages", "profiles.Message", "createdAt", None, ARCHIVE_FILE),
+)
+
+
+def get_policies() -> Dict[str, RetentionPolicy]:
+    """Default policies with settings.DATA_RETENTION overrides applied."""
+    overrides = getattr(settings, "DATA_RETENTION", {}) or {}
+    policies = {}
+    for policy in DEFAULT_POLICIES:
+        override = overrides.get(policy.name, {})
+        policies[policy.name] = policy._replace(
+            **{key: value for key, value in override.items() if key in ("days", "archive", "filters")}
+        )
+    return policies
+
+
+def archive_dir() -> Path:
+    return Path(getattr(settings, "DATA_ARCHIVE_DIR", settings.BASE_DIR / "archive"))
+
+
+def cutoff_for(policy: RetentionPolicy, now=None):
+    return (now or timezone.now()) - timedelta(days=policy.days)
+
+
+def expired_rows(policy: RetentionPolicy, now=None):
+    """Queryset of rows a policy would prune right now."""
+    model = apps.get_model(policy.model)
+    return model.objects.filter(
+        **{f"{policy.date_field}__lt": cutoff_for(policy, now)}, **policy.filters
+    ).order_by()
+
+
+# =============================================================================
+# ARCHIVE SINKS
+# =============================================================================
+
+
+def encode_rows(rows: List[Dict]) -> bytes:
+    lines = "\n".join(json.dumps(row, cls=DjangoJSONEncoder, sort_keys=True) for row in rows)
+    return gzip.compress(lines.encode("utf-8"))
+
+
+def decode_rows(payload: bytes) -> List[Dict]:
+    text = gzip.decompress(bytes(payload)).decode("utf-8")
+    return [json.loads(line) for line in text.splitlines() if line]
+
+
+def _archive_to_table(policy: RetentionPolicy, table: str, rows: List[Dict], date_field: str) -> None:
+    pk_name = next(iter(rows[0]))
+    stamps = [row[date_field] for row in rows if row.get(date_field)]
+    ArchiveBatch.objects.create(
+        policy=policy.name,
+        sourceTable=table,
+        firstSourceID=rows[0][pk_name],
+        lastSourceID=rows[-1][pk_name],
+        rowCount=len(rows),
+        oldestAt=min(stamps) if stamps else None,
+        newestAt=max(stamps) if stamps else None,
+        payload=encode_rows(rows),
+    )
+
+
+def _archive_to_file(policy: RetentionPolicy, table: str, rows: List[Dict], date_field: str) -> None:
+    pk_name = next(iter(rows[0]))
+    directory = archive_dir() / table
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{table}-{rows[0][pk_name]:012d}-{rows[-1][pk_name]:012d}.ndjson.gz"
+    # Written before the DELETE commits; a rerun after a crash overwrites the same file
+    path.write_bytes(encode_rows(rows))
+
+
+SINKS: Dict[str, Callable] = {
+    ARCHIVE_TABLE: _archive_to_table,
+    ARCHIVE_FILE: _archive_to_file,
+}
+
+
+def iter_archived_rows(source_table: str) -> Iterator[Dict]:
+    """Yield archived rows of one table from ArchiveBatch, oldest batch first."""
+    for payload in (
+        ArchiveBatch.objects.filter(sourceTable=source_table)
+        .order_by("firstSourceID")
+        .values_list("payload", flat=True)
+        .iterator(chunk_size=20)
+    ):
+        yield from decode_rows(payload)
+
+
+# =============================================================================
+# RUN
+# =============================================================================
+
+
+def run_policy(
+    policy: RetentionPolicy,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    max_batches: Optional[int] = None,
+    now=None,
+) -> Dict:
+    """
+    Archive and delete expired rows for one policy.
+
+    Returns a summary dict. With dry_run nothing is written and the summary
+    reports how many rows (and which ID range) would be pruned.
+    """
+    summary = {"policy": policy.name, "model": policy.model, "days": policy.days, "archive": policy.archive}
+    if policy.days is None:
+        return {**summary, "skipped": "disabled"}
+    if policy.archive is not None and policy.archive not in SINKS:
+        raise ValueError(f"Unknown archive sink '{policy.archive}' for policy '{policy.name}'")
+
+    model = apps.get_model(policy.model)
+    pk_name = model._meta.pk.attname
+    table = model._meta.db_table
+    queryset = expired_rows(policy, now)
+    summary["cutoff"] = cutoff_for(policy, now).isoformat()
+
+    if dry_run:
+        stats = queryset.aggregate(first=Min(pk_name), last=Max(pk_name))
+        return {**summary, "dry_run": True, "rows": queryset.count(), "first_id": stats["first"], "last_id": stats["last"]}
+
+    started = time.perf_counter()
+    deleted = batches = 0
+    last_pk = 0
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            ids = list(
+                queryset.filter(**{f"{pk_name}__gt": last_pk})
+                .order_by(pk_name)
+                .select_for_update(skip_locked=True)
+                .values_list(pk_name, flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            if policy.archive:
+                rows = list(model.objects.filter(**{f"{pk_name}__in": ids}).order_by(pk_name).values())
+                SINKS[policy.archive](policy, table, rows, policy.date_field)
+            # Queryset delete: a single DELETE unless the model has cascades
+            # (Message -> MessageAttachment). Model delete() hooks are skipped on
+            # purpose; pruned notifications are read, so unread counters stand.
+            _, per_model = model.objects.filter(**{f"{pk_name}__in": ids}).delete()
+            deleted += per_model.get(model._meta.label, 0)
+            last_pk = ids[-1]
+            batches += 1
+
+    return {
+        **summary,
+        "deleted": deleted,
+        "batches": batches,
+        "complete": max_batches is None or batches < max_batches,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def run_policies(names: Optional[List[str]] = None, **kwargs) -> List[Dict]:
+    policies = get_policies()
+    unknown = set(names or []) - set(policies)
+    if unknown:
+        raise ValueError(f"Unknown retention policies: {', '.join(sorted(unknown))}")
+    return [run_policy(policies[name], **kwargs) for name in (names or policies)]
@@ -0,0 +1,380 @@
+"""
+Analytics Rollup Service
+
+Maintains the per-day fact tables in adminpanel.models (JobDailyRollup,
+TransactionDailyRollup, AccountDailyRollup) so the admin dashboard and
+analytics endpoints aggregate a few hundred pre-computed rows instead of
+running full-table count()/Sum() queries over Job, Transaction, Accounts and
+JobApplication.
+
+How rows stay current:
+- New rows: each source table has a primary-key watermark; refresh picks up
+  rows past it, marks their creation days dirty and advances the watermark.
+- Mutations: Job/Transaction/Accounts/JobApplication save() or delete() hooks
+  call mark_dirty() for the affected creation day once the write commits.
+- Dirty days are recomputed in full (delete + re-aggregate one day), so a
+  refresh costs O(changed days), not O(history).
+- Bulk .update() calls bypass the hooks; the nightly
+  `refresh_analytics_rollups --trailing-days` run recomputes recent days.
+
+Refreshes only run from the `refresh_analytics_rollups` cron (every 10
+minutes). Read paths never refresh; they report rollup_status() so the admin
+UI can show how current the figures are.
+"""
+import logging
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+SOURCE_JOBS = "jobs"
+SOURCE_TRANSACTIONS = "transactions"
+SOURCE_ACCOUNTS = "accounts"
+SOURCES = (SOURCE_JOBS, SOURCE_TRANSACTIONS, SOURCE_ACCOUNTS)
+
+# RollupWatermark row touched by every full refresh_rollups() run
+REFRESH_MARKER = "rollups.refresh"
+# Two missed 10-minute cron runs
+STALE_AFTER_SECONDS = 20 * 60
+
+
+def _watermark_specs(source: str):
+    """(watermark name, model, pk field, creation-day field) per source table."""
+    from accounts.models import Accounts, Job, JobApplication, Profile, Transaction
+
+    return {
+        SOURCE_JOBS: [
+            ("jobs.job", Job, "jobID", "createdAt"),
+            ("jobs.application", JobApplication, "applicationID", "jobID__createdAt"),
+        ],
+        SOURCE_TRANSACTIONS: [
+            ("transactions.transaction", Transaction, "transactionID", "createdAt"),
+        ],
+        SOURCE_ACCOUNTS: [
+            ("accounts.account", Accounts, "accountID", "createdAt"),
+            ("accounts.profile", Profile, "profileID", "accountFK__createdAt"),
+        ],
+    }[source]
+
+
+def _to_day(value) -> Optional[date]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+    return value
+
+
+def _day_bounds(day: date):
+    start = timezone.make_aware(datetime.combine(day, datetime.min.time()))
+    return start, start + timedelta(days=1)
+
+
+def mark_dirty(source: str, *moments) -> None:
+    """Queue the creation day(s) of changed rows for recomputation."""
+    from .models import RollupDirtyDay
+
+    days = {_to_day(moment) for moment in moments if moment is not None}
+    if not days:
+        return
+    RollupDirtyDay.objects.bulk_create(
+        [RollupDirtyDay(source=source, day=day) for day in days],
+        ignore_conflicts=True,
+    )
+
+
+# =============================================================================
+# PER-DAY RECOMPUTATION
+# =============================================================================
+
+
+def _recompute_job_day(day: date) -> int:
+    from accounts.models import Job, JobApplication
+
+    from .models import JobDailyRollup
+
+    start, end = _day_bounds(day)
+    buckets: Dict[tuple, Dict] = {}
+
+    for row in (
+        Job.objects.filter(createdAt__gte=start, createdAt__lt=end)
+        .values("status", "categoryID_id", "urgency")
+        .annotate(job_count=Count("jobID"), budget_sum=Sum("budget"))
+    ):
+        key = (row["status"], row["categoryID_id"], row["urgency"])
+        buckets[key] = {
+            "jobCount": row["job_count"],
+            "budgetSum": row["budget_sum"] or Decimal("0.00"),
+            "applicationCount": 0,
+            "jobsWithApplications": 0,
+        }
+
+    for row in (
+        JobApplication.objects.filter(
+            jobID__createdAt__gte=start, jobID__createdAt__lt=end
+        )
+        .values("jobID__status", "jobID__categoryID_id", "jobID__urgency")
+        .annotate(
+            application_count=Count("applicationID"),
+            job_count=Count("jobID", distinct=True),
+        )
+    ):
+        key = (row["jobID__status"], row["jobID__categoryID_id"], row["jobID__urgency"])
+        bucket = buckets.get(key)
+        if bucket is None:
+            continue
+        bucket["applicationCount"] = row["application_count"]
+        bucket["jobsWithApplications"] = row["job_count"]
+
+    JobDailyRollup.objects.filter(day=day).delete()
+    JobDailyRollup.objects.bulk_create(
+        [
+            JobDailyRollup(day=day, status=status, categoryID=category_id, urgency=urgency, **values)
+            for (status, category_id, urgency), values in buckets.items()
+        ]
+    )
+    return len(buckets)
+
+
+def _recompute_transaction_day(day: date) -> int:
+    from accounts.models import Transaction
+
+    from .models import TransactionDailyRollup
+
+    start, end = _day_bounds(day)
+    rows = list(
+        Transaction.objects.filter(createdAt__gte=start, createdAt__lt=end)
+        .values("transactionType", "status", "paymentMethod")
+        .annotate(transaction_count=Count("transactionID"), amount_sum=Sum("amount"))
+    )
+
+    TransactionDailyRollup.objects.filter(day=day).delete()
+    TransactionDailyRollup.objects.bulk_create(
+        [
+            TransactionDailyRollup(
+                day=day,
+                transactionType=row["transactionType"],
+                status=row["status"],
+                paymentMethod=row["paymentMethod"],
+                transactionCount=row["transaction_count"],
+                amountSum=row["amount_sum"] or Decimal("0.00"),
+            )
+            for row in rows
+        ]
+    )
+    return len(rows)
+
+
+def _recompute_account_day(day: date) -> int:
+    from accounts.models import Accounts, Profile
+
+    from .models import AccountDailyRollup
+
+    start, end = _day_bounds(day)
+    accounts = Accounts.objects.filter(createdAt__gte=start, createdAt__lt=end).aggregate(
+        total=Count("accountID"),
+        verified=Count("accountID", filter=Q(isVerified=True)),
+    )
+    profiles = Profile.objects.filter(
+        accountFK__createdAt__gte=start, accountFK__createdAt__lt=end
+    ).aggregate(
+        clients=Count("profileID", filter=Q(profileType="CLIENT")),
+        workers=Count("profileID", filter=Q(profileType="WORKER")),
+        agencies=Count("profileID", filter=Q(profileType="AGENCY")),
+    )
+
+    if not accounts["total"]:
+        AccountDailyRollup.objects.filter(day=day).delete()
+        return 0
+    AccountDailyRollup.objects.update_or_create(
+        day=day,
+        defaults={
+            "accountCount": accounts["total"],
+            "verifiedCount": accounts["verified"],
+            "clientProfiles": profiles["clients"],
+            "workerProfiles": profiles["workers"],
+            "agencyProfiles": profiles["agencies"],
+        },
+    )
+    return 1
+
+
+RECOMPUTE = {
+    SOURCE_JOBS: _recompute_job_day,
+    SOURCE_TRANSACTIONS: _recompute_transaction_day,
+    SOURCE_ACCOUNTS: _recompute_account_day,
+}
+
+
+# =============================================================================
+# REFRESH
+# =============================================================================
+
+
+def _advance_watermarks(source: str) -> int:
+    """Mark the creation days of rows past each watermark dirty. Returns new rows seen."""
+    from .models import RollupWatermark
+
+    seen = 0
+    for name, model, pk_field, day_field in _watermark_specs(source):
+        watermark, _ = RollupWatermark.objects.get_or_create(name=name)
+        new_rows = model.objects.filter(**{f"{pk_field}__gt": watermark.lastID})
+        stats = new_rows.aggregate(max_id=Max(pk_field), total=Count(pk_field))
+        if not stats["max_id"]:
+            continue
+        days = (
+            new_rows.filter(**{f"{pk_field}__lte": stats["max_id"]})
+            .annotate(created_day=TruncDate(day_field))
+            .values_list("created_day", flat=True)
+            .distinct()
+        )
+        mark_dirty(source, *days)
+        watermark.lastID = stats["max_id"]
+        watermark.save(update_fields=["lastID", "updatedAt"])
+        seen += stats["total"]
+    return seen
+
+
+def _drain_dirty_days(source: str) -> int:
+    from .models import RollupDirtyDay
+
+    recomputed = 0
+    with transaction.atomic():
+        dirty = list(
+            RollupDirtyDay.objects.select_for_update(skip_locked=True)
+            .filter(source=source)
+            .order_by("day")
+        )
+        for entry in dirty:
+            RECOMPUTE[source](entry.day)
+            recomputed += 1
+        RollupDirtyDay.objects.filter(pk__in=[entry.pk for entry in dirty]).delete()
+    return recomputed
+
+
+def _history_days(source: str) -> List[date]:
+    days = set()
+    for _, model, _, day_field in _watermark_specs(source):
+        days.update(
+            model.objects.annotate(created_day=TruncDate(day_field))
+            .values_list("created_day", flat=True)
+            .distinct()
+        )
+    days.discard(None)
+    return sorted(days)
+
+
+def refresh_rollups(
+    sources: Optional[Iterable[str]] = None,
+    trailing_days: int = 0,
+    full: bool = False,
+) -> List[Dict]:
+    """
+    Bring rollups up to date and return per-source metrics.
+
+    trailing_days recomputes the last N local days regardless of dirty marks
+    (heals bulk .update() drift); full recomputes every day with data.
+    """
+    names = list(sources) if sources else list(SOURCES)
+    unknown = [name for name in names if name not in RECOMPUTE]
+    if unknown:
+        raise ValueError(f"Unknown rollup source(s): {', '.join(unknown)}")
+
+    today = timezone.localdate()
+    metrics = []
+    for source in names:
+        new_rows = _advance_watermarks(source)
+        if full:
+            from .models import AccountDailyRollup, JobDailyRollup, TransactionDailyRollup
+
+            {
+                SOURCE_JOBS: JobDailyRollup,
+                SOURCE_TRANSACTIONS: TransactionDailyRollup,
+                SOURCE_ACCOUNTS: AccountDailyRollup,
+            }[source].objects.all().delete()
+            mark_dirty(source, *_history_days(source))
+        elif trailing_days > 0:
+            mark_dirty(source, *[today - timedelta(days=offset) for offset in range(trailing_days)])
+        days = _drain_dirty_days(source)
+        metrics.append({"source": source, "new_rows": new_rows, "days_recomputed": days})
+        logger.info(
+            "analytics rollup source=%s new_rows=%s days_recomputed=%s",
+            source,
+            new_rows,
+            days,
+        )
+    if set(names) == set(SOURCES):
+        from .models import RollupWatermark
+
+        marker, _ = RollupWatermark.objects.get_or_create(name=REFRESH_MARKER)
+        marker.save(update_fields=["updatedAt"])
+    return metrics
+
+
+def rollup_status() -> Dict:
+    """When the rollups were last refreshed and whether that is too long ago (never refreshes)."""
+    from .models import RollupDirtyDay, RollupWatermark
+
+    refreshed_at = (
+        RollupWatermark.objects.filter(name=REFRESH_MARKER)
+        .values_list("updatedAt", flat=True)
+        .first()
+    )
+    stale = (
+        refreshed_at is None
+        or (timezone.now() - refreshed_at).total_seconds() > STALE_AFTER_SECONDS
+    )
+    return {
+        "refreshed_at": refreshed_at.isoformat() if refreshed_at else None,
+        "stale": stale,
+        "pending_days": RollupDirtyDay.objects.count(),
+    }
+
+
+# =============================================================================
+# READ HELPERS
+# =============================================================================
+
+
+def job_rollups(since: Optional[date] = None, until: Optional[date] = None):
+    from .models import JobDailyRollup
+
+    rows = JobDailyRollup.objects.all()
+    if since:
+        rows = rows.filter(day__gte=since)
+    if until:
+        rows = rows.filter(day__lt=until)
+    return rows
+
+
+def transaction_rollups(since: Optional[date] = None, until: Optional[date] = None):
+    from .models import TransactionDailyRollup
+
+    rows = TransactionDailyRollup.objects.all()
+    if since:
+        rows = rows.filter(day__gte=since)
+    if until:
+        rows = rows.filter(day__lt=until)
+    return rows
+
+
+def account_rollups(since: Optional[date] = None, until: Optional[date] = None):
+    from .models import AccountDailyRollup
+
+    rows = AccountDailyRollup.objects.all()
+    if since:
+        rows = rows.filter(day__gte=since)
+    if until:
+        rows = rows.filter(day__lt=until)
+    return rows
+
+
+def sum_field(rows, field: str):
+    """Sum one rollup column (0 when there are no rows)."""
+    return rows.aggregate(total=Sum(field))["total"] or 0
@@ -69,17 +69,12 @@ def create_admin_account(email: str, password: str, role: str = "ADMIN"):
     }
 
 def fetchAll_kyc(request):
-    kyc_records = kyc.objects.all().order_by('-createdAt')
+    """
+    Legacy unbounded KYC dump. New screens should use the paginated
+    /kyc/queue and /kyc/counts endpoints (adminpanel.kyc_queue_service).
+    """
+    kyc_records = kyc.objects.order_by('-createdAt')
     kyc_files = kycFiles.objects.filter(kycID__in=kyc_records)
-    
-    # Debug: Show pending records specifically
-    pending_kyc = kyc_records.filter(kyc_status='PENDING')
-    print(f"[ADMIN KYC] Total KYC records: {kyc_records.count()}")
-    print(f"[ADMIN KYC] Pending KYC records: {pending_kyc.count()}")
-    print(f"[ADMIN KYC] Pending KYC IDs: {[k.kycID for k in pending_kyc]}")
-    for pending in pending_kyc:
-        file_count = kycFiles.objects.filter(kycID=pending).count()
-        print(f"[ADMIN KYC] Pending kycID={pending.kycID} has {file_count} files")
 
     # Collect all user IDs linked to KYC records
     user_ids = kyc_records.values_list('accountFK', flat=True)
@@ -104,10 +99,10 @@ def fetchAll_kyc(request):
     for record in kyc_records:
         kyc_serialized.append({
             "kycID": record.kycID,
-            "accountFK_id": record.accountFK.accountID,
+            "accountFK_id": record.accountFK_id,
             "kycStatus": record.kyc_status,  # Convert snake_case to camelCase
             "reviewedAt": record.reviewedAt.isoformat() if record.reviewedAt else None,
-            "reviewedBy_id": record.reviewedBy.accountID if record.reviewedBy else None,
+            "reviewedBy_id": record.reviewedBy_id,
             "notes": record.notes,
             "createdAt": record.createdAt.isoformat() if record.createdAt else None,
             "updatedAt": record.updatedAt.isoformat() if record.updatedAt else None,
@@ -136,7 +131,7 @@ def fetchAll_kyc(request):
         file_type = derive_file_type(file.fileName)
         kyc_files_serialized.append({
             "kycFileID": file.kycFileID,
-            "kycID_id": file.kycID.kycID,
+            "kycID_id": file.kycID_id,
             "idType": file.idType,
             "fileName": file.fileName,
             "fileURL": file.fileURL,
@@ -161,8 +156,7 @@ def fetchAll_kyc(request):
 
     # Include Agency KYC submissions -> stored in separate app/models
     try:
-        agency_records = AgencyKYC.objects.all().order_by('-createdAt')
-        print(f"[ADMIN KYC] AgencyKYC count: {agency_records.count()} | IDs: {[a.agencyKycID for a in agency_records]}")
+        agency_records = AgencyKYC.objects.order_by('-createdAt')
         agency_files = AgencyKycFile.objects.filter(agencyKyc__in=agency_records)
 
         # Gather Agency profile data (businessName etc.)
@@ -183,10 +177,10 @@ def fetchAll_kyc(request):
         for record in agency_records:
             agency_kyc_serialized.append({
                 "agencyKycID": record.agencyKycID,
-                "accountFK_id": record.accountFK.accountID,
+                "accountFK_id": record.accountFK_id,
                 "status": record.status,  # Already correct field name
                 "reviewedAt": record.reviewedAt.isoformat() if record.reviewedAt else None,
-                "reviewedBy_id": record.reviewedBy.accountID if record.reviewedBy else None,
+                "reviewedBy_id": record.reviewedBy_id,
                 "notes": record.notes,
                 "rejectionReason": record.rejectionReason,
                 "face_similarity_score": record.face_similarity_score,
@@ -199,7 +193,7 @@ def fetchAll_kyc(request):
         for file in agency_files:
             agency_files_serialized.append({
                 "fileID": file.fileID,
-                "agencyKyc_id": file.agencyKyc.agencyKycID,
+                "agencyKyc_id": file.agencyKyc_id,
                 "fileType": file.fileType,
                 "fileName": file.fileName,
                 "fileURL": file.fileURL,
@@ -1020,6 +1014,63 @@ def fetch_kyc_logs(action_filter: str | None = None, limit: int = 100):
         raise
 
 
+def export_kyc_logs(
+    action_filter: str | None = None,
+    kyc_type: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    fmt: str = "csv",
+    gzip: bool = False,
+    after_id: int | None = None,
+    until_id: int | None = None,
+):
+    """
+    Stream the full KYC review log as CSV or NDJSON.
+
+    Unlike fetch_kyc_logs there is no row limit; rows are read in keyset
+    pages with a values_list projection. Returns a StreamingHttpResponse.
+    """
+    from datetime import datetime
+    from adminpanel.export_service import ExportColumn, format_datetime, streaming_export_response
+
+    queryset = KYCLogs.objects.all()
+    if action_filter:
+        queryset = queryset.filter(action__iexact=action_filter.strip().upper())
+    if kyc_type:
+        queryset = queryset.filter(kycType=kyc_type.strip().upper())
+    if date_from:
+        queryset = queryset.filter(
+            reviewedAt__gte=datetime.strptime(date_from, "%Y-%m-%d")
+        )
+    if date_to:
+        queryset = queryset.filter(
+            reviewedAt__lt=datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
+        )
+
+    columns = [
+        ExportColumn("ID", "kycLogID"),
+        ExportColumn("KYC ID", "kycID"),
+        ExportColumn("Action", "action"),
+        ExportColumn("KYC Type", "kycType"),
+        ExportColumn("User Email", "userEmail"),
+        ExportColumn("User Account ID", "userAccountID"),
+        ExportColumn("Reviewed By", "reviewedBy__email"),
+        ExportColumn("Reviewed At", "reviewedAt", format_datetime),
+        ExportColumn("Reason", "reason"),
+        ExportColumn("Created At", "createdAt", format_datetime),
+    ]
+    return streaming_export_response(
+        queryset,
+        columns,
+        pk_field="kycLogID",
+        filename="kyc-logs",
+        fmt=fmt,
+        gzip=gzip,
+        after_id=after_id,
+        until_id=until_id,
+    )
+
+
 def get_user_kyc_history(user_account_id):
     """
     Get KYC application history for a specific user.
@@ -1093,64 +1144,53 @@ def get_user_kyc_history(user_account_id):
 def get_admin_dashboard_stats():
     """Get comprehensive dashboard statistics for admin panel."""
     from django.db.models import Count, Q, Sum
-    
+    from adminpanel.rollup_service import account_rollups, job_rollups, rollup_status
+
     try:
-        # User statistics
-        total_users = Accounts.objects.count()
-        
-        # Count by account type (agencies are accounts with a linked agency profile)
-        total_agencies = Accounts.objects.filter(agency__isnull=False).count()
-        
-        # Clients and workers from Profile
-        profiles_with_type = Profile.objects.exclude(profileType__isnull=True)
-        total_clients = profiles_with_type.filter(profileType='CLIENT').count()
-        total_workers = profiles_with_type.filter(profileType='WORKER').count()
-        
+        # User statistics (AccountDailyRollup)
+        account_totals = account_rollups().aggregate(
+            total=Sum('accountCount'),
+            verified=Sum('verifiedCount'),
+            clients=Sum('clientProfiles'),
+            workers=Sum('workerProfiles'),
+        )
+        total_users = account_totals['total'] or 0
+        total_clients = account_totals['clients'] or 0
+        total_workers = account_totals['workers'] or 0
+
+        # Agencies are accounts with a linked agency profile (small table)
+        total_agencies = Agency.objects.values('accountFK').distinct().count()
+
         # Active users (verified accounts)
-        active_users = Accounts.objects.filter(isVerified=True).count()
+        active_users = account_totals['verified'] or 0
         
         # KYC statistics
         pending_kyc = kyc.objects.filter(kyc_status='PENDING').count()
         pending_agency_kyc = AgencyKYC.objects.filter(status='PENDING').count()
         total_pending_kyc = pending_kyc + pending_agency_kyc
         
-        # Job statistics - using Job model from accounts
-        try:
-            from accounts.models import Job
-            total_jobs = Job.objects.count()
-            
-            # Active job postings (not yet started)
-            active_jobs = Job.objects.filter(status='ACTIVE').count()
-            
-            # Jobs in progress
-            in_progress_jobs = Job.objects.filter(status='IN_PROGRESS').count()
-            
-            # Completed jobs
-            completed_jobs = Job.objects.filter(status='COMPLETED').count()
-            
-            # Cancelled jobs
-            cancelled_jobs = Job.objects.filter(status='CANCELLED').count()
-            
-            # Open jobs = Active + In Progress (available for workers or currently being worked on)
-            open_jobs = active_jobs + in_progress_jobs
-            
-        except Exception as e:
-            # If Job model doesn't exist or has issues
-            print(f"Warning: Could not fetch job statistics: {e}")
-            total_jobs = 0
-            active_jobs = 0
-            in_progress_jobs = 0
-            completed_jobs = 0
-            cancelled_jobs = 0
-            open_jobs = 0
+        # Job statistics (JobDailyRollup, one aggregate)
+        job_totals = job_rollups().aggregate(
+            total=Sum('jobCount'),
+            active=Sum('jobCount', filter=Q(status='ACTIVE')),
+            in_progress=Sum('jobCount', filter=Q(status='IN_PROGRESS')),
+            completed=Sum('jobCount', filter=Q(status='COMPLETED')),
+            cancelled=Sum('jobCount', filter=Q(status='CANCELLED')),
+        )
+        total_jobs = job_totals['total'] or 0
+        active_jobs = job_totals['active'] or 0
+        in_progress_jobs = job_totals['in_progress'] or 0
+        completed_jobs = job_totals['completed'] or 0
+        cancelled_jobs = job_totals['cancelled'] or 0
+
+        # Open jobs = Active + In Progress (available for workers or currently being worked on)
+        open_jobs = active_jobs + in_progress_jobs
         
         # Calculate new users this month
-        from datetime import datetime
-        from django.utils import timezone
-        current_month_start = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        new_users_this_month = Accounts.objects.filter(
-            createdAt__gte=current_month_start
-        ).count()
+        new_users_this_month = (
+            account_rollups(since=timezone.localdate().replace(day=1))
+            .aggregate(total=Sum('accountCount'))['total'] or 0
+        )
         
         return {
             "total_users": total_users,
@@ -1168,6 +1208,7 @@ def get_admin_dashboard_stats():
             "completed_jobs": completed_jobs,
             "cancelled_jobs": cancelled_jobs,
             "open_jobs": open_jobs,
+            "rollups": rollup_status(),
         }
         
     except Exception as e:
@@ -1177,10 +1218,10 @@ def get_admin_dashboard_stats():
         raise
 
 
-def get_clients_list(page: int = 1, page_size: int = 50, search: str | None = None, status_filter: str | None = None):
+def get_clients_list(page: int = 1, page_size: int = 50, search: str | None = None, status_filter: str | None = None, count_mode: str = 'exact'):
     """Get paginated list of client accounts with their details."""
     from django.db.models import Q, Count
-    from django.core.paginator import Paginator
+    from adminpanel.pagination import AdminPaginator
     
     try:
         # Get all profiles with type CLIENT
@@ -1205,7 +1246,7 @@ def get_clients_list(page: int = 1, page_size: int = 50, search: str | None = No
         clients_query = clients_query.order_by('-accountFK__createdAt')
         
         # Paginate
-        paginator = Paginator(clients_query, page_size)
+        paginator = AdminPaginator(clients_query, page_size, count_mode=count_mode)
         page_obj = paginator.get_page(page)
         
         # Build result
@@ -1360,10 +1401,10 @@ def get_clients_list(page: int = 1, page_size: int = 50, search: str | None = No
         raise
 
 
-def get_workers_list(page: int = 1, page_size: int = 50, search: str | None = None, status_filter: str | None = None):
+def get_workers_list(page: int = 1, page_size: int = 50, search: str | None = None, status_filter: str | None = None, count_mode: str = 'exact'):
     """Get paginated list of worker accounts with their details."""
     from django.db.models import Q, Avg
-    from django.core.paginator import Paginator
+    from adminpanel.pagination import AdminPaginator
     from accounts.models import Agency
     
     try:
@@ -1396,7 +1437,7 @@ def get_workers_list(page: int = 1, page_size: int = 50, search: str | None = No
         workers_query = workers_query.order_by('-accountFK__createdAt')
         
         # Paginate
-        paginator = Paginator(workers_query, page_size)
+        paginator = AdminPaginator(workers_query, page_size, count_mode=count_mode)
         page_obj = paginator.get_page(page)
         
         # Build result
@@ -2000,10 +2041,10 @@ def get_agency_detail(account_id: str):
         raise
 
 
-def get_agencies_list(page: int = 1, page_size: int = 50, search: str | None = None, status_filter: str | None = None):
+def get_agencies_list(page: int = 1, page_size: int = 50, search: str | None = None, status_filter: str | None = None, count_mode: str = 'exact'):
     """Get paginated list of agency accounts with their details."""
     from django.db.models import Q, Count
-    from django.core.paginator import Paginator
+    from adminpanel.pagination import AdminPaginator
     
     try:
         # Get all agencies
@@ -2027,7 +2068,7 @@ def get_agencies_list(page: int = 1, page_size: int = 50, search: str | None = N
         agencies_query = agencies_query.order_by('-accountFK__createdAt')
         
         # Paginate
-        paginator = Paginator(agencies_query, page_size)
+        paginator = AdminPaginator(agencies_query, page_size, count_mode=count_mode)
         page_obj = paginator.get_page(page)
         
         # Build result
@@ -2156,12 +2197,12 @@ def get_agencies_list(page: int = 1, page_size: int = 50, search: str | None = N
 # JOBS MANAGEMENT FUNCTIONS
 # ==========================================
 
-def get_jobs_list(page: int = 1, page_size: int = 20, status: str | None = None, category_id: int | None = None):
+def get_jobs_list(page: int = 1, page_size: int = 20, status: str | None = None, category_id: int | None = None, count_mode: str = 'exact'):
     """
     Get paginated list of all jobs with filtering options
     """
     from accounts.models import Job, Specializations
-    from django.core.paginator import Paginator
+    from adminpanel.pagination import AdminPaginator
     from django.db.models import Count
     
     try:
@@ -2180,7 +2221,7 @@ def get_jobs_list(page: int = 1, page_size: int = 20, status: str | None = None,
             queryset = queryset.filter(categoryID_id=category_id)
         
         # Paginate
-        paginator = Paginator(queryset, page_size)
+        paginator = AdminPaginator(queryset, page_size, count_mode=count_mode)
         page_obj = paginator.get_page(page)
         
         jobs_list = []
@@ -2375,36 +2416,32 @@ def get_job_categories_list():
     """
     Get list of all job categories with statistics
     Returns all categories with job counts
+
+    Category details come from the versioned reference-data cache; the counts
+    are three grouped queries instead of one triple-join COUNT(DISTINCT).
     """
     try:
-        from accounts.models import Specializations
+        from accounts.models import InterestedJobs, Job, workerSpecialization
+        from accounts.reference_data import get_data
         from django.db.models import Count
-        
-        # Get only global (non-custom) categories with job counts
-        categories = Specializations.objects.filter(
-            is_custom=False,
-            created_by_agency__isnull=True,
-            created_by_worker__isnull=True,
-        ).annotate(
-            jobs_count=Count('jobs', distinct=True),
-            workers_count=Count('workerspecialization', distinct=True),
-            clients_count=Count('interestedjobs', distinct=True)
-        ).order_by('specializationName')
-        
+
+        def _counts(queryset, field):
+            return dict(
+                queryset.values_list(field).annotate(total=Count('pk')).order_by()
+            )
+
+        jobs_counts = _counts(Job.objects.filter(categoryID__isnull=False), 'categoryID')
+        workers_counts = _counts(workerSpecialization.objects, 'specializationID')
+        clients_counts = _counts(InterestedJobs.objects, 'specializationID')
+
         categories_data = []
-        for category in categories:
+        for category in get_data("category_details")["categories"]:
+            category_id = category['id']
             categories_data.append({
-                'id': category.specializationID,
-                'name': category.specializationName,
-                'description': category.description or '',
-                'minimum_rate': float(category.minimumRate),
-                'rate_type': category.rateType,
-                'skill_level': category.skillLevel,
-                'average_project_cost_min': float(category.averageProjectCostMin),
-                'average_project_cost_max': float(category.averageProjectCostMax),
-                'jobs_count': getattr(category, 'jobs_count', 0),
-                'workers_count': getattr(category, 'workers_count', 0),
-                'clients_count': getattr(category, 'clients_count', 0),
+                **category,
+                'jobs_count': jobs_counts.get(category_id, 0),
+                'workers_count': workers_counts.get(category_id, 0),
+                'clients_count': clients_counts.get(category_id, 0),
             })
         
         return categories_data
@@ -3361,8 +3398,13 @@ def delete_job(job_id: str):
             # Delete related job applications
             JobApplication.objects.filter(jobID=job).delete()
             
-            # Delete related reviews (if any)
-            JobReview.objects.filter(jobID=job).delete()
+            # Delete related reviews (if any); queryset delete skips the
+            # JobReview hooks, so refresh the reviewees' RatingStats here
+            from accounts.rating_stats_service import refresh_subjects, subjects_for_queryset
+            job_reviews = JobReview.objects.filter(jobID=job)
+            review_subjects = subjects_for_queryset(job_reviews)
+            job_reviews.delete()
+            refresh_subjects(review_subjects)
             
             # Delete related transactions (if any)
             Transaction.objects.filter(relatedJobPosting=job).delete()
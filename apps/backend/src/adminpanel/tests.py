@@ -1,3 +1,463 @@
+import csv
+import gzip
+import io
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import (
+    Accounts,
+    ClientProfile,
+    Job,
+    Notification,
+    Profile,
+    Transaction,
+    Wallet,
+    kyc,
+    kycFiles,
+)
+from adminpanel.audit_service import export_audit_logs
+from adminpanel.bulk_finance_service import bulk_refund, bulk_release_escrow
+from adminpanel.kyc_queue_service import (
+    COUNTS_CACHE_KEY,
+    get_kyc_queue,
+    get_kyc_queue_counts,
+)
+from adminpanel.models import (
+    ArchiveBatch,
+    AuditLog,
+    JobDailyRollup,
+    RollupDirtyDay,
+    RollupWatermark,
+)
+from adminpanel.pagination import count_signature, paginate_queryset
+from adminpanel.payment_service import get_transaction_statistics
+from adminpanel.retention_service import get_policies, iter_archived_rows, run_policy
+from adminpanel.rollup_service import REFRESH_MARKER, STALE_AFTER_SECONDS, refresh_rollups
+from adminpanel.service import get_admin_dashboard_stats
+
+
+class AnalyticsRollupTests(TestCase):
+    def setUp(self):
+        account = Accounts.objects.create_user(
+            email="rollup-client@test.com",
+            password="password123",
+            isVerified=True,
+        )
+        profile = Profile.objects.create(
+            accountFK=account,
+            profileType="CLIENT",
+            firstName="Rollup",
+            lastName="Client",
+        )
+        self.client_record = ClientProfile.objects.create(
+            profileID=profile,
+            description="",
+            totalJobsPosted=0,
+            clientRating=0,
+            activeJobsCount=0,
+        )
+        self.wallet = Wallet.objects.create(accountFK=account, balance=Decimal("0.00"))
+
+    def _job(self, status):
+        return Job.objects.create(
+            clientID=self.client_record,
+            title=f"Rollup {status}",
+            description="desc",
+            budget=Decimal("1000.00"),
+            location="Test",
+            status=status,
+        )
+
+    def test_new_rows_are_folded_in_past_the_watermark(self):
+        self._job("ACTIVE")
+        self._job("COMPLETED")
+        Transaction.objects.create(
+            walletID=self.wallet,
+            transactionType=Transaction.TransactionType.DEPOSIT,
+            amount=Decimal("250.00"),
+            balanceAfter=Decimal("250.00"),
+            status=Transaction.TransactionStatus.PENDING,
+        )
+
+        metrics = refresh_rollups()
+        self.assertEqual({entry["source"] for entry in metrics}, {"jobs", "transactions", "accounts"})
+
+        stats = get_admin_dashboard_stats()
+        self.assertEqual(stats["total_users"], 1)
+        self.assertEqual(stats["total_clients"], 1)
+        self.assertEqual(stats["total_jobs"], 2)
+        self.assertEqual(stats["active_jobs"], 1)
+        self.assertEqual(stats["completed_jobs"], 1)
+
+        tx_stats = get_transaction_statistics()
+        self.assertEqual(tx_stats["total_transactions"], 1)
+        self.assertEqual(tx_stats["pending_amount"], 250.0)
+
+        # A second refresh with no changes recomputes nothing
+        metrics = refresh_rollups()
+        self.assertTrue(all(entry["days_recomputed"] == 0 for entry in metrics))
+
+    def test_updates_mark_their_day_dirty(self):
+        job = self._job("ACTIVE")
+        transaction = Transaction.objects.create(
+            walletID=self.wallet,
+            transactionType=Transaction.TransactionType.DEPOSIT,
+            amount=Decimal("250.00"),
+            balanceAfter=Decimal("250.00"),
+            status=Transaction.TransactionStatus.PENDING,
+        )
+        refresh_rollups()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job.status = "CANCELLED"
+            job.save()
+            transaction.status = Transaction.TransactionStatus.COMPLETED
+            transaction.save()
+            # Dirty days are queued only once the writes commit
+            self.assertFalse(RollupDirtyDay.objects.exists())
+        self.assertEqual(
+            set(RollupDirtyDay.objects.values_list("source", flat=True)),
+            {"jobs", "transactions"},
+        )
+
+        refresh_rollups()
+
+        self.assertFalse(RollupDirtyDay.objects.exists())
+        self.assertEqual(
+            list(JobDailyRollup.objects.values_list("status", "jobCount")),
+            [("CANCELLED", 1)],
+        )
+        tx_stats = get_transaction_statistics()
+        self.assertEqual(tx_stats["pending_transactions"], 0)
+        self.assertEqual(tx_stats["total_volume"], 250.0)
+
+    def test_reads_report_staleness_without_refreshing(self):
+        self._job("ACTIVE")
+
+        stats = get_admin_dashboard_stats()
+        self.assertEqual(stats["total_jobs"], 0)
+        self.assertTrue(stats["rollups"]["stale"])
+        self.assertIsNone(stats["rollups"]["refreshed_at"])
+        self.assertFalse(RollupWatermark.objects.exists())
+
+        refresh_rollups()
+        stats = get_admin_dashboard_stats()
+        self.assertEqual(stats["total_jobs"], 1)
+        self.assertFalse(stats["rollups"]["stale"])
+
+        RollupWatermark.objects.filter(name=REFRESH_MARKER).update(
+            updatedAt=timezone.now() - timedelta(seconds=STALE_AFTER_SECONDS + 60)
+        )
+        self.assertTrue(get_transaction_statistics()["rollups"]["stale"])
+
+
+class StreamingExportTests(TestCase):
+    def setUp(self):
+        AuditLog.objects.bulk_create(
+            [
+                AuditLog(
+                    adminEmail="admin@test.com",
+                    action=AuditLog.ActionType.KYC_APPROVAL,
+                    entityType=AuditLog.EntityType.KYC,
+                    entityID=str(index),
+                    details={"index": index},
+                )
+                for index in range(7)
+            ]
+        )
+        self.ids = list(
+            AuditLog.objects.order_by("auditLogID").values_list("auditLogID", flat=True)
+        )
+
+    def _body(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_csv_export_streams_every_row_in_pk_order(self):
+        response = export_audit_logs()
+
+        self.assertEqual(response["X-Export-Until-ID"], str(self.ids[-1]))
+        rows = list(csv.reader(io.StringIO(self._body(response).decode("utf-8"))))
+        self.assertEqual(rows[0][:4], ["ID", "Timestamp", "Admin Email", "Action"])
+        self.assertEqual([int(row[0]) for row in rows[1:]], self.ids)
+        self.assertEqual(rows[1][3], "KYC Approval")
+
+    def test_resumable_gzip_ndjson_range(self):
+        until_id = self.ids[4]
+        response = export_audit_logs(
+            fmt="ndjson", gzip=True, after_id=self.ids[1], until_id=until_id
+        )
+
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        lines = gzip.decompress(self._body(response)).decode("utf-8").splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual([record["ID"] for record in records], self.ids[2:5])
+        self.assertEqual(json.loads(records[0]["Details"]), {"index": 2})
+
+
+class KycQueueTests(TestCase):
+    def setUp(self):
+        cache.delete(COUNTS_CACHE_KEY)
+        self.records = []
+        for index, status in enumerate(["PENDING", "PENDING", "APPROVED", "Rejected"]):
+            account = Accounts.objects.create_user(
+                email=f"kyc-{index}@test.com", password="password123"
+            )
+            record = kyc.objects.create(accountFK=account, kyc_status=status)
+            kycFiles.objects.create(
+                kycID=record,
+                idType="NATIONALID",
+                fileName=f"FRONTID_{index}.jpg",
+                fileURL=f"user_{account.accountID}/kyc/FRONTID_{index}.jpg",
+            )
+            self.records.append(record)
+
+    def test_keyset_pages_cover_the_queue_once(self):
+        first = get_kyc_queue(limit=3)
+        self.assertTrue(first["has_more"])
+        second = get_kyc_queue(limit=3, cursor=first["next_cursor"])
+        self.assertFalse(second["has_more"])
+        self.assertIsNone(second["next_cursor"])
+
+        ids = [item["kycID"] for item in first["items"] + second["items"]]
+        self.assertEqual(ids, [record.kycID for record in reversed(self.records)])
+        self.assertEqual(first["items"][0]["files"][0]["fileType"], "front")
+
+    def test_status_filter_and_counts(self):
+        pending = get_kyc_queue(status="pending")
+        self.assertEqual(len(pending["items"]), 2)
+        rejected = get_kyc_queue(status="REJECTED")
+        self.assertEqual([item["kycID"] for item in rejected["items"]], [self.records[3].kycID])
+
+        counts = get_kyc_queue_counts()
+        self.assertEqual(counts["user"], {"pending": 2, "approved": 1, "rejected": 1})
+        self.assertEqual(counts["total"]["pending"], 2)
+
+    def test_invalid_cursor_is_rejected(self):
+        with self.assertRaises(ValueError):
+            get_kyc_queue(cursor="not-a-cursor")
+
+
+class AdminPaginationTests(TestCase):
+    def setUp(self):
+        AuditLog.objects.bulk_create(
+            [
+                AuditLog(
+                    adminEmail="admin@test.com",
+                    action=AuditLog.ActionType.KYC_APPROVAL,
+                    entityType=AuditLog.EntityType.KYC,
+                    entityID=str(index),
+                )
+                for index in range(7)
+            ]
+        )
+        self.queryset = AuditLog.objects.all()
+        cache.delete(count_signature(self.queryset.order_by("-auditLogID")))
+
+    def test_keyset_mode_walks_every_row_without_counting(self):
+        seen = []
+        cursor = None
+        while True:
+            rows, meta = paginate_queryset(
+                self.queryset, page_size=3, count_mode="none", cursor=cursor, keyset=("-auditLogID",)
+            )
+            self.assertIsNone(meta["total"])
+            seen.extend(row.auditLogID for row in rows)
+            cursor = meta["next_cursor"]
+            if not meta["has_next"]:
+                break
+
+        self.assertIsNone(cursor)
+        self.assertEqual(
+            seen, list(self.queryset.order_by("-auditLogID").values_list("auditLogID", flat=True))
+        )
+
+    def test_exact_count_is_cached_per_filter_signature(self):
+        _, meta = paginate_queryset(self.queryset, page=1, page_size=3, keyset=("-auditLogID",))
+        self.assertEqual((meta["total"], meta["total_pages"]), (7, 3))
+
+        # Second page reuses the cached count: only the page query runs
+        with self.assertNumQueries(1):
+            rows, meta = paginate_queryset(self.queryset, page=2, page_size=3, keyset=("-auditLogID",))
+        self.assertEqual(len(rows), 3)
+        self.assertTrue(meta["has_previous"])
+
+    def test_estimate_mode_falls_back_to_exact_for_small_lists(self):
+        _, meta = paginate_queryset(
+            self.queryset, page_size=3, count_mode="estimate", keyset=("-auditLogID",)
+        )
+        self.assertEqual(meta["total"], 7)
+        self.assertFalse(meta["total_is_estimate"])
+
+
+class BulkFinanceTests(TestCase):
+    def setUp(self):
+        self.admin = Accounts.objects.create_user(
+            email="bulk-admin@test.com", password="password123", is_staff=True
+        )
+        self.wallets = []
+        for index in range(3):
+            account = Accounts.objects.create_user(
+                email=f"bulk-client-{index}@test.com", password="password123"
+            )
+            self.wallets.append(Wallet.objects.create(accountFK=account, balance=Decimal("100.00")))
+
+    def _payments(self, count, status="PENDING"):
+        return Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    walletID=self.wallets[index % len(self.wallets)],
+                    transactionType="PAYMENT",
+                    amount=Decimal("50.00"),
+                    balanceAfter=Decimal("100.00"),
+                    status=status,
+                )
+                for index in range(count)
+            ]
+        )
+
+    def _release_queries(self, count):
+        ids = [payment.transactionID for payment in self._payments(count)]
+        with CaptureQueriesContext(connection) as queries:
+            result = bulk_release_escrow(ids, reason="batch", admin=self.admin)
+        self.assertEqual(result["processed"], count)
+        return len(queries)
+
+    def test_release_query_count_does_not_grow_with_batch_size(self):
+        self.assertEqual(self._release_queries(2), self._release_queries(12))
+
+    def test_release_reports_per_item_failures_and_writes_side_effects(self):
+        pending, done = self._payments(1), self._payments(1, status="COMPLETED")
+        result = bulk_release_escrow(
+            [pending[0].transactionID, done[0].transactionID, 999999], admin=self.admin
+        )
+
+        self.assertEqual((result["processed"], result["failed"]), (1, 2))
+        self.assertEqual([item["success"] for item in result["results"]], [True, False, False])
+        pending[0].refresh_from_db()
+        self.assertEqual(pending[0].status, "COMPLETED")
+        self.assertEqual(AuditLog.objects.filter(action="payment_release").count(), 1)
+        self.assertEqual(Notification.objects.filter(notificationType="ESCROW_PAID").count(), 1)
+
+    def test_refund_credits_each_wallet_once_with_running_balances(self):
+        payments = self._payments(4, status="COMPLETED")
+        # payments[0] and payments[3] share a wallet
+        result = bulk_refund(
+            [{"transaction_id": payment.transactionID, "amount": "10.00"} for payment in payments]
+            + [{"transaction_id": payments[0].transactionID, "amount": "10.00"}],
+            reason="batch",
+            admin=self.admin,
+        )
+
+        self.assertEqual((result["processed"], result["failed"]), (4, 1))
+        self.assertEqual(result["results"][-1]["error"], "Duplicate transaction in batch")
+        self.wallets[0].refresh_from_db()
+        self.assertEqual(self.wallets[0].balance, Decimal("120.00"))
+        refunds = Transaction.objects.filter(
+            walletID=self.wallets[0], transactionType="REFUND"
+        ).order_by("transactionID")
+        self.assertEqual(
+            [refund.balanceAfter for refund in refunds], [Decimal("110.00"), Decimal("120.00")]
+        )
+
+    def test_invalid_ids_are_reported_and_valid_items_still_processed(self):
+        pending = self._payments(1)[0]
+        result = bulk_release_escrow(["abc", pending.transactionID, None], admin=self.admin)
+
+        self.assertEqual((result["processed"], result["failed"]), (1, 2))
+        self.assertEqual(
+            [(item["id"], item.get("error")) for item in result["results"]],
+            [("abc", "Invalid transaction id"), (pending.transactionID, None), (None, "Invalid transaction id")],
+        )
+
+    def test_refund_skips_already_refunded_and_non_completed_originals(self):
+        completed = self._payments(2, status="COMPLETED")
+        pending = self._payments(1)[0]
+        bulk_refund([{"transaction_id": completed[0].transactionID, "amount": "10.00"}], admin=self.admin)
+
+        result = bulk_refund(
+            [
+                {"transaction_id": completed[0].transactionID, "amount": "10.00"},
+                {"transaction_id": pending.transactionID, "amount": "10.00"},
+                {"transaction_id": "12x", "amount": "10.00"},
+                {"transaction_id": completed[1].transactionID, "amount": "10.00"},
+            ],
+            reason="batch",
+            admin=self.admin,
+        )
+
+        self.assertEqual((result["processed"], result["failed"]), (1, 3))
+        self.assertEqual(
+            [item.get("error") for item in result["results"]],
+            [
+                "Transaction has already been refunded",
+                "Cannot refund transaction with status: PENDING",
+                "Invalid transaction id",
+                None,
+            ],
+        )
+        self.assertEqual(
+            Transaction.objects.filter(transactionType="REFUND").count(), 2
+        )
+
+
+class RetentionTests(TestCase):
+    def setUp(self):
+        self.account = Accounts.objects.create_user(email="retention@test.com", password="testpass123")
+        self.policies = get_policies()
+
+    def _age(self, model, rows, days):
+        model.objects.filter(pk__in=[row.pk for row in rows]).update(
+            createdAt=timezone.now() - timedelta(days=days)
+        )
+
+    def test_notifications_prune_only_old_read_rows(self):
+        old_read, old_unread, recent_read = Notification.objects.bulk_create(
+            [
+                Notification(accountFK=self.account, title="t", message="m", isRead=is_read)
+                for is_read in (True, False, True)
+            ]
+        )
+        self._age(Notification, [old_read, old_unread], 400)
+
+        dry = run_policy(self.policies["notifications"], dry_run=True)
+        self.assertEqual(dry["rows"], 1)
+        self.assertTrue(Notification.objects.filter(pk=old_read.pk).exists())
+
+        result = run_policy(self.policies["notifications"], batch_size=1)
+        self.assertEqual(result["deleted"], 1)
+        self.assertEqual(
+            set(Notification.objects.values_list("pk", flat=True)), {old_unread.pk, recent_read.pk}
+        )
+        self.assertFalse(ArchiveBatch.objects.exists())
+
+    def test_audit_logs_are_archived_in_batches_before_delete(self):
+        logs = AuditLog.objects.bulk_create(
+            [
+                AuditLog(
+                    adminEmail="admin@test.com",
+                    action=AuditLog.ActionType.KYC_APPROVAL,
+                    entityType=AuditLog.EntityType.KYC,
+                    entityID=str(index),
+                    details={"index": index},
+                )
+                for index in range(5)
+            ]
+        )
+        self._age(AuditLog, logs[:3], 2000)
+
+        result = run_policy(self.policies["audit_logs"], batch_size=2)
+
+        self.assertEqual((result["deleted"], result["batches"]), (3, 2))
+        self.assertEqual(AuditLog.objects.count(), 2)
+        self.assertEqual(list(ArchiveBatch.objects.values_list("rowCount", flat=True).order_by("batchID")), [2, 1])
+        archived = list(iter_archived_rows(AuditLog._meta.db_table))
+        self.assertEqual([row["auditLogID"] for row in archived], sorted(log.pk for log in logs[:3]))
+        self.assertEqual(archived[0]["details"], {"index": 0})
 
-# Create your tests here.
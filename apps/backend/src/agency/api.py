@@ -3554,14 +3554,15 @@ def send_agency_message(
         # Send WebSocket notification (if available)
         try:
             from channels.layers import get_channel_layer
-            from asgiref.sync import async_to_sync
+            from profiles.channel_routing import send_to_conversation
 
             channel_layer = get_channel_layer()
             if channel_layer:
-                async_to_sync(channel_layer.group_send)(
-                    f"chat_{conv.conversationID}",
+                send_to_conversation(
+                    conv.conversationID,
                     {
                         "type": "chat_message",
+                        "sender_account_id": agency.accountFK_id,
                         "message": {
                             "conversation_id": conv.conversationID,
                             "message_id": message.messageID,
@@ -3573,6 +3574,8 @@ def send_agency_message(
                             "is_mine": False,
                         },
                     },
+                    channel_layer=channel_layer,
+                    include_legacy_group=True,
                 )
         except Exception as ws_error:
             print(f"⚠️ WebSocket notification failed: {ws_error}")
@@ -3782,14 +3785,15 @@ def upload_agency_chat_image(request, conversation_id: int):
             # Send WebSocket notification
             try:
                 from channels.layers import get_channel_layer
-                from asgiref.sync import async_to_sync
+                from profiles.channel_routing import send_to_conversation
 
                 channel_layer = get_channel_layer()
                 if channel_layer:
-                    async_to_sync(channel_layer.group_send)(
-                        f"chat_{conversation.conversationID}",
+                    send_to_conversation(
+                        conversation.conversationID,
                         {
                             "type": "chat_message",
+                            "sender_account_id": agency.accountFK_id,
                             "message": {
                                 "conversation_id": conversation.conversationID,
                                 "message_id": message.messageID,
@@ -3802,6 +3806,8 @@ def upload_agency_chat_image(request, conversation_id: int):
                                 "is_mine": False,
                             },
                         },
+                        channel_layer=channel_layer,
+                        include_legacy_group=True,
                     )
             except Exception as ws_error:
                 print(f"⚠️ WebSocket notification failed: {ws_error}")
@@ -0,0 +1,28 @@
+"""
+Composite indexes for the paginated admin KYC queue (status filter plus
+keyset pagination on createdAt/agencyKycID, newest first).
+"""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("agency", "0012_alter_agencyemployee_email"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="agencykyc",
+            index=models.Index(
+                fields=["status", "-createdAt", "-agencyKycID"],
+                name="agency_kyc_status_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="agencykyc",
+            index=models.Index(
+                fields=["-createdAt", "-agencyKycID"], name="agency_kyc_created_idx"
+            ),
+        ),
+    ]
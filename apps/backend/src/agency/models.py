@@ -72,6 +72,16 @@ class AgencyKYC(models.Model):
         """Get number of remaining resubmission attempts."""
         return max(0, self.maxResubmissions - self.resubmissionCount)
 
+    class Meta:
+        indexes = [
+            # Admin KYC queue: status tab + keyset on (createdAt, agencyKycID) DESC
+            models.Index(
+                fields=["status", "-createdAt", "-agencyKycID"],
+                name="agency_kyc_status_created_idx",
+            ),
+            models.Index(fields=["-createdAt", "-agencyKycID"], name="agency_kyc_created_idx"),
+        ]
+
 
 class AgencyKycFile(models.Model):
     """Files uploaded for agency KYC submissions with AI verification."""
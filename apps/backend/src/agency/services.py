@@ -1344,6 +1344,7 @@ def get_agency_jobs(
 
         # Import Conversation model for conversation lookup
         from profiles.models import Conversation
+        from jobs.daily_payment_service import DailyPaymentService
 
         # Get jobs with related data (distinct avoids duplicates from multi-slot joins)
         jobs = (
@@ -1359,6 +1360,10 @@ def get_agency_jobs(
             )
             .order_by("-createdAt")[offset : offset + limit]
         )
+        jobs = list(jobs)
+
+        # Attendance/payment summaries for the page's daily jobs (cached counters)
+        daily_summaries = DailyPaymentService.get_daily_summaries(jobs)
 
         # Format response
         jobs_data = []
@@ -1456,6 +1461,7 @@ def get_agency_jobs(
                     "daily_escrow_total": float(job.daily_escrow_total)
                     if hasattr(job, "daily_escrow_total") and job.daily_escrow_total
                     else None,
+                    "daily_summary": daily_summaries.get(job.jobID),
                     # Team job fields
                     "is_team_job": is_team_slot_flow,
                     "total_workers_needed": job.total_workers_needed,
@@ -2159,71 +2165,35 @@ def validate_employee_not_working(employee, exclude_job=None, target_job=None):
     Check if an employee is already working on an active job.
     Returns the conflicting job title if busy, or None if available.
 
-    Checks both legacy (Job.assignedEmployeeID) and M2M (JobEmployeeAssignment) paths.
+    Checks both legacy (Job.assignedEmployeeID) and M2M (JobEmployeeAssignment) paths
+    through the ScheduleInterval index (see jobs/availability_index.py).
 
     Args:
         employee: AgencyEmployee instance
         exclude_job: Optional Job instance to exclude (for re-checking within same job)
+        target_job: Optional Job whose date window limits the check to overlaps
 
     Returns:
         str (conflicting job title) if employee is busy, None if available
     """
-    from accounts.models import Job, JobEmployeeAssignment
+    from accounts.models import Job
+    from jobs.availability_index import find_busy_employees, job_window
 
     # Date-overlap policy: if target job has a schedule window, only block overlapping windows.
-    target_start = (
-        getattr(target_job, "preferredStartDate", None) if target_job else None
+    busy = find_busy_employees(
+        [employee.employeeID],
+        target_window=job_window(target_job) if target_job else None,
+        exclude_job_id=exclude_job.jobID if exclude_job else None,
     )
-    target_end = (
-        (getattr(target_job, "scheduled_end_date", None) or target_start)
-        if target_start
-        else None
+    conflict_job_id = busy.get(employee.employeeID)
+    if conflict_job_id is None:
+        return None
+    return (
+        Job.objects.filter(jobID=conflict_job_id)
+        .values_list("title", flat=True)
+        .first()
     )
 
-    def _overlap(start_a, end_a, start_b, end_b):
-        if not all([start_a, end_a, start_b, end_b]):
-            return False
-        return start_a <= end_b and end_a >= start_b
-
-    # Check legacy path: Job.assignedEmployeeID
-    legacy_query = Job.objects.filter(
-        assignedEmployeeID=employee, status__in=["ASSIGNED", "IN_PROGRESS"]
-    )
-    if exclude_job:
-        legacy_query = legacy_query.exclude(jobID=exclude_job.jobID)
-    if target_start:
-        for legacy_job in legacy_query:
-            legacy_start = legacy_job.preferredStartDate
-            legacy_end = legacy_job.scheduled_end_date or legacy_start
-            if _overlap(legacy_start, legacy_end, target_start, target_end):
-                return legacy_job.title
-    else:
-        legacy_job = legacy_query.first()
-        if legacy_job:
-            return legacy_job.title
-
-    # Check M2M path: JobEmployeeAssignment
-    m2m_query = JobEmployeeAssignment.objects.filter(
-        employee=employee,
-        status__in=["ASSIGNED", "IN_PROGRESS"],
-        job__status__in=["ASSIGNED", "IN_PROGRESS"],
-    ).select_related("job")
-    if exclude_job:
-        m2m_query = m2m_query.exclude(job_id=exclude_job.jobID)
-    if target_start:
-        for m2m_assignment in m2m_query:
-            assigned_job = m2m_assignment.job
-            assigned_start = assigned_job.preferredStartDate
-            assigned_end = assigned_job.scheduled_end_date or assigned_start
-            if _overlap(assigned_start, assigned_end, target_start, target_end):
-                return assigned_job.title
-    else:
-        m2m_assignment = m2m_query.first()
-        if m2m_assignment:
-            return m2m_assignment.job.title
-
-    return None
-
 
 def get_employee_workload(agency_account, employee_id: int) -> dict:
     """
@@ -2389,12 +2359,19 @@ def assign_employees_to_job(
         names = ", ".join(emp.name for emp in inactive_employees)
         raise ValueError(f"The following employees are not active: {names}")
 
-    # Check if any employees are already working on OTHER jobs
+    # Check if any employees are already working on OTHER jobs (one index query)
+    from jobs.availability_index import find_busy_employees, job_window
+
+    busy = find_busy_employees(
+        found_ids, target_window=job_window(job), exclude_job_id=job.jobID
+    )
     for emp in employees:
-        conflicting_job = validate_employee_not_working(
-            emp, exclude_job=job, target_job=job
-        )
-        if conflicting_job:
+        if emp.employeeID in busy:
+            conflicting_job = (
+                Job.objects.filter(jobID=busy[emp.employeeID])
+                .values_list("title", flat=True)
+                .first()
+            )
             raise ValueError(
                 f"Employee {emp.name} is already working on '{conflicting_job}'. They must complete it before being assigned to a new job."
             )
@@ -3082,6 +3059,27 @@ def assign_employees_to_slots(
     slot_assignments = {slot_id: [] for slot_id in skill_slots.keys()}
     employee_ids_used = set()
 
+    # Load every requested employee and their conflicts up front (one query each)
+    from jobs.availability_index import find_busy_employees, job_window
+
+    requested_ids = set()
+    for assignment_data in assignments:
+        try:
+            requested_ids.add(int(assignment_data.get("employee_id")))
+        except (TypeError, ValueError):
+            pass
+    employees_by_id = {
+        employee.employeeID: employee
+        for employee in AgencyEmployee.objects.filter(
+            employeeID__in=requested_ids, agency=agency_account
+        )
+    }
+    busy_employees = find_busy_employees(
+        [employee_id for employee_id, employee in employees_by_id.items() if employee.isActive],
+        target_window=job_window(job),
+        exclude_job_id=job.jobID,
+    )
+
     with transaction.atomic():
         for assignment_data in assignments:
             slot_id = assignment_data.get("skill_slot_id")
@@ -3095,10 +3093,10 @@ def assign_employees_to_slots(
 
             # Validate employee exists and belongs to agency
             try:
-                employee = AgencyEmployee.objects.get(
-                    employeeID=employee_id, agency=agency_account
-                )
-            except AgencyEmployee.DoesNotExist:
+                employee = employees_by_id.get(int(employee_id))
+            except (TypeError, ValueError):
+                employee = None
+            if employee is None:
                 return {
                     "success": False,
                     "error": f"Employee {employee_id} not found or not in your agency",
@@ -3111,10 +3109,13 @@ def assign_employees_to_slots(
                 }
 
             # Check if employee is already working on another job
-            conflicting_job = validate_employee_not_working(
-                employee, exclude_job=job, target_job=job
-            )
-            if conflicting_job:
+            conflict_job_id = busy_employees.get(employee.employeeID)
+            if conflict_job_id is not None:
+                conflicting_job = (
+                    Job.objects.filter(jobID=conflict_job_id)
+                    .values_list("title", flat=True)
+                    .first()
+                )
                 return {
                     "success": False,
                     "error": f'Employee {employee.fullName} is already working on "{conflicting_job}". They must complete it before being assigned to a new job.',
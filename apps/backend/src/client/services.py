@@ -1,10 +1,22 @@
-from django.db.models import Q, Avg, Count, Case, When, IntegerField, F
+from django.db.models import Q, Avg, F, Value
+from django.db.models.functions import Coalesce
 from accounts.models import Agency, Job, JobReview, Profile
 from agency.models import AgencyKYC, AgencyEmployee
 from typing import Optional, List, Dict
 import math
 
 
+def _agency_stats_annotations() -> Dict:
+    """Annotations sourced from AgencyStats (maintained by accounts.agency_stats_service)"""
+    return {
+        "total_jobs": Coalesce(F('stats__totalJobs'), Value(0)),
+        "completed_jobs": Coalesce(F('stats__completedJobs'), Value(0)),
+        "active_jobs": Coalesce(F('stats__activeJobs'), Value(0)),
+        "avg_rating": F('stats__averageRating'),
+        "total_reviews": Coalesce(F('stats__reviewCount'), Value(0)),
+    }
+
+
 def browse_agencies(
     page: int = 1,
     limit: int = 20,
@@ -41,34 +53,18 @@ def browse_agencies(
     if province:
         agencies_query = agencies_query.filter(province__icontains=province)
     
-    # Annotate with stats
-    agencies_query = agencies_query.annotate(
-        total_jobs=Count('assigned_jobs', distinct=True),
-        completed_jobs=Count(
-            Case(
-                When(assigned_jobs__status='COMPLETED', then=1),
-                output_field=IntegerField()
-            )
-        ),
-        active_jobs=Count(
-            Case(
-                When(assigned_jobs__status__in=['ACTIVE', 'IN_PROGRESS'], then=1),
-                output_field=IntegerField()
-            )
-        ),
-        avg_rating=Avg('assigned_jobs__reviews__rating'),
-        total_reviews=Count('assigned_jobs__reviews', distinct=True)
-    )
+    # Read counters from the materialized AgencyStats row (one-to-one join, no fan-out)
+    agencies_query = agencies_query.annotate(**_agency_stats_annotations())
     
     # Filter by minimum rating
     if min_rating:
-        agencies_query = agencies_query.filter(avg_rating__gte=min_rating)
+        agencies_query = agencies_query.filter(stats__averageRating__gte=min_rating)
     
     # Sorting
     if sort_by == "rating":
         agencies_query = agencies_query.order_by(F('avg_rating').desc(nulls_last=True))
     elif sort_by == "jobs":
-        agencies_query = agencies_query.order_by('-completed_jobs')
+        agencies_query = agencies_query.order_by(F('stats__completedJobs').desc(nulls_last=True))
     elif sort_by == "created":
         agencies_query = agencies_query.order_by('-createdAt')
     else:
@@ -140,30 +136,14 @@ def search_agencies(query: str, limit: int = 20) -> Dict:
     # Search by business name or description
     agencies_query = Agency.objects.filter(
         Q(businessName__icontains=query) | Q(businessDesc__icontains=query),
-        agencykyc__status="APPROVED"  # Only show approved agencies
-    ).annotate(
-        total_jobs=Count('assigned_jobs', distinct=True),
-        completed_jobs=Count(
-            Case(
-                When(assigned_jobs__status='COMPLETED', then=1),
-                output_field=IntegerField()
-            )
-        ),
-        active_jobs=Count(
-            Case(
-                When(assigned_jobs__status__in=['ACTIVE', 'IN_PROGRESS'], then=1),
-                output_field=IntegerField()
-            )
-        ),
-        avg_rating=Avg('assigned_jobs__jobreview__rating'),
-        total_reviews=Count('assigned_jobs__jobreview', distinct=True)
-    ).order_by(F('avg_rating').desc(nulls_last=True))[:limit]
+        accountFK__agencykyc__status="APPROVED"  # Only show approved agencies
+    ).annotate(**_agency_stats_annotations()).order_by(F('avg_rating').desc(nulls_last=True))[:limit]
     
     # Build response
     agencies_data = []
     for agency in agencies_query:
         try:
-            kyc_record = AgencyKYC.objects.get(agencyID=agency)
+            kyc_record = AgencyKYC.objects.get(accountFK=agency.accountFK)
             kyc_status_val = kyc_record.status
         except AgencyKYC.DoesNotExist:
             kyc_status_val = "PENDING"
@@ -172,7 +152,7 @@ def search_agencies(query: str, limit: int = 20) -> Dict:
             Job.objects.filter(
                 assignedAgencyFK=agency,
                 status='COMPLETED'
-            ).values_list('categoryID__categoryName', flat=True).distinct()[:5]
+            ).values_list('categoryID__specializationName', flat=True).distinct()[:5]
         )
         
         agencies_data.append({
@@ -0,0 +1,210 @@
+"""
+Conditional GET for Polled Read Endpoints
+
+The mobile app polls job detail, daily attendance, backjob and escrow status
+and the wallet every few seconds, and each poll rebuilds and reserializes the
+whole payload even when nothing changed. @conditional_get(resource) wraps a
+django-ninja GET view:
+
+- A cheap version for the resource is read in ONE query: the resource row
+  itself (every column, so queryset .update() calls are seen too) plus a
+  count and max timestamp watermark per related table (applications,
+  attendance, disputes, transactions, ...).
+- The ETag digests that version with the viewer (account + profile type),
+  the full path and a TTL bucket, so state the watermarks don't cover
+  (e.g. a renamed worker, "today" rolling over) is refreshed within `ttl`.
+- The serialized 200 body is cached under the ETag. A hit answers 304 when
+  If-None-Match matches, or the cached bytes otherwise; the view only runs
+  when the version moved. 304s are only sent for ETags this viewer was
+  actually served, so a guessed ETag never skips the view's access checks.
+
+Errors in the version query fall back to the plain view.
+"""
+import hashlib
+import json
+import logging
+import time
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "cache:cget:"
+DEFAULT_TTL = 30
+CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+# (reverse relation, timestamps to take the max of); every relation is also counted
+JOB_WATERMARKS = (
+    ("applications", ("updatedAt",)),
+    ("worker_assignments", ("updatedAt",)),
+    ("employee_assignments", ()),
+    ("skill_slots", ("updatedAt",)),
+    ("daily_attendance", ("updatedAt",)),
+    ("extensions", ("updatedAt",)),
+    ("rate_changes", ("updatedAt",)),
+    ("daily_skip_requests", ("updatedAt",)),
+    ("disputes", ("updatedAt",)),
+    ("job_materials", ("updatedAt",)),
+    ("photos", ()),
+    ("logs", ()),
+    ("reviews", ("updatedAt",)),
+    ("transactions", ("completedAt",)),
+)
+
+WALLET_WATERMARKS = (
+    ("transactions", ("completedAt", "processedAt")),
+)
+
+
+# =============================================================================
+# VERSIONS
+# =============================================================================
+
+
+def _watermarks(model, relations) -> dict:
+    """Correlated count/max subqueries for each reverse relation of `model`."""
+    annotations = {}
+    for name, fields in relations:
+        relation = model._meta.get_field(name)
+        rows = (
+            relation.related_model.objects.filter(**{relation.field.name: OuterRef("pk")})
+            .order_by()
+            .values(relation.field.name)
+        )
+        annotations[f"_{name}_count"] = Subquery(rows.annotate(n=Count("pk")).values("n")[:1])
+        for field in fields:
+            annotations[f"_{name}_{field}"] = Subquery(rows.annotate(m=Max(field)).values("m")[:1])
+    return annotations
+
+
+def _row_version(queryset, relations) -> Optional[tuple]:
+    """Every column of the single row in `queryset` plus its watermarks, or None."""
+    model = queryset.model
+    annotations = _watermarks(model, relations)
+    columns = [field.attname for field in model._meta.concrete_fields]
+    return queryset.annotate(**annotations).values_list(*columns, *annotations).first()
+
+
+def job_version(request, job_id=None, dispute_id=None, **kwargs) -> Optional[tuple]:
+    from accounts.models import Job
+
+    if job_id is not None:
+        jobs = Job.objects.filter(pk=job_id)
+    elif dispute_id is not None:
+        jobs = Job.objects.filter(disputes__pk=dispute_id)
+    else:
+        return None
+    return _row_version(jobs, JOB_WATERMARKS)
+
+
+def wallet_version(request, **kwargs) -> Optional[tuple]:
+    from accounts.models import Wallet
+
+    return _row_version(Wallet.objects.filter(accountFK=request.auth), WALLET_WATERMARKS)
+
+
+RESOURCE_VERSIONS: Dict[str, Callable[..., Optional[tuple]]] = {
+    "job": job_version,
+    "wallet": wallet_version,
+}
+
+
+# =============================================================================
+# RESPONSES
+# =============================================================================
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """True when an If-None-Match header lists `etag` (or is "*")."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in [tag.strip() for tag in header.split(",")]
+
+
+def _viewer(request) -> Optional[Tuple[int, str]]:
+    account = getattr(request, "auth", None)
+    account_id = getattr(account, "accountID", None)
+    if account_id is None:
+        return None
+    return account_id, getattr(account, "profile_type", None) or "-"
+
+
+def _render(result) -> Optional[Tuple[str, bytes]]:
+    """(content type, body) of a 200 view result, or None when it must not be cached."""
+    if isinstance(result, HttpResponse):
+        if result.status_code != 200 or result.streaming:
+            return None
+        return result.get("Content-Type", "application/json"), result.content
+    if isinstance(result, (dict, list)):
+        from ninja.responses import NinjaJSONEncoder
+
+        return "application/json; charset=utf-8", json.dumps(result, cls=NinjaJSONEncoder).encode("utf-8")
+    return None  # (status, body) tuples and anything else go back to ninja untouched
+
+
+def _respond(request, etag: str, response: HttpResponse, hit: bool) -> HttpResponse:
+    # Both paths are authorized: a hit was served to this viewer before, a miss just ran the view
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        response = HttpResponse(status=304)
+    response["ETag"] = etag
+    response["Cache-Control"] = CACHE_CONTROL
+    response["X-Conditional-Cache"] = "HIT" if hit else "MISS"
+    return response
+
+
+def conditional_get(resource: str, ttl: int = DEFAULT_TTL):
+    """
+    Decorator for GET views whose payload is a function of `resource`'s version.
+
+    Example:
+        @router.get("/{job_id}/escrow-status", auth=dual_auth)
+        @conditional_get("job")
+        def get_escrow_status(request, job_id: int):
+            ...
+    """
+    version_of = RESOURCE_VERSIONS[resource]
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(request, *args, **kwargs):
+            viewer = _viewer(request)
+            if getattr(settings, "CONDITIONAL_GET_DISABLED", False) or request.method != "GET" or viewer is None:
+                return func(request, *args, **kwargs)
+
+            try:
+                version = version_of(request, **kwargs)
+            except Exception as e:
+                logger.warning("Conditional GET version for %s failed: %s", resource, e)
+                version = None
+            if version is None:
+                return func(request, *args, **kwargs)
+
+            state = (resource, viewer, request.get_full_path(), version, int(time.time() // ttl))
+            digest = hashlib.sha256(repr(state).encode("utf-8")).hexdigest()[:32]
+            etag = f'"{resource}-{digest}"'
+            key = f"{CACHE_KEY_PREFIX}{resource}:{digest}"
+
+            cached = cache.get(key)
+            if cached is not None:
+                content_type, body = cached
+                return _respond(request, etag, HttpResponse(body, content_type=content_type), hit=True)
+
+            result = func(request, *args, **kwargs)
+            rendered = _render(result)
+            if rendered is None:
+                return result
+            cache.set(key, rendered, ttl * 2)
+            if not isinstance(result, HttpResponse):
+                result = HttpResponse(rendered[1], content_type=rendered[0])
+            return _respond(request, etag, result, hit=False)
+
+        return wrapper
+
+    return decorator
@@ -129,6 +129,23 @@ class LocalBucketInterface:
             print(f"❌ Error creating signed URL: {str(e)}")
             return {'error': str(e), 'signedURL': None}
 
+    def create_signed_urls(self, paths: list, expires_in: int = 3600) -> list:
+        """
+        Batch version of create_signed_url (public URLs for local storage).
+
+        Args:
+            paths: File paths in bucket
+            expires_in: Expiration time in seconds (ignored for local)
+
+        Returns:
+            list: [{'path': str, 'signedURL': str, 'error': None}, ...]
+        """
+        return [
+            {'path': path.lstrip('/'), **self.create_signed_url(path, expires_in)}
+            for path in paths
+            if path
+        ]
+
     def remove(self, paths: list) -> dict:
         """
         Remove files from local storage
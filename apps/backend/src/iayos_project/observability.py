@@ -6,16 +6,28 @@ Designed to integrate with cloud monitoring solutions.
 
 Features:
 - Structured JSON logging for log aggregation (ELK, CloudWatch)
+- Non-blocking log output: records are queued and written to stdout by a
+  background thread (BackgroundQueueHandler), so request threads and the
+  ASGI event loop never wait on a pipe
+- Leveled, optionally sampled debug logs with redaction of tokens/emails
 - Sentry integration for error tracking and performance monitoring
 - Request ID tracking for distributed tracing
 - Performance timing decorators
 """
 
+import atexit
+import copy
+import os
+import queue
+import random
+import re
+import sys
 import time
 import uuid
 import logging
 import functools
-from typing import Optional, Any, Callable
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Any, Callable
 from contextvars import ContextVar
 from django.conf import settings
 
@@ -34,38 +46,94 @@ def get_request_id() -> str:
     return rid
 
 
+SENSITIVE_FIELDS = {"token", "access_token", "refresh_token", "password", "authorization", "cookie", "email"}
+_EMAIL_RE = re.compile(r"([A-Za-z0-9._%+-])[A-Za-z0-9._%+-]*(@[A-Za-z0-9.-]+)")
+
+
+def redact(value: Any) -> str:
+    """Mask a secret or email for logs: tokens keep 6 chars, emails keep the first letter and domain."""
+    if value is None:
+        return "None"
+    text = str(value)
+    if "@" in text:
+        return _EMAIL_RE.sub(r"\1***\2", text)
+    if len(text) <= 8:
+        return "***"
+    return f"{text[:6]}…({len(text)})"
+
+
 class StructuredLogger:
     """
     Structured logging wrapper for JSON-formatted logs.
     Designed for log aggregation systems (ELK, CloudWatch, Datadog).
+
+    Messages take %-style args so nothing is formatted unless the level is
+    enabled. debug() can be sampled (sample_rate, or LOG_DEBUG_SAMPLE_RATE)
+    for per-message/per-connection paths. Extra fields named like secrets
+    (SENSITIVE_FIELDS) are redacted.
     """
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, debug_sample_rate: Optional[float] = None):
         self.logger = logging.getLogger(name)
+        self.debug_sample_rate = debug_sample_rate
     
     def _format_extra(self, **kwargs) -> dict:
         """Format extra fields for structured logging"""
         return {
             "request_id": get_request_id(),
             "timestamp": time.time(),
-            **kwargs
+            **{
+                key: redact(value) if key.lower() in SENSITIVE_FIELDS else value
+                for key, value in kwargs.items()
+            },
         }
+
+    def is_enabled(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
     
-    def info(self, message: str, **kwargs):
-        self.logger.info(message, extra=self._format_extra(**kwargs))
+    def info(self, message: str, *args, **kwargs):
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, *args, extra=self._format_extra(**kwargs))
     
-    def warning(self, message: str, **kwargs):
-        self.logger.warning(message, extra=self._format_extra(**kwargs))
+    def warning(self, message: str, *args, **kwargs):
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(message, *args, extra=self._format_extra(**kwargs))
     
-    def error(self, message: str, exception: Optional[Exception] = None, **kwargs):
+    def error(self, message: str, *args, exception: Optional[Exception] = None, **kwargs):
         extra = self._format_extra(**kwargs)
         if exception:
             extra["exception_type"] = type(exception).__name__
             extra["exception_message"] = str(exception)
-        self.logger.error(message, extra=extra, exc_info=exception is not None)
+        self.logger.error(message, *args, extra=extra, exc_info=exception is not None)
+
+    def exception(self, message: str, *args, **kwargs):
+        """error() with the active exception's traceback; call from an except block."""
+        self.logger.error(message, *args, extra=self._format_extra(**kwargs), exc_info=True)
     
-    def debug(self, message: str, **kwargs):
-        self.logger.debug(message, extra=self._format_extra(**kwargs))
+    def debug(self, message: str, *args, sample_rate: Optional[float] = None, **kwargs):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        rate = sample_rate if sample_rate is not None else self.debug_sample_rate
+        if rate is None:
+            rate = float(getattr(settings, "LOG_DEBUG_SAMPLE_RATE", 1.0))
+        if rate < 1.0 and random.random() >= rate:
+            return
+        self.logger.debug(message, *args, extra=self._format_extra(**kwargs))
+
+
+_loggers: Dict[str, StructuredLogger] = {}
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """
+    StructuredLogger for a module (``get_logger(__name__)``), placed under the
+    "iayos" logger so LOG_LEVEL and the background handler apply to it.
+    """
+    if not name.startswith("iayos"):
+        name = f"iayos.{name}"
+    if name not in _loggers:
+        _loggers[name] = StructuredLogger(name)
+    return _loggers[name]
 
 
 # Global structured logger instance
@@ -289,8 +357,99 @@ def _json_logger_available() -> bool:
         return False
 
 
-def get_logging_config() -> dict:
-    """Get logging configuration for structured JSON output"""
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops (and counts) records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Merge args now; formatting is left to the writer thread
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            # Tracebacks reference live frames; render them before crossing threads
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BackgroundQueueHandler(logging.Handler):
+    """
+    Logging handler that never blocks the caller.
+
+    Records go through a QueueHandler onto a bounded in-memory queue and are
+    formatted and written by a QueueListener thread to a StreamHandler
+    (stdout by default). When the queue is full the record is dropped and
+    counted instead of stalling a request or the event loop. The writer is
+    restarted lazily after fork (gunicorn --preload), since threads do not
+    survive it.
+
+    A plain Handler (not a QueueHandler subclass) so dictConfig on
+    Python 3.12+ does not replace its queue and listener.
+    """
+
+    def __init__(self, stream=None, maxsize: int = 10000):
+        super().__init__()
+        self.maxsize = maxsize
+        self.target = logging.StreamHandler(stream or sys.stdout)
+        self.enqueuer = None
+        self.listener = None
+        self._pid = None
+        self._start()
+        atexit.register(self.close)
+
+    @property
+    def dropped(self) -> int:
+        return self.enqueuer.dropped if self.enqueuer else 0
+
+    def _start(self):
+        log_queue = queue.Queue(self.maxsize)
+        self._pid = os.getpid()
+        self.enqueuer = _DroppingQueueHandler(log_queue)
+        self.listener = QueueListener(log_queue, self.target)
+        self.listener.start()
+
+    def setFormatter(self, fmt):
+        # Formatting is done by the writer thread
+        super().setFormatter(fmt)
+        self.target.setFormatter(fmt)
+
+    def emit(self, record):
+        if self._pid != os.getpid():
+            self._start()
+        self.enqueuer.emit(record)
+
+    def flush(self):
+        """Wait until queued records are written (tests, benchmarks, shutdown)."""
+        if self.listener is not None and self._pid == os.getpid():
+            self.listener.stop()
+            self.listener.start()
+        self.target.flush()
+
+    def close(self):
+        if self.listener is not None and self._pid == os.getpid():
+            self.listener.stop()
+        self.listener = None
+        self.target.close()
+        super().close()
+
+
+def get_logging_config(level: str = "INFO", json_logs: bool = False) -> dict:
+    """
+    Logging configuration: every handler writes through BackgroundQueueHandler.
+    `level` applies to the "iayos" loggers (get_logger); DEBUG enables the
+    per-message debug logs on hot paths.
+    """
+    formatter = 'json' if json_logs and _json_logger_available() else 'standard'
     return {
         'version': 1,
         'disable_existing_loggers': False,
@@ -305,8 +464,8 @@ def get_logging_config() -> dict:
         },
         'handlers': {
             'console': {
-                'class': 'logging.StreamHandler',
-                'formatter': 'standard',  # Will be overridden if JSON_LOGGING=true
+                'class': 'iayos_project.observability.BackgroundQueueHandler',
+                'formatter': formatter,
             },
         },
         'root': {
@@ -321,7 +480,7 @@ def get_logging_config() -> dict:
             },
             'iayos': {
                 'handlers': ['console'],
-                'level': 'DEBUG',
+                'level': level.upper(),
                 'propagate': False,
             },
         },
@@ -0,0 +1,348 @@
+"""
+Performance Harness for iAyos hot API endpoints
+
+Builds scalable fixture datasets, measures per-endpoint query counts and
+latency percentiles through the Django test client, and writes a JSON report
+that can be diffed between commits.
+
+Used by iayos_project/tests_perf.py:
+    python manage.py test iayos_project.tests_perf
+    PERF_REPORT_PATH=perf-report.json python manage.py test iayos_project.tests_perf
+
+Compare two reports:
+    python -m iayos_project.perf_harness compare base.json head.json
+"""
+import json
+import statistics
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+# Row counts per fixture scale. "messages" is per conversation; every other
+# count grows with the scale so list endpoints see proportionally more rows.
+PERF_SCALES = {
+    "small": {"clients": 2, "workers": 5, "agencies": 1, "jobs_per_client": 5, "messages": 5},
+    "medium": {"clients": 4, "workers": 20, "agencies": 3, "jobs_per_client": 20, "messages": 20},
+    "large": {"clients": 8, "workers": 50, "agencies": 5, "jobs_per_client": 50, "messages": 40},
+}
+
+# Max SQL queries per request. Budgets are absolute and must hold at every
+# scale; the harness also asserts query counts do not grow with data volume.
+ENDPOINT_BUDGETS = {
+    "mobile_job_list": {"path": "/api/mobile/jobs/list", "actor": "worker", "max_queries": 20},
+    "mobile_my_jobs_client": {"path": "/api/mobile/jobs/my-jobs", "actor": "client", "max_queries": 40},
+    "mobile_my_jobs_worker": {"path": "/api/mobile/jobs/my-jobs", "actor": "worker", "max_queries": 40},
+    "mobile_wallet_transactions": {"path": "/api/mobile/wallet/transactions", "actor": "worker", "max_queries": 10},
+    "chat_conversations": {"path": "/api/profiles/chat/conversations", "actor": "client", "max_queries": 30},
+    "worker_schedule": {"path": "/api/jobs/worker-schedule", "actor": "worker", "max_queries": 15},
+}
+
+
+def issue_access_token(account, profile_type: str) -> str:
+    """Mint a short-lived access token the same way login does."""
+    import jwt
+    from django.conf import settings
+    from django.utils import timezone
+
+    now = timezone.now()
+    payload = {
+        "user_id": account.accountID,
+        "email": account.email,
+        "profile_type": profile_type,
+        "exp": now + timedelta(hours=1),
+        "iat": now,
+    }
+    return jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
+
+
+def _create_account(email: str, profile_type: str, first_name: str, last_name: str):
+    from accounts.models import Accounts, Profile
+
+    account = Accounts.objects.create_user(
+        email=email, password="password123", isVerified=True
+    )
+    profile = Profile.objects.create(
+        accountFK=account,
+        profileType=profile_type,
+        firstName=first_name,
+        lastName=last_name,
+    )
+    return account, profile
+
+
+def build_perf_dataset(scale: str = "small", prefix: str = "perf") -> Dict:
+    """
+    Create a dataset of clients, workers, agencies, jobs, applications,
+    conversations, messages, attendance and wallet transactions.
+
+    Row counts come from PERF_SCALES[scale]. Returns the primary actors
+    ("client", "worker") plus the counts that were created.
+    """
+    from django.utils import timezone
+
+    from accounts.models import (
+        Agency,
+        ClientProfile,
+        DailyAttendance,
+        Job,
+        JobApplication,
+        Specializations,
+        Transaction,
+        Wallet,
+        WorkerProfile,
+    )
+    from profiles.models import Conversation, Message
+
+    sizes = PERF_SCALES[scale]
+    today = timezone.localdate()
+
+    specialization = Specializations.objects.create(
+        specializationName=f"{prefix} {scale} skill",
+        minimumRate=Decimal("500.00"),
+    )
+
+    clients = []
+    for index in range(sizes["clients"]):
+        account, profile = _create_account(
+            f"{prefix}-{scale}-client{index}@test.com", "CLIENT", "Perf", f"Client{index}"
+        )
+        clients.append(
+            ClientProfile.objects.create(
+                profileID=profile,
+                description="",
+                totalJobsPosted=0,
+                clientRating=0,
+                activeJobsCount=0,
+            )
+        )
+
+    workers = []
+    for index in range(sizes["workers"]):
+        account, profile = _create_account(
+            f"{prefix}-{scale}-worker{index}@test.com", "WORKER", "Perf", f"Worker{index}"
+        )
+        workers.append(WorkerProfile.objects.create(profileID=profile))
+
+    for index in range(sizes["agencies"]):
+        account, _ = _create_account(
+            f"{prefix}-{scale}-agency{index}@test.com", "CLIENT", "Perf", f"Agency{index}"
+        )
+        Agency.objects.create(accountFK=account, businessName=f"Perf Agency {index}")
+
+    jobs = Job.objects.bulk_create(
+        [
+            Job(
+                clientID=client,
+                title=f"{prefix} job {client.pk}-{index}",
+                description="Performance fixture job",
+                budget=Decimal("2500.00"),
+                location="Zamboanga City",
+                categoryID=specialization,
+                status=Job.JobStatus.ACTIVE if index % 3 else Job.JobStatus.IN_PROGRESS,
+                assignedWorkerID=None if index % 3 else workers[index % len(workers)],
+                preferredStartDate=today,
+            )
+            for client in clients
+            for index in range(sizes["jobs_per_client"])
+        ]
+    )
+
+    applications = JobApplication.objects.bulk_create(
+        [
+            JobApplication(
+                jobID=job,
+                workerID=workers[(job_index + offset) % len(workers)],
+                proposalMessage="Perf proposal",
+                proposedBudget=Decimal("2400.00"),
+            )
+            for job_index, job in enumerate(jobs)
+            for offset in range(min(3, len(workers)))
+        ],
+        ignore_conflicts=True,
+    )
+
+    assigned_jobs = [job for job in jobs if job.assignedWorkerID_id]
+    conversations = Conversation.objects.bulk_create(
+        [
+            Conversation(
+                client=job.clientID.profileID,
+                worker=job.assignedWorkerID.profileID,
+                relatedJobPosting=job,
+            )
+            for job in assigned_jobs
+        ]
+    )
+
+    messages = Message.objects.bulk_create(
+        [
+            Message(
+                conversationID=conversation,
+                sender=conversation.client if index % 2 else conversation.worker,
+                messageText=f"Perf message {index}",
+            )
+            for conversation in conversations
+            for index in range(sizes["messages"])
+        ],
+        batch_size=1000,
+    )
+
+    attendance = DailyAttendance.objects.bulk_create(
+        [
+            DailyAttendance(
+                jobID=job,
+                workerID=job.assignedWorkerID,
+                date=today - timedelta(days=day),
+                status=DailyAttendance.AttendanceStatus.PRESENT,
+                amount_earned=Decimal("500.00"),
+            )
+            for job in assigned_jobs
+            for day in range(3)
+        ],
+        ignore_conflicts=True,
+    )
+
+    primary_worker = workers[0]
+    wallet = Wallet.objects.create(
+        accountFK=primary_worker.profileID.accountFK, balance=Decimal("0.00")
+    )
+    Transaction.objects.bulk_create(
+        [
+            Transaction(
+                walletID=wallet,
+                transactionType=Transaction.TransactionType.EARNING,
+                amount=Decimal("100.00"),
+                balanceAfter=Decimal("100.00") * (index + 1),
+                status=Transaction.TransactionStatus.COMPLETED,
+                description=f"Perf earning {index}",
+            )
+            for index in range(sizes["jobs_per_client"] * 2)
+        ]
+    )
+
+    return {
+        "scale": scale,
+        "client": clients[0].profileID.accountFK,
+        "worker": primary_worker.profileID.accountFK,
+        "counts": {
+            "clients": len(clients),
+            "workers": len(workers),
+            "agencies": sizes["agencies"],
+            "jobs": len(jobs),
+            "applications": len(applications),
+            "conversations": len(conversations),
+            "messages": len(messages),
+            "attendance": len(attendance),
+        },
+    }
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(percentile / 100 * len(ordered))) - 1))
+    return round(ordered[rank], 2)
+
+
+def measure_endpoint(client, path: str, token: str, profile_type: str, iterations: int = 5) -> Dict:
+    """
+    Issue `iterations` GETs against `path` and return status, query count
+    (from the first, cold request) and p50/p95/max latency in milliseconds.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+    timings: List[float] = []
+    query_count = 0
+    status_code = None
+
+    for iteration in range(max(1, iterations)):
+        with CaptureQueriesContext(connection) as ctx:
+            started = time.perf_counter()
+            response = client.get(path, **headers)
+            timings.append((time.perf_counter() - started) * 1000)
+        if iteration == 0:
+            query_count = len(ctx.captured_queries)
+            status_code = response.status_code
+
+    return {
+        "path": path,
+        "profile_type": profile_type,
+        "status": status_code,
+        "queries": query_count,
+        "iterations": len(timings),
+        "p50_ms": round(statistics.median(timings), 2),
+        "p95_ms": _percentile(timings, 95),
+        "max_ms": round(max(timings), 2),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, timeout=5
+            )
+            .decode()
+            .strip()
+        )
+    except Exception:
+        return None
+
+
+def write_report(results: List[Dict], path: str) -> Dict:
+    """Write measurements as JSON (one entry per endpoint per scale)."""
+    report = {
+        "commit": _git_commit(),
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+    return report
+
+
+def compare_reports(base: Dict, head: Dict, latency_tolerance: float = 0.25) -> List[str]:
+    """
+    Return human-readable regressions between two reports: any increase in
+    query count, or a p95 latency increase above `latency_tolerance`.
+    """
+    base_index = {(row["endpoint"], row["scale"]): row for row in base.get("results", [])}
+    regressions = []
+    for row in head.get("results", []):
+        key = (row["endpoint"], row["scale"])
+        previous = base_index.get(key)
+        if previous is None:
+            continue
+        if row["queries"] > previous["queries"]:
+            regressions.append(
+                f"{key[0]}@{key[1]}: queries {previous['queries']} -> {row['queries']}"
+            )
+        if previous["p95_ms"] and row["p95_ms"] > previous["p95_ms"] * (1 + latency_tolerance):
+            regressions.append(
+                f"{key[0]}@{key[1]}: p95 {previous['p95_ms']}ms -> {row['p95_ms']}ms"
+            )
+    return regressions
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) != 4 or argv[1] != "compare":
+        print("usage: python -m iayos_project.perf_harness compare BASE.json HEAD.json")
+        return 2
+    with open(argv[2], encoding="utf-8") as handle:
+        base = json.load(handle)
+    with open(argv[3], encoding="utf-8") as handle:
+        head = json.load(handle)
+    regressions = compare_reports(base, head)
+    for line in regressions:
+        print(line)
+    print(f"{len(regressions)} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
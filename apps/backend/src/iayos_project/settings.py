@@ -122,6 +122,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'corsheaders',
     'channels',
     'ninja_extra',
@@ -142,6 +143,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'iayos_project.health_check_middleware.HealthCheckMiddleware',  # Health probes bypass ALLOWED_HOSTS (must be first)
     'iayos_project.observability.RequestIDMiddleware',  # Request ID for tracing
+    'profiles.event_bus.DeferredBroadcastMiddleware',  # Flush committed job status broadcasts once per request
     'corsheaders.middleware.CorsMiddleware',
     'iayos_project.mobile_cors_middleware.MobileCORSMiddleware',  # Handle mobile apps without Origin header
     'django.middleware.security.SecurityMiddleware',
@@ -174,6 +176,12 @@ LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 # Set to 'true' in development/staging environments
 TESTING = os.environ.get('TESTING', 'false').lower() == 'true'
 JSON_LOGGING = os.environ.get('JSON_LOGGING', 'false').lower() == 'true'
+# Fraction of debug logs kept on per-message / per-connection paths (only when LOG_LEVEL=DEBUG)
+LOG_DEBUG_SAMPLE_RATE = float(os.environ.get('LOG_DEBUG_SAMPLE_RATE', '1.0'))
+
+# All log output is queued and written to stdout by a background thread
+from iayos_project.observability import get_logging_config  # noqa: E402
+LOGGING = get_logging_config(level=LOG_LEVEL, json_logs=JSON_LOGGING)
 
 # KYC selfie anti-eyewear check (resource-efficient heuristic detector)
 # strict_confidence: hard reject when glasses confidence >= this threshold
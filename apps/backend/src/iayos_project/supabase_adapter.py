@@ -159,6 +159,51 @@ class BucketInterface:
             print(f"❌ Error creating signed URL: {str(e)}")
             return {'error': str(e), 'signedURL': None}
 
+    def create_signed_urls(self, paths: list, expires_in: int = 3600) -> list:
+        """
+        Create signed URLs for many files in one request
+
+        Args:
+            paths: File paths in bucket
+            expires_in: Expiration time in seconds (default: 1 hour)
+
+        Returns:
+            list: [{'path': str, 'signedURL': str or None, 'error': ...}, ...]
+        """
+        clean_paths = [path.lstrip('/') for path in paths if path]
+        if not clean_paths:
+            return []
+
+        try:
+            url = f"{self.url}/storage/v1/object/sign/{self.bucket_name}"
+            payload = {
+                'expiresIn': expires_in,
+                'paths': clean_paths,
+            }
+
+            response = requests.post(url, json=payload, headers=self.headers, timeout=(10, 30))
+
+            if response.status_code != 200:
+                error_msg = response.json() if response.text else {'message': 'Failed to create signed URLs'}
+                return [{'path': path, 'signedURL': None, 'error': error_msg} for path in clean_paths]
+
+            results = []
+            for item in response.json():
+                signed = item.get('signedURL')
+                if signed and not signed.startswith('http'):
+                    # Batch responses return "/object/sign/<bucket>/<path>?token=..."
+                    signed = f"{self.url}/storage/v1{signed}"
+                results.append({
+                    'path': item.get('path'),
+                    'signedURL': signed,
+                    'error': item.get('error'),
+                })
+            return results
+
+        except Exception as e:
+            print(f"❌ Error creating signed URLs: {str(e)}")
+            return [{'path': path, 'signedURL': None, 'error': str(e)} for path in clean_paths]
+
     def download(self, path: str) -> bytes:
         """
         Download file from Supabase Storage
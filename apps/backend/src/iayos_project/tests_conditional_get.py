@@ -0,0 +1,79 @@
+"""
+Tests for @conditional_get: 304 on a matching If-None-Match, cached bytes on
+an unchanged version, and a fresh view call once the resource changes.
+"""
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from accounts.models import Accounts, Transaction, Wallet
+from iayos_project.conditional_get import conditional_get
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.account = Accounts.objects.create_user(email="cget@test.com", password="testpass123")
+        self.wallet = Wallet.objects.create(accountFK=self.account, balance=Decimal("100.00"))
+        self.calls = 0
+
+        @conditional_get("wallet")
+        def wallet_view(request):
+            self.calls += 1
+            wallet = Wallet.objects.get(accountFK=request.auth)
+            return {"balance": wallet.balance, "transactions": wallet.transactions.count()}
+
+        self.view = wallet_view
+
+    def _get(self, account=None, etag=None):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        request = self.factory.get("/api/mobile/wallet/balance", **headers)
+        request.auth = account or self.account
+        return self.view(request)
+
+    def test_unchanged_wallet_is_served_from_cache_and_revalidated(self):
+        first = self._get()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(self.calls, 1)
+        etag = first["ETag"]
+
+        with self.assertNumQueries(1):  # the version query only
+            second = self._get()
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["X-Conditional-Cache"], "HIT")
+
+        with self.assertNumQueries(1):
+            not_modified = self._get(etag=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], etag)
+        self.assertEqual(self.calls, 1)
+
+    def test_row_updates_and_new_transactions_change_the_version(self):
+        etag = self._get()["ETag"]
+
+        Wallet.objects.filter(pk=self.wallet.pk).update(balance=Decimal("250.00"))
+        response = self._get(etag=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'"250.00"', response.content)
+
+        Transaction.objects.create(
+            walletID=self.wallet,
+            transactionType=Transaction.TransactionType.DEPOSIT,
+            amount=Decimal("10.00"),
+            balanceAfter=Decimal("260.00"),
+        )
+        self.assertNotEqual(self._get(etag=response["ETag"])["ETag"], response["ETag"])
+        self.assertEqual(self.calls, 3)
+
+    def test_etags_are_not_shared_between_accounts(self):
+        etag = self._get()["ETag"]
+        other = Accounts.objects.create_user(email="cget-other@test.com", password="testpass123")
+        Wallet.objects.create(accountFK=other)
+
+        response = self._get(account=other, etag=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self.calls, 2)
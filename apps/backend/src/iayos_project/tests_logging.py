@@ -0,0 +1,63 @@
+"""
+Tests for the non-blocking logging pipeline: redaction, lazy/sampled debug
+logs and BackgroundQueueHandler delivery.
+"""
+import io
+import logging
+
+from django.test import SimpleTestCase
+
+from iayos_project.observability import BackgroundQueueHandler, StructuredLogger, redact
+
+
+class LoggingPipelineTests(SimpleTestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.handler = BackgroundQueueHandler(stream=self.stream, maxsize=100)
+        self.handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        self.logger = logging.getLogger("iayos.tests.logging")
+        self.logger.addHandler(self.handler)
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+    def test_redact_masks_tokens_and_emails(self):
+        self.assertEqual(redact("juan.delacruz@example.com"), "j***@example.com")
+        self.assertEqual(redact("eyJhbGciOiJIUzI1NiJ9.payload"), "eyJhbG…(28)")
+        self.assertEqual(redact("short"), "***")
+
+    def test_records_are_written_by_the_background_listener(self):
+        log = StructuredLogger(self.logger.name, debug_sample_rate=1.0)
+        log.info("Message %s routed to %s sockets", 42, 3, token="secret-token-value")
+
+        self.handler.flush()
+        self.assertIn("INFO Message 42 routed to 3 sockets", self.stream.getvalue())
+        self.assertEqual(self.handler.dropped, 0)
+
+    def test_disabled_and_sampled_out_debug_logs_are_not_formatted(self):
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("formatted a skipped log line")
+
+        StructuredLogger(self.logger.name, debug_sample_rate=0.0).debug("payload %s", Exploding())
+        self.logger.setLevel(logging.INFO)
+        StructuredLogger(self.logger.name, debug_sample_rate=1.0).debug("payload %s", Exploding())
+
+        self.handler.flush()
+        self.assertEqual(self.stream.getvalue(), "")
+
+    def test_exception_logs_the_traceback_through_the_queue(self):
+        log = StructuredLogger(self.logger.name)
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            log.exception("[InboxWS] Error in receive: %s", e)
+
+        self.handler.flush()
+        output = self.stream.getvalue()
+        self.assertIn("ERROR [InboxWS] Error in receive: boom", output)
+        self.assertIn("Traceback (most recent call last)", output)
+        self.assertIn("ValueError: boom", output)
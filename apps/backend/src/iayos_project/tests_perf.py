@@ -0,0 +1,88 @@
+"""
+Query-count and latency budgets for the hot mobile/web endpoints.
+
+Each endpoint in ENDPOINT_BUDGETS is measured at every fixture scale in
+PERF_SCALES. Tests fail when an endpoint exceeds its query budget or when its
+query count grows with data volume (an N+1). Set PERF_REPORT_PATH to also
+write the measurements as JSON for cross-commit comparison.
+"""
+import os
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import Client, TestCase
+
+from iayos_project.perf_harness import (
+    ENDPOINT_BUDGETS,
+    PERF_SCALES,
+    build_perf_dataset,
+    issue_access_token,
+    measure_endpoint,
+    write_report,
+)
+
+
+class EndpointPerformanceBudgetTests(TestCase):
+    iterations = int(os.environ.get("PERF_ITERATIONS", "5"))
+
+    def _measure_scale(self, scale):
+        # Each scale sees only its own rows: build, measure, then roll back
+        savepoint = transaction.savepoint()
+        try:
+            cache.clear()
+            return self._measure_dataset(scale)
+        finally:
+            transaction.savepoint_rollback(savepoint)
+
+    def _measure_dataset(self, scale):
+        dataset = build_perf_dataset(scale, prefix=f"perf-{scale}")
+        tokens = {
+            "client": issue_access_token(dataset["client"], "CLIENT"),
+            "worker": issue_access_token(dataset["worker"], "WORKER"),
+        }
+        http = Client()
+        rows = []
+        for endpoint, budget in ENDPOINT_BUDGETS.items():
+            actor = budget["actor"]
+            result = measure_endpoint(
+                http,
+                budget["path"],
+                tokens[actor],
+                actor.upper(),
+                iterations=self.iterations,
+            )
+            result.update(
+                {
+                    "endpoint": endpoint,
+                    "scale": scale,
+                    "max_queries": budget["max_queries"],
+                    "dataset": dataset["counts"],
+                }
+            )
+            rows.append(result)
+        return rows
+
+    def test_endpoints_stay_within_query_budgets_at_every_scale(self):
+        results = []
+        for scale in PERF_SCALES:
+            results.extend(self._measure_scale(scale))
+
+        report_path = os.environ.get("PERF_REPORT_PATH")
+        if report_path:
+            write_report(results, report_path)
+
+        for row in results:
+            with self.subTest(endpoint=row["endpoint"], scale=row["scale"]):
+                self.assertEqual(row["status"], 200)
+                self.assertLessEqual(row["queries"], row["max_queries"])
+
+        by_endpoint = {}
+        for row in results:
+            by_endpoint.setdefault(row["endpoint"], []).append(row["queries"])
+        for endpoint, counts in by_endpoint.items():
+            with self.subTest(endpoint=endpoint, check="constant_queries"):
+                self.assertEqual(
+                    len(set(counts)),
+                    1,
+                    f"{endpoint} query count grows with data volume: {counts}",
+                )
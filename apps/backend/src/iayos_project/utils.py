@@ -129,6 +129,35 @@ def get_signed_url(bucket: str, path: str, expires_in: int = 3600) -> str:
         return None
 
 
+def get_signed_urls(bucket: str, paths, expires_in: int = 3600) -> dict:
+    """
+    Generate signed URLs for many files in one storage round trip.
+
+    Args:
+        bucket: Supabase storage bucket name
+        paths: File paths within the bucket
+        expires_in: URL validity in seconds (default: 1 hour)
+
+    Returns:
+        Dict mapping each path to its signed URL (paths that failed are omitted)
+    """
+    unique_paths = list(dict.fromkeys(path.lstrip('/') for path in paths if path))
+    if not unique_paths or not settings.STORAGE:
+        return {}
+
+    try:
+        results = settings.STORAGE.storage().from_(bucket).create_signed_urls(unique_paths, expires_in)
+    except Exception as e:
+        print(f"❌ Signed URLs exception: {e}")
+        return {}
+
+    return {
+        item['path']: item['signedURL']
+        for item in results or []
+        if item.get('path') and item.get('signedURL')
+    }
+
+
 def delete_storage_file(bucket: str, path: str) -> bool:
     """
     Delete a file from Supabase storage.
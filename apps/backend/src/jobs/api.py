@@ -28,6 +28,7 @@ from accounts.models import (
     workerSpecialization,
 )
 from accounts.payment_provider import get_payment_provider
+from iayos_project.conditional_get import conditional_get
 from .models import JobPosting
 
 # Use Job directly for type checking (JobPosting is just an alias)
@@ -56,14 +57,12 @@ from .backjob_service import auto_start_agency_backjob_if_ready, get_business_lo
 from .start_date_action_lock import get_start_date_action_lock_payload
 from .text_moderation import validate_job_post_content
 from .rate_validation import validate_daily_rate_for_specialization
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from django.utils import timezone
 from decimal import Decimal
 from django.db import transaction as db_transaction, IntegrityError
 from django.db.models import Q, Sum
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from zoneinfo import ZoneInfo
 import os
 import re
@@ -411,10 +410,19 @@ def _self_heal_worker_team_assignments(worker_profile: WorkerProfile) -> int:
     return cancelled_fixed + completed_fixed
 
 
-def _derive_and_self_heal_job_date_window(job: JobPosting):
+def _derive_and_self_heal_job_date_window(
+    job: JobPosting,
+    persist: bool = True,
+    attendance: Optional[Tuple[List[date], int]] = None,
+):
     """
     Self-heal legacy jobs that are missing start/end day metadata.
     Returns (start_date, end_date, duration_days).
+
+    With persist=False the derived window is only applied in memory; read
+    endpoints use this and leave the write to the consistency reconciler.
+    List endpoints pass attendance=(distinct dates, confirmed day count)
+    loaded for the whole page instead of querying per job.
     """
     start_date = getattr(job, "preferredStartDate", None)
     end_date = getattr(job, "scheduled_end_date", None)
@@ -427,16 +435,19 @@ def _derive_and_self_heal_job_date_window(job: JobPosting):
         )
 
     attendance_dates = []
-    try:
-        from accounts.models import DailyAttendance
+    if attendance is not None:
+        attendance_dates = list(attendance[0])
+    else:
+        try:
+            from accounts.models import DailyAttendance
 
-        attendance_dates = list(
-            DailyAttendance.objects.filter(jobID=job)
-            .values_list("date", flat=True)
-            .distinct()
-        )
-    except Exception:
-        attendance_dates = []
+            attendance_dates = list(
+                DailyAttendance.objects.filter(jobID=job)
+                .values_list("date", flat=True)
+                .distinct()
+            )
+        except Exception:
+            attendance_dates = []
 
     earliest_attendance = min(attendance_dates) if attendance_dates else None
     latest_attendance = max(attendance_dates) if attendance_dates else None
@@ -475,23 +486,26 @@ def _derive_and_self_heal_job_date_window(job: JobPosting):
 
     if attendance_dates:
         confirmed_days = 0
-        try:
-            from accounts.models import DailyAttendance
+        if attendance is not None:
+            confirmed_days = attendance[1]
+        else:
+            try:
+                from accounts.models import DailyAttendance
 
-            confirmed_days = (
-                DailyAttendance.objects.filter(jobID=job, client_confirmed=True)
-                .values_list("date", flat=True)
-                .distinct()
-                .count()
-            )
-        except Exception:
-            confirmed_days = 0
+                confirmed_days = (
+                    DailyAttendance.objects.filter(jobID=job, client_confirmed=True)
+                    .values_list("date", flat=True)
+                    .distinct()
+                    .count()
+                )
+            except Exception:
+                confirmed_days = 0
 
         if confirmed_days > int(getattr(job, "total_days_worked", 0) or 0):
             job.total_days_worked = confirmed_days
             changed_fields.append("total_days_worked")
 
-    if changed_fields:
+    if changed_fields and persist:
         try:
             job.save(update_fields=list(dict.fromkeys(changed_fields)))
             print(
@@ -514,44 +528,20 @@ def _derive_and_self_heal_job_date_window(job: JobPosting):
 
 def broadcast_job_status_update(job_id, update_data):
     """
-    Broadcast job status update via WebSocket.
-    Sends to both the job_{job_id} group (JobStatusConsumer) AND all chat_{conv_id}
-    groups linked to this job (InboxConsumer) so mobile clients receive the update.
+    Queue a job status update for WebSocket delivery.
+
+    Delivered after the surrounding transaction commits (never for rolled-back
+    writes) to the job_{job_id} group (JobStatusConsumer) and the
+    user_{accountID} group of every participant in the job's conversations
+    (InboxConsumer). Updates for the same job within one request are
+    coalesced and sent in one batch; see profiles.event_bus.
     """
     try:
-        channel_layer = get_channel_layer()
-        if channel_layer:
-            async_to_sync(channel_layer.group_send)(
-                f"job_{job_id}", {"type": "job_status_update", "data": update_data}
-            )
-            print(f"📡 Broadcasted job status update for job {job_id}: {update_data}")
-
-            # Also broadcast to chat groups so InboxConsumer (mobile) receives it
-            try:
-                from profiles.models import Conversation
+        from profiles.event_bus import publish_job_status
 
-                conv_ids = list(
-                    Conversation.objects.filter(
-                        relatedJobPosting_id=job_id
-                    ).values_list("pk", flat=True)
-                )
-                for conv_id in conv_ids:
-                    async_to_sync(channel_layer.group_send)(
-                        f"chat_{conv_id}",
-                        {"type": "job_status_update", "data": update_data},
-                    )
-                if conv_ids:
-                    print(
-                        f"📡 Broadcasted job status update to chat groups {conv_ids} for job {job_id}"
-                    )
-            except Exception as conv_e:
-                print(
-                    f"⚠️ Could not broadcast to chat groups for job {job_id}: {str(conv_e)}"
-                )
-        else:
-            print(f"⚠️ No channel layer available for broadcasting")
+        publish_job_status(job_id, update_data)
     except Exception as e:
-        print(f"❌ Error broadcasting job status: {str(e)}")
+        print(f"❌ Error queueing job status broadcast for job {job_id}: {str(e)}")
         import traceback
 
         traceback.print_exc()
@@ -2754,7 +2744,8 @@ def get_worker_schedule(request):
         # Team job assignments for this worker
         team_job_ids = []
         if worker_profile:
-            _self_heal_worker_team_assignments(worker_profile)
+            # Stale ACTIVE rows on cancelled jobs are repaired by the
+            # consistency reconciler; this read just skips them.
             team_job_ids = list(
                 JobWorkerAssignment.objects.filter(
                     workerID=worker_profile,
@@ -2762,7 +2753,19 @@ def get_worker_schedule(request):
                         JobWorkerAssignment.AssignmentStatus.ACTIVE,
                         JobWorkerAssignment.AssignmentStatus.COMPLETED,
                     ],
-                ).values_list("jobID", flat=True)
+                )
+                .exclude(
+                    Q(assignment_status=JobWorkerAssignment.AssignmentStatus.ACTIVE)
+                    & (
+                        Q(jobID__status=JobPosting.JobStatus.CANCELLED)
+                        | Q(jobID__cancelledAt__isnull=False)
+                        | (
+                            Q(jobID__cancelledByRole__isnull=False)
+                            & ~Q(jobID__cancelledByRole="")
+                        )
+                    )
+                )
+                .values_list("jobID", flat=True)
             )
 
         # Agency-employee assignment path. This captures accounts that work as
@@ -2795,10 +2798,30 @@ def get_worker_schedule(request):
             .order_by("preferredStartDate", "jobID")
         )
 
+        # Attendance for every listed job in one query: distinct dates and
+        # client-confirmed days per job, for the date-window derivation.
+        from accounts.models import DailyAttendance
+
+        attendance_dates_by_job: Dict[int, set] = {}
+        confirmed_dates_by_job: Dict[int, set] = {}
+        for job_id, day, confirmed in (
+            DailyAttendance.objects.filter(jobID_id__in=relevant_job_ids)
+            .values_list("jobID_id", "date", "client_confirmed")
+            .distinct()
+        ):
+            attendance_dates_by_job.setdefault(job_id, set()).add(day)
+            if confirmed:
+                confirmed_dates_by_job.setdefault(job_id, set()).add(day)
+
         payload_jobs = []
         for j in jobs:
             start_date, end_date, duration_days = _derive_and_self_heal_job_date_window(
-                j
+                j,
+                persist=False,
+                attendance=(
+                    attendance_dates_by_job.get(j.jobID, ()),
+                    len(confirmed_dates_by_job.get(j.jobID, ())),
+                ),
             )
             if not start_date:
                 continue
@@ -3005,6 +3028,7 @@ def get_my_backjobs(request, status: Optional[str] = None):
 
 
 @router.get("/backjob/{dispute_id}", auth=dual_auth)
+@conditional_get("job")
 def get_backjob_by_dispute_id(request, dispute_id: int):
     """
     Fetch a specific backjob/dispute by dispute ID.
@@ -3137,6 +3161,7 @@ def get_backjob_by_dispute_id(request, dispute_id: int):
 
 
 @router.get("/{job_id}", auth=cookie_auth)
+@conditional_get("job")
 def get_job_posting(request, job_id: int):
     """
     Get details of a specific job posting
@@ -8839,6 +8864,7 @@ def request_backjob(
 
 
 @router.get("/{job_id}/backjob-status", auth=dual_auth)
+@conditional_get("job")
 def get_backjob_status(request, job_id: int):
     """
     Get the backjob/dispute status for a specific job.
@@ -12269,6 +12295,7 @@ def get_job_receipt(request, job_id: int):
 
 
 @router.get("/{job_id}/payment-timeline", auth=dual_auth)
+@conditional_get("job")
 def get_job_payment_timeline(request, job_id: int):
     """
     Get the payment timeline for a job, showing all payment-related events.
@@ -13165,6 +13192,7 @@ def confirm_arrival_today(request, job_id: int):
 
 
 @router.get("/{job_id}/daily/today-attendance", auth=dual_auth)
+@conditional_get("job")
 def get_today_project_attendance(request, job_id: int):
     """
     Get today's attendance row for a single (non-team) multi-day PROJECT job.
@@ -13339,6 +13367,7 @@ def mark_day_complete(request, job_id: int, attendance_id: str, data: dict = Non
 
 
 @router.get("/{job_id}/daily/attendance", auth=dual_auth)
+@conditional_get("job")
 def get_daily_attendance(
     request, job_id: int, start_date: str = None, end_date: str = None
 ):
@@ -13444,6 +13473,7 @@ def get_daily_attendance(
 
 
 @router.get("/{job_id}/daily/summary", auth=dual_auth)
+@conditional_get("job")
 def get_daily_job_summary(request, job_id: int):
     """
     Get a comprehensive summary of a daily-rate job.
@@ -14635,6 +14665,10 @@ def qa_skip_to_next_day(request, job_id: int, data: QASkipNextDaySchema):
                 time_in=None,
                 time_out=None,
             )
+            if reset_next_day_attendance_rows:
+                from jobs.daily_payment_service import DailyPaymentService
+
+                DailyPaymentService.invalidate_daily_summary(job.jobID)
 
             if job.workerMarkedComplete:
                 job.workerMarkedComplete = False
@@ -15642,6 +15676,7 @@ def get_daily_escrow_estimate(
 
 
 @router.get("/{job_id}/escrow-status", auth=dual_auth)
+@conditional_get("job")
 def get_escrow_status(request, job_id: int):
     """
     Get the current escrow health for an active job.
@@ -0,0 +1,292 @@
+"""
+Worker / Agency Employee Availability Index
+
+Maintains accounts.ScheduleInterval: one busy interval per worker or agency
+employee per job they are currently committed to, with the job's inclusive
+date window and shift. Schedule-conflict checks become a single indexed range
+query (GiST on (person, window)) instead of loading every active job or
+assignment and comparing windows in Python.
+
+Rows are recomputed per job from the source tables by sync_job_intervals(),
+which Job / JobWorkerAssignment / JobEmployeeAssignment save() and delete()
+call. Bulk .update() calls bypass those hooks, so the reconciler's
+"schedule_intervals" check and `python manage.py rebuild_schedule_intervals`
+repair drift. Between nightly full passes the reconciler only rebuilds jobs
+changed since its watermark (rebuild_intervals(since=...)).
+
+Busy rules mirror the previous in-Python checks:
+    - Direct worker: Job.assignedWorkerID on ACTIVE / IN_PROGRESS jobs
+    - Team worker: ACTIVE JobWorkerAssignment on ACTIVE / IN_PROGRESS jobs
+    - Legacy employee: Job.assignedEmployeeID on ASSIGNED / IN_PROGRESS jobs
+    - Employee assignment: ASSIGNED / IN_PROGRESS JobEmployeeAssignment on
+      ASSIGNED / IN_PROGRESS jobs
+
+There is deliberately no exclusion constraint: MORNING + NIGHT shifts may
+overlap, and legacy rows are written before conflict checks existed.
+"""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.backends.postgresql.psycopg_any import DateRange
+from django.db.models import Exists, OuterRef, Q
+
+WORKER_BUSY_JOB_STATUSES = ["ACTIVE", "IN_PROGRESS"]
+EMPLOYEE_BUSY_JOB_STATUSES = ["ASSIGNED", "IN_PROGRESS"]
+EMPLOYEE_BUSY_ASSIGNMENT_STATUSES = ["ASSIGNED", "IN_PROGRESS"]
+
+
+def job_window(job) -> Optional[DateRange]:
+    """Inclusive [start, end] range for a job, or None when it has no start date."""
+    start_date = getattr(job, "preferredStartDate", None)
+    if not start_date:
+        return None
+    end_date = getattr(job, "scheduled_end_date", None) or start_date
+    if end_date < start_date:
+        end_date = start_date
+    return DateRange(start_date, end_date, "[]")
+
+
+def _build_job_intervals(job) -> List:
+    from accounts.models import JobEmployeeAssignment, JobWorkerAssignment, ScheduleInterval
+
+    window = job_window(job)
+    rows = []
+
+    if job.status in WORKER_BUSY_JOB_STATUSES:
+        if job.assignedWorkerID_id:
+            rows.append(
+                ScheduleInterval(
+                    jobID_id=job.jobID,
+                    source=ScheduleInterval.Source.DIRECT_WORKER,
+                    workerID_id=job.assignedWorkerID_id,
+                    window=window,
+                    shift=job.shift_type,
+                )
+            )
+        for worker_id, assigned_shift in JobWorkerAssignment.objects.filter(
+            jobID_id=job.jobID, assignment_status="ACTIVE"
+        ).values_list("workerID_id", "assigned_shift"):
+            rows.append(
+                ScheduleInterval(
+                    jobID_id=job.jobID,
+                    source=ScheduleInterval.Source.TEAM_WORKER,
+                    workerID_id=worker_id,
+                    window=window,
+                    shift=assigned_shift,
+                )
+            )
+
+    if job.status in EMPLOYEE_BUSY_JOB_STATUSES:
+        if job.assignedEmployeeID_id:
+            rows.append(
+                ScheduleInterval(
+                    jobID_id=job.jobID,
+                    source=ScheduleInterval.Source.LEGACY_EMPLOYEE,
+                    employeeID_id=job.assignedEmployeeID_id,
+                    window=window,
+                    shift=job.shift_type,
+                )
+            )
+        for employee_id in JobEmployeeAssignment.objects.filter(
+            job_id=job.jobID, status__in=EMPLOYEE_BUSY_ASSIGNMENT_STATUSES
+        ).values_list("employee_id", flat=True):
+            rows.append(
+                ScheduleInterval(
+                    jobID_id=job.jobID,
+                    source=ScheduleInterval.Source.EMPLOYEE_ASSIGNMENT,
+                    employeeID_id=employee_id,
+                    window=window,
+                    shift=job.shift_type,
+                )
+            )
+
+    return rows
+
+
+def sync_job_intervals(job_id: Optional[int]) -> int:
+    """Replace every ScheduleInterval row for one job. Returns rows written."""
+    from accounts.models import Job, ScheduleInterval
+
+    if not job_id:
+        return 0
+
+    with transaction.atomic():
+        ScheduleInterval.objects.filter(jobID_id=job_id).delete()
+        job = (
+            Job.objects.filter(jobID=job_id)
+            .only(
+                "jobID",
+                "status",
+                "preferredStartDate",
+                "scheduled_end_date",
+                "shift_type",
+                "assignedWorkerID",
+                "assignedEmployeeID",
+            )
+            .first()
+        )
+        if job is None:
+            return 0
+        rows = _build_job_intervals(job)
+        if rows:
+            ScheduleInterval.objects.bulk_create(rows)
+    return len(rows)
+
+
+def busy_job_ids_queryset():
+    """Jobs that should currently have at least one interval row."""
+    from accounts.models import Job, JobEmployeeAssignment, JobWorkerAssignment
+
+    return Job.objects.filter(
+        Q(status__in=WORKER_BUSY_JOB_STATUSES, assignedWorkerID__isnull=False)
+        | Q(status__in=EMPLOYEE_BUSY_JOB_STATUSES, assignedEmployeeID__isnull=False)
+        | Q(
+            status__in=WORKER_BUSY_JOB_STATUSES,
+            jobID__in=JobWorkerAssignment.objects.filter(
+                assignment_status="ACTIVE"
+            ).values("jobID_id"),
+        )
+        | Q(
+            status__in=EMPLOYEE_BUSY_JOB_STATUSES,
+            jobID__in=JobEmployeeAssignment.objects.filter(
+                status__in=EMPLOYEE_BUSY_ASSIGNMENT_STATUSES
+            ).values("job_id"),
+        )
+    )
+
+
+def _conflict_window_q(target) -> Q:
+    """
+    Rows that collide with `target` by date: unscheduled rows always collide;
+    scheduled rows collide when their window overlaps the target's.
+    """
+    return Q(window__isnull=True) | Q(window__overlap=target)
+
+
+def _shift_conflict_q(incoming_shift: Optional[str]) -> Q:
+    """Only MORNING + NIGHT can share dates; everything else conflicts."""
+    if incoming_shift == "MORNING":
+        return ~Q(shift="NIGHT") | Q(shift__isnull=True)
+    if incoming_shift == "NIGHT":
+        return ~Q(shift="MORNING") | Q(shift__isnull=True)
+    return Q()
+
+
+def find_worker_conflict_job_id(
+    worker_id: int,
+    target_window: Optional[DateRange],
+    incoming_shift: Optional[str] = None,
+    exclude_job_id: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Return the jobID of a busy interval that blocks this worker, preferring
+    direct jobs over team slots. None when the worker is free.
+    """
+    from accounts.models import ScheduleInterval
+
+    rows = ScheduleInterval.objects.filter(workerID_id=worker_id).filter(
+        _shift_conflict_q(incoming_shift)
+    )
+    if target_window is not None:
+        rows = rows.filter(_conflict_window_q(target_window))
+    if exclude_job_id:
+        rows = rows.exclude(jobID_id=exclude_job_id)
+    return (
+        rows.order_by("source", "jobID_id")
+        .values_list("jobID_id", flat=True)
+        .first()
+    )
+
+
+def find_busy_employees(
+    employee_ids: Iterable[int],
+    target_window: Optional[DateRange] = None,
+    exclude_job_id: Optional[int] = None,
+) -> Dict[int, int]:
+    """
+    Batch "who is busy" lookup for agency employees in one query.
+
+    With a target window only scheduled, overlapping intervals block; without
+    one any busy interval blocks. Returns {employee_id: conflicting_job_id}.
+    """
+    from accounts.models import ScheduleInterval
+
+    ids = [int(employee_id) for employee_id in employee_ids]
+    if not ids:
+        return {}
+
+    rows = ScheduleInterval.objects.filter(employeeID_id__in=ids)
+    if target_window is not None:
+        rows = rows.filter(window__overlap=target_window)
+    if exclude_job_id:
+        rows = rows.exclude(jobID_id=exclude_job_id)
+
+    busy: Dict[int, tuple] = {}
+    # The legacy assignedEmployeeID path is reported ahead of M2M assignments
+    for employee_id, job_id, source in rows.order_by("employeeID_id", "jobID_id").values_list(
+        "employeeID_id", "jobID_id", "source"
+    ):
+        current = busy.get(employee_id)
+        if current is None or (
+            source == ScheduleInterval.Source.LEGACY_EMPLOYEE
+            and current[1] != ScheduleInterval.Source.LEGACY_EMPLOYEE
+        ):
+            busy[employee_id] = (job_id, source)
+    return {employee_id: job_id for employee_id, (job_id, _) in busy.items()}
+
+
+def rebuild_intervals(
+    batch_size: int = 500,
+    dry_run: bool = False,
+    limit: int = 0,
+    since: Optional[datetime] = None,
+) -> Dict:
+    """
+    Recompute intervals for every job that has rows or should have rows, or
+    with `since` only for jobs whose row or assignments changed after it.
+    Used by the rebuild command and the reconciler.
+    """
+    from accounts.models import Job, JobEmployeeAssignment, JobWorkerAssignment, ScheduleInterval
+    from jobs.consistency_reconciler import _iter_pk_batches
+
+    if since is not None:
+        # Busy state also changes through assignment rows, not just the job row
+        candidates = Job.objects.filter(
+            Q(updatedAt__gte=since)
+            | Exists(
+                JobWorkerAssignment.objects.filter(jobID=OuterRef("pk"), updatedAt__gte=since)
+            )
+            | Exists(
+                JobEmployeeAssignment.objects.filter(job=OuterRef("pk"), assignedAt__gte=since)
+            )
+        )
+    else:
+        candidates = Job.objects.filter(
+            Q(jobID__in=busy_job_ids_queryset().values("jobID"))
+            | Q(jobID__in=ScheduleInterval.objects.values("jobID_id"))
+        )
+    result = {"candidates": 0, "repaired": 0}
+
+    for batch in _iter_pk_batches(candidates, "jobID", batch_size, limit):
+        result["candidates"] += len(batch)
+        if dry_run:
+            continue
+        for job_id in batch:
+            before = _interval_signature(job_id)
+            sync_job_intervals(job_id)
+            if _interval_signature(job_id) != before:
+                result["repaired"] += 1
+
+    return result
+
+
+def _interval_signature(job_id: int):
+    from accounts.models import ScheduleInterval
+
+    return sorted(
+        (source, worker_id or 0, employee_id or 0, str(window), shift or "")
+        for source, worker_id, employee_id, window, shift in ScheduleInterval.objects.filter(
+            jobID_id=job_id
+        ).values_list("source", "workerID_id", "employeeID_id", "window", "shift")
+    )
@@ -0,0 +1,521 @@
+"""
+Job Consistency Reconciler
+
+Scans for the lifecycle drift that request handlers used to "self-heal" on
+read (stale team assignments, legacy jobs missing date windows, fully
+early-completed team jobs stuck pre-completion, fully staffed team jobs still
+ACTIVE, backjob disputes whose status lags their workflow flags, schedule
+intervals out of sync with job status) and repairs it in batches outside the
+request path.
+
+Every check selects candidates with predicates backed by existing indexes
+(jobs.status/updatedAt, job_worker_assignments.jobID/assignment_status,
+job_disputes.status) and walks them by primary key so each batch is its own
+short transaction. Lifecycle checks never touch jobs with an active backjob
+dispute or with team completion flags already set; those flows own the job.
+
+The per-row checks (INCREMENTAL_CHECKS) only look at rows changed since their
+last successful run, kept as a watermark in the cache. A missing watermark or
+full=True rescans everything; cron runs a full pass nightly to pick up drift
+from queryset .update() calls, which do not touch updatedAt.
+
+Run via `python manage.py reconcile_job_consistency` (scheduled by cron).
+"""
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from accounts.models import (
+    DailyAttendance,
+    Job,
+    JobDispute,
+    JobEmployeeAssignment,
+    JobSkillSlot,
+    JobWorkerAssignment,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+
+OPEN_JOB_STATUSES = [Job.JobStatus.ACTIVE, Job.JobStatus.IN_PROGRESS]
+SCHEDULED_JOB_STATUSES = [
+    Job.JobStatus.ACTIVE,
+    Job.JobStatus.IN_PROGRESS,
+    Job.JobStatus.COMPLETED,
+]
+ACTIVE_BACKJOB_STATUSES = [
+    JobDispute.DisputeStatus.OPEN,
+    JobDispute.DisputeStatus.IN_NEGOTIATION,
+    JobDispute.DisputeStatus.UNDER_REVIEW,
+]
+
+WATERMARK_KEY = "cache:reconciler:watermark:{check}"
+# Re-read a little before the watermark so rows committed during the last run are not missed
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+def _cancelled_job_q(prefix: str = "") -> Q:
+    return (
+        Q(**{f"{prefix}status": Job.JobStatus.CANCELLED})
+        | Q(**{f"{prefix}cancelledAt__isnull": False})
+        | (
+            Q(**{f"{prefix}cancelledByRole__isnull": False})
+            & ~Q(**{f"{prefix}cancelledByRole": ""})
+        )
+    )
+
+
+def stale_team_assignment_q() -> Q:
+    """ACTIVE team assignments whose job is already cancelled or completed."""
+    return Q(assignment_status=JobWorkerAssignment.AssignmentStatus.ACTIVE) & (
+        _cancelled_job_q("jobID__")
+        | Q(jobID__status=Job.JobStatus.COMPLETED)
+        | Q(jobID__clientMarkedComplete=True)
+    )
+
+
+def _active_backjob_exists() -> Exists:
+    return Exists(
+        JobDispute.objects.filter(jobID=OuterRef("pk"), status__in=ACTIVE_BACKJOB_STATUSES)
+    )
+
+
+def _team_completion_flags_q() -> Q:
+    """Jobs where the client, a worker or an agency already marked work complete."""
+    return (
+        Q(clientMarkedComplete=True)
+        | Q(workerMarkedComplete=True)
+        | Q(is_early_completed=True)
+        | Exists(
+            JobWorkerAssignment.objects.filter(jobID=OuterRef("pk")).filter(
+                Q(early_completed=True) | Q(worker_marked_complete=True)
+            )
+        )
+        | Exists(
+            JobEmployeeAssignment.objects.filter(job=OuterRef("pk")).filter(
+                Q(early_completed=True)
+                | Q(agencyMarkedComplete=True)
+                | Q(employeeMarkedComplete=True)
+            )
+        )
+    )
+
+
+def _iter_pk_batches(queryset, pk_field: str, batch_size: int, limit: int = 0):
+    """Yield lists of primary keys in ascending order, `batch_size` at a time."""
+    last_pk = 0
+    seen = 0
+    while True:
+        size = batch_size
+        if limit > 0:
+            size = min(size, limit - seen)
+            if size <= 0:
+                return
+        batch = list(
+            queryset.filter(**{f"{pk_field}__gt": last_pk})
+            .order_by(pk_field)
+            .values_list(pk_field, flat=True)[:size]
+        )
+        if not batch:
+            return
+        yield batch
+        seen += len(batch)
+        last_pk = batch[-1]
+
+
+def reconcile_stale_team_assignments(
+    batch_size: int = DEFAULT_BATCH_SIZE, dry_run: bool = False, limit: int = 0
+) -> Dict:
+    """
+    Set-based repair of ACTIVE JobWorkerAssignment rows on finished jobs:
+    cancelled jobs -> REMOVED, completed jobs -> COMPLETED.
+    """
+    candidates = JobWorkerAssignment.objects.filter(stale_team_assignment_q())
+    result = {"candidates": 0, "repaired": 0}
+
+    for batch in _iter_pk_batches(candidates, "assignmentID", batch_size, limit):
+        result["candidates"] += len(batch)
+        if dry_run:
+            continue
+        with transaction.atomic():
+            scoped = JobWorkerAssignment.objects.filter(
+                assignmentID__in=batch,
+                assignment_status=JobWorkerAssignment.AssignmentStatus.ACTIVE,
+            )
+            removed = scoped.filter(_cancelled_job_q("jobID__")).update(
+                assignment_status=JobWorkerAssignment.AssignmentStatus.REMOVED
+            )
+            completed = scoped.filter(
+                Q(jobID__status=Job.JobStatus.COMPLETED)
+                | Q(jobID__clientMarkedComplete=True)
+            ).update(
+                assignment_status=JobWorkerAssignment.AssignmentStatus.COMPLETED
+            )
+        result["repaired"] += removed + completed
+
+    return result
+
+
+def reconcile_job_date_windows(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    limit: int = 0,
+    since: Optional[datetime] = None,
+) -> Dict:
+    """
+    Backfill start/end/duration metadata on scheduled jobs missing it. Only
+    jobs with something to derive a start from (a start date, a confirmed
+    start or attendance) are candidates, so unstarted ACTIVE jobs are not
+    rescanned every run; jobs mid-backjob are left to the backjob flow.
+    """
+    from jobs.api import _derive_and_self_heal_job_date_window
+
+    has_attendance = Exists(DailyAttendance.objects.filter(jobID=OuterRef("pk")))
+    candidates = (
+        Job.objects.filter(status__in=SCHEDULED_JOB_STATUSES)
+        .filter(
+            Q(preferredStartDate__isnull=True)
+            | Q(actual_start_date__isnull=True)
+            | Q(scheduled_end_date__isnull=True)
+            | Q(duration_days__isnull=True)
+            | Q(duration_days__lte=0)
+        )
+        .filter(
+            Q(preferredStartDate__isnull=False)
+            | Q(actual_start_date__isnull=False)
+            | Q(clientConfirmedWorkStartedAt__isnull=False)
+            | has_attendance
+        )
+        .exclude(_active_backjob_exists())
+    )
+    if since is not None:
+        candidates = candidates.filter(
+            Q(updatedAt__gte=since)
+            | Exists(
+                DailyAttendance.objects.filter(jobID=OuterRef("pk"), updatedAt__gte=since)
+            )
+        )
+    result = {"candidates": 0, "repaired": 0}
+
+    for batch in _iter_pk_batches(candidates, "jobID", batch_size, limit):
+        result["candidates"] += len(batch)
+        if dry_run:
+            continue
+        for job in Job.objects.filter(jobID__in=batch).order_by("jobID"):
+            before = (
+                job.preferredStartDate,
+                job.actual_start_date,
+                job.scheduled_end_date,
+                job.duration_days,
+            )
+            _derive_and_self_heal_job_date_window(job)
+            after = (
+                job.preferredStartDate,
+                job.actual_start_date,
+                job.scheduled_end_date,
+                job.duration_days,
+            )
+            if after != before:
+                result["repaired"] += 1
+
+    return result
+
+
+def _team_jobs_with_early_completions(since: Optional[datetime] = None):
+    worker_early = JobWorkerAssignment.objects.filter(
+        jobID=OuterRef("pk"), early_completed=True
+    )
+    employee_early = JobEmployeeAssignment.objects.filter(
+        job=OuterRef("pk"),
+        skill_slot__isnull=False,
+        early_completed=True,
+    )
+    jobs = (
+        Job.objects.filter(
+            is_team_job=True,
+            status__in=OPEN_JOB_STATUSES,
+        )
+        .filter(Exists(worker_early) | Exists(employee_early))
+        .exclude(_active_backjob_exists())
+    )
+    if since is not None:
+        jobs = jobs.filter(
+            Q(updatedAt__gte=since)
+            | Exists(worker_early.filter(early_completed_at__gte=since))
+            | Exists(employee_early.filter(early_completed_at__gte=since))
+        )
+    return jobs
+
+
+def reconcile_team_early_completion(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    limit: int = 0,
+    since: Optional[datetime] = None,
+) -> Dict:
+    """
+    Finalize team jobs whose every assignment is early-completed but whose
+    job row is still ACTIVE/IN_PROGRESS (DAILY and PROJECT variants).
+    """
+    from jobs.team_job_services import (
+        _are_all_team_assignments_early_completed,
+        autoheal_hybrid_daily_all_early_completed,
+        autoheal_team_project_all_early_completed,
+    )
+
+    result = {"candidates": 0, "repaired": 0}
+    candidates = _team_jobs_with_early_completions(since)
+
+    for batch in _iter_pk_batches(candidates, "jobID", batch_size, limit):
+        for job in Job.objects.filter(jobID__in=batch).select_related(
+            "clientID__profileID"
+        ):
+            if not _are_all_team_assignments_early_completed(job):
+                continue
+            result["candidates"] += 1
+            if dry_run:
+                continue
+            payment_model = str(job.payment_model or "PROJECT").upper()
+            if payment_model == "DAILY":
+                heal = autoheal_hybrid_daily_all_early_completed(job)
+            else:
+                heal = autoheal_team_project_all_early_completed(job)
+            if heal.get("success") and heal.get("healed"):
+                result["repaired"] += 1
+
+    return result
+
+
+def reconcile_team_start_status(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    limit: int = 0,
+    since: Optional[datetime] = None,
+) -> Dict:
+    """
+    Move fully staffed team jobs that are still ACTIVE to IN_PROGRESS. Jobs
+    with team completion flags or an active backjob dispute are skipped.
+    """
+    candidates = (
+        Job.objects.filter(is_team_job=True, status=Job.JobStatus.ACTIVE)
+        .exclude(_team_completion_flags_q())
+        .exclude(_active_backjob_exists())
+    )
+    if since is not None:
+        # Staffing changes land on assignments and slots, not on the job row
+        candidates = candidates.filter(
+            Q(updatedAt__gte=since)
+            | Exists(
+                JobWorkerAssignment.objects.filter(jobID=OuterRef("pk"), updatedAt__gte=since)
+            )
+            | Exists(
+                JobEmployeeAssignment.objects.filter(job=OuterRef("pk"), assignedAt__gte=since)
+            )
+            | Exists(JobSkillSlot.objects.filter(jobID=OuterRef("pk"), updatedAt__gte=since))
+        )
+    result = {"candidates": 0, "repaired": 0}
+
+    for batch in _iter_pk_batches(candidates, "jobID", batch_size, limit):
+        for job in Job.objects.filter(jobID__in=batch):
+            if not job.can_start_team_job:
+                continue
+            result["candidates"] += 1
+            if dry_run:
+                continue
+            with transaction.atomic():
+                locked = (
+                    Job.objects.select_for_update()
+                    .filter(jobID=job.jobID, status=Job.JobStatus.ACTIVE)
+                    .first()
+                )
+                if locked is None:
+                    continue
+                locked.status = Job.JobStatus.IN_PROGRESS
+                locked.save(update_fields=["status", "updatedAt"])
+            result["repaired"] += 1
+
+    return result
+
+
+def stuck_backjob_dispute_q() -> Q:
+    """
+    Backjob disputes whose status/timestamps disagree with their workflow
+    flags (the cases jobs.api._self_heal_backjob_dispute_state normalizes).
+    Admin-RESOLVED disputes are only candidates once the client confirmed.
+    """
+    confirmed = Q(clientConfirmedBackjob=True) & (
+        Q(workerMarkedBackjobComplete=False)
+        | Q(backjobStarted=False)
+        | ~Q(status=JobDispute.DisputeStatus.RESOLVED)
+        | Q(resolvedDate__isnull=True)
+    )
+    not_confirmed = Q(clientConfirmedBackjob=False) & Q(status__in=ACTIVE_BACKJOB_STATUSES)
+    in_review = ~Q(status=JobDispute.DisputeStatus.UNDER_REVIEW)
+    worker_done = Q(workerMarkedBackjobComplete=True) & (Q(backjobStarted=False) | in_review)
+    started = Q(workerMarkedBackjobComplete=False, backjobStarted=True) & in_review
+    scheduled = (
+        Q(workerMarkedBackjobComplete=False, backjobStarted=False, workerScheduleConfirmed=True)
+        & in_review
+    )
+    unscheduled = Q(
+        workerMarkedBackjobComplete=False,
+        backjobStarted=False,
+        workerScheduleConfirmed=False,
+        status=JobDispute.DisputeStatus.UNDER_REVIEW,
+        scheduled_date__isnull=True,
+    )
+    return (
+        Q(status__in=ACTIVE_BACKJOB_STATUSES + [JobDispute.DisputeStatus.RESOLVED]) & confirmed
+    ) | (not_confirmed & (worker_done | started | scheduled | unscheduled))
+
+
+def reconcile_backjob_dispute_state(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    limit: int = 0,
+    since: Optional[datetime] = None,
+) -> Dict:
+    """Normalize backjob disputes stuck between workflow phases."""
+    from jobs.api import _self_heal_backjob_dispute_state
+
+    candidates = JobDispute.objects.filter(stuck_backjob_dispute_q())
+    if since is not None:
+        candidates = candidates.filter(updatedAt__gte=since)
+    result = {"candidates": 0, "repaired": 0}
+
+    for batch in _iter_pk_batches(candidates, "disputeID", batch_size, limit):
+        result["candidates"] += len(batch)
+        if dry_run:
+            continue
+        for dispute in JobDispute.objects.filter(disputeID__in=batch).order_by("disputeID"):
+            with transaction.atomic():
+                if _self_heal_backjob_dispute_state(dispute):
+                    result["repaired"] += 1
+
+    return result
+
+
+def reconcile_schedule_intervals(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    limit: int = 0,
+    since: Optional[datetime] = None,
+) -> Dict:
+    """
+    Resync ScheduleInterval rows. Incremental runs rebuild only jobs changed
+    since the watermark (rebuild_intervals); full runs look for busy-state
+    drift from bulk updates: busy jobs without rows, and jobs with rows that
+    are no longer busy. Full window/shift drift is covered by the
+    rebuild_schedule_intervals command.
+    """
+    from accounts.models import ScheduleInterval
+    from jobs.availability_index import busy_job_ids_queryset, rebuild_intervals, sync_job_intervals
+
+    if since is not None:
+        return rebuild_intervals(batch_size=batch_size, dry_run=dry_run, limit=limit, since=since)
+
+    has_rows = Exists(ScheduleInterval.objects.filter(jobID=OuterRef("pk")))
+    busy_ids = busy_job_ids_queryset().values("jobID")
+    candidates = Job.objects.filter(
+        (Q(jobID__in=busy_ids) & ~has_rows) | (~Q(jobID__in=busy_ids) & has_rows)
+    )
+    result = {"candidates": 0, "repaired": 0}
+
+    for batch in _iter_pk_batches(candidates, "jobID", batch_size, limit):
+        result["candidates"] += len(batch)
+        if dry_run:
+            continue
+        for job_id in batch:
+            sync_job_intervals(job_id)
+            result["repaired"] += 1
+
+    return result
+
+
+CHECKS: Dict[str, Callable[..., Dict]] = {
+    "stale_team_assignments": reconcile_stale_team_assignments,
+    "job_date_windows": reconcile_job_date_windows,
+    "team_early_completion": reconcile_team_early_completion,
+    "team_start_status": reconcile_team_start_status,
+    "backjob_dispute_state": reconcile_backjob_dispute_state,
+    "schedule_intervals": reconcile_schedule_intervals,
+}
+
+# Checks that accept `since`; the set-based ones always scan their (indexed) predicate
+INCREMENTAL_CHECKS = (
+    "job_date_windows",
+    "team_early_completion",
+    "team_start_status",
+    "backjob_dispute_state",
+    "schedule_intervals",
+)
+
+
+def _watermark(name: str) -> Optional[datetime]:
+    marked = cache.get(WATERMARK_KEY.format(check=name))
+    return marked - WATERMARK_OVERLAP if marked else None
+
+
+def _advance_watermark(name: str, started_at: datetime) -> None:
+    cache.set(WATERMARK_KEY.format(check=name), started_at, None)
+
+
+def run_reconciler(
+    checks: Optional[Iterable[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    limit: int = 0,
+    full: bool = False,
+) -> List[Dict]:
+    """
+    Run the selected checks (all by default) and return one metrics dict per
+    check: name, candidates, repaired, since, duration_ms and error (if it
+    failed). A failing check is logged and does not stop the remaining ones.
+
+    Incremental checks scan from their watermark unless `full`; the watermark
+    only advances after a complete, successful, non-dry run.
+    """
+    names = list(checks) if checks else list(CHECKS)
+    unknown = [name for name in names if name not in CHECKS]
+    if unknown:
+        raise ValueError(f"Unknown reconciler check(s): {', '.join(unknown)}")
+
+    metrics = []
+    for name in names:
+        started = time.monotonic()
+        started_at = timezone.now()
+        incremental = name in INCREMENTAL_CHECKS
+        since = _watermark(name) if incremental and not full else None
+        entry = {"check": name, "candidates": 0, "repaired": 0, "since": since, "error": None}
+        kwargs = {"batch_size": batch_size, "dry_run": dry_run, "limit": limit}
+        if incremental:
+            kwargs["since"] = since
+        try:
+            entry.update(CHECKS[name](**kwargs))
+        except Exception as exc:
+            entry["error"] = str(exc)
+            logger.exception("Reconciler check %s failed", name)
+        else:
+            # A --limit run may stop short of the newest rows, so it keeps the old watermark
+            if incremental and not dry_run and limit <= 0:
+                _advance_watermark(name, started_at)
+        entry["duration_ms"] = round((time.monotonic() - started) * 1000, 2)
+        logger.info(
+            "reconciler check=%s candidates=%s repaired=%s since=%s duration_ms=%s dry_run=%s",
+            name,
+            entry["candidates"],
+            entry["repaired"],
+            since.isoformat() if since else "full",
+            entry["duration_ms"],
+            dry_run,
+        )
+        metrics.append(entry)
+
+    return metrics
@@ -8,12 +8,15 @@ Handles daily-rate job payment logic including:
 - Multi-worker and agency support
 """
 
+import logging
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Optional, Dict, Any, List
+from django.core.cache import cache
 from django.db import transaction, IntegrityError
 from django.utils import timezone
-from django.db.models import Sum
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 
 from accounts.models import (
     Job,
@@ -30,6 +33,14 @@ from accounts.models import (
 )
 from jobs.rate_validation import validate_daily_rate_for_specialization
 
+logger = logging.getLogger(__name__)
+
+# Per-job summary counters (attendance + pending requests). Invalidated by
+# DailyAttendance/DailyJobExtension/DailyRateChange writes; TTL bounds any
+# bulk .update() path that bypasses model save().
+DAILY_SUMMARY_CACHE_PREFIX = "cache:daily:summary"
+DAILY_SUMMARY_CACHE_TTL = 300
+
 
 class DailyPaymentService:
     """Service class for handling daily payment operations."""
@@ -1074,28 +1085,138 @@ class DailyPaymentService:
         }
 
     @staticmethod
-    def get_daily_summary(job: Job) -> Dict[str, Any]:
+    def _summary_cache_key(job_id: int) -> str:
+        return f"{DAILY_SUMMARY_CACHE_PREFIX}:{job_id}"
+
+    @staticmethod
+    def invalidate_daily_summary(job_id: Optional[int]) -> None:
         """
-        Get a summary of daily attendance and payments for a job.
+        Drop the cached summary counters for a job.
+        Deleted now and again after commit so readers inside the write window
+        cannot leave stale counters behind.
         """
-        if job.payment_model != "DAILY":
-            return {"error": "Job is not a daily-rate job"}
+        if not job_id:
+            return
+        cache_key = DailyPaymentService._summary_cache_key(job_id)
+
+        def _delete():
+            try:
+                cache.delete(cache_key)
+            except Exception as e:
+                logger.warning(f"Daily summary cache invalidation error: {e}")
 
-        attendance_records = DailyAttendance.objects.filter(jobID=job).order_by("date")
+        _delete()
+        transaction.on_commit(_delete)
 
-        total_earned = attendance_records.filter(payment_processed=True).aggregate(
-            total=Sum("amount_earned")
-        )["total"] or Decimal("0.00")
+    @staticmethod
+    def _load_summary_counts(job_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Load attendance/payment/pending-request counters for many jobs in two
+        queries: one conditional aggregate over DailyAttendance grouped by job,
+        and one Job scan with pending extension/rate-change count subqueries.
+        """
+        if not job_ids:
+            return {}
+
+        attendance_rows = {
+            row["jobID_id"]: row
+            for row in DailyAttendance.objects.filter(jobID_id__in=job_ids)
+            .values("jobID_id")
+            .annotate(
+                total_records=Count("attendanceID"),
+                pending_confirmation=Count("attendanceID", filter=Q(status="PENDING")),
+                days_present=Count("attendanceID", filter=Q(status="PRESENT")),
+                days_half=Count("attendanceID", filter=Q(status="HALF_DAY")),
+                days_absent=Count("attendanceID", filter=Q(status="ABSENT")),
+                total_earned=Sum("amount_earned", filter=Q(payment_processed=True)),
+                absent_penalty_total=Sum(
+                    "absent_penalty_amount",
+                    filter=Q(status="ABSENT", absent_penalty_applied=True),
+                ),
+            )
+            .order_by()
+        }
+
+        pending_extensions_sq = (
+            DailyJobExtension.objects.filter(jobID=OuterRef("jobID"), status="PENDING")
+            .values("jobID")
+            .annotate(c=Count("extensionID"))
+            .values("c")
+        )
+        pending_rate_changes_sq = (
+            DailyRateChange.objects.filter(jobID=OuterRef("jobID"), status="PENDING")
+            .values("jobID")
+            .annotate(c=Count("changeID"))
+            .values("c")
+        )
+        pending_rows = {
+            row["jobID"]: row
+            for row in Job.objects.filter(jobID__in=job_ids)
+            .annotate(
+                pending_extensions=Coalesce(
+                    Subquery(pending_extensions_sq), Value(0), output_field=IntegerField()
+                ),
+                pending_rate_changes=Coalesce(
+                    Subquery(pending_rate_changes_sq), Value(0), output_field=IntegerField()
+                ),
+            )
+            .values("jobID", "pending_extensions", "pending_rate_changes")
+            .order_by()
+        }
+
+        counts = {}
+        for job_id in job_ids:
+            attendance = attendance_rows.get(job_id, {})
+            pending = pending_rows.get(job_id, {})
+            counts[job_id] = {
+                "total_records": attendance.get("total_records") or 0,
+                "pending_confirmation": attendance.get("pending_confirmation") or 0,
+                "days_present": attendance.get("days_present") or 0,
+                "days_half": attendance.get("days_half") or 0,
+                "days_absent": attendance.get("days_absent") or 0,
+                "total_earned": attendance.get("total_earned") or Decimal("0.00"),
+                "absent_penalty_total": attendance.get("absent_penalty_total")
+                or Decimal("0.00"),
+                "pending_extensions": pending.get("pending_extensions") or 0,
+                "pending_rate_changes": pending.get("pending_rate_changes") or 0,
+            }
+        return counts
 
-        pending_confirmation = attendance_records.filter(status="PENDING").count()
+    @staticmethod
+    def _get_summary_counts(job_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Cache-aside wrapper around _load_summary_counts (one get_many/set_many)."""
+        keys = {
+            job_id: DailyPaymentService._summary_cache_key(job_id) for job_id in job_ids
+        }
+        try:
+            cached = cache.get_many(list(keys.values()))
+        except Exception as e:
+            logger.warning(f"Daily summary cache read error: {e}")
+            cached = {}
 
-        days_present = attendance_records.filter(status="PRESENT").count()
-        days_half = attendance_records.filter(status="HALF_DAY").count()
-        days_absent = attendance_records.filter(status="ABSENT").count()
+        counts = {
+            job_id: cached[key] for job_id, key in keys.items() if key in cached
+        }
+        missing = [job_id for job_id in job_ids if job_id not in counts]
+        if missing:
+            loaded = DailyPaymentService._load_summary_counts(missing)
+            counts.update(loaded)
+            try:
+                cache.set_many(
+                    {keys[job_id]: value for job_id, value in loaded.items()},
+                    DAILY_SUMMARY_CACHE_TTL,
+                )
+            except Exception as e:
+                logger.warning(f"Daily summary cache write error: {e}")
+        return counts
 
-        absent_penalty_total = attendance_records.filter(
-            status="ABSENT", absent_penalty_applied=True
-        ).aggregate(total=Sum("absent_penalty_amount"))["total"] or Decimal("0.00")
+    @staticmethod
+    def _build_daily_summary(job: Job, counts: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine cached counters with the job's live rate/escrow/day fields."""
+        total_earned = counts["total_earned"]
+        absent_penalty_total = counts["absent_penalty_total"]
+        days_present = counts["days_present"]
+        days_half = counts["days_half"]
 
         gross_expected_earnings = (
             Decimal(days_present) * (job.daily_rate_agreed or Decimal("0.00"))
@@ -1108,15 +1229,6 @@ class DailyPaymentService:
         if net_expected_earnings < Decimal("0.00"):
             net_expected_earnings = Decimal("0.00")
 
-        # Get pending extensions/rate changes
-        pending_extensions = DailyJobExtension.objects.filter(
-            jobID=job, status="PENDING"
-        ).count()
-
-        pending_rate_changes = DailyRateChange.objects.filter(
-            jobID=job, status="PENDING"
-        ).count()
-
         duration_days = int(getattr(job, "duration_days", 0) or 0)
         actual_days_worked = int(getattr(job, "total_days_worked", 0) or 0)
         qa_day_offset = max(0, int(getattr(job, "qa_day_offset", 0) or 0))
@@ -1139,11 +1251,11 @@ class DailyPaymentService:
             "actual_days_worked": actual_days_worked,
             "qa_day_offset": qa_day_offset,
             "attendance": {
-                "total_records": attendance_records.count(),
-                "pending_confirmation": pending_confirmation,
+                "total_records": counts["total_records"],
+                "pending_confirmation": counts["pending_confirmation"],
                 "days_present": days_present,
                 "days_half": days_half,
-                "days_absent": days_absent,
+                "days_absent": counts["days_absent"],
             },
             "payments": {
                 "total_earned": float(total_earned),
@@ -1154,11 +1266,38 @@ class DailyPaymentService:
                 "net_expected_earnings": float(net_expected_earnings),
             },
             "pending_requests": {
-                "extensions": pending_extensions,
-                "rate_changes": pending_rate_changes,
+                "extensions": counts["pending_extensions"],
+                "rate_changes": counts["pending_rate_changes"],
             },
         }
 
+    @staticmethod
+    def get_daily_summary(job: Job) -> Dict[str, Any]:
+        """
+        Get a summary of daily attendance and payments for a job.
+        Counters come from the per-job cache (see invalidate_daily_summary).
+        """
+        if job.payment_model != "DAILY":
+            return {"error": "Job is not a daily-rate job"}
+
+        counts = DailyPaymentService._get_summary_counts([job.jobID])
+        return DailyPaymentService._build_daily_summary(job, counts[job.jobID])
+
+    @staticmethod
+    def get_daily_summaries(jobs: List[Job]) -> Dict[int, Dict[str, Any]]:
+        """
+        Batch variant of get_daily_summary for agency/admin views.
+        Returns {job_id: summary}; non-daily jobs are skipped.
+        """
+        daily_jobs = [job for job in jobs if job.payment_model == "DAILY"]
+        counts = DailyPaymentService._get_summary_counts(
+            [job.jobID for job in daily_jobs]
+        )
+        return {
+            job.jobID: DailyPaymentService._build_daily_summary(job, counts[job.jobID])
+            for job in daily_jobs
+        }
+
     @staticmethod
     @transaction.atomic
     def cancel_remaining_days(
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from jobs.availability_index import rebuild_intervals
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the ScheduleInterval availability index for every busy job "
+        "(and drop rows for jobs that are no longer busy)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count jobs that would be resynced without writing anything.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Jobs selected per batch.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=0,
+            help="Optional max number of jobs to inspect.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = bool(options.get("dry_run"))
+        result = rebuild_intervals(
+            batch_size=max(1, int(options.get("batch_size") or 500)),
+            dry_run=dry_run,
+            limit=int(options.get("limit") or 0),
+        )
+        mode_label = "DRY-RUN" if dry_run else "EXECUTE"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Schedule intervals rebuilt. jobs={result['candidates']}, "
+                f"changed={result['repaired']}, mode={mode_label}"
+            )
+        )
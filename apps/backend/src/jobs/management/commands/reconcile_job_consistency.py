@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.consistency_reconciler import CHECKS, DEFAULT_BATCH_SIZE, run_reconciler
+
+
+class Command(BaseCommand):
+    help = (
+        "Repair job/assignment lifecycle drift in batches (stale team "
+        "assignments, missing date windows, stuck team completions/starts, "
+        "stuck backjob disputes). Per-row checks only scan rows changed since "
+        "their last run unless --full is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="append",
+            choices=sorted(CHECKS),
+            help="Run only this check (repeatable). Defaults to all checks.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count candidates without writing anything.",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignore the per-check watermarks and rescan every candidate.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Rows selected per batch.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=0,
+            help="Optional max number of candidate rows to inspect per check.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = bool(options.get("dry_run"))
+        try:
+            metrics = run_reconciler(
+                checks=options.get("check"),
+                batch_size=max(1, int(options.get("batch_size") or DEFAULT_BATCH_SIZE)),
+                dry_run=dry_run,
+                limit=int(options.get("limit") or 0),
+                full=bool(options.get("full")),
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        failed = 0
+        for entry in metrics:
+            line = (
+                f"{entry['check']}: candidates={entry['candidates']}, "
+                f"repaired={entry['repaired']}, "
+                f"since={entry['since'].isoformat() if entry['since'] else 'full'}, "
+                f"duration_ms={entry['duration_ms']}"
+            )
+            if entry["error"]:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f"{line}, error={entry['error']}"))
+            else:
+                self.stdout.write(line)
+
+        mode_label = "DRY-RUN" if dry_run else "EXECUTE"
+        style = self.style.WARNING if failed else self.style.SUCCESS
+        self.stdout.write(
+            style(f"Reconcile complete. checks={len(metrics)}, failed={failed}, mode={mode_label}")
+        )
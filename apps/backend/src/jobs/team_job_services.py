@@ -8,7 +8,7 @@ from typing import Optional
 from zoneinfo import ZoneInfo
 from django.conf import settings
 from django.db import transaction, IntegrityError
-from django.db.models import Sum, Count, Q
+from django.db.models import Sum, Count, Prefetch, Q
 from django.utils import timezone
 
 from accounts.models import (
@@ -39,6 +39,10 @@ from jobs.start_date_action_lock import get_start_date_action_lock_payload
 
 PH_TIMEZONE = ZoneInfo("Asia/Manila")
 
+# Assignment statuses that occupy a team skill slot opening.
+TEAM_SLOT_FILLED_WORKER_STATUSES = ["ACTIVE", "COMPLETED"]
+TEAM_SLOT_FILLED_EMPLOYEE_STATUSES = ["ASSIGNED", "IN_PROGRESS", "COMPLETED"]
+
 
 def _get_effective_work_date(job: Job):
     """Get effective work date with TESTING-only QA offset applied."""
@@ -1275,24 +1279,6 @@ def _job_date_window(job) -> tuple:
     return (start_date, end_date)
 
 
-def _windows_overlap(start_a, end_a, start_b, end_b) -> bool:
-    """Inclusive overlap check between two date windows."""
-    if not all([start_a, end_a, start_b, end_b]):
-        return False
-    return start_a <= end_b and end_a >= start_b
-
-
-def _shifts_conflict(shift_a, shift_b) -> bool:
-    """
-    Return True if two shifts conflict (cannot be worked simultaneously).
-    Only MORNING + NIGHT is non-conflicting.
-    Legacy rows (None) always conflict conservatively.
-    """
-    if not shift_a or not shift_b:
-        return True
-    return frozenset([shift_a, shift_b]) != frozenset(["MORNING", "NIGHT"])
-
-
 def find_worker_schedule_conflict(
     worker_profile: WorkerProfile,
     target_job: Job,
@@ -1305,57 +1291,22 @@ def find_worker_schedule_conflict(
     If target job has no schedule, conservatively block on any active assignment.
     If target job has schedule, block on overlapping windows and on active jobs missing dates.
     Multi-shift: MORNING + NIGHT is non-conflicting; pass applied_shift to allow that combo.
+    Backed by the ScheduleInterval index (see jobs/availability_index.py).
     """
-    target_start, target_end = _job_date_window(target_job)
+    from jobs.availability_index import find_worker_conflict_job_id, job_window
+
     # Effective shift of the incoming job/application
     incoming_shift = applied_shift or getattr(target_job, "shift_type", None)
 
-    direct_jobs = Job.objects.filter(
-        assignedWorkerID=worker_profile,
-        status__in=[Job.JobStatus.ACTIVE, Job.JobStatus.IN_PROGRESS],
+    conflict_job_id = find_worker_conflict_job_id(
+        worker_profile.pk,
+        job_window(target_job),
+        incoming_shift=incoming_shift,
+        exclude_job_id=exclude_job_id,
     )
-    if exclude_job_id:
-        direct_jobs = direct_jobs.exclude(jobID=exclude_job_id)
-
-    team_assignments = JobWorkerAssignment.objects.filter(
-        workerID=worker_profile,
-        assignment_status="ACTIVE",
-        jobID__status__in=[Job.JobStatus.ACTIVE, Job.JobStatus.IN_PROGRESS],
-    ).select_related("jobID")
-    if exclude_job_id:
-        team_assignments = team_assignments.exclude(jobID__jobID=exclude_job_id)
-
-    if not target_start:
-        for job in direct_jobs:
-            if _shifts_conflict(getattr(job, "shift_type", None), incoming_shift):
-                return job
-        for ta in team_assignments:
-            if _shifts_conflict(getattr(ta, "assigned_shift", None), incoming_shift):
-                return ta.jobID
+    if conflict_job_id is None:
         return None
-
-    for job in direct_jobs:
-        if not _shifts_conflict(getattr(job, "shift_type", None), incoming_shift):
-            continue  # Non-conflicting shifts — no block
-        start_date, end_date = _job_date_window(job)
-        if not start_date:
-            return job
-        if _windows_overlap(start_date, end_date, target_start, target_end):
-            return job
-
-    for assignment in team_assignments:
-        if not _shifts_conflict(
-            getattr(assignment, "assigned_shift", None), incoming_shift
-        ):
-            continue  # Non-conflicting shifts — no block
-        job = assignment.jobID
-        start_date, end_date = _job_date_window(job)
-        if not start_date:
-            return job
-        if _windows_overlap(start_date, end_date, target_start, target_end):
-            return job
-
-    return None
+    return Job.objects.filter(jobID=conflict_job_id).first()
 
 
 def calculate_budget_allocation(
@@ -1909,16 +1860,49 @@ def get_team_job_detail(job_id: int, requesting_user=None) -> dict:
     Get full team job details including skill slots, worker assignments,
     and agency employee assignments (for mixed team jobs).
     """
+    # All filtering happens in the Prefetch querysets (to_attr lists) so the
+    # whole detail renders in a fixed number of queries regardless of slot count.
     try:
         job = (
             Job.objects.select_related("clientID__profileID")
             .prefetch_related(
-                "skill_slots__specializationID",
-                "skill_slots__invited_agency",
-                "skill_slots__worker_assignments__workerID__profileID",
-                "skill_slots__employee_slot_assignments__employee",
-                "worker_assignments__workerID__profileID",
-                "worker_assignments__skillSlotID__specializationID",
+                Prefetch(
+                    "skill_slots",
+                    queryset=JobSkillSlot.objects.select_related(
+                        "specializationID", "invited_agency"
+                    ).prefetch_related(
+                        Prefetch(
+                            "worker_assignments",
+                            queryset=JobWorkerAssignment.objects.filter(
+                                assignment_status__in=TEAM_SLOT_FILLED_WORKER_STATUSES
+                            ),
+                            to_attr="filled_worker_assignments",
+                        ),
+                        Prefetch(
+                            "employee_slot_assignments",
+                            queryset=JobEmployeeAssignment.objects.filter(
+                                status__in=TEAM_SLOT_FILLED_EMPLOYEE_STATUSES
+                            ).select_related("employee"),
+                            to_attr="filled_employee_assignments",
+                        ),
+                    ),
+                    to_attr="prefetched_skill_slots",
+                ),
+                Prefetch(
+                    "worker_assignments",
+                    queryset=JobWorkerAssignment.objects.select_related(
+                        "workerID__profileID", "skillSlotID__specializationID"
+                    ),
+                    to_attr="prefetched_worker_assignments",
+                ),
+                Prefetch(
+                    "employee_assignments",
+                    queryset=JobEmployeeAssignment.objects.filter(
+                        skill_slot__isnull=False,
+                        status__in=TEAM_SLOT_FILLED_EMPLOYEE_STATUSES,
+                    ).select_related("employee", "skill_slot__specializationID"),
+                    to_attr="filled_slot_employee_assignments",
+                ),
             )
             .get(jobID=job_id)
         )
@@ -1930,14 +1914,9 @@ def get_team_job_detail(job_id: int, requesting_user=None) -> dict:
 
     # Build skill slots detail
     skill_slots = []
-    for slot in job.skill_slots.all():
-        worker_count = slot.worker_assignments.filter(
-            assignment_status__in=["ACTIVE", "COMPLETED"]
-        ).count()
-
-        employee_count = slot.employee_slot_assignments.filter(
-            status__in=["ASSIGNED", "IN_PROGRESS", "COMPLETED"]
-        ).count()
+    for slot in job.prefetched_skill_slots:
+        worker_count = len(slot.filled_worker_assignments)
+        employee_count = len(slot.filled_employee_assignments)
 
         assigned_count = worker_count + employee_count
 
@@ -1976,9 +1955,7 @@ def get_team_job_detail(job_id: int, requesting_user=None) -> dict:
 
         # Employee assignments for this slot
         slot_employees = []
-        for emp_assign in slot.employee_slot_assignments.filter(
-            status__in=["ASSIGNED", "IN_PROGRESS", "COMPLETED"]
-        ):
+        for emp_assign in slot.filled_employee_assignments:
             slot_employees.append(
                 {
                     "assignment_id": emp_assign.assignmentID,
@@ -2019,7 +1996,7 @@ def get_team_job_detail(job_id: int, requesting_user=None) -> dict:
 
     # Build freelance worker assignments detail
     worker_assignments = []
-    for assignment in job.worker_assignments.all():
+    for assignment in job.prefetched_worker_assignments:
         worker = assignment.workerID
         profile = worker.profileID
         skill_slot = assignment.skillSlotID
@@ -2060,16 +2037,8 @@ def get_team_job_detail(job_id: int, requesting_user=None) -> dict:
         )
 
     # Build agency employee assignments detail (across all slots)
-    employee_assignments_list = list(
-        JobEmployeeAssignment.objects.filter(
-            job=job,
-            skill_slot__isnull=False,
-            status__in=["ASSIGNED", "IN_PROGRESS", "COMPLETED"],
-        ).select_related("employee", "skill_slot__specializationID")
-    )
-
     agency_employee_assignments = []
-    for emp_assign in employee_assignments_list:
+    for emp_assign in job.filled_slot_employee_assignments:
         slot = emp_assign.skill_slot
         specialization = slot.specializationID if slot else None
         specialization_name = (
@@ -1,7 +1,11 @@
+from datetime import timedelta
 from decimal import Decimal
 
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.core.management import call_command
 from django.utils import timezone
 
@@ -10,11 +14,14 @@ from accounts.models import (
     Agency,
     ClientProfile,
     DailyAttendance,
+    DailyJobExtension,
     Job,
+    JobDispute,
     JobEmployeeAssignment,
     JobSkillSlot,
     JobWorkerAssignment,
     Profile,
+    ScheduleInterval,
     Specializations,
     Wallet,
     WorkerProfile,
@@ -26,8 +33,18 @@ from jobs.team_job_services import (
     confirm_team_worker_arrival,
     create_team_job,
     early_complete_single_project_job,
+    find_worker_schedule_conflict,
+    get_team_job_detail,
 )
+from jobs.availability_index import find_worker_conflict_job_id, job_window
 from jobs.cancellation_service import cancel_job_with_scenarios
+from jobs.consistency_reconciler import (
+    reconcile_backjob_dispute_state,
+    reconcile_stale_team_assignments,
+    reconcile_team_start_status,
+    run_reconciler,
+)
+from jobs.daily_payment_service import DailyPaymentService
 from jobs.api import accept_job_invite_worker, confirm_project_employee_arrival
 from jobs.text_moderation import validate_job_post_content
 from agency.services import get_agency_jobs, assign_employees_to_slots
@@ -361,6 +378,26 @@ class AgencyHybridInviteCompatibilityTests(TestCase):
         self.assertEqual(result["jobs"][0]["inviteStatus"], "PENDING")
         self.assertEqual(result["jobs"][0]["is_team_job"], True)
 
+    def test_get_agency_jobs_attaches_daily_summaries(self):
+        self._create_direct_agency_team_job(invite_status="ACCEPTED", status="ACTIVE")
+        daily_job = self._create_direct_agency_team_job(invite_status="ACCEPTED", status="ACTIVE")
+        daily_job.payment_model = "DAILY"
+        daily_job.daily_rate_agreed = Decimal("800.00")
+        daily_job.duration_days = 3
+        daily_job.daily_escrow_total = Decimal("2400.00")
+        daily_job.save()
+
+        result = get_agency_jobs(account_id=self.agency_account.accountID)
+
+        summaries = {job["jobID"]: job["daily_summary"] for job in result["jobs"]}
+        self.assertEqual(len(summaries), 2)
+        self.assertEqual(summaries[daily_job.jobID]["daily_rate"], 800.0)
+        self.assertEqual(summaries[daily_job.jobID]["attendance"]["total_records"], 0)
+        self.assertEqual(
+            [summary for job_id, summary in summaries.items() if job_id != daily_job.jobID],
+            [None],
+        )
+
     def test_accept_job_invite_falls_back_for_team_job_without_slot_invites(self):
         job = self._create_direct_agency_team_job(invite_status="PENDING", status="ACTIVE")
 
@@ -438,6 +475,52 @@ class AgencyHybridInviteCompatibilityTests(TestCase):
         self.assertEqual(slot.invited_agency_id, self.agency.agencyId)
         self.assertEqual(slot.agency_invite_status, "ACCEPTED")
 
+    def test_assign_slots_rejects_busy_and_unknown_employees(self):
+        job = self._create_direct_agency_team_job(invite_status="ACCEPTED", status="ACTIVE")
+        slot = JobSkillSlot.objects.create(
+            jobID=job,
+            specializationID=self.specialization,
+            workers_needed=2,
+            budget_allocated=Decimal("1000.00"),
+            skill_level_required="ENTRY",
+            status="OPEN",
+        )
+        free, busy = [
+            AgencyEmployee.objects.create(
+                agency=self.agency_account,
+                name=f"Employee {n}",
+                firstName="Employee",
+                lastName=str(n),
+                specializations='["Masonry"]',
+                isActive=True,
+            )
+            for n in range(2)
+        ]
+        other_job = self._create_direct_agency_team_job(invite_status="ACCEPTED", status="IN_PROGRESS")
+        other_job.title = "Other site"
+        other_job.assignedEmployeeID = busy
+        other_job.save()
+
+        def assign(*employee_ids):
+            return assign_employees_to_slots(
+                agency_account=self.agency_account,
+                job_id=job.jobID,
+                assignments=[
+                    {"skill_slot_id": slot.skillSlotID, "employee_id": employee_id}
+                    for employee_id in employee_ids
+                ],
+                primary_contact_employee_id=free.employeeID,
+            )
+
+        result = assign(free.employeeID, busy.employeeID)
+        self.assertFalse(result["success"])
+        self.assertIn('already working on "Other site"', result["error"])
+
+        result = assign(free.employeeID, 999999)
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "Employee 999999 not found or not in your agency")
+        self.assertFalse(JobEmployeeAssignment.objects.filter(job=job).exists())
+
     def test_reject_job_invite_falls_back_for_team_job_without_slot_invites(self):
         job = self._create_direct_agency_team_job(invite_status="PENDING", status="ACTIVE")
 
@@ -953,3 +1036,516 @@ class AgencyEmployeeCancellationAvailabilityTests(TestCase):
 
         after = get_employee_workload(self.agency_account, employee.employeeID)
         self.assertEqual(after["availability"], "AVAILABLE")
+
+
+class DailySummaryAggregationTests(TestCase):
+    def setUp(self):
+        self.client_account = Accounts.objects.create_user(
+            email="daily-summary-client@test.com",
+            password="password123",
+            isVerified=True,
+        )
+        self.worker_account = Accounts.objects.create_user(
+            email="daily-summary-worker@test.com",
+            password="password123",
+            isVerified=True,
+        )
+        self.client_profile = Profile.objects.create(
+            accountFK=self.client_account,
+            profileType="CLIENT",
+            firstName="Daily",
+            lastName="Client",
+        )
+        self.client_record = ClientProfile.objects.create(
+            profileID=self.client_profile,
+            description="",
+            totalJobsPosted=0,
+            clientRating=0,
+            activeJobsCount=0,
+        )
+        worker_profile = Profile.objects.create(
+            accountFK=self.worker_account,
+            profileType="WORKER",
+            firstName="Daily",
+            lastName="Worker",
+        )
+        self.worker_record = WorkerProfile.objects.create(profileID=worker_profile)
+
+    def _create_daily_job(self, title="Daily summary job"):
+        return Job.objects.create(
+            clientID=self.client_record,
+            title=title,
+            description="desc",
+            budget=Decimal("5000.00"),
+            location="Test",
+            status="IN_PROGRESS",
+            payment_model="DAILY",
+            daily_rate_agreed=Decimal("1000.00"),
+            duration_days=5,
+            daily_escrow_total=Decimal("5000.00"),
+            assignedWorkerID=self.worker_record,
+        )
+
+    def _attendance(self, job, day, status, **extra):
+        return DailyAttendance.objects.create(
+            jobID=job,
+            workerID=self.worker_record,
+            date=timezone.localdate() - timedelta(days=day),
+            status=status,
+            **extra,
+        )
+
+    def test_summary_counts_and_cache_invalidation(self):
+        job = self._create_daily_job()
+        self._attendance(
+            job, 1, "PRESENT",
+            payment_processed=True, amount_earned=Decimal("1000.00"),
+        )
+        self._attendance(job, 2, "HALF_DAY")
+        self._attendance(
+            job, 3, "ABSENT",
+            absent_penalty_applied=True, absent_penalty_amount=Decimal("100.00"),
+        )
+
+        summary = DailyPaymentService.get_daily_summary(job)
+        self.assertEqual(summary["attendance"]["total_records"], 3)
+        self.assertEqual(summary["attendance"]["days_present"], 1)
+        self.assertEqual(summary["attendance"]["days_half"], 1)
+        self.assertEqual(summary["attendance"]["days_absent"], 1)
+        self.assertEqual(summary["payments"]["total_earned"], 1000.0)
+        self.assertEqual(summary["payments"]["gross_expected_earnings"], 1500.0)
+        self.assertEqual(summary["payments"]["net_expected_earnings"], 1400.0)
+        self.assertEqual(summary["pending_requests"]["extensions"], 0)
+
+        with self.assertNumQueries(0):
+            DailyPaymentService.get_daily_summary(job)
+
+        self._attendance(job, 4, "PENDING")
+        DailyJobExtension.objects.create(
+            jobID=job,
+            additional_days=1,
+            additional_escrow=Decimal("1000.00"),
+            reason="One more day",
+            requested_by=DailyJobExtension.RequestedBy.CLIENT,
+            requestedByUser=self.client_account,
+        )
+
+        summary = DailyPaymentService.get_daily_summary(job)
+        self.assertEqual(summary["attendance"]["total_records"], 4)
+        self.assertEqual(summary["attendance"]["pending_confirmation"], 1)
+        self.assertEqual(summary["pending_requests"]["extensions"], 1)
+
+    def test_cold_summary_uses_two_queries(self):
+        job = self._create_daily_job()
+        self._attendance(job, 1, "PRESENT")
+        DailyPaymentService.invalidate_daily_summary(job.jobID)
+
+        with self.assertNumQueries(2):
+            summary = DailyPaymentService.get_daily_summary(job)
+
+        self.assertEqual(summary["attendance"]["days_present"], 1)
+
+    def test_batch_summaries_use_two_queries(self):
+        jobs = [self._create_daily_job(title=f"Daily batch {i}") for i in range(3)]
+        for job in jobs:
+            self._attendance(job, 1, "PRESENT")
+            DailyPaymentService.invalidate_daily_summary(job.jobID)
+
+        with self.assertNumQueries(2):
+            summaries = DailyPaymentService.get_daily_summaries(jobs)
+
+        self.assertEqual(set(summaries.keys()), {job.jobID for job in jobs})
+        for job in jobs:
+            self.assertEqual(summaries[job.jobID]["attendance"]["days_present"], 1)
+
+
+class TeamJobDetailQueryCountTests(TestCase):
+    def setUp(self):
+        client_account = Accounts.objects.create_user(
+            email="team-detail-client@test.com",
+            password="password123",
+            isVerified=True,
+        )
+        client_profile = Profile.objects.create(
+            accountFK=client_account,
+            profileType="CLIENT",
+            firstName="Team",
+            lastName="Client",
+        )
+        self.client_record = ClientProfile.objects.create(
+            profileID=client_profile,
+            description="",
+            totalJobsPosted=0,
+            clientRating=0,
+            activeJobsCount=0,
+        )
+        self.workers = []
+        for index in range(4):
+            account = Accounts.objects.create_user(
+                email=f"team-detail-worker{index}@test.com",
+                password="password123",
+                isVerified=True,
+            )
+            profile = Profile.objects.create(
+                accountFK=account,
+                profileType="WORKER",
+                firstName="Worker",
+                lastName=str(index),
+            )
+            self.workers.append(WorkerProfile.objects.create(profileID=profile))
+
+    def _create_team_job(self, slot_count):
+        job = Job.objects.create(
+            clientID=self.client_record,
+            title=f"Team detail {slot_count}",
+            description="desc",
+            budget=Decimal("8000.00"),
+            location="Test",
+            is_team_job=True,
+        )
+        for slot_index in range(slot_count):
+            specialization = Specializations.objects.create(
+                specializationName=f"Detail skill {slot_count}-{slot_index}",
+                minimumRate=Decimal("500.00"),
+            )
+            slot = JobSkillSlot.objects.create(
+                jobID=job,
+                specializationID=specialization,
+                workers_needed=2,
+                budget_allocated=Decimal("2000.00"),
+            )
+            for index, worker in enumerate(self.workers[:2]):
+                JobWorkerAssignment.objects.create(
+                    jobID=job,
+                    skillSlotID=slot,
+                    workerID=worker,
+                    slot_position=index + 1,
+                    assignment_status=JobWorkerAssignment.AssignmentStatus.ACTIVE,
+                )
+        return job
+
+    def _count_detail_queries(self, job):
+        with CaptureQueriesContext(connection) as ctx:
+            detail = get_team_job_detail(job.jobID)
+        return len(ctx.captured_queries), detail
+
+    def test_detail_query_count_does_not_grow_with_slots(self):
+        small_queries, small = self._count_detail_queries(self._create_team_job(1))
+        large_queries, large = self._count_detail_queries(self._create_team_job(4))
+
+        self.assertEqual(small_queries, large_queries)
+        self.assertEqual(large["total_workers_needed"], 8)
+        self.assertEqual(large["total_workers_assigned"], 8)
+        self.assertEqual(
+            [slot["freelancers_assigned"] for slot in large["skill_slots"]],
+            [2, 2, 2, 2],
+        )
+        self.assertEqual(len(small["worker_assignments"]), 2)
+
+
+class ConsistencyReconcilerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        client_account = Accounts.objects.create_user(
+            email="reconcile-client@test.com",
+            password="password123",
+            isVerified=True,
+        )
+        client_profile = Profile.objects.create(
+            accountFK=client_account,
+            profileType="CLIENT",
+            firstName="Reconcile",
+            lastName="Client",
+        )
+        self.client_record = ClientProfile.objects.create(
+            profileID=client_profile,
+            description="",
+            totalJobsPosted=0,
+            clientRating=0,
+            activeJobsCount=0,
+        )
+        worker_account = Accounts.objects.create_user(
+            email="reconcile-worker@test.com",
+            password="password123",
+            isVerified=True,
+        )
+        worker_profile = Profile.objects.create(
+            accountFK=worker_account,
+            profileType="WORKER",
+            firstName="Reconcile",
+            lastName="Worker",
+        )
+        self.worker = WorkerProfile.objects.create(profileID=worker_profile)
+        self.specialization = Specializations.objects.create(
+            specializationName="Reconcile skill",
+            minimumRate=Decimal("500.00"),
+        )
+
+    def _active_assignment(self, status, **job_fields):
+        job = Job.objects.create(
+            clientID=self.client_record,
+            title=f"Reconcile {status}",
+            description="desc",
+            budget=Decimal("3000.00"),
+            location="Test",
+            is_team_job=True,
+            status=status,
+            **job_fields,
+        )
+        slot = JobSkillSlot.objects.create(
+            jobID=job,
+            specializationID=self.specialization,
+            workers_needed=1,
+            budget_allocated=Decimal("3000.00"),
+        )
+        return JobWorkerAssignment.objects.create(
+            jobID=job,
+            skillSlotID=slot,
+            workerID=self.worker,
+            assignment_status=JobWorkerAssignment.AssignmentStatus.ACTIVE,
+        )
+
+    def test_stale_team_assignments_repaired_in_batches(self):
+        cancelled = self._active_assignment("CANCELLED")
+        completed = self._active_assignment("COMPLETED")
+        in_progress = self._active_assignment("IN_PROGRESS")
+
+        dry = reconcile_stale_team_assignments(batch_size=1, dry_run=True)
+        self.assertEqual(dry, {"candidates": 2, "repaired": 0})
+        cancelled.refresh_from_db()
+        self.assertEqual(cancelled.assignment_status, "ACTIVE")
+
+        result = reconcile_stale_team_assignments(batch_size=1)
+        self.assertEqual(result, {"candidates": 2, "repaired": 2})
+
+        cancelled.refresh_from_db()
+        completed.refresh_from_db()
+        in_progress.refresh_from_db()
+        self.assertEqual(cancelled.assignment_status, "REMOVED")
+        self.assertEqual(completed.assignment_status, "COMPLETED")
+        self.assertEqual(in_progress.assignment_status, "ACTIVE")
+
+    def test_run_reconciler_reports_metrics_per_check(self):
+        self._active_assignment("CANCELLED")
+
+        metrics = run_reconciler(checks=["stale_team_assignments"])
+
+        self.assertEqual(len(metrics), 1)
+        self.assertEqual(metrics[0]["check"], "stale_team_assignments")
+        self.assertEqual(metrics[0]["repaired"], 1)
+        self.assertIsNone(metrics[0]["error"])
+        self.assertIn("duration_ms", metrics[0])
+
+        with self.assertRaises(ValueError):
+            run_reconciler(checks=["unknown_check"])
+
+    def _dispute(self, job, **fields):
+        return JobDispute.objects.create(
+            jobID=job,
+            disputedBy="CLIENT",
+            reason="Backjob",
+            description="Needs redo",
+            jobAmount=Decimal("3000.00"),
+            **fields,
+        )
+
+    def test_team_start_skips_completion_flags_and_active_backjobs(self):
+        ready = self._active_assignment("ACTIVE").jobID
+        flagged = self._active_assignment("ACTIVE", clientMarkedComplete=True).jobID
+        early = self._active_assignment("ACTIVE")
+        JobWorkerAssignment.objects.filter(pk=early.pk).update(early_completed=True)
+        backjob = self._active_assignment("ACTIVE").jobID
+        self._dispute(backjob)
+
+        result = reconcile_team_start_status()
+
+        self.assertEqual(result, {"candidates": 1, "repaired": 1})
+        for job, status in ((ready, "IN_PROGRESS"), (flagged, "ACTIVE"), (early.jobID, "ACTIVE"), (backjob, "ACTIVE")):
+            job.refresh_from_db()
+            self.assertEqual(job.status, status)
+
+    def test_stuck_backjob_disputes_are_normalized(self):
+        job = self._active_assignment("COMPLETED").jobID
+        stuck = self._dispute(job, status="IN_NEGOTIATION", backjobStarted=True)
+        admin_resolved = self._dispute(job, status="RESOLVED", workerMarkedBackjobComplete=True)
+
+        result = reconcile_backjob_dispute_state()
+
+        self.assertEqual(result, {"candidates": 1, "repaired": 1})
+        stuck.refresh_from_db()
+        admin_resolved.refresh_from_db()
+        self.assertEqual(stuck.status, "UNDER_REVIEW")
+        self.assertEqual(admin_resolved.status, "RESOLVED")
+
+    def test_incremental_runs_skip_rows_older_than_the_watermark(self):
+        first = run_reconciler(checks=["team_start_status"])
+        self.assertIsNone(first[0]["since"])
+
+        assignment = self._active_assignment("ACTIVE")
+        old = timezone.now() - timedelta(hours=1)
+        Job.objects.filter(pk=assignment.jobID_id).update(updatedAt=old)
+        JobSkillSlot.objects.filter(jobID=assignment.jobID_id).update(updatedAt=old)
+        JobWorkerAssignment.objects.filter(pk=assignment.pk).update(updatedAt=old)
+
+        incremental = run_reconciler(checks=["team_start_status"])
+        self.assertIsNotNone(incremental[0]["since"])
+        self.assertEqual(incremental[0]["candidates"], 0)
+
+        full = run_reconciler(checks=["team_start_status"], full=True)
+        self.assertIsNone(full[0]["since"])
+        self.assertEqual(full[0]["repaired"], 1)
+
+
+class ScheduleIntervalIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        client_account = Accounts.objects.create_user(
+            email="interval-client@test.com",
+            password="password123",
+            isVerified=True,
+        )
+        client_profile = Profile.objects.create(
+            accountFK=client_account,
+            profileType="CLIENT",
+            firstName="Interval",
+            lastName="Client",
+        )
+        self.client_record = ClientProfile.objects.create(
+            profileID=client_profile,
+            description="",
+            totalJobsPosted=0,
+            clientRating=0,
+            activeJobsCount=0,
+        )
+        self.workers = []
+        for index in range(2):
+            account = Accounts.objects.create_user(
+                email=f"interval-worker{index}@test.com",
+                password="password123",
+                isVerified=True,
+            )
+            profile = Profile.objects.create(
+                accountFK=account,
+                profileType="WORKER",
+                firstName="Interval",
+                lastName=f"Worker{index}",
+            )
+            self.workers.append(WorkerProfile.objects.create(profileID=profile))
+        self.specialization = Specializations.objects.create(
+            specializationName="Interval skill",
+            minimumRate=Decimal("500.00"),
+        )
+        self.today = timezone.localdate()
+
+    def _job(self, start_offset, days=1, **fields):
+        start = self.today + timedelta(days=start_offset)
+        fields.setdefault("status", "ACTIVE")
+        return Job.objects.create(
+            clientID=self.client_record,
+            title=f"Interval job {start_offset}",
+            description="desc",
+            budget=Decimal("1000.00"),
+            location="Test",
+            preferredStartDate=start,
+            scheduled_end_date=start + timedelta(days=days - 1),
+            **fields,
+        )
+
+    def _target(self, start_offset, days=1, shift_type="ANY"):
+        start = self.today + timedelta(days=start_offset)
+        return Job(
+            preferredStartDate=start,
+            scheduled_end_date=start + timedelta(days=days - 1),
+            shift_type=shift_type,
+        )
+
+    def test_direct_job_interval_drives_conflict_checks(self):
+        busy_job = self._job(0, days=3, assignedWorkerID=self.workers[0])
+        self.assertEqual(
+            ScheduleInterval.objects.filter(workerID=self.workers[0]).count(), 1
+        )
+
+        conflict = find_worker_schedule_conflict(self.workers[0], self._target(2))
+        self.assertEqual(conflict, busy_job)
+        self.assertIsNone(find_worker_schedule_conflict(self.workers[0], self._target(5)))
+        self.assertIsNone(
+            find_worker_schedule_conflict(
+                self.workers[0], self._target(1), exclude_job_id=busy_job.jobID
+            )
+        )
+
+        busy_job.status = "COMPLETED"
+        busy_job.save()
+        self.assertFalse(ScheduleInterval.objects.filter(jobID=busy_job).exists())
+        self.assertIsNone(find_worker_schedule_conflict(self.workers[0], self._target(1)))
+
+    def test_morning_and_night_shifts_do_not_conflict(self):
+        self._job(0, assignedWorkerID=self.workers[0], shift_type="MORNING")
+
+        self.assertIsNone(
+            find_worker_schedule_conflict(
+                self.workers[0], self._target(0, shift_type="NIGHT")
+            )
+        )
+        self.assertIsNotNone(
+            find_worker_schedule_conflict(
+                self.workers[0], self._target(0, shift_type="MORNING")
+            )
+        )
+
+    def test_team_assignment_rows_drive_worker_conflicts(self):
+        job = self._job(0, days=2, is_team_job=True)
+        slot = JobSkillSlot.objects.create(
+            jobID=job,
+            specializationID=self.specialization,
+            workers_needed=1,
+            budget_allocated=Decimal("1000.00"),
+        )
+        assignment = JobWorkerAssignment.objects.create(
+            jobID=job,
+            skillSlotID=slot,
+            workerID=self.workers[0],
+            assignment_status=JobWorkerAssignment.AssignmentStatus.ACTIVE,
+        )
+        window = job_window(self._target(0, days=2))
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(
+                find_worker_conflict_job_id(self.workers[0].pk, window), job.jobID
+            )
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIsNone(find_worker_conflict_job_id(self.workers[1].pk, window))
+
+        assignment.assignment_status = JobWorkerAssignment.AssignmentStatus.REMOVED
+        assignment.save()
+        self.assertIsNone(find_worker_conflict_job_id(self.workers[0].pk, window))
+
+    def test_reconciler_resyncs_bulk_status_drift(self):
+        job = self._job(0, assignedWorkerID=self.workers[0])
+        Job.objects.filter(jobID=job.jobID).update(status="CANCELLED")
+        self.assertTrue(ScheduleInterval.objects.filter(jobID=job).exists())
+
+        metrics = run_reconciler(checks=["schedule_intervals"])
+
+        self.assertEqual(metrics[0]["repaired"], 1)
+        self.assertFalse(ScheduleInterval.objects.filter(jobID=job).exists())
+
+    def test_incremental_reconcile_only_rebuilds_recently_changed_jobs(self):
+        stale = self._job(0, assignedWorkerID=self.workers[0])
+        fresh = self._job(2, assignedWorkerID=self.workers[1])
+        self.assertIsNone(run_reconciler(checks=["schedule_intervals"])[0]["since"])
+
+        Job.objects.filter(jobID=stale.jobID).update(
+            status="CANCELLED", updatedAt=timezone.now() - timedelta(hours=1)
+        )
+        Job.objects.filter(jobID=fresh.jobID).update(status="CANCELLED", updatedAt=timezone.now())
+
+        incremental = run_reconciler(checks=["schedule_intervals"])
+        self.assertIsNotNone(incremental[0]["since"])
+        self.assertEqual((incremental[0]["candidates"], incremental[0]["repaired"]), (1, 1))
+        self.assertFalse(ScheduleInterval.objects.filter(jobID=fresh).exists())
+        self.assertTrue(ScheduleInterval.objects.filter(jobID=stale).exists())
+
+        full = run_reconciler(checks=["schedule_intervals"], full=True)
+        self.assertEqual(full[0]["repaired"], 1)
+        self.assertFalse(ScheduleInterval.objects.filter(jobID=stale).exists())
@@ -18,6 +18,7 @@ from django.db import transaction as db_transaction
 from django.db.models import Q
 from django.conf import settings
 from datetime import datetime, timedelta
+from typing import Optional
 import re
 from zoneinfo import ZoneInfo
 from jobs.backjob_service import auto_start_agency_backjob_if_ready
@@ -619,40 +620,56 @@ def withdraw_funds(request, amount: float, payment_method_id: int, notes: str =
 
 
 @router.get("/wallet/transactions", auth=cookie_auth)
-def get_wallet_transactions(request):
-    """Get user's wallet transaction history"""
+def get_wallet_transactions(
+    request, cursor: Optional[str] = None, limit: int = 50, compact: bool = False
+):
+    """
+    Get user's wallet transaction history, newest first.
+    Pages continue from next_cursor (keyset, no COUNT); every row carries
+    the server-computed running_balance.
+    """
     try:
+        from accounts.ledger_service import get_transaction_history
+
         # Get wallet
         try:
             wallet = Wallet.objects.get(accountFK=request.auth)
         except Wallet.DoesNotExist:
-            return {"success": True, "transactions": []}
+            return {"success": True, "transactions": [], "next_cursor": None, "has_next": False}
 
-        # Get transactions
-        transactions = Transaction.objects.filter(walletID=wallet).order_by(
-            "-createdAt"
-        )[:50]  # Last 50 transactions
+        try:
+            transactions, meta = get_transaction_history(
+                wallet.walletID, cursor=cursor, limit=limit, compact=compact
+            )
+        except ValueError:
+            return Response({"error": "Invalid cursor"}, status=400)
 
-        transaction_list = [
-            {
+        transaction_list = []
+        for t in transactions:
+            row = {
                 "id": t.transactionID,
                 "type": t.transactionType,
                 "amount": float(t.amount),
                 "balance_after": float(t.balanceAfter),
+                "running_balance": float(t.running_balance),
                 "status": t.status,
-                "description": t.description,
-                "payment_method": t.paymentMethod,
-                "reference_number": t.referenceNumber,
                 "created_at": t.createdAt.isoformat(),
-                "completed_at": t.completedAt.isoformat() if t.completedAt else None,
             }
-            for t in transactions
-        ]
+            if not compact:
+                row.update({
+                    "description": t.description,
+                    "payment_method": t.paymentMethod,
+                    "reference_number": t.referenceNumber,
+                    "completed_at": t.completedAt.isoformat() if t.completedAt else None,
+                })
+            transaction_list.append(row)
 
         return {
             "success": True,
             "transactions": transaction_list,
             "current_balance": float(wallet.balance),
+            "next_cursor": meta["next_cursor"],
+            "has_next": meta["has_next"],
         }
 
     except Exception as e:
@@ -667,9 +684,13 @@ def get_wallet_transactions(request):
 def xendit_webhook(request):
     """
     Handle Xendit payment webhook callbacks
-    This endpoint is called by Xendit when payment status changes
+    This endpoint is called by Xendit when payment status changes.
+    The callback is verified and queued in the webhook inbox; the payment
+    is applied by accounts.webhook_inbox (duplicates are stored once).
     """
     try:
+        from accounts.models import WebhookEvent
+        from accounts.webhook_inbox import record_event, xendit_invoice_event_id
         from accounts.xendit_service import XenditService
         import json
 
@@ -684,53 +705,21 @@ def xendit_webhook(request):
             print(f"❌ Invalid webhook signature")
             return Response({"error": "Invalid webhook signature"}, status=401)
 
-        # Parse webhook data
-        webhook_data = XenditService.parse_webhook_payload(payload)
-        if not webhook_data:
+        event_id = xendit_invoice_event_id(payload, request.headers.get("webhook-id", ""))
+        if not event_id:
             return Response({"error": "Invalid webhook payload"}, status=400)
 
-        # Find transaction by Xendit invoice ID
-        try:
-            transaction = Transaction.objects.get(
-                xenditInvoiceID=webhook_data["invoice_id"]
-            )
-        except Transaction.DoesNotExist:
-            print(f"❌ Transaction not found for invoice {webhook_data['invoice_id']}")
-            return Response({"error": "Transaction not found"}, status=404)
-
-        # Update transaction based on status
-        invoice_status = webhook_data["status"]
-
-        if invoice_status == "PAID":
-            # Payment successful
-            wallet = transaction.walletID
-
-            # Update wallet balance
-            wallet.balance += transaction.amount
-            wallet.save()
-
-            # Update transaction
-            transaction.status = Transaction.TransactionStatus.COMPLETED
-            transaction.balanceAfter = wallet.balance
-            transaction.xenditPaymentID = webhook_data.get("payment_id")
-            transaction.xenditPaymentChannel = webhook_data.get("payment_channel")
-            transaction.xenditPaymentMethod = webhook_data.get("payment_method")
-            transaction.completedAt = timezone.now()
-            transaction.save()
-
-            print(f"✅ Payment completed for transaction {transaction.transactionID}")
-
-        elif invoice_status in ["EXPIRED", "FAILED"]:
-            # Payment failed or expired
-            transaction.status = Transaction.TransactionStatus.FAILED
-            transaction.description = f"{transaction.description} - {invoice_status}"
-            transaction.save()
-
-            print(
-                f"❌ Payment {invoice_status.lower()} for transaction {transaction.transactionID}"
-            )
-
-        return {"success": True, "message": "Webhook processed"}
+        event, created = record_event(
+            WebhookEvent.Provider.XENDIT_INVOICE,
+            event_id,
+            payload,
+            event_type=str(payload.get("status", "")),
+        )
+        return {
+            "success": True,
+            "message": "Webhook queued" if created else "Duplicate webhook ignored",
+            "event_id": event.webhookEventID,
+        }
 
     except Exception as e:
         print(f"❌ Error processing webhook: {str(e)}")
@@ -989,7 +978,10 @@ def get_conversations(request, filter: str = "all"):
             .select_related(
                 "client__accountFK",
                 "worker__accountFK",
-                "relatedJobPosting",
+                "agency",
+                "relatedJobPosting__clientID__profileID__accountFK",
+                "relatedJobPosting__assignedWorkerID__profileID__accountFK",
+                "relatedJobPosting__assignedAgencyFK__accountFK",
                 "lastMessageSender",
             )
             .distinct()
@@ -1156,9 +1148,18 @@ def get_conversations(request, filter: str = "all"):
                     )
                 )
 
-        conversations = conversations_query.order_by("-updatedAt")
+        conversations = list(conversations_query.order_by("-updatedAt"))
 
-        print(f"📊 After filters: {conversations.count()} conversations")
+        print(f"📊 After filters: {len(conversations)} conversations")
+
+        # (job, reviewer) pairs for every listed job, for the 1:1 review flags
+        from accounts.models import JobReview
+
+        reviewed_pairs = set(
+            JobReview.objects.filter(
+                jobID_id__in={conv.relatedJobPosting_id for conv in conversations}
+            ).values_list("jobID_id", "reviewerID_id")
+        )
 
         result = []
         for conv in conversations:
@@ -1339,9 +1340,6 @@ def get_conversations(request, filter: str = "all"):
             # Check if archived by current user
             is_archived = conv.archivedByClient if is_client else conv.archivedByWorker
 
-            # Check review status for this job
-            from accounts.models import JobReview
-
             # Worker account can be from assignedWorkerID or assignedAgencyFK
             worker_account = None
             if job.assignedWorkerID:
@@ -1401,9 +1399,7 @@ def get_conversations(request, filter: str = "all"):
                     client_reviewed = client_reviews_count >= total_workers
                     all_team_workers_reviewed = client_reviewed
             elif worker_account and client_account:
-                worker_reviewed = JobReview.objects.filter(
-                    jobID=job, reviewerID=worker_account
-                ).exists()
+                worker_reviewed = (job.jobID, worker_account.accountID) in reviewed_pairs
 
                 if is_agency_job:
                     # For agency jobs, client reviews the agency.
@@ -1453,9 +1449,7 @@ def get_conversations(request, filter: str = "all"):
                         ).exists()
                     )
                 else:
-                    client_reviewed = JobReview.objects.filter(
-                        jobID=job, reviewerID=client_account
-                    ).exists()
+                    client_reviewed = (job.jobID, client_account.accountID) in reviewed_pairs
 
             result.append(
                 {
@@ -1571,50 +1565,9 @@ def get_conversation_by_job(request, job_id: int, reopen: bool = False):
                 {"error": "You are not a participant of this job"}, status=403
             )
 
-        # Auto-heal edge case: mixed/team DAILY jobs where all assignments were
-        # early-completed but lifecycle flags remained stuck pre-completion.
-        if is_client and job.is_team_job:
-            try:
-                from jobs.team_job_services import (
-                    autoheal_team_project_all_early_completed,
-                    autoheal_hybrid_daily_all_early_completed,
-                )
-
-                heal_result = autoheal_hybrid_daily_all_early_completed(
-                    job, request.user
-                )
-                if heal_result.get("success") and heal_result.get("healed"):
-                    print(
-                        f"[get_conversation_by_job] Auto-healed fully early-completed team DAILY job {job.jobID}"
-                    )
-                    job.refresh_from_db()
-
-                project_heal_result = autoheal_team_project_all_early_completed(
-                    job, request.user
-                )
-                if project_heal_result.get("success") and project_heal_result.get("healed"):
-                    print(
-                        f"[get_conversation_by_job] Auto-healed fully early-completed team PROJECT job {job.jobID}"
-                    )
-                    job.refresh_from_db()
-            except Exception as heal_err:
-                print(
-                    f"[get_conversation_by_job] Early-completion auto-heal skipped: {heal_err}"
-                )
-
-        # Auto-heal legacy team jobs that are fully staffed but still marked ACTIVE.
-        # This keeps job/chat workflow gates consistent for existing hybrid jobs.
-        if job.is_team_job and job.status == "ACTIVE" and job.can_start_team_job:
-            try:
-                job.status = "IN_PROGRESS"
-                job.save(update_fields=["status", "updatedAt"])
-                print(
-                    f"[get_conversation_by_job] Auto-transitioned team job {job.jobID} to IN_PROGRESS"
-                )
-            except Exception as status_err:
-                print(
-                    f"[get_conversation_by_job] Team status auto-transition skipped: {status_err}"
-                )
+        # Lifecycle drift (fully early-completed team jobs, fully staffed team
+        # jobs still ACTIVE) is repaired by jobs.consistency_reconciler, so
+        # this endpoint stays read-only.
 
         # Try to find existing conversation
         conversation = Conversation.objects.filter(relatedJobPosting=job).first()
@@ -1993,36 +1946,6 @@ def get_conversation_messages(request, conversation_id: int):
         if job_ref and is_team_slot_flow:
             is_agency_conversation = False
 
-            # Auto-heal edge case: DAILY team/hybrid jobs that are fully
-            # early-completed but remained in-progress should be finalized.
-            try:
-                from jobs.team_job_services import (
-                    autoheal_team_project_all_early_completed,
-                    autoheal_hybrid_daily_all_early_completed,
-                )
-
-                heal_result = autoheal_hybrid_daily_all_early_completed(
-                    job_ref, request.auth
-                )
-                if heal_result.get("success") and heal_result.get("healed"):
-                    print(
-                        f"[get_conversation_messages] Auto-healed fully early-completed DAILY team job {job_ref.jobID}"
-                    )
-                    job_ref.refresh_from_db()
-
-                project_heal_result = autoheal_team_project_all_early_completed(
-                    job_ref, request.auth
-                )
-                if project_heal_result.get("success") and project_heal_result.get("healed"):
-                    print(
-                        f"[get_conversation_messages] Auto-healed fully early-completed PROJECT team job {job_ref.jobID}"
-                    )
-                    job_ref.refresh_from_db()
-            except Exception as heal_err:
-                print(
-                    f"[get_conversation_messages] Early-completion auto-heal skipped: {heal_err}"
-                )
-
         # Verify user is a participant (either client, worker, team participant, or agency owner)
         is_client = conversation.client == user_profile
         is_worker = (
@@ -0,0 +1,291 @@
+"""
+Per-account WebSocket routing for chat and job events.
+
+Every InboxConsumer socket joins exactly one group, ``user_{accountID}``.
+Conversation-scoped events (messages, typing, read receipts, job status
+updates) are fanned out to the participant accounts of the conversation,
+resolved from a cached membership map instead of per-conversation groups.
+An account's sockets all share that group, so the consumer drops conversation
+events its own profile (JWT profile_type) has no access to.
+
+Membership is cached per conversation (client/worker/agency accounts plus
+ConversationParticipant profiles/admins) and the job -> conversation list is
+cached per job. Conversation and ConversationParticipant saves/deletes
+invalidate the affected keys and notify open sockets of the previous members;
+the TTL bounds drift from bulk updates.
+
+Sends go through group_send_many(), which issues a batch from a single
+async_to_sync call instead of one event-loop hop per recipient: groups are
+sent to concurrently, events for the same group in order.
+"""
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from asgiref.sync import async_to_sync
+from channels.db import database_sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+from iayos_project.observability import get_logger
+
+log = get_logger(__name__)
+
+CONVERSATION_MEMBERS_CACHE_PREFIX = "cache:chat:members"
+JOB_CONVERSATIONS_CACHE_PREFIX = "cache:chat:job_conversations"
+MEMBERSHIP_CACHE_TTL = 300
+
+
+def user_group_name(account_id: int) -> str:
+    return f"user_{account_id}"
+
+
+def legacy_conversation_group_name(conversation_id: int) -> str:
+    """Group joined by the legacy per-conversation ChatConsumer (ws/chat/<id>/)."""
+    return f"chat_{conversation_id}"
+
+
+def _members_cache_key(conversation_id: int) -> str:
+    return f"{CONVERSATION_MEMBERS_CACHE_PREFIX}:{conversation_id}"
+
+
+def _job_conversations_cache_key(job_id: int) -> str:
+    return f"{JOB_CONVERSATIONS_CACHE_PREFIX}:{job_id}"
+
+
+def _load_member_accounts(conversation_ids: List[int]) -> Dict[int, List[int]]:
+    """Resolve participant account IDs for many conversations in two queries."""
+    from .models import Conversation, ConversationParticipant
+
+    members: Dict[int, set] = {conversation_id: set() for conversation_id in conversation_ids}
+
+    for row in Conversation.objects.filter(conversationID__in=conversation_ids).values(
+        "conversationID",
+        "client__accountFK_id",
+        "worker__accountFK_id",
+        "agency__accountFK_id",
+    ):
+        bucket = members[row["conversationID"]]
+        for key in ("client__accountFK_id", "worker__accountFK_id", "agency__accountFK_id"):
+            if row[key]:
+                bucket.add(row[key])
+
+    for row in ConversationParticipant.objects.filter(
+        conversation_id__in=conversation_ids
+    ).values("conversation_id", "profile__accountFK_id", "admin_account_id"):
+        bucket = members[row["conversation_id"]]
+        if row["profile__accountFK_id"]:
+            bucket.add(row["profile__accountFK_id"])
+        if row["admin_account_id"]:
+            bucket.add(row["admin_account_id"])
+
+    return {conversation_id: sorted(accounts) for conversation_id, accounts in members.items()}
+
+
+def get_members_for_conversations(conversation_ids: Iterable[int]) -> Dict[int, List[int]]:
+    """Cache-aside lookup of participant account IDs keyed by conversation ID."""
+    ids = list(dict.fromkeys(int(conversation_id) for conversation_id in conversation_ids))
+    if not ids:
+        return {}
+
+    keys = {conversation_id: _members_cache_key(conversation_id) for conversation_id in ids}
+    cached = cache.get_many(list(keys.values()))
+    result = {
+        conversation_id: cached[key]
+        for conversation_id, key in keys.items()
+        if key in cached
+    }
+
+    missing = [conversation_id for conversation_id in ids if conversation_id not in result]
+    if missing:
+        loaded = _load_member_accounts(missing)
+        cache.set_many(
+            {keys[conversation_id]: accounts for conversation_id, accounts in loaded.items()},
+            MEMBERSHIP_CACHE_TTL,
+        )
+        result.update(loaded)
+
+    return result
+
+
+def get_conversation_member_accounts(conversation_id: int) -> List[int]:
+    return get_members_for_conversations([conversation_id]).get(int(conversation_id), [])
+
+
+def get_conversation_ids_for_jobs(job_ids: Iterable[int]) -> Dict[int, List[int]]:
+    """Cached conversation IDs per job; cache misses are loaded in one query."""
+    from .models import Conversation
+
+    ids = list(dict.fromkeys(int(job_id) for job_id in job_ids))
+    if not ids:
+        return {}
+
+    keys = {job_id: _job_conversations_cache_key(job_id) for job_id in ids}
+    cached = cache.get_many(list(keys.values()))
+    result = {job_id: cached[key] for job_id, key in keys.items() if key in cached}
+
+    missing = [job_id for job_id in ids if job_id not in result]
+    if missing:
+        loaded: Dict[int, List[int]] = {job_id: [] for job_id in missing}
+        for job_id, conversation_id in (
+            Conversation.objects.filter(relatedJobPosting_id__in=missing)
+            .order_by("conversationID")
+            .values_list("relatedJobPosting_id", "conversationID")
+        ):
+            loaded[job_id].append(conversation_id)
+        cache.set_many(
+            {keys[job_id]: conversation_ids for job_id, conversation_ids in loaded.items()},
+            MEMBERSHIP_CACHE_TTL,
+        )
+        result.update(loaded)
+
+    return result
+
+
+def get_job_conversation_ids(job_id: int) -> List[int]:
+    """Cached list of conversation IDs linked to a job."""
+    return get_conversation_ids_for_jobs([job_id]).get(int(job_id), [])
+
+
+def get_job_member_accounts(job_ids: Iterable[int]) -> Dict[int, List[int]]:
+    """Distinct participant account IDs across each job's conversations."""
+    conversations = get_conversation_ids_for_jobs(job_ids)
+    members = get_members_for_conversations(
+        conversation_id for conversation_ids in conversations.values() for conversation_id in conversation_ids
+    )
+    return {
+        job_id: list(dict.fromkeys(
+            account_id
+            for conversation_id in conversation_ids
+            for account_id in members.get(conversation_id, [])
+        ))
+        for job_id, conversation_ids in conversations.items()
+    }
+
+
+def invalidate_conversation_membership(conversation_id: int, job_id: Optional[int] = None):
+    """
+    Drop cached membership for a conversation (and the job's conversation
+    list). Accounts that were cached as members get a membership_changed event
+    after commit so open sockets drop their per-connection access cache.
+    """
+    members_key = _members_cache_key(conversation_id)
+    previous_members = cache.get(members_key) or []
+    keys = [members_key]
+    if job_id:
+        keys.append(_job_conversations_cache_key(job_id))
+    cache.delete_many(keys)
+
+    if previous_members:
+        event = {"type": "membership_changed", "conversation_id": int(conversation_id)}
+
+        def _notify():
+            try:
+                send_to_accounts(previous_members, event)
+            except Exception as exc:
+                log.warning("⚠️ membership_changed notify failed for conversation %s: %s", conversation_id, exc)
+
+        transaction.on_commit(_notify)
+
+
+def send_to_accounts(account_ids: Iterable[int], event: dict, channel_layer=None) -> int:
+    """group_send `event` once per distinct account. Returns sends issued."""
+    if channel_layer is None:
+        from channels.layers import get_channel_layer
+
+        channel_layer = get_channel_layer()
+    if not channel_layer:
+        return 0
+
+    return group_send_many(
+        [(user_group_name(account_id), event) for account_id in dict.fromkeys(account_ids)],
+        channel_layer,
+    )
+
+
+async def _agroup_send_many(channel_layer, messages: List[Tuple[str, dict]]) -> None:
+    by_group: Dict[str, List[dict]] = {}
+    for group, event in messages:
+        by_group.setdefault(group, []).append(event)
+
+    async def _send_in_order(group: str, events: List[dict]) -> None:
+        for event in events:
+            await channel_layer.group_send(group, event)
+
+    await asyncio.gather(*(_send_in_order(group, events) for group, events in by_group.items()))
+
+
+def group_send_many(messages: List[Tuple[str, dict]], channel_layer=None) -> int:
+    """
+    Send (group, event) pairs in one async_to_sync call: distinct groups
+    concurrently, a group's events in list order. Returns sends issued.
+    """
+    if not messages:
+        return 0
+    if channel_layer is None:
+        from channels.layers import get_channel_layer
+
+        channel_layer = get_channel_layer()
+    if not channel_layer:
+        return 0
+
+    async_to_sync(_agroup_send_many)(channel_layer, messages)
+    return len(messages)
+
+
+def send_to_conversation(
+    conversation_id: int,
+    event: dict,
+    channel_layer=None,
+    include_legacy_group: bool = False,
+) -> int:
+    """
+    Deliver a conversation event to every participant account.
+
+    Only chat_message events should set include_legacy_group; the legacy
+    ChatConsumer has no handlers for the other event types.
+    """
+    if channel_layer is None:
+        from channels.layers import get_channel_layer
+
+        channel_layer = get_channel_layer()
+    if not channel_layer:
+        return 0
+
+    messages = [
+        (user_group_name(account_id), event)
+        for account_id in get_conversation_member_accounts(conversation_id)
+    ]
+    if include_legacy_group:
+        messages.append((legacy_conversation_group_name(conversation_id), event))
+    return group_send_many(messages, channel_layer)
+
+
+def send_to_job_conversations(job_id: int, event: dict, channel_layer=None) -> int:
+    """
+    Deliver a job-level event to the participants of every conversation linked
+    to the job. Accounts present in several conversations receive it once.
+    """
+    account_ids = get_job_member_accounts([job_id]).get(int(job_id), [])
+    if not account_ids:
+        return 0
+    return send_to_accounts(account_ids, event, channel_layer)
+
+
+async def asend_to_conversation(
+    channel_layer,
+    conversation_id: int,
+    event: dict,
+    include_legacy_group: bool = False,
+) -> int:
+    """Async variant of send_to_conversation for consumers."""
+    account_ids = await database_sync_to_async(get_conversation_member_accounts)(
+        conversation_id
+    )
+    for account_id in account_ids:
+        await channel_layer.group_send(user_group_name(account_id), event)
+    sent = len(account_ids)
+    if include_legacy_group:
+        await channel_layer.group_send(
+            legacy_conversation_group_name(conversation_id), event
+        )
+        sent += 1
+    return sent
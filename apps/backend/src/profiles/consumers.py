@@ -1,15 +1,30 @@
 ﻿import json
+import time
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth import get_user_model
+from django.db.models import Q
 from django.utils import timezone
 from .models import Conversation, ConversationParticipant, Message, Profile
 from .content_filter import contains_contact_info
+from .channel_routing import asend_to_conversation, user_group_name
 from accounts.models import Job, JobReview, Agency
+from accounts.notification_feed import is_visible_to
+from iayos_project.observability import get_logger, redact
+
+log = get_logger(__name__)
 
 User = get_user_model()
 CONTACT_INFO_BLOCKED_MESSAGE = "For safety, sharing phone numbers or email addresses in chat is not allowed."
 
+# Per-connection conversation ACL entries (granted and denied) are trusted for
+# this long; membership changes also evict them early via the membership_changed
+# event.
+ACCESS_CACHE_TTL_SECONDS = 60
+# Repeated "is typing" events for the same conversation are dropped inside this
+# window; a change of state (start/stop) is always forwarded.
+TYPING_THROTTLE_SECONDS = 2.0
+
 
 class InboxConsumer(AsyncWebsocketConsumer):
     """
@@ -21,11 +36,11 @@ class InboxConsumer(AsyncWebsocketConsumer):
         self.user = self.scope.get('user')
         self.is_agency = False
         
-        print(f"[InboxWS] Connection attempt for user: {self.user}")
-        print(f"[InboxWS] Is authenticated: {self.user.is_authenticated if self.user else 'No user'}")
+        log.debug("[InboxWS] Connection attempt for user: %s", getattr(self.user, "accountID", None))
+        log.debug("[InboxWS] Is authenticated: %s", self.user.is_authenticated if self.user else 'No user')
         
         if not self.user or not self.user.is_authenticated:
-            print(f"[InboxWS] REJECTED: User not authenticated")
+            log.warning("[InboxWS] REJECTED: User not authenticated")
             await self.close()
             return
         
@@ -34,39 +49,81 @@ class InboxConsumer(AsyncWebsocketConsumer):
         self.agency = await self.get_user_agency()
         
         if not self.profile and not self.agency:
-            print(f"[InboxWS] REJECTED: Neither Profile nor Agency found for user")
+            log.warning("[InboxWS] REJECTED: Neither Profile nor Agency found for user")
             await self.close()
             return
         
         self.is_agency = self.agency is not None
-        print(f"[InboxWS] User type: {'Agency' if self.is_agency else 'Profile'}")
-        
-        # Get ALL conversations this user is part of
-        conversation_ids = await self.get_user_conversations()
-        print(f"[InboxWS] User has {len(conversation_ids)} conversations: {conversation_ids}")
+        log.debug("[InboxWS] User type: %s", 'Agency' if self.is_agency else 'Profile')
+
+        # Resolved once per connection; typing/mark-read/send reuse these.
+        self.sender_identity = await self.get_user_info()
+        self.typing_state = {}
+
+        # Warm the ACL with one query: every event handler checks it, so a
+        # cold cache would cost a lookup per conversation on first delivery.
+        expires_at = time.monotonic() + ACCESS_CACHE_TTL_SECONDS
+        self.access_cache = {
+            conversation_id: (True, expires_at)
+            for conversation_id in await self.get_accessible_conversation_ids()
+        }
         
-        # Subscribe to ALL conversation groups
-        self.conversation_groups = []
-        for conv_id in conversation_ids:
-            group_name = f'chat_{conv_id}'
-            await self.channel_layer.group_add(group_name, self.channel_name)
-            self.conversation_groups.append(group_name)
+        # One delivery group per account. Conversation events are fanned out
+        # to participant accounts by profiles.channel_routing, so connect cost
+        # no longer depends on how many conversations the user has.
+        self.user_group = user_group_name(self.user.pk)
+        self.muted_conversations = set()
+        await self.channel_layer.group_add(self.user_group, self.channel_name)
         
         await self.accept()
-        print(f"[InboxWS] ✅ Connection accepted for user {self.user.email}")
-        print(f"[InboxWS] ✅ Subscribed to {len(self.conversation_groups)} conversation groups")
+        log.debug("[InboxWS] ✅ Connection accepted for user %s (%s)", redact(self.user.email), self.user_group)
 
     async def disconnect(self, close_code):
-        # Unsubscribe from all conversation groups
-        if hasattr(self, 'conversation_groups'):
-            for group_name in self.conversation_groups:
-                await self.channel_layer.group_discard(group_name, self.channel_name)
-            print(f"[InboxWS] Disconnected, unsubscribed from {len(self.conversation_groups)} groups")
+        if hasattr(self, 'user_group'):
+            await self.channel_layer.group_discard(self.user_group, self.channel_name)
+            log.debug("[InboxWS] Disconnected, left %s", self.user_group)
+
+    async def has_conversation_access(self, conversation_id):
+        """Per-connection cached wrapper around verify_conversation_access."""
+        try:
+            conversation_id = int(conversation_id)
+        except (TypeError, ValueError):
+            return False
+
+        now = time.monotonic()
+        has_access, expires_at = self.access_cache.get(conversation_id, (False, 0))
+        if expires_at > now:
+            return has_access
+
+        has_access = await self.verify_conversation_access(conversation_id)
+        self.access_cache[conversation_id] = (has_access, now + ACCESS_CACHE_TTL_SECONDS)
+        return has_access
+
+    async def membership_changed(self, event):
+        """Conversation participants changed: re-check access on next use."""
+        conversation_id = event.get('conversation_id')
+        self.access_cache.pop(conversation_id, None)
+        self.typing_state.pop(conversation_id, None)
+
+    def _is_muted(self, conversation_id):
+        try:
+            return int(conversation_id) in self.muted_conversations
+        except (TypeError, ValueError):
+            return False
+
+    async def _should_forward(self, conversation_id):
+        """
+        Conversation events reach every socket of a member account; only forward
+        them if this socket's profile (JWT profile_type) is in the conversation.
+        """
+        if self._is_muted(conversation_id):
+            return False
+        return await self.has_conversation_access(conversation_id)
 
     async def receive(self, text_data):
         try:
-            print(f"[InboxWS] 📩 Received data: {text_data}")
             data = json.loads(text_data)
+            log.debug("[InboxWS] 📩 Received action=%s (%s bytes)", data.get('action') or 'message', len(text_data))
 
             # Check if this is a message history request
             action = data.get('action')
@@ -98,25 +155,25 @@ class InboxConsumer(AsyncWebsocketConsumer):
             message_text = data.get('message', '')
             message_type = data.get('type', 'TEXT')
 
-            print(f"[InboxWS] Conversation: {conversation_id}, Message: '{message_text}', Type: {message_type}")
+            log.debug("[InboxWS] Conversation: %s, Message: %s chars, Type: %s", conversation_id, len(message_text or ''), message_type)
 
             if not conversation_id:
-                print("[InboxWS] ⚠️ No conversation_id provided, skipping")
+                log.warning("[InboxWS] ⚠️ No conversation_id provided, skipping")
                 return
 
             if not message_text:
-                print("[InboxWS] ⚠️ Empty message, skipping")
+                log.warning("[InboxWS] ⚠️ Empty message, skipping")
                 return
 
             # Verify user has access to this conversation
-            has_access = await self.verify_conversation_access(conversation_id)
+            has_access = await self.has_conversation_access(conversation_id)
             if not has_access:
-                print(f"[InboxWS] ⚠️ User does not have access to conversation {conversation_id}")
+                log.warning("[InboxWS] ⚠️ User does not have access to conversation %s", conversation_id)
                 return
 
-            print(f"[InboxWS] 💾 Saving message to database...")
+            log.debug("[InboxWS] 💾 Saving message to database...")
             message = await self.save_message(conversation_id, message_text, message_type)
-            print(f"[InboxWS] ✅ Message saved with ID: {message.messageID}")
+            log.debug("[InboxWS] ✅ Message saved with ID: %s", message.messageID)
 
             # Determine sender info (works for both Profile and Agency senders)
             sender_name = message.get_sender_name()
@@ -124,10 +181,10 @@ class InboxConsumer(AsyncWebsocketConsumer):
             if message.sender and hasattr(message.sender, 'profileImg') and message.sender.profileImg:
                 sender_avatar = message.sender.profileImg  # profileImg is a CharField (URL string), not FileField
 
-            # Broadcast to conversation group
-            room_group_name = f'chat_{conversation_id}'
-            await self.channel_layer.group_send(
-                room_group_name,
+            # Fan out to participant accounts (and legacy per-conversation sockets)
+            await asend_to_conversation(
+                self.channel_layer,
+                conversation_id,
                 {
                     'type': 'chat_message',
                     'sender_account_id': self.user.pk,
@@ -140,9 +197,10 @@ class InboxConsumer(AsyncWebsocketConsumer):
                         'message_type': message.messageType,
                         'created_at': message.createdAt.isoformat(),
                     }
-                }
+                },
+                include_legacy_group=True,
             )
-            print(f"[InboxWS] 📤 Message broadcasted to group {room_group_name}")
+            log.debug("[InboxWS] 📤 Message routed for conversation %s", conversation_id)
         except ValueError as e:
             if str(e) == "CONTACT_INFO_BLOCKED":
                 await self.send(text_data=json.dumps({
@@ -153,17 +211,17 @@ class InboxConsumer(AsyncWebsocketConsumer):
                 return
             raise
         except json.JSONDecodeError as e:
-            print(f"[InboxWS] ❌ JSON decode error: {str(e)}")
+            log.error("[InboxWS] ❌ JSON decode error: %s", e)
         except Exception as e:
-            print(f'[InboxWS] ❌ Error in receive: {str(e)}')
-            import traceback
-            traceback.print_exc()
+            log.exception("[InboxWS] ❌ Error in receive: %s", e)
 
     async def chat_message(self, event):
         """Send chat message with explicit type for mobile listeners."""
         message = event['message']
+        if not await self._should_forward(message.get('conversation_id')):
+            return
         message['is_mine'] = (self.user.pk == event.get('sender_account_id'))
-        print(f"[InboxWS] 📤 Sending message for conversation {message.get('conversation_id')}")
+        log.debug("[InboxWS] 📤 Sending message for conversation %s", message.get('conversation_id'))
         await self.send(text_data=json.dumps({
             'type': 'chat_message',
             'message': message
@@ -175,7 +233,9 @@ class InboxConsumer(AsyncWebsocketConsumer):
             return
 
         data = event['data']
-        print(f"[InboxWS] 📤 Sending typing indicator for conversation {data.get('conversation_id')}")
+        if not await self._should_forward(data.get('conversation_id')):
+            return
+        log.debug("[InboxWS] 📤 Sending typing indicator for conversation %s", data.get('conversation_id'))
         await self.send(text_data=json.dumps({
             'type': 'typing_indicator',
             'action': 'typing',
@@ -188,16 +248,49 @@ class InboxConsumer(AsyncWebsocketConsumer):
     async def message_read(self, event):
         """Forward read-receipt events to WebSocket clients."""
         data = event.get('data', {})
+        if not await self._should_forward(data.get('conversation_id')):
+            return
         await self.send(text_data=json.dumps({
             'type': 'message_read',
             'data': data
         }))
 
+    def _notification_visible(self, profile_type):
+        """Same profile scoping as the REST feed (visible_notifications)."""
+        return is_visible_to(profile_type, getattr(self.user, 'profile_type', None))
+
+    async def notification_created(self, event):
+        """Push a new in-app notification (replaces polling /notifications)."""
+        if not self._notification_visible(event['notification'].get('profileType')):
+            return
+        await self.send(text_data=json.dumps({
+            'type': 'notification',
+            'notification': event['notification'],
+        }))
+
+    async def notifications_read(self, event):
+        """Notifications were read on another device (all=True: every notification)."""
+        if not self._notification_visible(event.get('profileType')):
+            return
+        await self.send(text_data=json.dumps({
+            'type': 'notifications_read',
+            'notification_ids': event.get('notification_ids'),
+            'all': event.get('all', False),
+        }))
+
+    async def notification_deleted(self, event):
+        if not self._notification_visible(event.get('profileType')):
+            return
+        await self.send(text_data=json.dumps({
+            'type': 'notification_deleted',
+            'notification_id': event.get('notification_id'),
+        }))
+
     async def job_status_update(self, event):
         """Forward job status updates to WebSocket client (e.g. worker marked complete)"""
         data = event.get('data', {})
         job_id = data.get('job_id')
-        print(f"[InboxWS] 📤 Sending job_status_update for job {job_id}")
+        log.debug("[InboxWS] 📤 Sending job_status_update for job %s", job_id)
         await self.send(text_data=json.dumps({
             'type': 'job_status_update',
             'data': data
@@ -205,60 +298,49 @@ class InboxConsumer(AsyncWebsocketConsumer):
 
     async def handle_subscribe(self, data):
         """
-        Dynamically subscribe to a new conversation group.
-        Called when a user opens a conversation that was created after the WebSocket connected
-        (e.g., after accepting a job application).
+        Resume delivery for a conversation.
+        Every conversation the account participates in is already routed to the
+        user group, so this only clears a previous unsubscribe.
         """
         conversation_id = data.get('conversation_id')
         if not conversation_id:
-            print("[InboxWS] ⚠️ No conversation_id in subscribe request")
-            return
-
-        group_name = f'chat_{conversation_id}'
-
-        # Don't re-subscribe if already in this group
-        if group_name in self.conversation_groups:
-            print(f"[InboxWS] Already subscribed to {group_name}")
+            log.warning("[InboxWS] ⚠️ No conversation_id in subscribe request")
             return
 
-        # Verify user has access to this conversation
-        has_access = await self.verify_conversation_access(conversation_id)
+        has_access = await self.has_conversation_access(conversation_id)
         if not has_access:
-            print(f"[InboxWS] ⚠️ User does not have access to conversation {conversation_id}, subscribe denied")
+            log.warning("[InboxWS] ⚠️ User does not have access to conversation %s, subscribe denied", conversation_id)
             return
 
-        await self.channel_layer.group_add(group_name, self.channel_name)
-        self.conversation_groups.append(group_name)
-        print(f"[InboxWS] ✅ Dynamically subscribed to {group_name}")
+        self.muted_conversations.discard(int(conversation_id))
+        log.debug("[InboxWS] ✅ Delivering conversation %s", conversation_id)
 
     async def handle_unsubscribe(self, data):
-        """Dynamically unsubscribe from a conversation group."""
+        """Stop forwarding events for a conversation on this socket."""
         conversation_id = data.get('conversation_id')
         if not conversation_id:
             return
 
-        group_name = f'chat_{conversation_id}'
-        if group_name not in self.conversation_groups:
+        try:
+            self.muted_conversations.add(int(conversation_id))
+        except (TypeError, ValueError):
             return
-
-        await self.channel_layer.group_discard(group_name, self.channel_name)
-        self.conversation_groups.remove(group_name)
-        print(f"[InboxWS] ✅ Dynamically unsubscribed from {group_name}")
+        log.debug("[InboxWS] ✅ Muted conversation %s", conversation_id)
 
     async def handle_mark_read(self, data):
-        """Mark a message as read and broadcast receipt to chat group."""
+        """Mark a message as read and broadcast receipt to conversation participants."""
         message_id = data.get('message_id')
         if not message_id:
             return
 
-        read_info = await self.mark_message_as_read(message_id)
-        if not read_info:
+        conversation_id = await self.get_message_conversation_id(message_id)
+        if not conversation_id or not await self.has_conversation_access(conversation_id):
             return
 
-        conversation_id = read_info['conversation_id']
-        room_group_name = f'chat_{conversation_id}'
-        await self.channel_layer.group_send(
-            room_group_name,
+        read_info = await self.mark_message_as_read(message_id, conversation_id)
+        await asend_to_conversation(
+            self.channel_layer,
+            conversation_id,
             {
                 'type': 'message_read',
                 'data': read_info
@@ -266,36 +348,40 @@ class InboxConsumer(AsyncWebsocketConsumer):
         )
 
     async def handle_typing_indicator(self, data):
-        """Handle typing indicator events"""
+        """
+        Handle typing indicator events.
+        Ephemeral: uses the cached ACL/identity and is throttled per conversation,
+        so it never touches the database once the cache is warm.
+        """
         conversation_id = data.get('conversation_id')
-        is_typing = data.get('is_typing', True)
+        is_typing = bool(data.get('is_typing', True))
 
         if not conversation_id:
-            print("[InboxWS] ⚠️ No conversation_id in typing event")
+            log.warning("[InboxWS] ⚠️ No conversation_id in typing event")
             return
 
-        # Verify access
-        has_access = await self.verify_conversation_access(conversation_id)
-        if not has_access:
-            print(f"[InboxWS] ⚠️ User does not have access to conversation {conversation_id}")
+        if not await self.has_conversation_access(conversation_id):
+            log.warning("[InboxWS] ⚠️ User does not have access to conversation %s", conversation_id)
             return
 
-        # Get user info
-        user_info = await self.get_user_info()
-
-        print(f"[InboxWS] 👀 Broadcasting typing indicator: User {user_info['name']} {'is' if is_typing else 'stopped'} typing")
+        conversation_id = int(conversation_id)
+        now = time.monotonic()
+        last_state, last_sent_at = self.typing_state.get(conversation_id, (None, 0.0))
+        if last_state == is_typing and (not is_typing or now - last_sent_at < TYPING_THROTTLE_SECONDS):
+            return
+        self.typing_state[conversation_id] = (is_typing, now)
 
-        # Broadcast typing indicator to conversation group
-        room_group_name = f'chat_{conversation_id}'
-        await self.channel_layer.group_send(
-            room_group_name,
+        # Fan out typing indicator to participant accounts
+        await asend_to_conversation(
+            self.channel_layer,
+            conversation_id,
             {
                 'type': 'typing_indicator',
                 'sender_channel': self.channel_name,
                 'data': {
-                    'conversation_id': int(conversation_id),
-                    'user_id': user_info['id'],
-                    'user_name': user_info['name'],
+                    'conversation_id': conversation_id,
+                    'user_id': self.sender_identity['id'],
+                    'user_name': self.sender_identity['name'],
                     'is_typing': is_typing
                 }
             }
@@ -303,35 +389,24 @@ class InboxConsumer(AsyncWebsocketConsumer):
 
     @database_sync_to_async
     def get_user_info(self):
-        """Get current user's profile information (supports dual profiles)"""
+        """Resolve the sender identity shown in typing events (called once at connect)."""
         try:
-            from accounts.models import Agency
-
-            agency = Agency.objects.filter(accountFK=self.user).first()
-            if agency:
+            if self.agency:
                 return {
                     'id': self.user.accountID,
-                    'name': agency.businessName or 'Agency'
+                    'name': self.agency.businessName or 'Agency'
                 }
-
-            # Handle dual-profile users by checking profile_type from JWT
-            profile_type = getattr(self.user, 'profile_type', None)
-            if profile_type:
-                profile = Profile.objects.filter(accountFK=self.user, profileType=profile_type).first()
-            else:
-                profile = Profile.objects.filter(accountFK=self.user).first()
-            
-            if profile:
+            if self.profile:
                 return {
-                    'id': profile.profileID,
-                    'name': f"{profile.firstName} {profile.lastName}"
+                    'id': self.profile.profileID,
+                    'name': f"{self.profile.firstName} {self.profile.lastName}"
                 }
             return {
                 'id': 0,
                 'name': 'Unknown'
             }
         except Exception as e:
-            print(f"[InboxWS] Error in get_user_info: {str(e)}")
+            log.error("[InboxWS] Error in get_user_info: %s", e)
             return {
                 'id': 0,
                 'name': 'Unknown'
@@ -348,7 +423,7 @@ class InboxConsumer(AsyncWebsocketConsumer):
             else:
                 return Profile.objects.filter(accountFK=self.user).first()
         except Exception as e:
-            print(f"[InboxWS] Error in get_user_profile: {str(e)}")
+            log.error("[InboxWS] Error in get_user_profile: %s", e)
             return None
 
     @database_sync_to_async
@@ -360,51 +435,20 @@ class InboxConsumer(AsyncWebsocketConsumer):
             return None
 
     @database_sync_to_async
-    def get_user_conversations(self):
-        """Get all conversation IDs the user is part of (supports both Profile and Agency users)"""
-        try:
-            conversations = Conversation.objects.none()
-            
-            # Check for Profile-based conversations (client or worker)
-            try:
-                profile_type = getattr(self.user, 'profile_type', None)
-                if profile_type:
-                    profile = Profile.objects.filter(accountFK=self.user, profileType=profile_type).first()
-                else:
-                    profile = Profile.objects.filter(accountFK=self.user).first()
-                if profile:
-                    conversations = Conversation.objects.filter(
-                        client=profile
-                    ) | Conversation.objects.filter(
-                        worker=profile
-                    )
-                    # Also include conversations where user is a ConversationParticipant (team/group jobs)
-                    participant_conv_ids = ConversationParticipant.objects.filter(
-                        profile=profile
-                    ).values_list('conversation_id', flat=True)
-                    if participant_conv_ids:
-                        participant_convs = Conversation.objects.filter(conversationID__in=participant_conv_ids)
-                        conversations = conversations | participant_convs
-            except Exception:
-                pass
-            
-            # Check for Agency-based conversations (directly via agency field)
-            try:
-                agency = Agency.objects.get(accountFK=self.user)
-                agency_conversations = Conversation.objects.filter(agency=agency)
-                conversations = conversations | agency_conversations
-                print(f"[InboxWS] Found {agency_conversations.count()} agency conversations")
-            except Agency.DoesNotExist:
-                pass
-            
-            result = list(conversations.distinct().values_list('conversationID', flat=True))
-            print(f"[InboxWS] Total conversations: {len(result)}")
-            return result
-        except Exception as e:
-            print(f"[InboxWS] ERROR getting conversations: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return []
+    def get_accessible_conversation_ids(self):
+        """IDs of every conversation verify_conversation_access would allow."""
+        access = Q()
+        if self.profile:
+            access |= Q(client=self.profile) | Q(worker=self.profile) | Q(participants__profile=self.profile)
+        if self.agency:
+            access |= Q(agency=self.agency)
+        if not access:
+            return set()
+        return set(
+            Conversation.objects.filter(access)
+            .values_list('conversationID', flat=True)
+            .distinct()
+        )
 
     @database_sync_to_async
     def verify_conversation_access(self, conversation_id):
@@ -412,19 +456,15 @@ class InboxConsumer(AsyncWebsocketConsumer):
         try:
             conversation = Conversation.objects.get(conversationID=conversation_id)
             
-            # Check Profile-based access (client or worker)
+            # Check Profile-based access (client or worker), resolved at connect
             try:
-                profile_type = getattr(self.user, 'profile_type', None)
-                if profile_type:
-                    profile = Profile.objects.filter(accountFK=self.user, profileType=profile_type).first()
-                else:
-                    profile = Profile.objects.filter(accountFK=self.user).first()
+                profile = self.profile
                 if profile:
-                    if conversation.client and conversation.client.profileID == profile.profileID:
-                        print(f"[InboxWS] Client access granted for conv {conversation_id}")
+                    if conversation.client_id == profile.profileID:
+                        log.debug("[InboxWS] Client access granted for conv %s", conversation_id)
                         return True
-                    if conversation.worker and conversation.worker.profileID == profile.profileID:
-                        print(f"[InboxWS] Worker access granted for conv {conversation_id}")
+                    if conversation.worker_id == profile.profileID:
+                        log.debug("[InboxWS] Worker access granted for conv %s", conversation_id)
                         return True
                     # Check ConversationParticipant for team/group jobs
                     is_participant = ConversationParticipant.objects.filter(
@@ -432,24 +472,20 @@ class InboxConsumer(AsyncWebsocketConsumer):
                         profile=profile
                     ).exists()
                     if is_participant:
-                        print(f"[InboxWS] Participant access granted for conv {conversation_id}")
+                        log.debug("[InboxWS] Participant access granted for conv %s", conversation_id)
                         return True
             except Exception as e:
-                print(f"[InboxWS] Error checking profile access for conv {conversation_id}: {e}")
+                log.error("[InboxWS] Error checking profile access for conv %s: %s", conversation_id, e)
             
             # Check Agency-based access (directly via agency field)
-            try:
-                agency = Agency.objects.get(accountFK=self.user)
-                if conversation.agency and conversation.agency.agencyId == agency.agencyId:
-                    print(f"[InboxWS] Agency access granted for conv {conversation_id}")
-                    return True
-            except Agency.DoesNotExist:
-                pass
+            if self.agency and conversation.agency_id == self.agency.agencyId:
+                log.debug("[InboxWS] Agency access granted for conv %s", conversation_id)
+                return True
             
-            print(f"[InboxWS] Access DENIED for conv {conversation_id} (user={self.user.email}, client={getattr(conversation.client, 'profileID', None)}, worker={getattr(conversation.worker, 'profileID', None) if conversation.worker else None})")
+            log.warning("[InboxWS] Access DENIED for conv %s (user=%s, client=%s, worker=%s)", conversation_id, redact(self.user.email), conversation.client_id, conversation.worker_id)
             return False
         except Conversation.DoesNotExist as e:
-            print(f"[InboxWS] ERROR: Conversation {conversation_id} not found")
+            log.error("[InboxWS] ERROR: Conversation %s not found", conversation_id)
             return False
 
     @database_sync_to_async
@@ -462,32 +498,16 @@ class InboxConsumer(AsyncWebsocketConsumer):
 
             conversation = Conversation.objects.get(conversationID=conversation_id)
             
-            # Try to get profile for sender
-            profile = None
-            agency = None
-            try:
-                profile_type = getattr(self.user, 'profile_type', None)
-                if profile_type:
-                    profile = Profile.objects.filter(accountFK=self.user, profileType=profile_type).first()
-                else:
-                    profile = Profile.objects.filter(accountFK=self.user).first()
-                if profile:
-                    print(f"[InboxWS] ✅ Sender profile: {profile.profileID}")
-                else:
-                    raise Profile.DoesNotExist
-            except Profile.DoesNotExist:
-                # For agency users without profile, get their agency
-                print(f"[InboxWS] ⚠️ No profile for user {self.user.email}, checking if agency...")
-                try:
-                    agency = Agency.objects.get(accountFK=self.user)
-                    print(f"[InboxWS] ✅ Sender agency: {agency.agencyId} ({agency.businessName})")
-                except Agency.DoesNotExist:
-                    print(f"[InboxWS] ❌ No profile or agency found for user!")
-                    raise Exception("User has no profile or agency")
+            # Sender resolved at connect (profile first, agency otherwise)
+            profile = self.profile
+            agency = None if profile else self.agency
+            if not profile and not agency:
+                log.error("[InboxWS] ❌ No profile or agency found for user!")
+                raise Exception("User has no profile or agency")
             
-            print(f"[InboxWS] 🔍 Looking up conversation: {conversation_id}")
+            log.debug("[InboxWS] 🔍 Looking up conversation: %s", conversation_id)
             
-            print(f"[InboxWS] 💾 Creating message...")
+            log.debug("[InboxWS] 💾 Creating message...")
             message = Message.objects.create(
                 conversationID=conversation, 
                 sender=profile,  # None if agency user
@@ -496,64 +516,33 @@ class InboxConsumer(AsyncWebsocketConsumer):
                 messageType=normalized_message_type,
                 isRead=False
             )
-            print(f"[InboxWS] ✅ Message created with ID: {message.messageID}")
+            log.debug("[InboxWS] ✅ Message created with ID: %s", message.messageID)
             return message
         except Exception as e:
-            print(f"[InboxWS] ❌ Error saving message: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            log.exception("[InboxWS] ❌ Error saving message: %s", e)
             raise
 
     @database_sync_to_async
-    def mark_message_as_read(self, message_id):
-        """Mark message read if user has access to the conversation."""
-        try:
-            message = Message.objects.select_related('conversationID').get(messageID=message_id)
-            conversation_id = message.conversationID.conversationID
-
-            # Only allow read update for accessible conversations
-            conversation = message.conversationID
-            has_access = False
-
-            profile_type = getattr(self.user, 'profile_type', None)
-            if profile_type:
-                profile = Profile.objects.filter(accountFK=self.user, profileType=profile_type).first()
-            else:
-                profile = Profile.objects.filter(accountFK=self.user).first()
-
-            if profile:
-                is_direct_participant = (
-                    (conversation.client and conversation.client.profileID == profile.profileID)
-                    or (conversation.worker and conversation.worker.profileID == profile.profileID)
-                )
-                is_team_participant = ConversationParticipant.objects.filter(
-                    conversation=conversation,
-                    profile=profile,
-                ).exists()
-                has_access = is_direct_participant or is_team_participant
-
-            if not has_access:
-                agency = Agency.objects.filter(accountFK=self.user).first()
-                if agency and conversation.agency and conversation.agency.agencyId == agency.agencyId:
-                    has_access = True
-
-            if not has_access:
-                return None
-
-            if not message.isRead:
-                message.isRead = True
-                message.save(update_fields=['isRead'])
+    def get_message_conversation_id(self, message_id):
+        return (
+            Message.objects.filter(messageID=message_id)
+            .values_list('conversationID_id', flat=True)
+            .first()
+        )
 
-            return {
-                'message_id': message.messageID,
-                'conversation_id': conversation_id,
-                'read_at': timezone.now().isoformat(),
-            }
-        except Message.DoesNotExist:
-            return None
-        except Exception as e:
-            print(f"[InboxWS] ❌ Error marking message as read: {str(e)}")
-            return None
+    @database_sync_to_async
+    def mark_message_as_read(self, message_id, conversation_id):
+        """Mark message read (access already checked by the caller)."""
+        read_at = timezone.now()
+        # Queryset update: Message.save() would re-bump conversation unread counters.
+        Message.objects.filter(messageID=message_id, isRead=False).update(
+            isRead=True, readAt=read_at
+        )
+        return {
+            'message_id': int(message_id),
+            'conversation_id': conversation_id,
+            'read_at': read_at.isoformat(),
+        }
 
     async def handle_get_messages(self, data):
         """Handle WebSocket request for message history"""
@@ -567,7 +556,7 @@ class InboxConsumer(AsyncWebsocketConsumer):
             return
         
         # Verify access
-        has_access = await self.verify_conversation_access(conversation_id)
+        has_access = await self.has_conversation_access(conversation_id)
         if not has_access:
             await self.send(text_data=json.dumps({
                 'action': 'messages_response',
@@ -575,7 +564,7 @@ class InboxConsumer(AsyncWebsocketConsumer):
             }))
             return
         
-        print(f"[InboxWS] 📖 Fetching message history for conversation {conversation_id}")
+        log.debug("[InboxWS] 📖 Fetching message history for conversation %s", conversation_id)
         
         # Get messages and conversation data
         messages_data = await self.get_conversation_messages(conversation_id)
@@ -588,7 +577,7 @@ class InboxConsumer(AsyncWebsocketConsumer):
             'conversation': messages_data['conversation']
         }))
         
-        print(f"[InboxWS] ✅ Sent {len(messages_data['messages'])} messages for conversation {conversation_id}")
+        log.debug("[InboxWS] ✅ Sent %s messages for conversation %s", len(messages_data['messages']), conversation_id)
 
     @database_sync_to_async
     def get_conversation_messages(self, conversation_id):
@@ -696,9 +685,7 @@ class InboxConsumer(AsyncWebsocketConsumer):
                 'conversation': conversation_data
             }
         except Exception as e:
-            print(f"[InboxWS] ❌ Error getting messages: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            log.exception("[InboxWS] ❌ Error getting messages: %s", e)
             return {'messages': [], 'conversation': {}}
 
 
@@ -709,26 +696,26 @@ class ChatConsumer(AsyncWebsocketConsumer):
         self.user = self.scope.get('user')
         
         # Debug logging
-        print(f"[WebSocket] Connection attempt to conversation {self.conversation_id}")
-        print(f"[WebSocket] User: {self.user}")
-        print(f"[WebSocket] Is authenticated: {self.user.is_authenticated if self.user else 'No user'}")
+        log.debug("[WebSocket] Connection attempt to conversation %s", self.conversation_id)
+        log.debug("[WebSocket] User: %s", getattr(self.user, "accountID", None))
+        log.debug("[WebSocket] Is authenticated: %s", self.user.is_authenticated if self.user else 'No user')
         
         if not self.user or not self.user.is_authenticated:
-            print(f"[WebSocket] REJECTED: User not authenticated")
+            log.warning("[WebSocket] REJECTED: User not authenticated")
             await self.close()
             return
         
         has_access = await self.verify_conversation_access()
-        print(f"[WebSocket] Has access: {has_access}")
+        log.debug("[WebSocket] Has access: %s", has_access)
         
         if not has_access:
-            print(f"[WebSocket] REJECTED: User does not have access to conversation")
+            log.warning("[WebSocket] REJECTED: User does not have access to conversation")
             await self.close()
             return
         
         await self.channel_layer.group_add(self.room_group_name, self.channel_name)
         await self.accept()
-        print(f"[WebSocket] ✅ Connection accepted for user {self.user.email}")
+        log.debug("[WebSocket] ✅ Connection accepted for user %s", redact(self.user.email))
 
     async def disconnect(self, close_code):
         if hasattr(self, 'room_group_name'):
@@ -736,24 +723,26 @@ class ChatConsumer(AsyncWebsocketConsumer):
 
     async def receive(self, text_data):
         try:
-            print(f"[WebSocket] 📩 Received data: {text_data}")
             data = json.loads(text_data)
+            log.debug("[WebSocket] 📩 Received %s bytes", len(text_data))
             message_text = data.get('message', '')
             message_type = data.get('type', 'TEXT')
-            print(f"[WebSocket] Message text: '{message_text}', type: {message_type}")
+            log.debug("[WebSocket] Message: %s chars, type: %s", len(message_text or ''), message_type)
             
             if not message_text:
-                print("[WebSocket] ⚠️ Empty message, skipping")
+                log.warning("[WebSocket] ⚠️ Empty message, skipping")
                 return
             
-            print(f"[WebSocket] 💾 Saving message to database...")
+            log.debug("[WebSocket] 💾 Saving message to database...")
             message = await self.save_message(message_text, message_type)
-            print(f"[WebSocket] ✅ Message saved with ID: {message.messageID}")
+            log.debug("[WebSocket] ✅ Message saved with ID: %s", message.messageID)
             
-            await self.channel_layer.group_send(
-                self.room_group_name,
+            await asend_to_conversation(
+                self.channel_layer,
+                self.conversation_id,
                 {
                     'type': 'chat_message',
+                    'sender_account_id': self.user.pk,
                     'message': {
                         'id': message.messageID,
                         'conversation_id': self.conversation_id,
@@ -764,9 +753,10 @@ class ChatConsumer(AsyncWebsocketConsumer):
                         'timestamp': message.createdAt.isoformat(),
                         'is_read': message.isRead,
                     }
-                }
+                },
+                include_legacy_group=True,
             )
-            print(f"[WebSocket] 📤 Message broadcasted to group")
+            log.debug("[WebSocket] 📤 Message broadcasted to group")
         except ValueError as e:
             if str(e) == "CONTACT_INFO_BLOCKED":
                 await self.send(text_data=json.dumps({
@@ -777,11 +767,9 @@ class ChatConsumer(AsyncWebsocketConsumer):
                 return
             raise
         except json.JSONDecodeError as e:
-            print(f"[WebSocket] ❌ JSON decode error: {str(e)}")
+            log.error("[WebSocket] ❌ JSON decode error: %s", e)
         except Exception as e:
-            print(f'[WebSocket] ❌ Error in receive: {str(e)}')
-            import traceback
-            traceback.print_exc()
+            log.exception("[WebSocket] ❌ Error in receive: %s", e)
 
     async def chat_message(self, event):
         message = event['message']
@@ -790,23 +778,20 @@ class ChatConsumer(AsyncWebsocketConsumer):
     @database_sync_to_async
     def verify_conversation_access(self):
         try:
-            print(f"[WebSocket] Checking access for user: {self.user}")
+            log.debug("[WebSocket] Checking access for user: %s", getattr(self.user, "accountID", None))
             profile_type = getattr(self.user, 'profile_type', None)
             if profile_type:
                 profile = Profile.objects.filter(accountFK=self.user, profileType=profile_type).first()
             else:
                 profile = Profile.objects.filter(accountFK=self.user).first()
             if not profile:
-                print(f"[WebSocket] ERROR: Profile not found for user {self.user}")
+                log.error("[WebSocket] ERROR: Profile not found for user %s", getattr(self.user, "accountID", None))
                 return False
-            print(f"[WebSocket] Found profile: {profile.profileID}")
+            log.debug("[WebSocket] Found profile: %s", profile.profileID)
             
             conversation = Conversation.objects.get(conversationID=self.conversation_id)
-            print(f"[WebSocket] Found conversation: {conversation.conversationID}")
-            print(
-                f"[WebSocket] Client: {getattr(conversation.client, 'profileID', None)}, "
-                f"Worker: {getattr(conversation.worker, 'profileID', None)}"
-            )
+            log.debug("[WebSocket] Found conversation: %s", conversation.conversationID)
+            log.debug("[WebSocket] Client: %s, Worker: %s", getattr(conversation.client, 'profileID', None), getattr(conversation.worker, 'profileID', None))
 
             is_direct_participant = (
                 (conversation.client and conversation.client.profileID == profile.profileID)
@@ -819,13 +804,13 @@ class ChatConsumer(AsyncWebsocketConsumer):
             ).exists()
 
             has_access = is_direct_participant or is_team_participant
-            print(f"[WebSocket] Access result: {has_access}")
+            log.debug("[WebSocket] Access result: %s", has_access)
             return has_access
         except Conversation.DoesNotExist:
-            print(f"[WebSocket] ERROR: Conversation {self.conversation_id} not found")
+            log.error("[WebSocket] ERROR: Conversation %s not found", self.conversation_id)
             return False
         except Exception as e:
-            print(f"[WebSocket] ERROR: {str(e)}")
+            log.error("[WebSocket] ERROR: %s", e)
             return False
 
     @database_sync_to_async
@@ -835,7 +820,7 @@ class ChatConsumer(AsyncWebsocketConsumer):
             if normalized_message_type == "TEXT" and contains_contact_info(message_text):
                 raise ValueError("CONTACT_INFO_BLOCKED")
 
-            print(f"[WebSocket] 🔍 Looking up profile for user: {self.user.email}")
+            log.debug("[WebSocket] 🔍 Looking up profile for user: %s", redact(self.user.email))
             profile_type = getattr(self.user, 'profile_type', None)
             if profile_type:
                 profile = Profile.objects.filter(accountFK=self.user, profileType=profile_type).first()
@@ -843,13 +828,13 @@ class ChatConsumer(AsyncWebsocketConsumer):
                 profile = Profile.objects.filter(accountFK=self.user).first()
             if not profile:
                 raise Profile.DoesNotExist(f"No profile found for user {self.user.email}")
-            print(f"[WebSocket] ✅ Found profile: {profile.profileID}")
+            log.debug("[WebSocket] ✅ Found profile: %s", profile.profileID)
             
-            print(f"[WebSocket] 🔍 Looking up conversation: {self.conversation_id}")
+            log.debug("[WebSocket] 🔍 Looking up conversation: %s", self.conversation_id)
             conversation = Conversation.objects.get(conversationID=self.conversation_id)
-            print(f"[WebSocket] ✅ Found conversation: {conversation.conversationID}")
+            log.debug("[WebSocket] ✅ Found conversation: %s", conversation.conversationID)
             
-            print(f"[WebSocket] 💾 Creating message...")
+            log.debug("[WebSocket] 💾 Creating message...")
             message = Message.objects.create(
                 conversationID=conversation, 
                 sender=profile, 
@@ -857,12 +842,10 @@ class ChatConsumer(AsyncWebsocketConsumer):
                 messageType=normalized_message_type,
                 isRead=False
             )
-            print(f"[WebSocket] ✅ Message created with ID: {message.messageID}")
+            log.debug("[WebSocket] ✅ Message created with ID: %s", message.messageID)
             return message
         except Exception as e:
-            print(f"[WebSocket] ❌ Error saving message: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            log.exception("[WebSocket] ❌ Error saving message: %s", e)
             raise
 
 
@@ -876,44 +859,44 @@ class JobStatusConsumer(AsyncWebsocketConsumer):
         self.room_group_name = f'job_{self.job_id}'
         self.user = self.scope.get('user')
         
-        print(f"[JobWS] Connection attempt to job {self.job_id}")
-        print(f"[JobWS] User: {self.user}")
+        log.debug("[JobWS] Connection attempt to job %s", self.job_id)
+        log.debug("[JobWS] User: %s", getattr(self.user, "accountID", None))
         
         if not self.user or not self.user.is_authenticated:
-            print(f"[JobWS] REJECTED: User not authenticated")
+            log.warning("[JobWS] REJECTED: User not authenticated")
             await self.close()
             return
         
         has_access = await self.verify_job_access()
-        print(f"[JobWS] Has access: {has_access}")
+        log.debug("[JobWS] Has access: %s", has_access)
         
         if not has_access:
-            print(f"[JobWS] REJECTED: User does not have access to job")
+            log.warning("[JobWS] REJECTED: User does not have access to job")
             await self.close()
             return
         
         await self.channel_layer.group_add(self.room_group_name, self.channel_name)
         await self.accept()
-        print(f"[JobWS] ✅ Connection accepted for user {self.user.email}")
+        log.debug("[JobWS] ✅ Connection accepted for user %s", redact(self.user.email))
 
     async def disconnect(self, close_code):
         if hasattr(self, 'room_group_name'):
             await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
-            print(f"[JobWS] Disconnected from job {self.job_id}")
+            log.debug("[JobWS] Disconnected from job %s", self.job_id)
 
     async def receive(self, text_data):
         """Handle incoming WebSocket messages"""
         try:
-            print(f"[JobWS] 📩 Received data: {text_data}")
             data = json.loads(text_data)
+            log.debug("[JobWS] 📩 Received action=%s (%s bytes)", data.get('action'), len(text_data))
             # Currently no client-to-server messages needed
             # Job status updates are sent from the API endpoints
         except Exception as e:
-            print(f'[JobWS] ❌ Error in receive: {str(e)}')
+            log.error("[JobWS] ❌ Error in receive: %s", e)
 
     async def job_status_update(self, event):
         """Send job status update to WebSocket"""
-        print(f"[JobWS] 📤 Broadcasting job status update: {event['data']}")
+        log.debug("[JobWS] 📤 Broadcasting job status update: %s", event['data'])
         await self.send(text_data=json.dumps({
             'type': 'job_status_update',
             'data': event['data']
@@ -940,18 +923,16 @@ class JobStatusConsumer(AsyncWebsocketConsumer):
             is_worker = job.assignedWorkerID and job.assignedWorkerID.profileID.profileID == profile.profileID
             
             has_access = is_client or is_worker
-            print(f"[JobWS] Access check - Client: {is_client}, Worker: {is_worker}, Has access: {has_access}")
+            log.debug("[JobWS] Access check - Client: %s, Worker: %s, Has access: %s", is_client, is_worker, has_access)
             return has_access
         except Profile.DoesNotExist:
-            print(f"[JobWS] ERROR: Profile not found for user {self.user}")
+            log.error("[JobWS] ERROR: Profile not found for user %s", getattr(self.user, "accountID", None))
             return False
         except Job.DoesNotExist:
-            print(f"[JobWS] ERROR: Job {self.job_id} not found")
+            log.error("[JobWS] ERROR: Job %s not found", self.job_id)
             return False
         except Exception as e:
-            print(f"[JobWS] ERROR: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            log.exception("[JobWS] ERROR: %s", e)
             return False
 
 
@@ -970,17 +951,17 @@ class CallConsumer(AsyncWebsocketConsumer):
         self.call_group_name = f'call_{self.conversation_id}'
         self.user = self.scope.get('user')
         
-        print(f"[CallWS] Connection attempt for conversation {self.conversation_id}")
+        log.debug("[CallWS] Connection attempt for conversation %s", self.conversation_id)
         
         if not self.user or not self.user.is_authenticated:
-            print(f"[CallWS] REJECTED: User not authenticated")
+            log.warning("[CallWS] REJECTED: User not authenticated")
             await self.close()
             return
         
         # Verify user has access to this conversation
         has_access = await self.verify_conversation_access()
         if not has_access:
-            print(f"[CallWS] REJECTED: User does not have access to conversation")
+            log.warning("[CallWS] REJECTED: User does not have access to conversation")
             await self.close()
             return
         
@@ -988,19 +969,19 @@ class CallConsumer(AsyncWebsocketConsumer):
         await self.channel_layer.group_add(self.call_group_name, self.channel_name)
         await self.accept()
         
-        print(f"[CallWS] ✅ Connection accepted for user {self.user.email}")
+        log.debug("[CallWS] ✅ Connection accepted for user %s", redact(self.user.email))
     
     async def disconnect(self, close_code):
         if hasattr(self, 'call_group_name'):
             await self.channel_layer.group_discard(self.call_group_name, self.channel_name)
-            print(f"[CallWS] Disconnected from call group {self.call_group_name}")
+            log.debug("[CallWS] Disconnected from call group %s", self.call_group_name)
     
     async def receive(self, text_data):
         """Handle incoming call signaling messages"""
         try:
-            print(f"[CallWS] 📩 Received: {text_data}")
             data = json.loads(text_data)
             action = data.get('action')
+            log.debug("[CallWS] 📩 Received action=%s", action)
             
             if action == 'initiate':
                 await self.handle_call_initiate(data)
@@ -1013,11 +994,9 @@ class CallConsumer(AsyncWebsocketConsumer):
             elif action == 'busy':
                 await self.handle_call_busy(data)
             else:
-                print(f"[CallWS] Unknown action: {action}")
+                log.debug("[CallWS] Unknown action: %s", action)
         except Exception as e:
-            print(f"[CallWS] ❌ Error in receive: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            log.exception("[CallWS] ❌ Error in receive: %s", e)
     
     async def handle_call_initiate(self, data):
         """Handle call initiation - broadcast to other participant"""
@@ -1047,7 +1026,7 @@ class CallConsumer(AsyncWebsocketConsumer):
             is_group=is_group,
         )
         
-        print(f"[CallWS] 📞 Call initiated by {caller_name} in conversation {self.conversation_id}")
+        log.debug("[CallWS] 📞 Call initiated by %s in conversation %s", caller_name, self.conversation_id)
     
     async def handle_call_accept(self, data):
         """Handle call acceptance"""
@@ -1064,7 +1043,7 @@ class CallConsumer(AsyncWebsocketConsumer):
             }
         )
         
-        print(f"[CallWS] ✅ Call accepted by {user_name}")
+        log.debug("[CallWS] ✅ Call accepted by %s", user_name)
     
     async def handle_call_reject(self, data):
         """Handle call rejection"""
@@ -1086,7 +1065,7 @@ class CallConsumer(AsyncWebsocketConsumer):
         # Create system message for missed/rejected call
         await self.create_call_system_message(f"📞 Missed call from {user_name}")
         
-        print(f"[CallWS] ❌ Call rejected by {user_name}: {reason}")
+        log.error("[CallWS] ❌ Call rejected by %s: %s", user_name, reason)
     
     async def handle_call_end(self, data):
         """Handle call termination"""
@@ -1110,7 +1089,7 @@ class CallConsumer(AsyncWebsocketConsumer):
             duration_str = self.format_duration(duration)
             await self.create_call_system_message(f"📞 Voice call • {duration_str}")
         
-        print(f"[CallWS] 📵 Call ended by {user_name}, duration: {duration}s")
+        log.debug("[CallWS] 📵 Call ended by %s, duration: %ss", user_name, duration)
     
     async def handle_call_busy(self, data):
         """Handle busy signal (user already in a call)"""
@@ -1127,7 +1106,7 @@ class CallConsumer(AsyncWebsocketConsumer):
             }
         )
         
-        print(f"[CallWS] 📵 {user_name} is busy")
+        log.debug("[CallWS] 📵 %s is busy", user_name)
     
     async def call_event(self, event):
         """Send call event to WebSocket client"""
@@ -1194,7 +1173,7 @@ class CallConsumer(AsyncWebsocketConsumer):
         except Conversation.DoesNotExist:
             return False
         except Exception as e:
-            print(f"[CallWS] Error verifying access: {str(e)}")
+            log.error("[CallWS] Error verifying access: %s", e)
             return False
     
     @database_sync_to_async
@@ -1219,9 +1198,9 @@ class CallConsumer(AsyncWebsocketConsumer):
                 messageText=text,
                 messageType='SYSTEM'
             )
-            print(f"[CallWS] Created system message: {text}")
+            log.debug("[CallWS] Created system message: %s", text)
         except Exception as e:
-            print(f"[CallWS] Error creating system message: {str(e)}")
+            log.error("[CallWS] Error creating system message: %s", e)
 
     @database_sync_to_async
     def get_call_recipient_account_ids(self):
@@ -1252,7 +1231,7 @@ class CallConsumer(AsyncWebsocketConsumer):
             recipient_ids.discard(caller_account_id)
             return list(recipient_ids)
         except Exception as e:
-            print(f"[CallWS] Error getting recipient account IDs: {str(e)}")
+            log.error("[CallWS] Error getting recipient account IDs: %s", e)
             return []
 
     @database_sync_to_async
@@ -1267,7 +1246,9 @@ class CallConsumer(AsyncWebsocketConsumer):
             conversation = Conversation.objects.filter(conversationID=self.conversation_id).first()
             related_job = conversation.relatedJobPosting if conversation else None
 
-            Notification.objects.bulk_create([
+            from accounts.notification_feed import publish_created
+
+            publish_created(Notification.objects.bulk_create([
                 Notification(
                     accountFK_id=account_id,
                     notificationType='MESSAGE',
@@ -1276,9 +1257,9 @@ class CallConsumer(AsyncWebsocketConsumer):
                     relatedJobID=related_job,
                 )
                 for account_id in recipient_account_ids
-            ])
+            ]))
         except Exception as e:
-            print(f"[CallWS] Error creating incoming call notifications: {str(e)}")
+            log.error("[CallWS] Error creating incoming call notifications: %s", e)
 
     async def send_incoming_call_push_notifications(self, caller_name, channel_name, is_group=False):
         """Create in-app notification records and send device push alerts for call invites."""
@@ -1309,6 +1290,6 @@ class CallConsumer(AsyncWebsocketConsumer):
                 data=payload,
                 category='messages',
             )
-            print(f"[CallWS] 📲 Push call alert sent: {send_result}")
+            log.debug("[CallWS] 📲 Push call alert sent: %s", send_result)
         except Exception as e:
-            print(f"[CallWS] Error sending call push notifications: {str(e)}")
+            log.error("[CallWS] Error sending call push notifications: %s", e)
@@ -0,0 +1,121 @@
+"""
+Deferred broadcast bus for job status updates.
+
+publish_job_status() never talks to the channel layer itself. The event is
+handed to transaction.on_commit, so updates from rolled-back writes are never
+delivered, and on commit it lands in the current request's buffer. All
+updates for the same job are coalesced into one message: data dicts are
+merged in publish order and, when several distinct events were merged,
+"events" lists them all (the last one stays in "event").
+
+DeferredBroadcastMiddleware opens a buffer per request and flushes it once
+the response is built: job -> conversation -> member accounts are resolved
+from the routing caches in a couple of cache round trips, and every
+job_{id} / user_{accountID} send goes out through a single
+group_send_many() call. Outside a request (management commands, scripts)
+wrap work in deferred_broadcasts(); without a buffer each committed update
+is delivered on its own.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from django.db import transaction
+
+from .channel_routing import get_job_member_accounts, group_send_many, user_group_name
+from iayos_project.observability import get_logger
+
+log = get_logger(__name__)
+
+JOB_STATUS_EVENT = "job_status_update"
+
+_current_buffer: ContextVar[Optional["EventBuffer"]] = ContextVar("event_bus_buffer", default=None)
+
+
+def job_group_name(job_id: int) -> str:
+    """Group joined by JobStatusConsumer (ws/job/<id>/)."""
+    return f"job_{job_id}"
+
+
+class EventBuffer:
+    """Committed job status updates waiting to be delivered, coalesced per job."""
+
+    def __init__(self):
+        self.jobs: Dict[int, dict] = {}
+        self.event_names: Dict[int, List[str]] = {}
+
+    def add_job_status(self, job_id: int, data: dict) -> None:
+        self.jobs.setdefault(job_id, {}).update(data)
+        name = data.get("event")
+        names = self.event_names.setdefault(job_id, [])
+        if name and name not in names:
+            names.append(name)
+
+    def build_messages(self) -> List[tuple]:
+        members = get_job_member_accounts(self.jobs)
+        messages = []
+        for job_id, data in self.jobs.items():
+            names = self.event_names.get(job_id, [])
+            if len(names) > 1:
+                data = {**data, "events": names}
+            event = {"type": JOB_STATUS_EVENT, "data": data}
+            messages.append((job_group_name(job_id), event))
+            messages.extend((user_group_name(account_id), event) for account_id in members.get(job_id, []))
+        return messages
+
+    def flush(self, channel_layer=None) -> int:
+        """Deliver and clear buffered updates. Returns sends issued."""
+        if not self.jobs:
+            return 0
+        try:
+            sent = group_send_many(self.build_messages(), channel_layer)
+            log.debug("📡 Broadcasted %s job status update(s) in %s group send(s)", len(self.jobs), sent)
+            return sent
+        except Exception as e:
+            log.error("❌ Error broadcasting job status updates for jobs %s: %s", list(self.jobs), e)
+            return 0
+        finally:
+            self.jobs, self.event_names = {}, {}
+
+
+def _deliver(job_id: int, data: dict) -> None:
+    buffer = _current_buffer.get()
+    if buffer is not None:
+        buffer.add_job_status(job_id, data)
+        return
+    single = EventBuffer()
+    single.add_job_status(job_id, data)
+    single.flush()
+
+
+def publish_job_status(job_id: int, data: dict) -> None:
+    """Queue a job status update for delivery after the current transaction commits."""
+    job_id, data = int(job_id), dict(data)
+    transaction.on_commit(lambda: _deliver(job_id, data))
+
+
+@contextmanager
+def deferred_broadcasts(channel_layer=None):
+    """Buffer committed job status updates and flush them once on exit (re-entrant)."""
+    if _current_buffer.get() is not None:
+        yield _current_buffer.get()
+        return
+
+    buffer = EventBuffer()
+    token = _current_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _current_buffer.reset(token)
+        buffer.flush(channel_layer)
+
+
+class DeferredBroadcastMiddleware:
+    """Flush the request's buffered job status updates after the response is built."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with deferred_broadcasts():
+            return self.get_response(request)
@@ -0,0 +1,113 @@
+"""
+Benchmark InboxConsumer connect/broadcast cost: per-conversation groups vs
+per-account routing.
+
+Simulates sockets against a counting in-memory channel layer (no database
+or Redis needed) and prints JSON with channel-layer operations and wall time
+for each strategy at several conversation counts.
+
+Usage:
+    python manage.py benchmark_inbox_routing
+    python manage.py benchmark_inbox_routing --sockets 200 --conversations 10,100,500
+"""
+import asyncio
+import json
+import time
+
+from channels.layers import InMemoryChannelLayer
+from django.core.management.base import BaseCommand
+
+from profiles.channel_routing import legacy_conversation_group_name, user_group_name
+
+
+class CountingChannelLayer(InMemoryChannelLayer):
+    """InMemoryChannelLayer that counts group operations (a stand-in for Redis round trips)."""
+
+    def __init__(self, **kwargs):
+        super().__init__(capacity=100000, **kwargs)
+        self.ops = 0
+
+    async def group_add(self, group, channel):
+        self.ops += 1
+        return await super().group_add(group, channel)
+
+    async def group_send(self, group, message):
+        self.ops += 1
+        return await super().group_send(group, message)
+
+
+async def _simulate(strategy: str, sockets: int, conversations: int, job_conversations: int):
+    layer = CountingChannelLayer()
+    # Socket i belongs to account i; every account shares `conversations`
+    # conversations with its neighbour, so membership is two accounts each.
+    channels = [await layer.new_channel() for _ in range(sockets)]
+
+    started = time.perf_counter()
+    for account_id, channel in enumerate(channels):
+        if strategy == "per_conversation":
+            for offset in range(conversations):
+                conversation_id = account_id * conversations + offset
+                await layer.group_add(legacy_conversation_group_name(conversation_id), channel)
+        else:
+            await layer.group_add(user_group_name(account_id), channel)
+    connect_ms = (time.perf_counter() - started) * 1000
+    connect_ops = layer.ops
+
+    # One job update fanned out to `job_conversations` conversations whose
+    # participants are the same client plus one worker each.
+    layer.ops = 0
+    event = {"type": "job.status.update", "data": {"job_id": 1}}
+    started = time.perf_counter()
+    if strategy == "per_conversation":
+        for conversation_id in range(job_conversations):
+            await layer.group_send(legacy_conversation_group_name(conversation_id), event)
+    else:
+        accounts = {0} | {1 + index for index in range(min(job_conversations, sockets - 1))}
+        for account_id in accounts:
+            await layer.group_send(user_group_name(account_id), event)
+    broadcast_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "strategy": strategy,
+        "sockets": sockets,
+        "conversations_per_user": conversations,
+        "job_conversations": job_conversations,
+        "connect_ops_total": connect_ops,
+        "connect_ops_per_socket": round(connect_ops / max(sockets, 1), 2),
+        "connect_ms_total": round(connect_ms, 2),
+        "broadcast_ops": layer.ops,
+        "broadcast_ms": round(broadcast_ms, 2),
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare InboxConsumer connect/broadcast cost for per-conversation vs per-account groups"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sockets", type=int, default=100, help="Simulated sockets (one per account).")
+        parser.add_argument(
+            "--conversations",
+            default="10,100,500",
+            help="Comma-separated conversations-per-user scales.",
+        )
+        parser.add_argument(
+            "--job-conversations",
+            type=int,
+            default=20,
+            help="Conversations linked to the broadcast job (team jobs have many).",
+        )
+
+    def handle(self, *args, **options):
+        sockets = max(2, options["sockets"])
+        scales = [int(value) for value in str(options["conversations"]).split(",") if value.strip()]
+
+        results = []
+        for conversations in scales:
+            for strategy in ("per_conversation", "per_account"):
+                results.append(
+                    asyncio.run(
+                        _simulate(strategy, sockets, conversations, options["job_conversations"])
+                    )
+                )
+
+        self.stdout.write(json.dumps({"results": results}, indent=2))
@@ -0,0 +1,193 @@
+"""
+Benchmark websocket message throughput with print() vs the background logger.
+
+Runs a minimal consumer that, like InboxConsumer.receive, writes six log
+lines per message and echoes it back, driven by concurrent
+WebsocketCommunicator clients (no database, Redis or channel layer needed).
+Prints JSON with messages/sec for each scenario:
+
+- print:              f-string print() to the sink (the old hot path)
+- logging_sync:       stdlib logger at DEBUG with a plain StreamHandler
+- background_debug:   get_logger() at DEBUG through BackgroundQueueHandler
+- background_sampled: same, debug lines sampled at --sample-rate
+- background_info:    get_logger() at INFO (debug lines skipped, production)
+
+--write-delay-ms makes every sink write sleep, simulating a stdout pipe that
+is slow to drain (container log driver under load).
+
+Usage:
+    python manage.py benchmark_ws_logging
+    python manage.py benchmark_ws_logging --clients 50 --messages 200 --write-delay-ms 0.2
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import redirect_stdout
+
+from channels.generic.websocket import AsyncWebsocketConsumer
+from channels.testing import WebsocketCommunicator
+from django.core.management.base import BaseCommand
+
+from iayos_project.observability import BackgroundQueueHandler, StructuredLogger
+
+LOGGER_NAME = "iayos.benchmark.ws_logging"
+
+
+class SlowSink:
+    """Line sink (os.devnull) whose line writes can be made to block."""
+
+    def __init__(self, delay_ms: float):
+        self.delay = delay_ms / 1000
+        self.file = open(os.devnull, "w")
+        self.lines = 0
+
+    def write(self, text):
+        # print() writes the text and the newline separately; count lines once
+        if text.endswith("\n"):
+            if self.delay:
+                time.sleep(self.delay)
+            self.lines += 1
+        return self.file.write(text)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class BenchmarkConsumer(AsyncWebsocketConsumer):
+    # Not a configured alias: no channel layer, so nothing outside the process is touched
+    channel_layer_alias = "benchmark-no-layer"
+    emit = None  # set per scenario: emit(user_id, conversation_id, text)
+
+    async def connect(self):
+        await self.accept()
+
+    async def receive(self, text_data=None, bytes_data=None):
+        data = json.loads(text_data)
+        BenchmarkConsumer.emit(data["user_id"], data["conversation_id"], data["message"])
+        await self.send(text_data=text_data)
+
+
+def _print_emit(user_id, conversation_id, text):
+    print(f"[InboxWS] 📩 Received data: {text}")
+    print(f"[InboxWS] Conversation: {conversation_id}, Message: '{text}', Type: TEXT")
+    print("[InboxWS] 💾 Saving message to database...")
+    print(f"[InboxWS] ✅ Message saved with ID: {conversation_id}")
+    print(f"[InboxWS] 📤 Message routed for conversation {conversation_id}")
+    print(f"[InboxWS] 📤 Sending message for conversation {conversation_id} to {user_id}")
+
+
+def _logger_emit(log):
+    def emit(user_id, conversation_id, text):
+        log.debug("[InboxWS] 📩 Received data: %s", text)
+        log.debug("[InboxWS] Conversation: %s, Message: '%s', Type: TEXT", conversation_id, text)
+        log.debug("[InboxWS] 💾 Saving message to database...")
+        log.debug("[InboxWS] ✅ Message saved with ID: %s", conversation_id)
+        log.debug("[InboxWS] 📤 Message routed for conversation %s", conversation_id)
+        log.debug("[InboxWS] 📤 Sending message for conversation %s to %s", conversation_id, user_id)
+
+    return emit
+
+
+async def _client(index: int, messages: int):
+    communicator = WebsocketCommunicator(BenchmarkConsumer.as_asgi(), "/ws/benchmark/")
+    connected, _ = await communicator.connect()
+    assert connected
+    for number in range(messages):
+        payload = {"user_id": index, "conversation_id": index * messages + number, "message": f"hello {number}"}
+        await communicator.send_to(text_data=json.dumps(payload))
+        await communicator.receive_from(timeout=30)
+    await communicator.disconnect()
+
+
+async def _drive(clients: int, messages: int) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(_client(index, messages) for index in range(clients)))
+    return time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = "Compare websocket throughput with print() vs the non-blocking logger"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clients", type=int, default=20, help="Concurrent websocket clients.")
+        parser.add_argument("--messages", type=int, default=100, help="Messages per client.")
+        parser.add_argument("--write-delay-ms", type=float, default=0.0, help="Sleep per sink write.")
+        parser.add_argument("--sample-rate", type=float, default=0.1, help="Debug sample rate (sampled scenario).")
+
+    def handle(self, *args, **options):
+        clients, messages = max(1, options["clients"]), max(1, options["messages"])
+        logger = logging.getLogger(LOGGER_NAME)
+        previous = (logger.level, logger.propagate, list(logger.handlers))
+        logger.propagate = False
+
+        results = []
+        try:
+            for name in ("print", "logging_sync", "background_debug", "background_sampled", "background_info"):
+                results.append(self._run(name, logger, clients, messages, options))
+        finally:
+            logger.setLevel(previous[0])
+            logger.propagate = previous[1]
+            logger.handlers = previous[2]
+            BenchmarkConsumer.emit = None
+
+        self.stdout.write(
+            json.dumps(
+                {
+                    "clients": clients,
+                    "messages_per_client": messages,
+                    "write_delay_ms": options["write_delay_ms"],
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+
+    def _run(self, name, logger, clients, messages, options):
+        sink = SlowSink(options["write_delay_ms"])
+        handler = None
+        logger.handlers = []
+        if name == "print":
+            BenchmarkConsumer.emit = _print_emit
+        else:
+            if name == "logging_sync":
+                handler = logging.StreamHandler(sink)
+            else:
+                handler = BackgroundQueueHandler(stream=sink, maxsize=100000)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO if name == "background_info" else logging.DEBUG)
+            if name == "logging_sync":
+                BenchmarkConsumer.emit = _logger_emit(logger)
+            else:
+                rate = options["sample_rate"] if name == "background_sampled" else 1.0
+                BenchmarkConsumer.emit = _logger_emit(StructuredLogger(LOGGER_NAME, debug_sample_rate=rate))
+
+        try:
+            if name == "print":
+                with redirect_stdout(sink):
+                    elapsed = asyncio.run(_drive(clients, messages))
+            else:
+                elapsed = asyncio.run(_drive(clients, messages))
+            dropped = getattr(handler, "dropped", 0)
+            if handler is not None:
+                handler.flush()
+        finally:
+            if handler is not None:
+                logger.removeHandler(handler)
+                handler.close()
+            sink.close()
+
+        total = clients * messages
+        return {
+            "scenario": name,
+            "messages": total,
+            "seconds": round(elapsed, 3),
+            "msgs_per_sec": round(total / elapsed, 1),
+            "lines_written": sink.lines,
+            "dropped": dropped,
+        }
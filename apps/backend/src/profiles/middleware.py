@@ -4,6 +4,9 @@ from django.contrib.auth.models import AnonymousUser
 from django.contrib.auth import get_user_model
 from django.conf import settings
 import jwt
+from iayos_project.observability import get_logger, redact
+
+log = get_logger(__name__)
 
 User = get_user_model()
 
@@ -22,16 +25,16 @@ def get_user_from_jwt(token):
             # Attach profile_type to user object for dual-profile support
             if profile_type:
                 user.profile_type = profile_type
-                print(f"[WebSocket Auth] Profile type from JWT: {profile_type}")
+                log.debug("[WebSocket Auth] Profile type from JWT: %s", profile_type)
             return user
     except jwt.ExpiredSignatureError:
-        print(f"[WebSocket Auth] Token has expired")
+        log.debug("[WebSocket Auth] Token has expired")
     except jwt.InvalidTokenError as e:
-        print(f"[WebSocket Auth] Invalid token: {str(e)}")
+        log.debug("[WebSocket Auth] Invalid token: %s", e)
     except User.DoesNotExist:
-        print(f"[WebSocket Auth] User not found: {user_id}")
+        log.debug("[WebSocket Auth] User not found: %s", user_id)
     except Exception as e:
-        print(f"[WebSocket Auth] Error: {str(e)}")
+        log.error("[WebSocket Auth] Error: %s", e)
     
     return AnonymousUser()
 
@@ -45,22 +48,22 @@ class SessionAuthMiddleware(BaseMiddleware):
     """
     
     async def __call__(self, scope, receive, send):
-        print(f"[WebSocket Auth] ========== NEW CONNECTION ==========")
-        print(f"[WebSocket Auth] Scope type: {scope.get('type')}")
-        print(f"[WebSocket Auth] Path: {scope.get('path')}")
+        log.debug("[WebSocket Auth] ========== NEW CONNECTION ==========")
+        log.debug("[WebSocket Auth] Scope type: %s", scope.get('type'))
+        log.debug("[WebSocket Auth] Path: %s", scope.get('path'))
         
         access_token = None
         
         # First try to get token from query string (higher priority for WebSocket)
         query_string = scope.get('query_string', b'').decode()
-        print(f"[WebSocket Auth] Query string: {query_string[:50] if query_string else 'None'}...")
+        log.debug("[WebSocket Auth] Query string present: %s", bool(query_string))
         
         if query_string:
             from urllib.parse import parse_qs
             params = parse_qs(query_string)
             if 'token' in params:
                 access_token = params['token'][0]
-                print(f"[WebSocket Auth] Token from query param: {access_token[:30]}...")
+                log.debug("[WebSocket Auth] Token from query param: %s...", redact(access_token[:30]))
         
         # If no query token, try cookies
         if not access_token:
@@ -76,16 +79,16 @@ class SessionAuthMiddleware(BaseMiddleware):
                 access_token = cookies.get('access')
                 
                 if access_token:
-                    print(f"[WebSocket Auth] Token from cookie: {access_token[:30]}...")
+                    log.debug("[WebSocket Auth] Token from cookie: %s...", redact(access_token[:30]))
                 else:
-                    print(f"[WebSocket Auth] Cookies found but no 'access': {', '.join(cookies.keys())}")
+                    log.debug("[WebSocket Auth] Cookies found but no 'access': %s", ', '.join(cookies.keys()))
         
         # Get user from JWT token
         if access_token:
             scope['user'] = await get_user_from_jwt(access_token)
-            print(f"[WebSocket Auth] Authenticated user: {scope['user']}")
+            log.debug("[WebSocket Auth] Authenticated user: %s", scope['user'].accountID)
         else:
             scope['user'] = AnonymousUser()
-            print(f"[WebSocket Auth] No access token found")
+            log.debug("[WebSocket Auth] No access token found")
         
         return await super().__call__(scope, receive, send)
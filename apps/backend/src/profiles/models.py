@@ -186,6 +186,41 @@ class Conversation(models.Model):
             return f"{self.worker.firstName} {self.worker.lastName}"
         return "Unknown"
     
+    MEMBERSHIP_FIELDS = ('client_id', 'worker_id', 'agency_id', 'relatedJobPosting_id')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._membership_snapshot = instance._membership_key()
+        return instance
+
+    def _membership_key(self):
+        # Read from __dict__ so deferred fields are not fetched.
+        return tuple(self.__dict__.get(field) for field in self.MEMBERSHIP_FIELDS)
+
+    def save(self, *args, **kwargs):
+        """Drop cached WebSocket membership when participants changed."""
+        previous = getattr(self, '_membership_snapshot', None)
+        super().save(*args, **kwargs)
+        current = self._membership_key()
+        if previous != current:
+            if previous and previous[3] and previous[3] != current[3]:
+                from .channel_routing import invalidate_conversation_membership
+                invalidate_conversation_membership(self.pk, previous[3])
+            self._invalidate_membership()
+            self._membership_snapshot = current
+
+    def delete(self, *args, **kwargs):
+        conversation_id, job_id = self.pk, self.relatedJobPosting_id
+        result = super().delete(*args, **kwargs)
+        from .channel_routing import invalidate_conversation_membership
+        invalidate_conversation_membership(conversation_id, job_id)
+        return result
+
+    def _invalidate_membership(self):
+        from .channel_routing import invalidate_conversation_membership
+        invalidate_conversation_membership(self.pk, self.relatedJobPosting_id)
+
     def __str__(self):
         job_title = self.relatedJobPosting.title if self.relatedJobPosting else "Unknown Job"
         if self.agency:
@@ -277,6 +312,8 @@ class Conversation(models.Model):
             conversation=self,
             profile=worker_profile
         ).delete()
+        if deleted:
+            self._invalidate_membership()
         return deleted > 0
     
     def get_all_participants(self):
@@ -380,6 +417,20 @@ class ConversationParticipant(models.Model):
             return f"Admin ({self.admin_account.email}) in {self.conversation}"
         return f"Participant in {self.conversation}"
     
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        super().save(*args, **kwargs)
+        if update_fields is None or {'conversation', 'profile', 'admin_account'}.intersection(update_fields):
+            from .channel_routing import invalidate_conversation_membership
+            invalidate_conversation_membership(self.conversation_id)
+
+    def delete(self, *args, **kwargs):
+        conversation_id = self.conversation_id
+        result = super().delete(*args, **kwargs)
+        from .channel_routing import invalidate_conversation_membership
+        invalidate_conversation_membership(conversation_id)
+        return result
+
     def mark_as_read(self):
         """Mark all messages as read for this participant."""
         from django.utils import timezone
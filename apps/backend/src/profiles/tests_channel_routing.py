@@ -0,0 +1,257 @@
+"""
+Tests for per-account WebSocket routing: cached conversation membership,
+job fan-out, deferred job status broadcasts and the InboxConsumer access
+filter for dual-profile accounts.
+"""
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+
+from accounts.models import Accounts, ClientProfile, Job, Profile
+
+from .channel_routing import (
+    get_conversation_member_accounts,
+    group_send_many,
+    send_to_job_conversations,
+    user_group_name,
+)
+from .consumers import InboxConsumer
+from .event_bus import deferred_broadcasts, job_group_name, publish_job_status
+from .models import Conversation
+
+
+class RecordingChannelLayer:
+    def __init__(self):
+        self.sent = []
+
+    async def group_send(self, group, message):
+        self.sent.append((group, message))
+
+
+class _RoutingFixtureMixin:
+    def _build_fixture(self):
+        cache.clear()
+        self.client_account = Accounts.objects.create_user(email="route-client@example.com", password="pass123")
+        self.client_profile = Profile.objects.create(
+            accountFK=self.client_account,
+            firstName="Route",
+            lastName="Client",
+            profileType=Profile.ProfileType.CLIENT,
+        )
+        client_record = ClientProfile.objects.create(
+            profileID=self.client_profile,
+            description="",
+            totalJobsPosted=0,
+            clientRating=0,
+            activeJobsCount=0,
+        )
+        self.worker_account = Accounts.objects.create_user(email="route-worker@example.com", password="pass123")
+        self.worker_profile = Profile.objects.create(
+            accountFK=self.worker_account,
+            firstName="Route",
+            lastName="Worker",
+            profileType=Profile.ProfileType.WORKER,
+        )
+        self.job = Job.objects.create(
+            clientID=client_record,
+            title="Routing job",
+            description="desc",
+            budget=Decimal("1000.00"),
+            location="Test",
+        )
+        self.conversation = Conversation.objects.create(
+            client=self.client_profile,
+            relatedJobPosting=self.job,
+            conversation_type=Conversation.ConversationType.TEAM_GROUP,
+        )
+
+
+class ChannelRoutingTests(_RoutingFixtureMixin, TestCase):
+    def setUp(self):
+        self._build_fixture()
+
+    def test_members_resolved_and_invalidated_on_participant_change(self):
+        self.assertEqual(
+            get_conversation_member_accounts(self.conversation.conversationID),
+            [self.client_account.accountID],
+        )
+
+        self.conversation.add_team_worker(self.worker_profile)
+
+        self.assertEqual(
+            get_conversation_member_accounts(self.conversation.conversationID),
+            sorted([self.client_account.accountID, self.worker_account.accountID]),
+        )
+
+    def test_job_update_sent_once_per_participant_account(self):
+        self.conversation.add_team_worker(self.worker_profile)
+        layer = RecordingChannelLayer()
+
+        sent = send_to_job_conversations(
+            self.job.jobID, {"type": "job_status_update", "data": {}}, channel_layer=layer
+        )
+
+        self.assertEqual(sent, 2)
+        self.assertEqual(
+            sorted(group for group, _ in layer.sent),
+            sorted([
+                user_group_name(self.client_account.accountID),
+                user_group_name(self.worker_account.accountID),
+            ]),
+        )
+
+    def test_non_membership_save_keeps_cached_members(self):
+        get_conversation_member_accounts(self.conversation.conversationID)
+        conversation = Conversation.objects.get(pk=self.conversation.pk)
+        conversation.lastMessageText = "hello"
+        conversation.save()
+
+        self.assertIsNotNone(
+            cache.get(f"cache:chat:members:{self.conversation.conversationID}")
+        )
+
+        conversation.worker = self.worker_profile
+        conversation.save()
+
+        self.assertIsNone(
+            cache.get(f"cache:chat:members:{self.conversation.conversationID}")
+        )
+
+    def test_updates_for_one_job_are_coalesced_after_commit(self):
+        layer = RecordingChannelLayer()
+        with deferred_broadcasts(channel_layer=layer):
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    publish_job_status(self.job.jobID, {"event": "worker_arrived", "status": "IN_PROGRESS"})
+                    publish_job_status(self.job.jobID, {"event": "job_completed", "status": "COMPLETED"})
+                self.assertEqual(layer.sent, [])
+
+        groups = [group for group, _ in layer.sent]
+        self.assertEqual(groups, [job_group_name(self.job.jobID), user_group_name(self.client_account.accountID)])
+        data = layer.sent[0][1]["data"]
+        self.assertEqual(data["status"], "COMPLETED")
+        self.assertEqual(data["events"], ["worker_arrived", "job_completed"])
+
+    def test_rolled_back_updates_are_never_sent(self):
+        layer = RecordingChannelLayer()
+        with deferred_broadcasts(channel_layer=layer):
+            with self.captureOnCommitCallbacks(execute=True):
+                try:
+                    with transaction.atomic():
+                        publish_job_status(self.job.jobID, {"event": "job_cancelled"})
+                        raise ValueError("rollback")
+                except ValueError:
+                    pass
+
+        self.assertEqual(layer.sent, [])
+
+
+class GroupSendManyTests(TestCase):
+    def test_events_for_one_group_keep_their_order(self):
+        layer = RecordingChannelLayer()
+        messages = [("user_1", {"n": 1}), ("user_2", {"n": 2}), ("user_1", {"n": 3})]
+
+        self.assertEqual(group_send_many(messages, layer), 3)
+
+        self.assertEqual([event["n"] for group, event in layer.sent if group == "user_1"], [1, 3])
+        self.assertEqual(sorted(layer.sent, key=lambda sent: sent[1]["n"]), messages)
+
+
+class InboxConsumerAccessTests(_RoutingFixtureMixin, TransactionTestCase):
+    """
+    The consumer's DB helpers run through database_sync_to_async, which closes
+    the connection between calls; that needs real commits, not a TestCase
+    transaction.
+    """
+
+    def setUp(self):
+        self._build_fixture()
+
+    def _consumer(self, account, profile_type=None):
+        consumer = InboxConsumer()
+        account.profile_type = profile_type
+        consumer.user = account
+        consumer.profile = async_to_sync(consumer.get_user_profile)()
+        consumer.agency = None
+        consumer.access_cache = {}
+        consumer.muted_conversations = set()
+        consumer.sent = []
+
+        async def send(text_data=None, bytes_data=None, close=False):
+            consumer.sent.append(text_data)
+
+        consumer.send = send
+        return consumer
+
+    def _chat_event(self):
+        return {
+            "type": "chat_message",
+            "sender_account_id": self.worker_account.accountID,
+            "message": {"conversation_id": self.conversation.conversationID, "message_text": "hi"},
+        }
+
+    def test_inbox_access_check_cold_then_warm_cache(self):
+        consumer = self._consumer(self.client_account)
+        conversation_id = self.conversation.conversationID
+
+        self.assertTrue(async_to_sync(consumer.has_conversation_access)(conversation_id))
+        self.assertIn(conversation_id, consumer.access_cache)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(async_to_sync(consumer.has_conversation_access)(str(conversation_id)))
+
+        outsider = self._consumer(self.worker_account)
+        self.assertFalse(async_to_sync(outsider.has_conversation_access)(conversation_id))
+        with self.assertNumQueries(0):
+            self.assertFalse(async_to_sync(outsider.has_conversation_access)(conversation_id))
+
+    def _job(self, title):
+        return Job.objects.create(
+            clientID=self.job.clientID,
+            title=title,
+            description="desc",
+            budget=Decimal("1000.00"),
+            location="Test",
+        )
+
+    def test_connect_warm_set_matches_verified_access(self):
+        other = Conversation.objects.create(
+            client=self.client_profile,
+            worker=self.worker_profile,
+            relatedJobPosting=self._job("Direct job"),
+        )
+        self.conversation.add_team_worker(self.worker_profile)
+        unrelated = Conversation.objects.create(
+            client=self.client_profile,
+            relatedJobPosting=self._job("Unrelated job"),
+            conversation_type=Conversation.ConversationType.TEAM_GROUP,
+        )
+
+        consumer = self._consumer(self.worker_account)
+        warm = async_to_sync(consumer.get_accessible_conversation_ids)()
+
+        self.assertEqual(warm, {self.conversation.conversationID, other.conversationID})
+        for conversation_id in (self.conversation.conversationID, other.conversationID, unrelated.conversationID):
+            self.assertEqual(
+                async_to_sync(consumer.verify_conversation_access)(conversation_id),
+                conversation_id in warm,
+            )
+
+    def test_dual_profile_socket_only_gets_events_for_its_profile(self):
+        Profile.objects.create(
+            accountFK=self.client_account,
+            firstName="Route",
+            lastName="Client",
+            profileType=Profile.ProfileType.WORKER,
+        )
+        worker_socket = self._consumer(self.client_account, "WORKER")
+        client_socket = self._consumer(Accounts.objects.get(pk=self.client_account.pk), "CLIENT")
+
+        async_to_sync(worker_socket.chat_message)(self._chat_event())
+        async_to_sync(client_socket.chat_message)(self._chat_event())
+
+        self.assertEqual(worker_socket.sent, [])
+        self.assertEqual(len(client_socket.sent), 1)
@@ -0,0 +1,239 @@
+"""
+Codemod: rewrite print() statements into leveled, lazily formatted log calls.
+
+    print(f"[InboxWS] ✅ Message saved with ID: {message.messageID}")
+becomes
+    log.debug("[InboxWS] ✅ Message saved with ID: %s", message.messageID)
+
+with `log = get_logger(__name__)` (iayos_project.observability) added after
+the module's imports. Modules that already have a logging.getLogger() logger
+can keep it with --logger-name logger (it goes through the same background
+handler via the root logger). Rules:
+
+- Only single-argument print() statements are rewritten; prints with
+  sep/end/file or several arguments are reported and left alone.
+- Level: "❌"/"error" -> error, "⚠️"/"rejected"/"denied"/"failed" ->
+  warning, everything else -> --default-level (debug).
+- f-string fields become %-style args so nothing is formatted when the level
+  is disabled; str(x) is unwrapped. Fields with a format spec keep the
+  f-string as-is.
+- Fields whose expression mentions a token, email, password or auth header are
+  wrapped in redact().
+
+Dry run (prints a diff) unless --write is given.
+
+Usage (from apps/backend/src):
+    python scripts/maintenance/print_to_logging.py profiles/consumers.py profiles/middleware.py
+    python scripts/maintenance/print_to_logging.py accounts/mobile_services.py --function get_mobile_job_list \
+        --logger-name logger --write
+"""
+import argparse
+import ast
+import difflib
+import sys
+from pathlib import Path
+
+IMPORT_MODULE = "iayos_project.observability"
+DEFAULT_LOGGER_NAME = "log"
+SENSITIVE_HINTS = ("token", "email", "password", "authorization")
+ERROR_HINTS = ("❌", "error")
+WARNING_HINTS = ("⚠️", "⚠", "rejected", "denied", "failed", "warning")
+CONVERSIONS = {-1: "%s", ord("s"): "%s", ord("r"): "%r", ord("a"): "%a"}
+
+
+def _literal(text: str) -> str:
+    """Double-quoted Python string literal (non-ASCII kept as-is)."""
+    escaped = (
+        text.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\t", "\\t")
+        .replace("\r", "\\r")
+    )
+    return f'"{escaped}"'
+
+
+def _unwrap_str(node: ast.AST) -> ast.AST:
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "str"
+        and len(node.args) == 1
+        and not node.keywords
+    ):
+        return node.args[0]
+    return node
+
+
+class Rewriter:
+    def __init__(self, source: str, default_level: str, functions=None, logger_name: str = DEFAULT_LOGGER_NAME):
+        self.source = source
+        self.logger_name = logger_name
+        self.tree = ast.parse(source)
+        self.default_level = default_level
+        self.functions = set(functions or [])
+        self.lines = source.splitlines(keepends=True)
+        self.needs_redact = False
+        self.skipped = []
+
+    # -- positions (ast columns are UTF-8 byte offsets) -----------------------
+
+    def _offset(self, lineno: int, col: int) -> int:
+        line = self.lines[lineno - 1]
+        return sum(len(text) for text in self.lines[: lineno - 1]) + len(line.encode("utf-8")[:col].decode("utf-8"))
+
+    def _segment(self, node: ast.AST) -> str:
+        return ast.get_source_segment(self.source, node)
+
+    # -- message conversion ---------------------------------------------------
+
+    def _argument(self, node: ast.AST) -> str:
+        node = _unwrap_str(node)
+        text = self._segment(node) or ast.unparse(node)
+        if any(hint in text.lower() for hint in SENSITIVE_HINTS):
+            self.needs_redact = True
+            return f"redact({text})"
+        return text
+
+    def _message(self, node: ast.AST):
+        """(message literal, [arg sources], plain text used for level detection)"""
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return _literal(node.value), [], node.value
+        if isinstance(node, ast.JoinedStr):
+            if any(
+                isinstance(part, ast.FormattedValue) and (part.format_spec or part.conversion not in CONVERSIONS)
+                for part in node.values
+            ):
+                text = "".join(part.value for part in node.values if isinstance(part, ast.Constant))
+                return self._segment(node), [], text
+            template, args, text = [], [], []
+            for part in node.values:
+                if isinstance(part, ast.Constant):
+                    template.append(part.value.replace("%", "%%"))
+                    text.append(part.value)
+                else:
+                    template.append(CONVERSIONS[part.conversion])
+                    args.append(self._argument(part.value))
+            return _literal("".join(template)), args, "".join(text)
+        return '"%s"', [self._argument(node)], ""
+
+    def _level(self, text: str) -> str:
+        lowered = text.lower()
+        if any(hint in lowered for hint in ERROR_HINTS):
+            return "error"
+        if any(hint in lowered for hint in WARNING_HINTS):
+            return "warning"
+        return self.default_level
+
+    # -- traversal ------------------------------------------------------------
+
+    def _targets(self):
+        stack = []
+
+        def visit(node, inside):
+            for child in ast.iter_child_nodes(node):
+                child_inside = inside
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    child_inside = inside or child.name in self.functions
+                if (
+                    isinstance(child, ast.Expr)
+                    and isinstance(child.value, ast.Call)
+                    and isinstance(child.value.func, ast.Name)
+                    and child.value.func.id == "print"
+                    and (child_inside or not self.functions)
+                ):
+                    call = child.value
+                    if len(call.args) == 1 and not call.keywords:
+                        stack.append(child)
+                    else:
+                        self.skipped.append(child.lineno)
+                visit(child, child_inside)
+
+        visit(self.tree, False)
+        return stack
+
+    def _import_position(self) -> int:
+        """Character offset just after the last top-level import of the module header."""
+        last = None
+        for statement in self.tree.body:
+            if isinstance(statement, (ast.Import, ast.ImportFrom)):
+                last = statement
+            elif last is not None and not (
+                isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant)
+            ):
+                break
+        if last is None:
+            return 0
+        return self._offset(last.end_lineno, last.end_col_offset) + 1  # past the newline
+
+    def _has_logger(self) -> bool:
+        for statement in self.tree.body:
+            if isinstance(statement, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == self.logger_name for target in statement.targets
+            ):
+                return True
+        return False
+
+    def rewrite(self):
+        targets = self._targets()
+        if not targets:
+            return self.source, 0
+
+        edits = []
+        for statement in targets:
+            message, args, text = self._message(statement.value.args[0])
+            call = f"{self.logger_name}.{self._level(text)}({', '.join([message, *args])})"
+            start = self._offset(statement.lineno, statement.col_offset)
+            end = self._offset(statement.end_lineno, statement.end_col_offset)
+            edits.append((start, end, call))
+
+        result = self.source
+        for start, end, replacement in sorted(edits, reverse=True):
+            result = result[:start] + replacement + result[end:]
+
+        if not self._has_logger():
+            names = "get_logger, redact" if self.needs_redact else "get_logger"
+            header = f"from {IMPORT_MODULE} import {names}\n\n{self.logger_name} = get_logger(__name__)\n"
+            position = self._import_position()
+            result = result[:position] + header + result[position:]
+        elif self.needs_redact and "redact" not in self.source:
+            position = self._import_position()
+            result = result[:position] + f"from {IMPORT_MODULE} import redact\n" + result[position:]
+
+        return result, len(edits)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rewrite print() calls into structured log calls.")
+    parser.add_argument("paths", nargs="+", type=Path)
+    parser.add_argument("--function", action="append", dest="functions", help="Only rewrite inside these functions.")
+    parser.add_argument("--logger-name", default=DEFAULT_LOGGER_NAME, help="Module-level logger to call (default: log).")
+    parser.add_argument("--default-level", default="debug", choices=("debug", "info", "warning", "error"))
+    parser.add_argument("--write", action="store_true", help="Write changes instead of printing a diff.")
+    options = parser.parse_args(argv)
+
+    total = 0
+    for path in options.paths:
+        raw = path.read_bytes()
+        has_bom = raw.startswith(b"\xef\xbb\xbf")
+        source = raw.decode("utf-8-sig")
+        rewriter = Rewriter(source, options.default_level, options.functions, options.logger_name)
+        result, count = rewriter.rewrite()
+        total += count
+        ast.parse(result)  # never write a file that no longer parses
+        print(f"{path}: {count} print() rewritten, {len(rewriter.skipped)} skipped {rewriter.skipped or ''}")
+        if not count:
+            continue
+        if options.write:
+            path.write_bytes((b"\xef\xbb\xbf" if has_bom else b"") + result.encode("utf-8"))
+        else:
+            sys.stdout.writelines(
+                difflib.unified_diff(
+                    source.splitlines(keepends=True), result.splitlines(keepends=True), str(path), str(path)
+                )
+            )
+    print(f"total: {total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -343,23 +343,15 @@ export default function Sidebar({ className }: SidebarProps) {
   useEffect(() => {
     const fetchPendingCount = async () => {
       try {
-        const response = await fetch(`${API_BASE}/api/adminpanel/kyc/all`, {
+        const response = await fetch(`${API_BASE}/api/adminpanel/kyc/counts`, {
           credentials: "include",
         });
 
         if (response.ok) {
           const data = await response.json();
           if (data.success) {
-            // Count pending KYC records
-            const pendingCount =
-              (data.kyc || []).filter(
-                (kyc: any) => kyc.kycStatus?.toLowerCase() === "pending",
-              ).length +
-              (data.agency_kyc || []).filter(
-                (kyc: any) => kyc.status?.toLowerCase() === "pending",
-              ).length;
-
-            setPendingKYCCount(pendingCount);
+            // Pending user + agency KYC submissions
+            setPendingKYCCount(data.total?.pending || 0);
           }
         }
       } catch (error) {